@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
@@ -9,9 +12,11 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.requests import RequestsInstrumentor
 
 from src import logger, parse_error
+from src.controllers.job import JobController
 from src.mcp.server import build_mcp
-from src.routes import environment, flight, motor, rocket
-from src.utils import RocketPyGZipMiddleware
+from src.routes import admin, environment, flight, job, motor, rocket
+from src.services.executor import get_simulation_executor
+from src.compression import RocketPyCompressionMiddleware
 
 
 rest_app = FastAPI(
@@ -26,11 +31,13 @@ rest_app.include_router(flight.router)
 rest_app.include_router(environment.router)
 rest_app.include_router(motor.router)
 rest_app.include_router(rocket.router)
+rest_app.include_router(job.router)
+rest_app.include_router(admin.router)
 
 RequestsInstrumentor().instrument()
 
-# Compress responses above 1KB
-rest_app.add_middleware(RocketPyGZipMiddleware, minimum_size=1000)
+# Compress responses above 1KB with the best coding the client accepts
+rest_app.add_middleware(RocketPyCompressionMiddleware, minimum_size=1000)
 
 
 def custom_openapi():
@@ -94,11 +101,36 @@ async def validation_exception_handler(
 # --- MCP server mounted under /mcp -------
 mcp_app = build_mcp(rest_app).http_app(path="/")
 
+
+async def fail_orphaned_jobs():
+    try:
+        failed = await JobController.fail_orphaned_jobs()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("Could not check for orphaned jobs: %s", e)
+        return
+    if failed:
+        logger.warning("Marked %d orphaned simulation jobs as failed", failed)
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    async with mcp_app.lifespan(app_):
+        # Jobs of a previous run of this worker never finish; fail them
+        # in the background, so startup does not wait for MongoDB.
+        orphaned_jobs = asyncio.create_task(fail_orphaned_jobs())
+        try:
+            yield
+        finally:
+            orphaned_jobs.cancel()
+            # Stop simulation workers instead of leaving them orphaned
+            get_simulation_executor().shutdown()
+
+
 app = FastAPI(
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
-    lifespan=mcp_app.lifespan,
+    lifespan=lifespan,
 )
 
 app.mount("/mcp", mcp_app)
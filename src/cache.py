@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from pydantic import BaseModel
+
+
+def _strip_ids(data):
+    """Drop view identifiers (flight_id, rocket_id, ...) from a dump."""
+    if isinstance(data, dict):
+        return {
+            key: _strip_ids(value)
+            for key, value in data.items()
+            if not key.endswith("_id")
+        }
+    if isinstance(data, list):
+        return [_strip_ids(item) for item in data]
+    return data
+
+
+def model_hash(model: BaseModel, **params) -> str:
+    """
+    Stable content hash of an API model.
+
+    Views and models describing the same design hash identically: ids
+    and unset optional fields are ignored and keys are sorted, so only
+    the physical definition (plus any extra ``params``) affects the key.
+
+    Returns:
+        str: hex sha256 digest.
+    """
+    canonical = {
+        "model": _strip_ids(model.model_dump(mode="json", exclude_none=True)),
+        "params": params,
+    }
+    payload = json.dumps(
+        canonical, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by entry count and
+    an optional total size.
+
+    Init Attributes:
+        max_items: maximum number of entries.
+        max_size: maximum sum of entry sizes (None for no limit).
+        ttl: seconds an entry is served after it was put (None for no
+            expiry).
+    """
+
+    def __init__(
+        self,
+        max_items: int = 128,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.max_items = max_items
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value, size, expires = self._entries[key]
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, size: int = 1):
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            if self.max_items <= 0 or (
+                self.max_size is not None and size > self.max_size
+            ):
+                return
+            expires = None if self.ttl is None else time.monotonic() + self.ttl
+            self._entries[key] = (value, size, expires)
+            self._size += size
+            self._evict_overflow()
+
+    def resize(self, key: Hashable, value: Any, size: int):
+        """
+        Update the size of an entry that grew in place, unless ``key``
+        no longer holds ``value``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not value:
+                return
+            self._size += size - entry[1]
+            if self.max_size is not None and size > self.max_size:
+                del self._entries[key]
+                self._size -= size
+                return
+            self._entries[key] = (value, size, entry[2])
+            self._evict_overflow()
+
+    def _evict_overflow(self):
+        # Callers hold the lock.
+        while len(self._entries) > self.max_items or (
+            self.max_size is not None and self._size > self.max_size
+        ):
+            self._size -= self._entries.popitem(last=False)[1][1]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value, size, _ = self._entries.pop(key)
+            self._size -= size
+            return value
+
+    def evict_if(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry for which predicate(key, value) is true."""
+        with self._lock:
+            doomed = [
+                key
+                for key, (value, *_) in self._entries.items()
+                if predicate(key, value)
+            ]
+            for key in doomed:
+                self._size -= self._entries.pop(key)[1]
+            return len(doomed)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SocketCache:
+    """
+    Byte cache shared by the processes of a host: a memcached-compatible
+    server listening on a local (unix) socket.
+
+    One connection is kept per process and requests on it are
+    serialized. Any connection error drops the connection and is raised
+    as ConnectionError; callers fall back to their source.
+
+    Init Attributes:
+        path: unix socket path of the server.
+        ttl: seconds the server keeps an entry (0 for no expiry).
+    """
+
+    def __init__(self, path: str, ttl: int = 0):
+        self.path = path
+        self.ttl = ttl
+        self._streams = None
+        self._lock = asyncio.Lock()
+
+    async def _request(self, command: bytes, read_reply: bool):
+        async with self._lock:
+            try:
+                if self._streams is None:
+                    self._streams = await asyncio.open_unix_connection(
+                        self.path
+                    )
+                reader, writer = self._streams
+                writer.write(command)
+                await writer.drain()
+                if read_reply:
+                    return await self._read_value(reader)
+                return None
+            except (
+                OSError,
+                RuntimeError,
+                asyncio.IncompleteReadError,
+                ValueError,
+            ) as e:
+                if self._streams is not None:
+                    self._streams[1].close()
+                self._streams = None
+                raise ConnectionError(str(e)) from e
+
+    @staticmethod
+    async def _read_value(reader: asyncio.StreamReader) -> Optional[bytes]:
+        header = await reader.readuntil(b"\r\n")
+        if header == b"END\r\n":
+            return None
+        if not header.startswith(b"VALUE "):
+            raise ValueError(f"Unexpected reply {header!r}")
+        length = int(header.split()[3])
+        value = (await reader.readexactly(length + 2))[:-2]
+        if await reader.readuntil(b"\r\n") != b"END\r\n":
+            raise ValueError("Unterminated reply")
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._request(f"get {key}\r\n".encode(), True)
+
+    async def put(self, key: str, value: bytes):
+        await self._request(
+            f"set {key} 0 {self.ttl} {len(value)} noreply\r\n".encode()
+            + value
+            + b"\r\n",
+            False,
+        )
+
+    async def delete(self, key: str):
+        await self._request(f"delete {key} noreply\r\n".encode(), False)
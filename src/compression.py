@@ -0,0 +1,519 @@
+import hashlib
+import struct
+import time
+import zlib
+from functools import cache, cached_property
+from typing import Callable, Dict, Iterator, NoReturn, Optional, Tuple
+
+from opentelemetry import metrics
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.secrets import Secrets
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+meter = metrics.get_meter(__name__)
+
+# Levels used unless COMPRESSION_LEVELS overrides them; gzip 9 costs
+# about twice the CPU of 6 for the same size on simulation JSON.
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+
+# Bodies and stream chunks from this size up are compressed in a thread
+# instead of on the event loop.
+COMPRESSION_OFFLOAD_BYTES = int(
+    Secrets.get_secret("COMPRESSION_OFFLOAD_BYTES", 256 * 1024)
+)
+
+# Media types that are compressed already.
+INCOMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/octet-stream",
+        "application/gzip",
+        "application/zip",
+        "application/vnd.google-earth.kmz",
+        "application/vnd.apache.parquet",
+        "application/x-npz",
+        "image/png",
+        "image/jpeg",
+    }
+)
+
+
+class GZipCompressor:
+    def __init__(self, level: int):
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressobj.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressobj.flush()
+
+
+def available_encodings() -> Dict[str, type]:
+    """
+    Compressors by content coding, in server preference order; zstd and
+    br are only offered when their optional packages are installed.
+    """
+    encodings = {}
+    if zstandard is not None:
+        encodings["zstd"] = ZstdCompressor
+    if brotli is not None:
+        encodings["br"] = BrotliCompressor
+    encodings["gzip"] = GZipCompressor
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, encodings=None) -> Optional[str]:
+    """
+    Pick the content coding of a response from its Accept-Encoding.
+
+    The coding with the highest q-value wins and ties go to the server
+    preference of ``encodings``; ``*`` stands for unlisted codings and
+    ``q=0`` refuses one.
+
+    Returns:
+        The content coding, or None to send the body as it is.
+    """
+    if encodings is None:
+        encodings = available_encodings()
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        weight = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def parse_levels(setting: Optional[str]) -> Dict[Tuple[str, str], int]:
+    """
+    Parse COMPRESSION_LEVELS, comma-separated ``<media type>:<coding>=
+    <level>`` entries, e.g. ``application/json:zstd=6,*:gzip=4``; ``*``
+    applies to every media type.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    levels = {}
+    for entry in filter(None, map(str.strip, (setting or "").split(","))):
+        media_type, _, level = entry.rpartition("=")
+        media_type, _, encoding = media_type.rpartition(":")
+        if not media_type or encoding not in DEFAULT_LEVELS:
+            raise ValueError(f"Invalid COMPRESSION_LEVELS entry: {entry}")
+        levels[(media_type.strip().lower(), encoding)] = int(level)
+    return levels
+
+
+COMPRESSION_LEVELS = parse_levels(Secrets.get_secret("COMPRESSION_LEVELS"))
+
+
+def compression_level(media_type: str, encoding: str) -> int:
+    return COMPRESSION_LEVELS.get(
+        (media_type, encoding),
+        COMPRESSION_LEVELS.get(("*", encoding), DEFAULT_LEVELS[encoding]),
+    )
+
+
+class CompressionMetrics:
+    """
+    Bytes in and out of response compression, per content coding.
+
+    Totals are kept on the instance and mirrored to OpenTelemetry as
+    ``http.server.response.compression.*`` instruments, so the CPU spent
+    can be weighed against the bandwidth saved.
+    """
+
+    def __init__(self):
+        self.input_bytes: Dict[str, int] = {}
+        self.output_bytes: Dict[str, int] = {}
+        self._input = meter.create_counter(
+            "http.server.response.compression.input",
+            unit="By",
+            description="Response bytes before compression.",
+        )
+        self._output = meter.create_counter(
+            "http.server.response.compression.output",
+            unit="By",
+            description="Response bytes after compression.",
+        )
+        self._duration = meter.create_histogram(
+            "http.server.response.compression.duration",
+            unit="s",
+            description="Time spent compressing one response.",
+        )
+
+    def record(
+        self,
+        encoding: str,
+        media_type: str,
+        input_bytes: int,
+        output_bytes: int,
+        duration: float,
+    ):
+        self.input_bytes[encoding] = (
+            self.input_bytes.get(encoding, 0) + input_bytes
+        )
+        self.output_bytes[encoding] = (
+            self.output_bytes.get(encoding, 0) + output_bytes
+        )
+        attributes = {
+            "http.response.header.content-encoding": encoding,
+            "http.response.header.content-type": media_type,
+        }
+        self._input.add(input_bytes, attributes)
+        self._output.add(output_bytes, attributes)
+        self._duration.record(duration, attributes)
+
+    def snapshot(self) -> dict:
+        return {
+            "input_bytes": dict(self.input_bytes),
+            "output_bytes": dict(self.output_bytes),
+        }
+
+
+@cache
+def get_compression_metrics() -> CompressionMetrics:
+    """
+    Provides the process-wide response compression metrics.
+
+    Returns:
+        CompressionMetrics: Shared metrics instance.
+    """
+    return CompressionMetrics()
+
+
+# gzip member header: deflate, no flags, no mtime, unknown OS.
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+_ZLIB_PRESET_DICTIONARY = 0x20
+
+
+def zlib_to_gzip(payload: bytes) -> bytes:
+    """
+    Reframe a zlib stream as gzip without compressing it again: both
+    wrap the same deflate data.
+
+    Raises:
+        zlib.error: If ``payload`` is not a valid zlib stream.
+    """
+    data = zlib.decompress(payload)
+    if payload[1] & _ZLIB_PRESET_DICTIONARY:
+        raise zlib.error("zlib streams with a preset dictionary")
+    return (
+        _GZIP_HEADER
+        + payload[2:-4]
+        + struct.pack("<II", zlib.crc32(data), len(data) & 0xFFFFFFFF)
+    )
+
+
+class PrecompressedBody:
+    """
+    Response body stored zlib-compressed, with a variant per content
+    coding built the first time a client asks for it and kept.
+
+    Init Attributes:
+        key: cache key the body is stored under.
+        payload: zlib-compressed body; the strong ETag is its hash.
+        media_type: media type of the body.
+        on_resize: called with ``size`` whenever a new variant is kept.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        payload: bytes,
+        media_type: str = "application/json",
+        on_resize: Optional[Callable[[int], None]] = None,
+    ):
+        self.key = key
+        self.payload = payload
+        self.media_type = media_type
+        self.on_resize = on_resize
+        self._variants: Dict[str, bytes] = {}
+
+    @property
+    def size(self) -> int:
+        """Bytes held: the payload and every variant built so far."""
+        return len(self.payload) + sum(map(len, self._variants.values()))
+
+    @cached_property
+    def digest(self) -> str:
+        """sha256 of the stored payload."""
+        return hashlib.sha256(self.payload).hexdigest()
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """Strong ETag of the body as sent with ``encoding``."""
+        if encoding:
+            return f'"{self.digest}-{encoding}"'
+        return f'"{self.digest}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """
+        Whether an If-None-Match header names this body, in any coding.
+        """
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/").strip('"')
+            if tag == "*" or tag.split("-")[0] == self.digest:
+                return True
+        return False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Decompress the body up to ``chunk_size`` bytes at a time."""
+        decompressor = zlib.decompressobj()
+        data = self.payload
+        while data:
+            chunk = decompressor.decompress(data, chunk_size)
+            data = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+    def content(self, encoding: Optional[str] = None) -> bytes:
+        if encoding is None:
+            return zlib.decompress(self.payload)
+        variant = self._variants.get(encoding)
+        if variant is None:
+            if encoding == "gzip":
+                variant = zlib_to_gzip(self.payload)
+            else:
+                compressor = available_encodings()[encoding](
+                    compression_level(self.media_type, encoding)
+                )
+                variant = (
+                    compressor.compress(zlib.decompress(self.payload))
+                    + compressor.finish()
+                )
+            self._variants[encoding] = variant
+            if self.on_resize is not None:
+                self.on_resize(self.size)
+        return variant
+
+
+async def precompressed_response(
+    body: PrecompressedBody,
+    accept_encoding: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """
+    Serve ``body`` in the coding negotiated from ``accept_encoding``,
+    with its ETag; 304 Not Modified when ``if_none_match`` names it.
+    Variants of large bodies are built in a thread.
+    """
+    encoding = negotiate_encoding(accept_encoding or "")
+    headers = {"ETag": body.etag(encoding), "Vary": "Accept-Encoding"}
+    if if_none_match and body.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    if len(body.payload) >= COMPRESSION_OFFLOAD_BYTES:
+        content = await run_in_threadpool(body.content, encoding)
+    else:
+        content = body.content(encoding)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content, media_type=body.media_type, headers=headers)
+
+
+class RocketPyCompressionMiddleware:
+    """
+    Compresses responses with the best coding the client accepts: zstd,
+    br or gzip.
+
+    Init Attributes:
+        minimum_size: smallest body, in bytes, worth compressing.
+        offload_size: smallest body or chunk compressed in a thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        offload_size: int = COMPRESSION_OFFLOAD_BYTES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            encoding = negotiate_encoding(headers.get("Accept-Encoding", ""))
+            if encoding is not None:
+                responder = CompressionResponder(
+                    self.app, self.minimum_size, encoding, self.offload_size
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    # fork of https://github.com/encode/starlette/blob/master/starlette/middleware/gzip.py
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        encoding: str,
+        offload_size: int = COMPRESSION_OFFLOAD_BYTES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.offload_size = offload_size
+        self.send: Send = unattached_send
+        self.initial_message: Message = {}
+        self.started = False
+        self.content_encoding_set = False
+        self.compressor = None
+        self.media_type = ""
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.duration = 0.0
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def _compress(self, body: bytes, finish: bool) -> bytes:
+        def compress():
+            data = self.compressor.compress(body)
+            return data + self.compressor.finish() if finish else data
+
+        start = time.perf_counter()
+        if len(body) >= self.offload_size:
+            data = await run_in_threadpool(compress)
+        else:
+            data = compress()
+        self.duration += time.perf_counter() - start
+        self.input_bytes += len(body)
+        self.output_bytes += len(data)
+        if finish:
+            get_compression_metrics().record(
+                self.encoding,
+                self.media_type,
+                self.input_bytes,
+                self.output_bytes,
+                self.duration,
+            )
+        return data
+
+    def _start(self, headers: MutableHeaders):
+        level = compression_level(self.media_type, self.encoding)
+        self.compressor = available_encodings()[self.encoding](level)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Don't send the initial message until we've determined how to
+            # modify the outgoing headers correctly.
+            self.initial_message = message
+            headers = Headers(raw=self.initial_message["headers"])
+            self.content_encoding_set = "content-encoding" in headers
+            self.media_type = (
+                headers.get("content-type", "").split(";")[0].strip().lower()
+            )
+        elif (
+            message_type == "http.response.body" and self.content_encoding_set
+        ):
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+        elif message_type == "http.response.body" and not self.started:
+            self.started = True
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if (
+                (len(body) < self.minimum_size) and not more_body
+            ) or self.media_type in INCOMPRESSIBLE_TYPES:
+                # Don't compress small outgoing responses or compressed
+                # media types.
+                self.content_encoding_set = True
+                await self.send(self.initial_message)
+                await self.send(message)  # pylint: disable=unreachable
+            elif not more_body:
+                # Standard compressed response.
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                self._start(headers)
+                body = await self._compress(body, finish=True)
+                headers["Content-Length"] = str(len(body))
+                message["body"] = body
+
+                await self.send(self.initial_message)
+                await self.send(message)  # pylint: disable=unreachable
+            else:
+                # Initial body in streaming compressed response.
+                headers = MutableHeaders(raw=self.initial_message["headers"])
+                self._start(headers)
+                del headers["Content-Length"]
+                message["body"] = await self._compress(body, finish=False)
+
+                await self.send(self.initial_message)
+                await self.send(message)  # pylint: disable=unreachable
+
+        elif message_type == "http.response.body":
+            # Remaining body in streaming compressed response.
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            message["body"] = await self._compress(body, finish=not more_body)
+            await self.send(message)
+
+        else:
+            # Pass through other message types unmodified.
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+
+
+async def unattached_send(message: Message) -> NoReturn:
+    raise RuntimeError("send awaitable not set")  # pragma: no cover
@@ -0,0 +1,163 @@
+import asyncio
+from typing import List
+
+from fastapi import HTTPException, status
+from pymongo.errors import OperationFailure
+
+from src.controllers.interface import (
+    ControllerBase,
+    controller_exception_handler,
+)
+from src.models.admin import QueryExplainRequest
+from src.models.environment import EnvironmentModel
+from src.models.flight import FlightModel
+from src.models.interface import ApiBaseModel
+from src.models.job import JobModel
+from src.models.motor import MotorModel
+from src.models.rocket import RocketModel
+from src.models.simulation import SimulationCacheModel
+from src.repositories.interface import RepositoryInterface
+from src.views.admin import (
+    CollectionIndexes,
+    IndexReport,
+    IndexUsage,
+    QueryPlan,
+)
+
+# Models whose collections the admin endpoints report on.
+ADMIN_MODELS = (
+    EnvironmentModel,
+    MotorModel,
+    RocketModel,
+    FlightModel,
+    SimulationCacheModel,
+    JobModel,
+)
+
+
+def _plan_stages(plan: dict) -> List[dict]:
+    """Stages of a query plan, from its root down to its leaves."""
+    stages = []
+    pending = [plan]
+    while pending:
+        stage = pending.pop(0)
+        stages.append(stage)
+        if "inputStage" in stage:
+            pending.append(stage["inputStage"])
+        pending.extend(stage.get("inputStages", ()))
+    return stages
+
+
+class AdminController(ControllerBase):
+    """
+    Controller for database administration.
+
+    Enables:
+        - Reporting index usage of every collection.
+        - Explaining queries, to check which index serves them.
+    """
+
+    def __init__(self):
+        super().__init__(models=[])
+
+    @staticmethod
+    def _declared_indexes(model: ApiBaseModel) -> List[tuple]:
+        declared = list(model.INDEXES)
+        if model.EXPIRES_AFTER is not None:
+            declared.append((model.EXPIRES_AFTER[0],))
+        return declared
+
+    @classmethod
+    async def _collection_indexes(
+        cls, model: ApiBaseModel
+    ) -> CollectionIndexes:
+        repo_cls = RepositoryInterface.get_model_repo(model)
+        async with repo_cls() as repo:
+            stats = await repo.read_index_stats()
+        names = {index["name"] for index in stats}
+        return CollectionIndexes(
+            collection=model.NAME,
+            indexes=[
+                IndexUsage(
+                    name=index["name"],
+                    key=index["key"],
+                    accesses=index["accesses"]["ops"],
+                    since=index["accesses"].get("since"),
+                )
+                for index in sorted(stats, key=lambda index: index["name"])
+            ],
+            missing=[
+                repo_cls.index_name(fields)
+                for fields in cls._declared_indexes(model)
+                if repo_cls.index_name(fields) not in names
+            ],
+        )
+
+    @controller_exception_handler
+    async def get_index_report(self) -> IndexReport:
+        """
+        Report the indexes of every collection and how often each one
+        served a query since the database server started.
+
+        Returns:
+            views.IndexReport
+        """
+        collections = await asyncio.gather(
+            *(self._collection_indexes(model) for model in ADMIN_MODELS)
+        )
+        return IndexReport(collections=collections)
+
+    @controller_exception_handler
+    async def explain_query(
+        self, collection: str, request: QueryExplainRequest
+    ) -> QueryPlan:
+        """
+        Explain a query against a collection with execution statistics.
+
+        The query runs once on the server, so explaining a slow query
+        costs as much as running it.
+
+        Args:
+            collection: collection name, e.g. "motor".
+            request: models.QueryExplainRequest
+
+        Returns:
+            views.QueryPlan
+
+        Raises:
+            HTTP 404 Not Found: If the collection is unknown.
+            HTTP 422 Unprocessable Entity: If the server rejects the query.
+        """
+        models = {model.NAME: model for model in ADMIN_MODELS}
+        if collection not in models:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Collection not found",
+            )
+        repo_cls = RepositoryInterface.get_model_repo(models[collection])
+        try:
+            async with repo_cls() as repo:
+                explained = await repo.explain_query(
+                    request.filter, sort=request.sort, limit=request.limit
+                )
+        except OperationFailure as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+        winning_plan = explained["queryPlanner"]["winningPlan"]
+        # Servers with the slot-based engine nest the plan one level down.
+        stages = _plan_stages(winning_plan.get("queryPlan", winning_plan))
+        execution = explained.get("executionStats", {})
+        return QueryPlan(
+            collection=collection,
+            stages=[stage["stage"] for stage in stages],
+            indexes=[
+                stage["indexName"] for stage in stages if "indexName" in stage
+            ],
+            returned=execution.get("nReturned", 0),
+            keys_examined=execution.get("totalKeysExamined", 0),
+            documents_examined=execution.get("totalDocsExamined", 0),
+            execution_time_ms=execution.get("executionTimeMillis", 0),
+            winning_plan=winning_plan,
+        )
@@ -1,3 +1,6 @@
+from typing import Optional, Tuple, Union
+
+from src.compression import PrecompressedBody
 from src.controllers.interface import (
     ControllerBase,
     controller_exception_handler,
@@ -5,6 +8,8 @@ from src.controllers.interface import (
 from src.views.environment import EnvironmentSimulation
 from src.models.environment import EnvironmentModel
 from src.services.environment import EnvironmentService
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
+from src.services.executor import get_simulation_executor
 
 
 class EnvironmentController(ControllerBase):
@@ -37,25 +42,48 @@ class EnvironmentController(ControllerBase):
             HTTP 404 Not Found: If the env is not found in the database.
         """
         env = await self.get_environment_by_id(env_id)
-        env_service = EnvironmentService.from_env_model(env.environment)
-        return env_service.get_environment_binary()
+        return await get_simulation_executor().run(
+            EnvironmentService.from_env_model,
+            env.environment,
+            "get_environment_binary",
+        )
 
     @controller_exception_handler
     async def get_environment_simulation(
-        self, env_id: str
-    ) -> EnvironmentSimulation:
+        self,
+        env_id: str,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+        encoded: bool = False,
+    ) -> Union[EnvironmentSimulation, PrecompressedBody]:
         """
         Simulate a rocket environment.
 
         Args:
             env_id: str.
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
+            encoded: return the cached serialized view instead.
 
         Returns:
-            EnvironmentSimulation
+            EnvironmentSimulation, or its PrecompressedBody when
+            ``encoded``.
 
         Raises:
             HTTP 404 Not Found: If the env does not exist in the database.
         """
         env = await self.get_environment_by_id(env_id)
-        env_service = EnvironmentService.from_env_model(env.environment)
-        return env_service.get_environment_simulation()
+        return await self._simulate(
+            EnvironmentModel,
+            env_id,
+            env.environment,
+            EnvironmentSimulation,
+            EnvironmentService.from_env_model,
+            "get_environment_simulation",
+            points=points,
+            method=method,
+            fields=fields,
+            encoded=encoded,
+        )
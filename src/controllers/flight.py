@@ -1,19 +1,57 @@
+import asyncio
+from typing import AsyncIterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 
+from src.compression import PrecompressedBody
 from src.controllers.interface import (
+    SIMULATION_JOB_TIMEOUT,
     ControllerBase,
     controller_exception_handler,
 )
-from src.views.flight import FlightSimulation, FlightCreated, FlightImported
+from src.views.flight import (
+    FlightSimulation,
+    FlightCreated,
+    FlightImported,
+    FlightMonteCarloSimulation,
+    FlightSweepSimulation,
+)
+from src.views.job import JobCreated
 from src.models.flight import (
+    SWEEP_MAX_POINTS,
     FlightModel,
+    FlightMonteCarloRequest,
+    FlightSweepRequest,
     FlightWithReferencesRequest,
 )
 from src.models.environment import EnvironmentModel
 from src.models.motor import MotorModel
 from src.models.rocket import RocketModel
+from src.repositories.client import run_in_transaction
 from src.repositories.interface import RepositoryInterface
+from src.services.executor import get_simulation_executor
+from src.secrets import Secrets
 from src.services.flight import FlightService
+from src.services.study import MONTE_CARLO_OUTPUTS, FlightStudyService
+from src.services.timeseries import TimeseriesFormat
+from src.utils import (
+    DEFAULT_CURVE_POINTS,
+    CurveDownsampling,
+    apply_merge_patch,
+    merge_patch_updates,
+)
+
+MONTE_CARLO_MAX_SAMPLES = int(
+    Secrets.get_secret("MONTE_CARLO_MAX_SAMPLES", 1000)
+)
+RPY_IMPORT_TRANSACTION = Secrets.get_flag("RPY_IMPORT_TRANSACTION")
+# Flights created from references keep environment_id and rocket_id
+# instead of copies of both documents.
+NORMALIZED_FLIGHT_STORAGE = Secrets.get_flag("NORMALIZED_FLIGHT_STORAGE")
+# Read-patch-write rounds of a PATCH without If-Match before answering 409.
+FLIGHT_PATCH_ATTEMPTS = 3
 
 
 class FlightController(ControllerBase):
@@ -51,12 +89,71 @@ class FlightController(ControllerBase):
             )
         return rocket
 
+    async def _load_references(
+        self, environment_id: str, rocket_id: str
+    ) -> Tuple[EnvironmentModel, RocketModel]:
+        """
+        Load the referenced environment and rocket concurrently.
+
+        Raises:
+            HTTP 404 Not Found: If either is missing; a missing
+                environment is reported first.
+        """
+        environment, rocket = await asyncio.gather(
+            self._load_environment(environment_id),
+            self._load_rocket(rocket_id),
+            return_exceptions=True,
+        )
+        for loaded in (environment, rocket):
+            if isinstance(loaded, BaseException):
+                raise loaded
+        return environment, rocket
+
+    async def _check_references(self, environment_id: str, rocket_id: str):
+        """
+        Check that the referenced environment and rocket exist, reading
+        only their versions.
+
+        Raises:
+            HTTP 404 Not Found: If either is missing; a missing
+                environment is reported first.
+        """
+
+        async def read_version(model, model_id: str) -> Optional[int]:
+            repo_cls = RepositoryInterface.get_model_repo(model)
+            async with repo_cls() as repo:
+                return await repo.read_version_by_id(model_id)
+
+        versions = await asyncio.gather(
+            read_version(EnvironmentModel, environment_id),
+            read_version(RocketModel, rocket_id),
+        )
+        for model, version in zip((EnvironmentModel, RocketModel), versions):
+            if version is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{model.NAME.capitalize()} not found",
+                )
+
     @controller_exception_handler
     async def create_flight_from_references(
         self, payload: FlightWithReferencesRequest
     ) -> FlightCreated:
-        environment = await self._load_environment(payload.environment_id)
-        rocket = await self._load_rocket(payload.rocket_id)
+        if NORMALIZED_FLIGHT_STORAGE:
+            await self._check_references(
+                payload.environment_id, payload.rocket_id
+            )
+            repo_cls = RepositoryInterface.get_model_repo(FlightModel)
+            async with repo_cls() as repo:
+                flight_id = await repo.create_flight_with_references(
+                    payload.flight,
+                    environment_id=payload.environment_id,
+                    rocket_id=payload.rocket_id,
+                )
+            return FlightModel.CREATED(flight_id)
+        environment, rocket = await self._load_references(
+            payload.environment_id, payload.rocket_id
+        )
         flight_model = payload.flight.assemble(
             environment=environment,
             rocket=rocket,
@@ -69,8 +166,28 @@ class FlightController(ControllerBase):
         flight_id: str,
         payload: FlightWithReferencesRequest,
     ) -> None:
-        environment = await self._load_environment(payload.environment_id)
-        rocket = await self._load_rocket(payload.rocket_id)
+        if NORMALIZED_FLIGHT_STORAGE:
+            await self._check_references(
+                payload.environment_id, payload.rocket_id
+            )
+            repo_cls = RepositoryInterface.get_model_repo(FlightModel)
+            async with repo_cls() as repo:
+                updated = await repo.update_flight_with_references_by_id(
+                    flight_id,
+                    payload.flight,
+                    environment_id=payload.environment_id,
+                    rocket_id=payload.rocket_id,
+                )
+            if updated is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Flight not found",
+                )
+            await self._invalidate_simulations(FlightModel, flight_id)
+            return
+        environment, rocket = await self._load_references(
+            payload.environment_id, payload.rocket_id
+        )
         flight_model = payload.flight.assemble(
             environment=environment,
             rocket=rocket,
@@ -79,6 +196,188 @@ class FlightController(ControllerBase):
         await self.put_flight_by_id(flight_id, flight_model)
         return
 
+    async def _write_flight_paths(
+        self,
+        flight_id: str,
+        *,
+        set_fields: Optional[dict] = None,
+        unset_fields: Sequence[str] = (),
+        version: Optional[int] = None,
+    ) -> int:
+        """
+        Write only the given paths of a flight and invalidate its cached
+        simulations.
+
+        Returns:
+            The new flight version.
+
+        Raises:
+            HTTP 404 Not Found: If the flight is not found in the database.
+            HTTP 412 Precondition Failed: If the flight is no longer at
+                ``version``.
+        """
+        repo_cls = RepositoryInterface.get_model_repo(FlightModel)
+        async with repo_cls() as repo:
+            new_version = await repo.patch_flight_by_id(
+                flight_id,
+                set_fields=set_fields,
+                unset_fields=unset_fields,
+                version=version,
+            )
+            if new_version is None:
+                current_version = (
+                    None
+                    if version is None
+                    else await repo.read_flight_version_by_id(flight_id)
+                )
+                if current_version is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Flight not found",
+                    )
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail=(
+                        f"Flight was modified; its version is now "
+                        f"{current_version}"
+                    ),
+                )
+        await self._invalidate_simulations(FlightModel, flight_id)
+        return new_version
+
+    @controller_exception_handler
+    async def patch_flight_by_id(
+        self,
+        flight_id: str,
+        patch: dict,
+        *,
+        version: Optional[int] = None,
+    ) -> int:
+        """
+        Apply a JSON merge patch (RFC 7386) to a models.Flight.
+
+        The patched flight is validated as a whole, but only the patched
+        paths are written, with ``$set``/``$unset``. The write only
+        happens if the flight is still at the version that was read, so
+        concurrent updates are never silently overwritten: without
+        ``version`` the patch is applied again to the newer flight, up to
+        FLIGHT_PATCH_ATTEMPTS times. Patching a
+        referenced environment or rocket embeds a patched copy in the
+        flight and leaves the shared document untouched.
+
+        Args:
+            flight_id: str
+            patch: JSON merge patch of the flight document.
+            version: expected flight version, from ``If-Match``.
+
+        Returns:
+            The new flight version.
+
+        Raises:
+            HTTP 404 Not Found: If the flight is not found in the database.
+            HTTP 409 Conflict: If, without ``version``, the flight was
+                modified concurrently on every attempt.
+            HTTP 412 Precondition Failed: If the flight is not, or no
+                longer, at the expected version.
+            HTTP 422 Unprocessable Entity: If the patched flight is not
+                valid.
+        """
+        unknown_fields = sorted(
+            set(patch).difference(FlightModel.model_fields)
+        )
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Unknown flight fields: " + ", ".join(unknown_fields),
+            )
+        repo_cls = RepositoryInterface.get_model_repo(FlightModel)
+        for _ in range(FLIGHT_PATCH_ATTEMPTS):
+            async with repo_cls() as repo:
+                flight = await repo.read_flight_by_id(flight_id)
+            if flight is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Flight not found",
+                )
+            if version is not None and version != flight.get_version():
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail=(
+                        f"Flight was modified; its version is now "
+                        f"{flight.get_version()}"
+                    ),
+                )
+            set_fields, unset_fields = self._merge_patch_paths(
+                flight, patch, repo_cls.REFERENCES
+            )
+            try:
+                return await self._write_flight_paths(
+                    flight_id,
+                    set_fields=set_fields,
+                    unset_fields=unset_fields,
+                    version=flight.get_version(),
+                )
+            except HTTPException as e:
+                # Without If-Match the client set no precondition, so a
+                # concurrent write only means patching the newer flight.
+                if (
+                    version is not None
+                    or e.status_code != status.HTTP_412_PRECONDITION_FAILED
+                ):
+                    raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Flight kept being modified concurrently; retry the patch",
+        )
+
+    @staticmethod
+    def _merge_patch_paths(
+        flight: FlightModel, patch: dict, references: Sequence[str]
+    ) -> Tuple[dict, List[str]]:
+        """
+        Paths to ``$set`` and ``$unset`` to apply a merge patch to a flight.
+
+        Referenced environments or rockets touched by the patch are
+        embedded whole and their reference id is unset.
+
+        Raises:
+            HTTP 422 Unprocessable Entity: If the patched flight is not
+                valid.
+        """
+        try:
+            patched = FlightModel.model_validate(
+                apply_merge_patch(flight.model_dump(exclude_none=True), patch)
+            )
+            set_fields, unset_fields = merge_patch_updates(
+                patch, patched.model_dump(exclude_none=True)
+            )
+        except (ValidationError, ValueError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+        for field in references:
+            if getattr(flight, field).get_id() is None:
+                continue
+            touched = {
+                path
+                for path in [*set_fields, *unset_fields]
+                if path == field or path.startswith(f"{field}.")
+            }
+            if touched:
+                set_fields = {
+                    path: value
+                    for path, value in set_fields.items()
+                    if path not in touched
+                }
+                set_fields[field] = getattr(patched, field).model_dump(
+                    exclude_none=True
+                )
+                unset_fields = [
+                    path for path in unset_fields if path not in touched
+                ] + [f"{field}_id"]
+        return set_fields, unset_fields
+
     @controller_exception_handler
     async def update_environment_by_flight_id(
         self, flight_id: str, *, environment: EnvironmentModel
@@ -86,6 +385,9 @@ class FlightController(ControllerBase):
         """
         Update a models.Flight.environment in the database.
 
+        Only the environment is written, with ``$set``; a referenced
+        environment is replaced by the embedded one.
+
         Args:
             flight_id: str
             environment: models.Environment
@@ -96,9 +398,13 @@ class FlightController(ControllerBase):
         Raises:
             HTTP 404 Not Found: If the flight is not found in the database.
         """
-        flight = await self.get_flight_by_id(flight_id)
-        flight.environment = environment
-        await self.update_flight_by_id(flight_id, flight)
+        await self._write_flight_paths(
+            flight_id,
+            set_fields={
+                "environment": environment.model_dump(exclude_none=True)
+            },
+            unset_fields=("environment_id",),
+        )
         return
 
     @controller_exception_handler
@@ -108,6 +414,9 @@ class FlightController(ControllerBase):
         """
         Update a models.Flight.rocket in the database.
 
+        Only the rocket is written, with ``$set``; a referenced rocket
+        is replaced by the embedded one.
+
         Args:
             flight_id: str
             rocket: models.Rocket
@@ -118,9 +427,11 @@ class FlightController(ControllerBase):
         Raises:
             HTTP 404 Not Found: If the flight is not found in the database.
         """
-        flight = await self.get_flight_by_id(flight_id)
-        flight.rocket = rocket
-        await self.update_flight_by_id(flight_id, flight)
+        await self._write_flight_paths(
+            flight_id,
+            set_fields={"rocket": rocket.model_dump(exclude_none=True)},
+            unset_fields=("rocket_id",),
+        )
         return
 
     @controller_exception_handler
@@ -142,51 +453,355 @@ class FlightController(ControllerBase):
                 in the database.
         """
         flight = await self.get_flight_by_id(flight_id)
-        flight_service = FlightService.from_flight_model(flight.flight)
-        return flight_service.get_flight_rpy()
+        return await get_simulation_executor().run(
+            FlightService.from_flight_model, flight.flight, "get_flight_rpy"
+        )
 
     @controller_exception_handler
     async def get_flight_kml(
         self,
         flight_id: str,
+        max_points: Optional[int] = None,
+        kmz: bool = False,
     ) -> bytes:
         """
         Get the flight trajectory as a KML file.
 
         Args:
             flight_id: str
+            max_points: trajectory points kept (None for every step).
+            kmz: zip the KML into a KMZ archive.
 
         Returns:
-            bytes (KML XML)
+            bytes (KML XML, or KMZ)
 
         Raises:
             HTTP 404 Not Found: If the flight is not found
                 in the database.
         """
         flight = await self.get_flight_by_id(flight_id)
-        flight_service = FlightService.from_flight_model(flight.flight)
-        return flight_service.get_flight_kml()
+        return await get_simulation_executor().run(
+            FlightService.from_flight_model,
+            flight.flight,
+            "get_flight_kml",
+            max_points,
+            kmz,
+        )
+
+    @controller_exception_handler
+    async def get_flight_timeseries(
+        self,
+        flight_id: str,
+        table_format: TimeseriesFormat = TimeseriesFormat.CSV,
+        columns: Optional[Tuple[str, ...]] = None,
+    ) -> bytes:
+        """
+        Get the full-resolution time series of a flight as a table file.
+
+        Args:
+            flight_id: str
+            table_format: arrow, parquet, npz or csv.
+            columns: derived curves to add to the solution columns (None
+                for the defaults).
+
+        Returns:
+            bytes of the table file.
+
+        Raises:
+            HTTP 404 Not Found: If the flight does not exist in the database.
+            HTTP 422 Unprocessable Entity: If a column is not a flight
+                time series.
+            HTTP 501 Not Implemented: If the format needs pyarrow and it
+                is not installed.
+        """
+        if not table_format.available:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail=f"{table_format.value} export requires pyarrow",
+            )
+        flight = await self.get_flight_by_id(flight_id)
+        try:
+            return await get_simulation_executor().run(
+                FlightService.from_flight_model,
+                flight.flight,
+                "get_flight_timeseries",
+                table_format,
+                columns,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
 
     @controller_exception_handler
     async def get_flight_simulation(
         self,
         flight_id: str,
-    ) -> FlightSimulation:
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+        encoded: bool = False,
+    ) -> Union[FlightSimulation, PrecompressedBody]:
         """
         Simulate a rocket flight.
 
         Args:
             flight_id: str
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
+            encoded: return the cached serialized view instead.
+
+        Returns:
+            Flight simulation view, or its PrecompressedBody when
+            ``encoded``.
+
+        Raises:
+            HTTP 404 Not Found: If the flight does not exist in the database.
+        """
+        flight = await self.get_flight_by_id(flight_id)
+        return await self._simulate(
+            FlightModel,
+            flight_id,
+            flight.flight,
+            FlightSimulation,
+            FlightService.from_flight_model,
+            "get_flight_simulation",
+            points=points,
+            method=method,
+            fields=fields,
+            encoded=encoded,
+        )
+
+    @controller_exception_handler
+    async def stream_flight_simulation(
+        self,
+        flight_id: str,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Simulate a rocket flight and stream its JSON.
+
+        Args:
+            flight_id: str
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
 
         Returns:
-            Flight simulation view.
+            Iterator over the JSON of the flight simulation view.
 
         Raises:
             HTTP 404 Not Found: If the flight does not exist in the database.
         """
         flight = await self.get_flight_by_id(flight_id)
-        flight_service = FlightService.from_flight_model(flight.flight)
-        return flight_service.get_flight_simulation()
+        return await self._stream_simulation(
+            FlightModel,
+            flight_id,
+            flight.flight,
+            FlightSimulation,
+            FlightService.from_flight_model,
+            "get_flight_simulation",
+            points=points,
+            method=method,
+            fields=fields,
+        )
+
+    @controller_exception_handler
+    async def post_flight_simulation_job(
+        self,
+        flight_id: str,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> JobCreated:
+        """
+        Queue a flight simulation as a background job.
+
+        Args:
+            flight_id: str
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
+
+        Returns:
+            views.JobCreated
+
+        Raises:
+            HTTP 404 Not Found: If the flight does not exist in the database.
+            HTTP 422 Unprocessable Entity: If ``fields`` is not valid.
+        """
+        self._check_simulation_fields(FlightSimulation, fields)
+        flight = await self.get_flight_by_id(flight_id)
+        return await self._submit_job(
+            FlightModel,
+            flight_id,
+            {
+                "points": points,
+                "method": CurveDownsampling(method).value,
+                "fields": list(fields) if fields else None,
+            },
+            lambda: self._simulate(
+                FlightModel,
+                flight_id,
+                flight.flight,
+                FlightSimulation,
+                FlightService.from_flight_model,
+                "get_flight_simulation",
+                timeout=SIMULATION_JOB_TIMEOUT,
+                points=points,
+                method=method,
+                fields=fields,
+            ),
+        )
+
+    async def _load_study_flight(
+        self, flight_id: str, paths: List[str]
+    ) -> Tuple[FlightModel, List[float]]:
+        flight = await self.get_flight_by_id(flight_id)
+        flight_model = FlightModel.model_validate(
+            flight.flight.model_dump(exclude={"flight_id"})
+        )
+        try:
+            nominal = FlightStudyService.nominal_values(flight_model, paths)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+        return flight_model, nominal
+
+    @staticmethod
+    async def _run_flight_study(
+        flight_model: FlightModel,
+        paths: List[str],
+        samples: np.ndarray,
+        outputs: Tuple[str, ...],
+    ) -> np.ndarray:
+        """
+        Simulate every row of ``samples`` on the simulation workers, one
+        contiguous batch per worker, and stack their scalar outputs.
+
+        When a batch fails the others are cancelled, so batches still
+        waiting for a worker do not run for a study that already failed.
+        """
+        executor = get_simulation_executor()
+        batches = np.array_split(
+            samples, min(len(samples), executor.max_workers)
+        )
+        tasks = [
+            asyncio.ensure_future(
+                executor.run(
+                    FlightStudyService.from_flight_model,
+                    flight_model,
+                    "get_sample_outputs",
+                    paths,
+                    batch,
+                    outputs,
+                    timeout=SIMULATION_JOB_TIMEOUT,
+                )
+            )
+            for batch in batches
+        ]
+        try:
+            return np.concatenate(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @controller_exception_handler
+    async def post_flight_monte_carlo(
+        self,
+        flight_id: str,
+        payload: FlightMonteCarloRequest,
+    ) -> FlightMonteCarloSimulation:
+        """
+        Run a Monte Carlo dispersion study around a stored flight.
+
+        Samples are split into one batch per simulation worker and only
+        per-sample scalar outputs travel back, so the response holds
+        summary statistics instead of the individual simulations.
+
+        Args:
+            flight_id: str
+            payload: models.FlightMonteCarloRequest
+
+        Returns:
+            views.FlightMonteCarloSimulation
+
+        Raises:
+            HTTP 404 Not Found: If the flight does not exist in the database.
+            HTTP 422 Unprocessable Entity: If a dispersion path is not a
+                numeric field, samples exceeds MONTE_CARLO_MAX_SAMPLES or
+                every sample failed.
+        """
+        if payload.samples > MONTE_CARLO_MAX_SAMPLES:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"samples must not exceed {MONTE_CARLO_MAX_SAMPLES}",
+            )
+        paths = [dispersion.path for dispersion in payload.dispersions]
+        flight_model, nominal = await self._load_study_flight(flight_id, paths)
+        draws = FlightStudyService.draw_samples(
+            payload.dispersions, nominal, payload.samples, payload.seed
+        )
+        outputs = await self._run_flight_study(
+            flight_model, paths, draws, MONTE_CARLO_OUTPUTS
+        )
+        try:
+            return FlightStudyService.summarize_monte_carlo(
+                outputs, payload.percentiles, payload.seed
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            ) from e
+
+    @controller_exception_handler
+    async def post_flight_sweep(
+        self,
+        flight_id: str,
+        payload: FlightSweepRequest,
+    ) -> FlightSweepSimulation:
+        """
+        Simulate a stored flight over the cartesian product of swept
+        field values.
+
+        Grid points are batched like Monte Carlo samples; the response
+        is a columnar table with one row per grid point.
+
+        Args:
+            flight_id: str
+            payload: models.FlightSweepRequest
+
+        Returns:
+            views.FlightSweepSimulation
+
+        Raises:
+            HTTP 404 Not Found: If the flight does not exist in the database.
+            HTTP 422 Unprocessable Entity: If a swept path is not a numeric
+                field or the grid exceeds SWEEP_MAX_POINTS.
+        """
+        if payload.get_points() > SWEEP_MAX_POINTS:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"sweep points must not exceed {SWEEP_MAX_POINTS}",
+            )
+        paths = [parameter.path for parameter in payload.parameters]
+        flight_model, nominal = await self._load_study_flight(flight_id, paths)
+        grid = FlightStudyService.sweep_grid(
+            [parameter.get_values() for parameter in payload.parameters],
+            nominal,
+        )
+        outputs = tuple(output.value for output in payload.outputs)
+        results = await self._run_flight_study(
+            flight_model, paths, grid, outputs
+        )
+        return FlightStudyService.tabulate_sweep(paths, grid, outputs, results)
 
     async def _persist_model(self, model_cls, model_instance) -> str:
         repo_cls = RepositoryInterface.get_model_repo(model_cls)
@@ -194,6 +809,35 @@ class FlightController(ControllerBase):
             creator = getattr(repo, f"create_{model_cls.NAME}")
             return await creator(model_instance)
 
+    async def _persist_models(self, *models) -> List[str]:
+        """
+        Persist (model class, model instance) pairs.
+
+        The inserts are independent, so they run concurrently; with
+        RPY_IMPORT_TRANSACTION they run one after the other in a single
+        transaction instead, so either every model is stored or none is.
+
+        Returns:
+            Inserted ids, in order.
+        """
+        if not RPY_IMPORT_TRANSACTION:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._persist_model(model_cls, model_instance)
+                        for model_cls, model_instance in models
+                    )
+                )
+            )
+
+        async def persist_in_order() -> List[str]:
+            return [
+                await self._persist_model(model_cls, model_instance)
+                for model_cls, model_instance in models
+            ]
+
+        return await run_in_transaction(persist_in_order)
+
     @controller_exception_handler
     async def import_flight_from_rpy(
         self,
@@ -224,10 +868,12 @@ class FlightController(ControllerBase):
 
         env, motor, rocket, flight = flight_service.extract_models()
 
-        env_id = await self._persist_model(EnvironmentModel, env)
-        motor_id = await self._persist_model(MotorModel, motor)
-        rocket_id = await self._persist_model(RocketModel, rocket)
-        flight_id = await self._persist_model(FlightModel, flight)
+        env_id, motor_id, rocket_id, flight_id = await self._persist_models(
+            (EnvironmentModel, env),
+            (MotorModel, motor),
+            (RocketModel, rocket),
+            (FlightModel, flight),
+        )
 
         return FlightImported(
             flight_id=flight_id,
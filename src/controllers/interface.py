@@ -1,12 +1,75 @@
+import asyncio
 import functools
-from typing import List
+import json
+import zlib
+from datetime import datetime
+from importlib.metadata import version
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from bson import ObjectId
 from pymongo.errors import PyMongoError
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from src import logger
+from src.cache import model_hash
+from src.compression import PrecompressedBody
+from src.models.environment import weather_cycle
+from src.models.flight import FlightModel
 from src.models.interface import ApiBaseModel
-from src.views.interface import ApiBaseView
+from src.models.job import JobModel, JobStatus
+from src.models.simulation import SimulationCacheModel
+from src.views.interface import (
+    ApiBaseView,
+    BulkCreated,
+    BulkDeleted,
+    BulkItemStatus,
+    DocumentPage,
+)
 from src.repositories.interface import RepositoryInterface
+from src.repositories.job import JOB_HEARTBEAT_SECONDS
+from src.secrets import Secrets
+from src.services.executor import get_simulation_executor
+from src.utils import iter_model_json
+
+# Part of every simulation cache key: a RocketPy upgrade may change results.
+ROCKETPY_VERSION = version("rocketpy")
+
+# Background jobs are not bound by an HTTP request, so they may run for
+# longer than SIMULATION_TIMEOUT.
+SIMULATION_JOB_TIMEOUT = float(
+    Secrets.get_secret("SIMULATION_JOB_TIMEOUT", 600)
+)
+
+# Size of the chunks streamed simulation responses are sent in.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Items one bulk create, read or delete request may carry.
+BULK_MAX_ITEMS = int(Secrets.get_secret("BULK_MAX_ITEMS", 500))
+
+# Strong references to running simulation jobs; asyncio only keeps weak
+# ones and would otherwise let a pending job be garbage collected.
+_background_jobs = set()
+
+
+def _compress_view(view: ApiBaseView) -> bytes:
+    """zlib-compressed JSON of a view, as simulation caches store it."""
+    return zlib.compress(view.model_dump_json().encode())
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
 
 
 def controller_exception_handler(method):
@@ -49,6 +112,13 @@ class ControllerBase:
         - put_{model_name}_by_id for PUT method
         - delete_{model_name}_by_id for DELETE method
 
+    Models listing bulk actions in BULK_METHODS also get:
+        - post_{model_name}_bulk for bulk POST
+        - get_{model_name}_by_ids for bulk GET
+        - delete_{model_name}_by_ids for bulk DELETE
+        - get_{model_name}_page and stream_{model_name}_documents for
+          listing, along with bulk GET
+
     """
 
     def __init__(self, models: List[ApiBaseModel]):
@@ -68,6 +138,15 @@ class ControllerBase:
                 method = self._generate_method(action.lower(), model)
                 setattr(self, method_name, method)
 
+            for action in model.BULK_METHODS:
+                method_name = (
+                    f"{action.lower()}_{model.NAME}_bulk"
+                    if action == "POST"
+                    else f"{action.lower()}_{model.NAME}_by_ids"
+                )
+                method = self._generate_method(f"{action.lower()}_bulk", model)
+                setattr(self, method_name, method)
+
     def _generate_method(self, action: str, model: ApiBaseModel):
         async def method(*args, **kwargs):
             handler = getattr(self, f"_{action}_model", None)
@@ -123,7 +202,23 @@ class ControllerBase:
             await getattr(repo, f'update_{model.NAME}_by_id')(
                 model_id, model_instance
             )
-            return model.UPDATED()
+        await self._invalidate_simulations(model, model_id)
+        return model.UPDATED()
+
+    @staticmethod
+    async def _find_referenced(
+        model: ApiBaseModel, model_ids: List[str]
+    ) -> Set[str]:
+        """
+        Returns:
+            Ids among ``model_ids`` that flights stored with references
+            point to; deleting them would break those flights.
+        """
+        flight_repo = RepositoryInterface.get_model_repo(FlightModel)
+        if model.NAME not in flight_repo.REFERENCES:
+            return set()
+        async with flight_repo() as repo:
+            return await repo.find_referenced_ids(model.NAME, model_ids)
 
     @controller_exception_handler
     async def _delete_model(
@@ -132,6 +227,510 @@ class ControllerBase:
         model_repo: RepositoryInterface,
         model_id: str,
     ) -> ApiBaseView:
+        if await self._find_referenced(model, [model_id]):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"{model.NAME} is referenced by flights",
+            )
         async with model_repo() as repo:
             await getattr(repo, f'delete_{model.NAME}_by_id')(model_id)
-            return model.DELETED()
+        await self._invalidate_simulations(model, model_id)
+        return model.DELETED()
+
+    @staticmethod
+    def _check_bulk_size(items: list):
+        if len(items) > BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Bulk requests are limited to {BULK_MAX_ITEMS} items",
+            )
+
+    @staticmethod
+    def _validate_bulk(
+        model: ApiBaseModel, documents: List[dict]
+    ) -> Tuple[List[Tuple[Optional[str], Optional[str]]], dict]:
+        """
+        Validate bulk documents one by one.
+
+        Returns:
+            One (None, error) pair per document, the error being None for
+            valid ones, and the dumps of the valid ones by position.
+        """
+        results = [(None, None)] * len(documents)
+        dumps = {}
+        for position, document in enumerate(documents):
+            try:
+                dumps[position] = model.model_validate(document).model_dump(
+                    exclude_none=True
+                )
+            except ValidationError as e:
+                results[position] = (None, str(e))
+        return results, dumps
+
+    @controller_exception_handler
+    async def _post_bulk_model(
+        self,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        documents: List[dict],
+    ) -> BulkCreated:
+        self._check_bulk_size(documents)
+        results, dumps = self._validate_bulk(model, documents)
+        if dumps:
+            async with model_repo() as repo:
+                inserted = await repo.insert_many(
+                    list(dumps.values()), validated=True
+                )
+            for position, result in zip(dumps, inserted):
+                results[position] = result
+        items = [
+            (
+                BulkItemStatus(id=inserted_id, status=status.HTTP_201_CREATED)
+                if inserted_id is not None
+                else BulkItemStatus(
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=error
+                )
+            )
+            for inserted_id, error in results
+        ]
+        created = sum(item.id is not None for item in items)
+        return BulkCreated(
+            created=created, failed=len(items) - created, items=items
+        )
+
+    @controller_exception_handler
+    async def _get_bulk_model(
+        self,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        model_ids: List[str],
+    ) -> ApiBaseView:
+        self._check_bulk_size(model_ids)
+        async with model_repo() as repo:
+            found = await repo.find_by_ids(model_ids)
+        items = [
+            (
+                BulkItemStatus(id=model_id, status=status.HTTP_200_OK)
+                if model_id in found
+                else BulkItemStatus(
+                    id=model_id,
+                    status=status.HTTP_404_NOT_FOUND,
+                    detail=f"{model.NAME} not found",
+                )
+            )
+            for model_id in model_ids
+        ]
+        return model.RETRIEVED_MANY(
+            [
+                found[model_id]
+                for model_id in dict.fromkeys(model_ids)
+                if model_id in found
+            ],
+            items,
+        )
+
+    @controller_exception_handler
+    async def _delete_bulk_model(
+        self,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        model_ids: List[str],
+    ) -> BulkDeleted:
+        self._check_bulk_size(model_ids)
+        referenced = await self._find_referenced(model, model_ids)
+        async with model_repo() as repo:
+            deleted = await repo.delete_by_ids(
+                [
+                    model_id
+                    for model_id in model_ids
+                    if model_id not in referenced
+                ]
+            )
+        if deleted:
+            simulation_repo = RepositoryInterface.get_model_repo(
+                SimulationCacheModel
+            )
+            async with simulation_repo() as repo:
+                await repo.delete_simulations_by_owners(
+                    [f"{model.NAME}:{model_id}" for model_id in deleted]
+                )
+        items = [
+            (
+                BulkItemStatus(id=model_id, status=status.HTTP_204_NO_CONTENT)
+                if model_id in deleted
+                else (
+                    BulkItemStatus(
+                        id=model_id,
+                        status=status.HTTP_409_CONFLICT,
+                        detail=f"{model.NAME} is referenced by flights",
+                    )
+                    if model_id in referenced
+                    else BulkItemStatus(
+                        id=model_id,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail=f"{model.NAME} not found",
+                    )
+                )
+            )
+            for model_id in model_ids
+        ]
+        return BulkDeleted(deleted=len(deleted), items=items)
+
+    @staticmethod
+    def _check_document_query(
+        model: ApiBaseModel,
+        after: Optional[str],
+        fields: Optional[Tuple[str, ...]],
+    ):
+        if after is not None and not ObjectId.is_valid(after):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid page cursor",
+            )
+        if not fields:
+            return
+        unknown_fields = sorted(
+            {field.split(".")[0] for field in fields}.difference(
+                model.model_fields
+            )
+        )
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown {model.NAME} fields: "
+                + ", ".join(unknown_fields),
+            )
+
+    @staticmethod
+    def _document_view(model: ApiBaseModel, document: dict) -> dict:
+        document[f"{model.NAME}_id"] = str(document.pop("_id"))
+        return document
+
+    @controller_exception_handler
+    async def _get_page_model(
+        self,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        after: Optional[str] = None,
+        limit: int = 50,
+        fields: Optional[Tuple[str, ...]] = None,
+        resolve: bool = True,
+    ) -> DocumentPage:
+        self._check_document_query(model, after, fields)
+        async with model_repo() as repo:
+            # One extra document tells whether another page follows.
+            documents = await repo.find_page(
+                after=after, limit=limit + 1, fields=fields, resolve=resolve
+            )
+        next_cursor = (
+            str(documents[limit - 1]["_id"])
+            if len(documents) > limit
+            else None
+        )
+        return DocumentPage(
+            documents=[
+                self._document_view(model, document)
+                for document in documents[:limit]
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @controller_exception_handler
+    async def _stream_model(
+        self,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        after: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        resolve: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """
+        Validate a listing and return an iterator over its documents as
+        NDJSON lines.
+
+        Documents are read from the cursor a batch at a time, so memory
+        stays flat however large the collection is. Query errors are
+        raised here, before a streaming response starts.
+        """
+        self._check_document_query(model, after, fields)
+        return self._iter_ndjson(model, model_repo, after, fields, resolve)
+
+    @classmethod
+    async def _iter_ndjson(
+        cls,
+        model: ApiBaseModel,
+        model_repo: RepositoryInterface,
+        after: Optional[str],
+        fields: Optional[Tuple[str, ...]],
+        resolve: bool = True,
+    ) -> AsyncIterator[bytes]:
+        async with model_repo() as repo:
+            async for document in repo.iter_documents(
+                after=after, fields=fields, resolve=resolve
+            ):
+                line = json.dumps(
+                    cls._document_view(model, document),
+                    default=_json_default,
+                )
+                yield line.encode() + b"\n"
+
+    @staticmethod
+    async def _invalidate_simulations(model: ApiBaseModel, model_id: str):
+        simulation_repo = RepositoryInterface.get_model_repo(
+            SimulationCacheModel
+        )
+        async with simulation_repo() as repo:
+            await repo.delete_simulations_by_owner(f"{model.NAME}:{model_id}")
+
+    @staticmethod
+    def _check_simulation_fields(view: type[ApiBaseView], fields):
+        if not fields:
+            return
+        unknown_fields = sorted(set(fields).difference(view.model_fields))
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Unknown simulation fields: "
+                + ", ".join(unknown_fields),
+            )
+
+    async def _simulate(
+        self,
+        model: ApiBaseModel,
+        model_id: str,
+        model_instance: ApiBaseModel,
+        view: type[ApiBaseView],
+        factory: Callable,
+        method_name: str,
+        *,
+        timeout: Optional[float] = None,
+        encoded: bool = False,
+        **options,
+    ) -> Union[ApiBaseView, PrecompressedBody]:
+        """
+        Run a service simulation through the simulation cache.
+
+        Results are keyed by the content hash of ``model_instance``, so
+        unchanged designs are served from the in-process or Mongo tier
+        and only new designs reach the simulation executor.
+
+        Args:
+            model: API model class owning the simulated document.
+            model_id: id of the simulated document.
+            model_instance: model handed to ``factory``.
+            view: simulation view class returned by ``method_name``.
+            factory: service constructor, e.g. FlightService.from_flight_model.
+            method_name: service method producing the view.
+            timeout: executor timeout override, in seconds.
+            encoded: return the serialized view as cached, skipping its
+                validation and serialization on cache hits.
+            options: keyword arguments for ``method_name``; they are part
+                of the cache key. ``fields`` is checked against ``view``.
+
+        Returns:
+            The simulation view, or its PrecompressedBody when
+            ``encoded``; the cache key is the body's ETag.
+
+        Raises:
+            HTTP 422 Unprocessable Entity: If ``fields`` names attributes
+                the view does not have.
+        """
+        self._check_simulation_fields(view, options.get("fields"))
+        key = self._simulation_key(model_instance, view, options)
+        body = await self._read_cached_simulation(key)
+        if body is not None:
+            if encoded:
+                return body
+            return view.model_validate_json(body.content())
+
+        simulation = await get_simulation_executor().run(
+            factory, model_instance, method_name, timeout=timeout, **options
+        )
+        payload = await run_in_threadpool(_compress_view, simulation)
+        await self._cache_simulation(model, model_id, key, payload)
+        if encoded:
+            return PrecompressedBody(key, payload)
+        return simulation
+
+    async def _stream_simulation(
+        self,
+        model: ApiBaseModel,
+        model_id: str,
+        model_instance: ApiBaseModel,
+        view: type[ApiBaseView],
+        factory: Callable,
+        method_name: str,
+        **options,
+    ) -> AsyncIterator[bytes]:
+        """
+        Like ``_simulate``, but return an iterator over the JSON of the
+        view, in chunks of up to STREAM_CHUNK_BYTES.
+
+        Cached results are decompressed a chunk at a time; new ones are
+        serialized field by field and compressed into their cache entry
+        as they are sent. The simulation runs before the iterator is
+        returned, so its errors are raised here; the worker still builds
+        the whole view and sends it back in one piece, so only the JSON
+        string is never held whole.
+        """
+        self._check_simulation_fields(view, options.get("fields"))
+        key = self._simulation_key(model_instance, view, options)
+        body = await self._read_cached_simulation(key)
+        if body is not None:
+            return self._iter_cached_simulation(body)
+        simulation = await get_simulation_executor().run(
+            factory, model_instance, method_name, **options
+        )
+        return self._iter_simulation(model, model_id, key, simulation)
+
+    @staticmethod
+    def _simulation_key(
+        model_instance: ApiBaseModel, view: type[ApiBaseView], options: dict
+    ) -> str:
+        weather = weather_cycle(model_instance)
+        if weather is not None:
+            options = {**options, "weather": weather}
+        return model_hash(
+            model_instance,
+            view=view.__name__,
+            rocketpy=ROCKETPY_VERSION,
+            **options,
+        )
+
+    @staticmethod
+    async def _read_cached_simulation(key: str) -> Optional[PrecompressedBody]:
+        simulation_repo = RepositoryInterface.get_model_repo(
+            SimulationCacheModel
+        )
+        async with simulation_repo() as repo:
+            return await repo.read_simulation_body_by_key(key)
+
+    @staticmethod
+    async def _cache_simulation(
+        model: ApiBaseModel, model_id: str, key: str, payload: bytes
+    ):
+        simulation_repo = RepositoryInterface.get_model_repo(
+            SimulationCacheModel
+        )
+        entry = SimulationCacheModel(
+            key=key, owner=f"{model.NAME}:{model_id}", payload=payload
+        )
+        try:
+            async with simulation_repo() as repo:
+                await repo.create_simulation(entry)
+        except PyMongoError:
+            # A cold cache is not worth failing a finished simulation over.
+            logger.warning(f"Could not persist simulation {key}")
+
+    @staticmethod
+    async def _iter_cached_simulation(
+        body: PrecompressedBody,
+    ) -> AsyncIterator[bytes]:
+        for chunk in body.iter_content(STREAM_CHUNK_BYTES):
+            yield chunk
+
+    @classmethod
+    async def _iter_simulation(
+        cls,
+        model: ApiBaseModel,
+        model_id: str,
+        key: str,
+        simulation: ApiBaseView,
+    ) -> AsyncIterator[bytes]:
+        compressor = zlib.compressobj()
+        payload = []
+        buffer = bytearray()
+        for piece in iter_model_json(simulation):
+            buffer += piece
+            if len(buffer) >= STREAM_CHUNK_BYTES:
+                payload.append(compressor.compress(buffer))
+                yield bytes(buffer)
+                buffer.clear()
+        payload.append(compressor.compress(buffer))
+        payload.append(compressor.flush())
+        yield bytes(buffer)
+        await cls._cache_simulation(model, model_id, key, b"".join(payload))
+
+    async def _submit_job(
+        self,
+        model: ApiBaseModel,
+        model_id: str,
+        options: dict,
+        simulate: Callable[[], Awaitable[ApiBaseView]],
+    ) -> ApiBaseView:
+        """
+        Persist a simulation job and run ``simulate`` in the background.
+
+        The job document is created before returning, so its id can be
+        polled from any worker; progress and the result are written back
+        to it by ``_run_job``.
+
+        Args:
+            model: API model class owning the simulated document.
+            model_id: id of the simulated document.
+            options: simulation parameters recorded on the job.
+            simulate: coroutine factory producing the simulation view.
+
+        Returns:
+            views.JobCreated
+        """
+        job_repo = RepositoryInterface.get_model_repo(JobModel)
+        async with job_repo() as repo:
+            job_id = await repo.create_job(
+                JobModel(kind=model.NAME, target_id=model_id, options=options)
+            )
+        task = asyncio.create_task(self._run_job(job_id, simulate))
+        _background_jobs.add(task)
+        task.add_done_callback(_background_jobs.discard)
+        return JobModel.CREATED(job_id)
+
+    @staticmethod
+    async def _beat_job(job_id: str):
+        """Renew the lease of a running job until cancelled."""
+        job_repo = RepositoryInterface.get_model_repo(JobModel)
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+            try:
+                async with job_repo() as repo:
+                    await repo.renew_job_lease(job_id)
+            except PyMongoError:
+                logger.warning(f"Could not renew the lease of job {job_id}")
+
+    @classmethod
+    async def _run_job(
+        cls, job_id: str, simulate: Callable[[], Awaitable[ApiBaseView]]
+    ):
+        job_repo = RepositoryInterface.get_model_repo(JobModel)
+        try:
+            async with job_repo() as repo:
+                await repo.update_job_status(job_id, JobStatus.RUNNING)
+                heartbeat = asyncio.create_task(cls._beat_job(job_id))
+                try:
+                    simulation = await simulate()
+                except HTTPException as e:
+                    await repo.update_job_status(
+                        job_id,
+                        JobStatus.FAILED,
+                        error_status=e.status_code,
+                        error=str(e.detail),
+                    )
+                    return
+                finally:
+                    heartbeat.cancel()
+                await repo.update_job_status(
+                    job_id,
+                    JobStatus.SUCCEEDED,
+                    result=await run_in_threadpool(_compress_view, simulation),
+                )
+        except Exception as e:
+            logger.exception(f"Simulation job {job_id} failed: {e}")
+            try:
+                async with job_repo() as repo:
+                    await repo.update_job_status(
+                        job_id,
+                        JobStatus.FAILED,
+                        error_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        error="Unexpected error",
+                    )
+            except PyMongoError:
+                logger.error(f"Could not record failure of job {job_id}")
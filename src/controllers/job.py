@@ -0,0 +1,27 @@
+from src.controllers.interface import ControllerBase
+from src.models.job import JobModel
+from src.repositories.interface import RepositoryInterface
+
+
+class JobController(ControllerBase):
+    """
+    Controller for the Job model.
+
+    Enables:
+        - Polling background simulation jobs and fetching their results.
+    """
+
+    def __init__(self):
+        super().__init__(models=[JobModel])
+
+    @staticmethod
+    async def fail_orphaned_jobs() -> int:
+        """
+        Mark the jobs of workers that restarted or stopped as failed.
+
+        Returns:
+            Number of jobs marked as failed.
+        """
+        job_repo = RepositoryInterface.get_model_repo(JobModel)
+        async with job_repo() as repo:
+            return await repo.fail_orphaned_jobs()
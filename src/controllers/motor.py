@@ -1,10 +1,15 @@
+from typing import Optional, Tuple, Union
+
+from src.compression import PrecompressedBody
 from src.controllers.interface import (
     ControllerBase,
     controller_exception_handler,
 )
 from src.views.motor import MotorSimulation, MotorDrawingGeometryView
 from src.models.motor import MotorModel
+from src.services.executor import get_simulation_executor
 from src.services.motor import MotorService
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 
 class MotorController(ControllerBase):
@@ -37,26 +42,49 @@ class MotorController(ControllerBase):
             HTTP 404 Not Found: If the motor is not found in the database.
         """
         motor = await self.get_motor_by_id(motor_id)
-        motor_service = MotorService.from_motor_model(motor.motor)
-        return motor_service.get_motor_binary()
+        return await get_simulation_executor().run(
+            MotorService.from_motor_model, motor.motor, "get_motor_binary"
+        )
 
     @controller_exception_handler
-    async def get_motor_simulation(self, motor_id: str) -> MotorSimulation:
+    async def get_motor_simulation(
+        self,
+        motor_id: str,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+        encoded: bool = False,
+    ) -> Union[MotorSimulation, PrecompressedBody]:
         """
         Simulate a rocketpy motor.
 
         Args:
             motor_id: str
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
+            encoded: return the cached serialized view instead.
 
         Returns:
-            views.MotorSimulation
+            views.MotorSimulation, or its PrecompressedBody when
+            ``encoded``.
 
         Raises:
             HTTP 404 Not Found: If the motor does not exist in the database.
         """
         motor = await self.get_motor_by_id(motor_id)
-        motor_service = MotorService.from_motor_model(motor.motor)
-        return motor_service.get_motor_simulation()
+        return await self._simulate(
+            MotorModel,
+            motor_id,
+            motor.motor,
+            MotorSimulation,
+            MotorService.from_motor_model,
+            "get_motor_simulation",
+            points=points,
+            method=method,
+            fields=fields,
+            encoded=encoded,
+        )
 
     @controller_exception_handler
     async def get_motor_drawing_geometry(
@@ -79,5 +107,6 @@ class MotorController(ControllerBase):
             HTTP 422: If the motor has no drawable geometry.
         """
         motor = await self.get_motor_by_id(motor_id)
-        motor_service = MotorService.from_motor_model(motor.motor)
-        return motor_service.get_drawing_geometry()
+        return await get_simulation_executor().run(
+            MotorService.from_motor_model, motor.motor, "get_drawing_geometry"
+        )
@@ -1,5 +1,8 @@
+from typing import Optional, Tuple, Union
+
 from fastapi import HTTPException, status
 
+from src.compression import PrecompressedBody
 from src.controllers.interface import (
     ControllerBase,
     controller_exception_handler,
@@ -15,7 +18,9 @@ from src.models.rocket import (
     RocketWithMotorReferenceRequest,
 )
 from src.repositories.interface import RepositoryInterface
+from src.services.executor import get_simulation_executor
 from src.services.rocket import RocketService
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 
 class RocketController(ControllerBase):
@@ -76,8 +81,9 @@ class RocketController(ControllerBase):
             HTTP 404 Not Found: If the rocket is not found in the database.
         """
         rocket = await self.get_rocket_by_id(rocket_id)
-        rocket_service = RocketService.from_rocket_model(rocket.rocket)
-        return rocket_service.get_rocket_binary()
+        return await get_simulation_executor().run(
+            RocketService.from_rocket_model, rocket.rocket, "get_rocket_binary"
+        )
 
     @controller_exception_handler
     async def get_rocket_drawing_geometry(
@@ -97,26 +103,48 @@ class RocketController(ControllerBase):
             HTTP 422: If the rocket has no aerodynamic surfaces to draw.
         """
         rocket = await self.get_rocket_by_id(rocket_id)
-        rocket_service = RocketService.from_rocket_model(rocket.rocket)
-        return rocket_service.get_drawing_geometry()
+        return await get_simulation_executor().run(
+            RocketService.from_rocket_model,
+            rocket.rocket,
+            "get_drawing_geometry",
+        )
 
     @controller_exception_handler
     async def get_rocket_simulation(
         self,
         rocket_id: str,
-    ) -> RocketSimulation:
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Tuple[str, ...]] = None,
+        encoded: bool = False,
+    ) -> Union[RocketSimulation, PrecompressedBody]:
         """
         Simulate a rocketpy rocket.
 
         Args:
             rocket_id: str
+            points: samples kept per curve.
+            method: curve downsampling method.
+            fields: simulation attributes to compute (None for all).
+            encoded: return the cached serialized view instead.
 
         Returns:
-            views.RocketSimulation
+            views.RocketSimulation, or its PrecompressedBody when
+            ``encoded``.
 
         Raises:
             HTTP 404 Not Found: If the rocket does not exist in the database.
         """
         rocket = await self.get_rocket_by_id(rocket_id)
-        rocket_service = RocketService.from_rocket_model(rocket.rocket)
-        return rocket_service.get_rocket_simulation()
+        return await self._simulate(
+            RocketModel,
+            rocket_id,
+            rocket.rocket,
+            RocketSimulation,
+            RocketService.from_rocket_model,
+            "get_rocket_simulation",
+            points=points,
+            method=method,
+            fields=fields,
+            encoded=encoded,
+        )
@@ -1,12 +1,22 @@
+from enum import Enum
 from functools import cache
-from typing import Annotated
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
-from fastapi import Depends
+from fastapi import Body, Depends, Header, HTTPException, Query, status
 
+from src.controllers.admin import AdminController
 from src.controllers.rocket import RocketController
 from src.controllers.motor import MotorController
 from src.controllers.environment import EnvironmentController
 from src.controllers.flight import FlightController
+from src.controllers.interface import BULK_MAX_ITEMS
+from src.controllers.job import JobController
+from src.secrets import Secrets
+from src.services.timeseries import TimeseriesFormat
+from src.utils import MAX_CURVE_POINTS, CurveDownsampling
+
+# Admin endpoints explain arbitrary queries, so they are opt-in.
+ADMIN_ENDPOINTS = Secrets.get_flag("ADMIN_ENDPOINTS")
 
 
 @cache
@@ -56,6 +66,41 @@ def get_flight_controller() -> FlightController:
     return FlightController()
 
 
+@cache
+def get_job_controller() -> JobController:
+    """
+    Provides a singleton JobController instance.
+
+    Returns:
+        JobController: Shared controller instance for simulation jobs.
+    """
+    return JobController()
+
+
+@cache
+def get_admin_controller() -> AdminController:
+    """
+    Provides a singleton AdminController instance.
+
+    Returns:
+        AdminController: Shared controller instance for administration.
+    """
+    return AdminController()
+
+
+def check_admin_endpoints():
+    """
+    Hides the admin endpoints unless ADMIN_ENDPOINTS is set.
+
+    Raises:
+        HTTP 404 Not Found: If admin endpoints are turned off.
+    """
+    if not ADMIN_ENDPOINTS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Not Found"
+        )
+
+
 RocketControllerDep = Annotated[
     RocketController, Depends(get_rocket_controller)
 ]
@@ -66,3 +111,272 @@ EnvironmentControllerDep = Annotated[
 FlightControllerDep = Annotated[
     FlightController, Depends(get_flight_controller)
 ]
+JobControllerDep = Annotated[JobController, Depends(get_job_controller)]
+AdminControllerDep = Annotated[AdminController, Depends(get_admin_controller)]
+
+CurvePointsQuery = Annotated[
+    int,
+    Query(
+        ge=2,
+        le=MAX_CURVE_POINTS,
+        description="Samples kept per simulation curve.",
+    ),
+]
+CurveMethodQuery = Annotated[
+    CurveDownsampling,
+    Query(
+        description=(
+            "Curve reduction: uniform resampling, Largest-Triangle-"
+            "Three-Buckets (lttb) or per-bucket min/max (minmax)."
+        ),
+    ),
+]
+
+
+def get_simulation_fields(
+    fields: Annotated[
+        Optional[str],
+        Query(
+            description=(
+                "Comma-separated simulation attributes to compute, "
+                "e.g. apogee,x_impact. All attributes when omitted."
+            ),
+        ),
+    ] = None,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parses the ``fields`` projection of simulation endpoints.
+
+    Returns:
+        Sorted, de-duplicated field names, or None for every field.
+    """
+    if fields is None:
+        return None
+    selected = {field.strip() for field in fields.split(",")} - {""}
+    return tuple(sorted(selected)) or None
+
+
+SimulationFieldsDep = Annotated[
+    Optional[Tuple[str, ...]], Depends(get_simulation_fields)
+]
+
+
+def get_timeseries_columns(
+    columns: Annotated[
+        Optional[str],
+        Query(
+            description=(
+                "Comma-separated derived flight curves added to the "
+                "solution columns, e.g. altitude,mach_number."
+            ),
+        ),
+    ] = None,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parses the ``columns`` of flight time series exports.
+
+    Returns:
+        De-duplicated curve names in request order, or None for the
+        default curves.
+    """
+    if columns is None:
+        return None
+    return tuple(
+        dict.fromkeys(filter(None, map(str.strip, columns.split(","))))
+    )
+
+
+TimeseriesColumnsDep = Annotated[
+    Optional[Tuple[str, ...]], Depends(get_timeseries_columns)
+]
+TimeseriesFormatQuery = Annotated[
+    TimeseriesFormat,
+    Query(
+        alias="format",
+        description=(
+            "File format of the table: arrow (IPC file), parquet, npz "
+            "or csv."
+        ),
+    ),
+]
+
+
+def get_bulk_ids(
+    ids: Annotated[
+        Optional[str],
+        Query(
+            min_length=1,
+            description=(
+                "Comma-separated ids, e.g. 65f0...,65f1...; reads these "
+                "documents instead of a page."
+            ),
+        ),
+    ] = None,
+) -> Optional[List[str]]:
+    """
+    Parses the ``ids`` query of bulk reads.
+
+    Returns:
+        De-duplicated ids in request order, or None to list a page.
+    """
+    if ids is None:
+        return None
+    return list(dict.fromkeys(filter(None, map(str.strip, ids.split(",")))))
+
+
+def get_document_fields(
+    fields: Annotated[
+        Optional[str],
+        Query(
+            description=(
+                "Comma-separated document fields to return, e.g. "
+                "name,latitude. Whole documents when omitted."
+            ),
+        ),
+    ] = None,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parses the ``fields`` projection of list endpoints.
+
+    Returns:
+        Sorted, de-duplicated field names, or None for whole documents.
+    """
+    return get_simulation_fields(fields)
+
+
+class ListFormat(str, Enum):
+    """Response format of list endpoints."""
+
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+DEFAULT_PAGE_LIMIT = 50
+
+BulkIdsDep = Annotated[Optional[List[str]], Depends(get_bulk_ids)]
+DocumentFieldsDep = Annotated[
+    Optional[Tuple[str, ...]], Depends(get_document_fields)
+]
+PageCursorQuery = Annotated[
+    Optional[str],
+    Query(
+        description=(
+            "next_cursor of the previous page; lists from the start when "
+            "omitted."
+        ),
+    ),
+]
+PageLimitQuery = Annotated[
+    int,
+    Query(ge=1, le=BULK_MAX_ITEMS, description="Documents per page."),
+]
+ListFormatQuery = Annotated[
+    ListFormat,
+    Query(
+        description=(
+            "json for one page, ndjson to stream every document after the "
+            "cursor, one per line."
+        ),
+    ),
+]
+KmlMaxPointsQuery = Annotated[
+    Optional[int],
+    Query(
+        ge=3,
+        description=(
+            "Trajectory points kept, chosen to preserve the apogee and "
+            "the shape of the path; every integration step when omitted."
+        ),
+    ),
+]
+KmzQuery = Annotated[
+    bool,
+    Query(description="Whether the KML is zipped into a KMZ archive."),
+]
+StreamSimulationQuery = Annotated[
+    bool,
+    Query(
+        description=(
+            "Whether the simulation is streamed as it is serialized, "
+            "without ETag; avoids building the whole JSON string, but a "
+            "new simulation is still computed in full before the first "
+            "chunk is sent."
+        ),
+    ),
+]
+ResolveReferencesQuery = Annotated[
+    bool,
+    Query(
+        description=(
+            "Whether referenced components are read into each document; "
+            "false returns their ids only."
+        ),
+    ),
+]
+
+
+def get_if_match_version(
+    if_match: Annotated[
+        Optional[str],
+        Header(
+            description=(
+                "Version the document must still be at, from its "
+                'version field, e.g. "3".'
+            ),
+        ),
+    ] = None,
+) -> Optional[int]:
+    """
+    Parses the ``If-Match`` header of versioned updates.
+
+    Returns:
+        Expected document version, or None to skip the check.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    version = if_match.strip().removeprefix("W/").strip('"')
+    if not version.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="If-Match must be a document version",
+        )
+    return int(version)
+
+
+IfMatchVersionDep = Annotated[Optional[int], Depends(get_if_match_version)]
+AcceptEncodingHeader = Annotated[
+    Optional[str],
+    Header(description="Content codings the client accepts, e.g. zstd, gzip."),
+]
+IfNoneMatchHeader = Annotated[
+    Optional[str],
+    Header(
+        description=(
+            "ETag of a simulation the client already has; answered with "
+            "304 Not Modified while it is current."
+        ),
+    ),
+]
+MergePatchBody = Annotated[
+    Dict[str, Any],
+    Body(
+        media_type="application/merge-patch+json",
+        description=(
+            "JSON merge patch (RFC 7386): objects are merged, null "
+            "removes a field and other values replace it."
+        ),
+    ),
+]
+BulkDocumentsBody = Annotated[
+    List[Dict[str, Any]],
+    Body(
+        description=(
+            "Documents to create; each one is validated on its own and "
+            "reported with 422 in items when invalid."
+        ),
+    ),
+]
+BulkIdsBody = Annotated[
+    List[str],
+    Body(min_length=1, description="Ids of the documents to delete."),
+]
@@ -0,0 +1,11 @@
+from typing import Any, Dict, Literal
+
+from pydantic import BaseModel, Field
+
+
+class QueryExplainRequest(BaseModel):
+    """Query to explain against one collection, as MongoDB find() takes it."""
+
+    filter: Dict[str, Any] = Field(default_factory=dict)
+    sort: Dict[str, Literal[1, -1]] = Field(default_factory=dict)
+    limit: int = Field(default=0, ge=0)
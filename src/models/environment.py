@@ -1,17 +1,55 @@
 from datetime import datetime, timezone, timedelta
-from typing import Optional, ClassVar, Self, Literal
-from pydantic import Field
+from typing import List, Optional, ClassVar, Self, Literal
+from pydantic import BaseModel, Field
 from src.models.interface import ApiBaseModel
 
+# Weather models publish a new run every WEATHER_CYCLE_HOURS hours.
+WEATHER_CYCLE_HOURS = 6
+
 
 def _default_future_datetime() -> datetime:
     """Factory function to create timezone-aware datetime one day in the future."""
     return datetime.now(timezone.utc) + timedelta(days=1)
 
 
+def weather_cycle(model: BaseModel) -> Optional[str]:
+    """
+    Weather run the atmosphere of ``model`` would be fetched from.
+
+    ``model`` is an environment or a model embedding one. Forecast,
+    reanalysis and ensemble atmospheres are downloaded when the
+    environment is built, so results computed from them only hold for
+    the run they were fetched from and this is part of their cache keys.
+
+    Returns:
+        str: start of the current weather cycle (UTC, ISO 8601), or
+        None when the atmosphere is not fetched.
+    """
+    env = getattr(model, 'environment', model)
+    if not isinstance(env, EnvironmentModel):
+        return None
+    if env.atmospheric_model_type not in env.FETCHED_ATMOSPHERIC_MODELS:
+        return None
+    now = datetime.now(timezone.utc)
+    return now.replace(
+        hour=now.hour - now.hour % WEATHER_CYCLE_HOURS,
+        minute=0,
+        second=0,
+        microsecond=0,
+    ).isoformat()
+
+
 class EnvironmentModel(ApiBaseModel):
     NAME: ClassVar = 'environment'
     METHODS: ClassVar = ('POST', 'GET', 'PUT', 'DELETE')
+    BULK_METHODS: ClassVar = ('POST', 'GET', 'DELETE')
+    INDEXES: ClassVar = (('atmospheric_model_type',),)
+    ARRAY_FIELDS: ClassVar = ('pressure', 'temperature', 'wind_u', 'wind_v')
+    FETCHED_ATMOSPHERIC_MODELS: ClassVar = (
+        'forecast',
+        'reanalysis',
+        'ensemble',
+    )
     latitude: float
     longitude: float
     elevation: Optional[float] = 0.0
@@ -51,8 +89,24 @@ class EnvironmentModel(ApiBaseModel):
         from src.views.environment import EnvironmentRetrieved, EnvironmentView
 
         return EnvironmentRetrieved(
-            environment=EnvironmentView(
-                environment_id=model_instance.get_id(),
-                **model_instance.model_dump(),
+            environment=model_instance.as_view(
+                EnvironmentView, environment_id=model_instance.get_id()
             )
         )
+
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        from src.views.environment import (
+            EnvironmentsRetrieved,
+            EnvironmentView,
+        )
+
+        return EnvironmentsRetrieved(
+            environments=[
+                model_instance.as_view(
+                    EnvironmentView, environment_id=model_instance.get_id()
+                )
+                for model_instance in model_instances
+            ],
+            items=items,
+        )
@@ -1,15 +1,23 @@
 import json
-from typing import Optional, Self, ClassVar, Literal
+from enum import Enum
+from typing import List, Optional, Self, ClassVar, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from src.models.interface import ApiBaseModel
 from src.models.rocket import RocketModel
 from src.models.environment import EnvironmentModel
+from src.secrets import Secrets
+
+SWEEP_MAX_POINTS = int(Secrets.get_secret("SWEEP_MAX_POINTS", 1000))
 
 
 class FlightModel(ApiBaseModel):
     NAME: ClassVar = "flight"
     METHODS: ClassVar = ("POST", "GET", "PUT", "DELETE")
+    BULK_METHODS: ClassVar = ("POST", "GET", "DELETE")
+    # environment_id and rocket_id are only set on flights stored with
+    # references; their indexes keep reference checks off full scans.
+    INDEXES: ClassVar = (("name",), ("environment_id",), ("rocket_id",))
 
     name: str = "flight"
     environment: EnvironmentModel
@@ -67,12 +75,29 @@ class FlightModel(ApiBaseModel):
         from src.views.flight import FlightRetrieved, FlightView
 
         return FlightRetrieved(
-            flight=FlightView(
+            flight=model_instance.as_view(
+                FlightView,
                 flight_id=model_instance.get_id(),
-                **model_instance.model_dump(),
+                version=model_instance.get_version(),
             )
         )
 
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        from src.views.flight import FlightsRetrieved, FlightView
+
+        return FlightsRetrieved(
+            flights=[
+                model_instance.as_view(
+                    FlightView,
+                    flight_id=model_instance.get_id(),
+                    version=model_instance.get_version(),
+                )
+                for model_instance in model_instances
+            ],
+            items=items,
+        )
+
     @field_validator('environment', mode='before')
     @classmethod
     def _coerce_environment(cls, value):
@@ -145,3 +170,168 @@ class FlightWithReferencesRequest(BaseModel):
             except json.JSONDecodeError as exc:
                 raise ValueError('Invalid JSON for flight payload') from exc
         return value
+
+
+class DispersionDistribution(str, Enum):
+    NORMAL = "normal"
+    UNIFORM = "uniform"
+    TRIANGULAR = "triangular"
+
+
+class FlightDispersion(BaseModel):
+    """
+    Distribution of one numeric field of a stored flight.
+
+    ``path`` walks the flight document, including its rocket, motor
+    and environment, as a JSON pointer or dotted path, e.g.
+    ``inclination``, ``rocket.motor.burn_time``,
+    ``/environment/elevation`` or ``rocket.parachutes.0.cd_s``.
+
+    normal: ``mean`` (defaults to the stored value) and ``std``.
+    uniform: ``low`` and ``high``.
+    triangular: ``low`` and ``high``, with the mode at the stored value.
+    """
+
+    path: str = Field(min_length=1)
+    distribution: DispersionDistribution = DispersionDistribution.NORMAL
+    mean: Optional[float] = None
+    std: Optional[float] = Field(default=None, ge=0)
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+    @model_validator(mode='after')
+    def _check_parameters(self):
+        if self.distribution == DispersionDistribution.NORMAL:
+            if self.std is None:
+                raise ValueError('normal dispersions require std')
+        elif self.low is None or self.high is None or self.low > self.high:
+            raise ValueError(
+                f'{self.distribution.value} dispersions require low <= high'
+            )
+        return self
+
+
+class FlightMonteCarloRequest(BaseModel):
+    """Payload for a Monte Carlo dispersion study of a stored flight."""
+
+    samples: int = Field(default=100, ge=2)
+    seed: Optional[int] = None
+    dispersions: List[FlightDispersion] = Field(min_length=1)
+    percentiles: List[float] = Field(default=[5, 25, 50, 75, 95])
+
+    @field_validator('dispersions')
+    @classmethod
+    def _check_unique_paths(cls, value):
+        paths = [dispersion.path for dispersion in value]
+        if len(set(paths)) != len(paths):
+            raise ValueError('each path can only be dispersed once')
+        return value
+
+    @field_validator('percentiles')
+    @classmethod
+    def _check_percentiles(cls, value):
+        if any(not 0 <= percentile <= 100 for percentile in value):
+            raise ValueError('percentiles must lie between 0 and 100')
+        return value
+
+
+class FlightScalarOutput(str, Enum):
+    APOGEE = "apogee"
+    APOGEE_TIME = "apogee_time"
+    APOGEE_X = "apogee_x"
+    APOGEE_Y = "apogee_y"
+    APOGEE_FREESTREAM_SPEED = "apogee_freestream_speed"
+    X_IMPACT = "x_impact"
+    Y_IMPACT = "y_impact"
+    Z_IMPACT = "z_impact"
+    IMPACT_VELOCITY = "impact_velocity"
+    T_FINAL = "t_final"
+    OUT_OF_RAIL_TIME = "out_of_rail_time"
+    OUT_OF_RAIL_VELOCITY = "out_of_rail_velocity"
+    OUT_OF_RAIL_STABILITY_MARGIN = "out_of_rail_stability_margin"
+    INITIAL_STABILITY_MARGIN = "initial_stability_margin"
+    MIN_STABILITY_MARGIN = "min_stability_margin"
+    MAX_STABILITY_MARGIN = "max_stability_margin"
+    MAX_SPEED = "max_speed"
+    MAX_SPEED_TIME = "max_speed_time"
+    MAX_MACH_NUMBER = "max_mach_number"
+    MAX_MACH_NUMBER_TIME = "max_mach_number_time"
+    MAX_ACCELERATION = "max_acceleration"
+    MAX_ACCELERATION_TIME = "max_acceleration_time"
+    MAX_DYNAMIC_PRESSURE = "max_dynamic_pressure"
+    MAX_DYNAMIC_PRESSURE_TIME = "max_dynamic_pressure_time"
+    MAX_REYNOLDS_NUMBER = "max_reynolds_number"
+    FRONTAL_SURFACE_WIND = "frontal_surface_wind"
+    LATERAL_SURFACE_WIND = "lateral_surface_wind"
+
+
+class FlightSweepParameter(BaseModel):
+    """
+    Values of one numeric flight field in a sweep, addressed like
+    ``FlightDispersion.path``.
+
+    Either list the ``values`` or give ``start``, ``stop`` and ``num``
+    for evenly spaced values, both ends included.
+    """
+
+    path: str = Field(min_length=1)
+    values: Optional[List[float]] = Field(
+        default=None, min_length=1, max_length=SWEEP_MAX_POINTS
+    )
+    start: Optional[float] = None
+    stop: Optional[float] = None
+    num: Optional[int] = Field(default=None, ge=1, le=SWEEP_MAX_POINTS)
+
+    @model_validator(mode='after')
+    def _check_values(self):
+        spaced = (self.start, self.stop, self.num)
+        if self.values is None and None in spaced:
+            raise ValueError('sweeps require values or start, stop and num')
+        if self.values is not None and spaced != (None, None, None):
+            raise ValueError('sweeps take values or start, stop and num')
+        return self
+
+    def get_count(self) -> int:
+        return self.num if self.values is None else len(self.values)
+
+    def get_values(self) -> List[float]:
+        if self.values is not None:
+            return self.values
+        if self.num == 1:
+            return [self.start]
+        step = (self.stop - self.start) / (self.num - 1)
+        return [self.start + step * index for index in range(self.num)]
+
+
+class FlightSweepRequest(BaseModel):
+    """Payload for a parameter sweep around a stored flight."""
+
+    parameters: List[FlightSweepParameter] = Field(min_length=1)
+    outputs: List[FlightScalarOutput] = Field(
+        default=[
+            FlightScalarOutput.APOGEE,
+            FlightScalarOutput.MAX_MACH_NUMBER,
+            FlightScalarOutput.X_IMPACT,
+            FlightScalarOutput.Y_IMPACT,
+        ],
+        min_length=1,
+    )
+
+    @field_validator('parameters')
+    @classmethod
+    def _check_unique_paths(cls, value):
+        paths = [parameter.path for parameter in value]
+        if len(set(paths)) != len(paths):
+            raise ValueError('each path can only be swept once')
+        return value
+
+    @field_validator('outputs')
+    @classmethod
+    def _check_unique_outputs(cls, value):
+        return list(dict.fromkeys(value))
+
+    def get_points(self) -> int:
+        points = 1
+        for parameter in self.parameters:
+            points *= parameter.get_count()
+        return points
@@ -1,4 +1,20 @@
-from typing import Self, Optional
+import types
+from enum import Enum
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    List,
+    Literal,
+    Self,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 from abc import abstractmethod, ABC
 from pydantic import (
     BaseModel,
@@ -6,6 +22,94 @@ from pydantic import (
     ConfigDict,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _matches_literals(model: Type[BaseModel], value: dict) -> bool:
+    for name, field in model.model_fields.items():
+        if get_origin(field.annotation) is Literal:
+            if value.get(name, field.default) not in get_args(
+                field.annotation
+            ):
+                return False
+    return True
+
+
+def _fits_sequence(annotation: Any, value: list) -> bool:
+    origin = get_origin(annotation)
+    if origin is tuple:
+        args = get_args(annotation)
+        return not args or args[-1] is ... or len(args) == len(value)
+    return origin is list or annotation in (list, tuple)
+
+
+def _construct_value(annotation: Any, value: Any, enums: bool) -> Any:
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return _construct_value(args[0], value, enums)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation(value) if enums else value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if isinstance(value, dict):
+            return construct_model(annotation, value)
+        return value
+    if origin in (Union, types.UnionType):
+        if isinstance(value, dict):
+            members = [
+                member
+                for member in args
+                if isinstance(member, type)
+                and issubclass(member, BaseModel)
+                and _matches_literals(member, value)
+            ]
+        elif isinstance(value, (list, tuple)):
+            members = [
+                member for member in args if _fits_sequence(member, value)
+            ]
+        else:
+            members = []
+        if not members:
+            return value
+        return _construct_value(members[0], value, enums)
+    if origin is list and isinstance(value, (list, tuple)):
+        item = args[0] if args else Any
+        return [_construct_value(item, element, enums) for element in value]
+    if origin is tuple and isinstance(value, (list, tuple)):
+        if not args:
+            return tuple(value)
+        if len(args) == 2 and args[1] is ...:
+            return tuple(
+                _construct_value(args[0], element, enums) for element in value
+            )
+        return tuple(
+            _construct_value(item, element, enums)
+            for item, element in zip(args, value)
+        )
+    if annotation is tuple and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def construct_model(model: Type[ModelT], data: dict) -> ModelT:
+    """
+    Build ``model`` from trusted data without validating it.
+
+    Unlike ``model_construct``, nested models, union members, enums and
+    tuples are rebuilt, so a document written from a validated model
+    reads back as the same model; validators are not run and other types
+    are not coerced.
+    """
+    enums = not model.model_config.get("use_enum_values", False)
+    values = {
+        name: _construct_value(field.annotation, data[name], enums)
+        for name, field in model.model_fields.items()
+        if name in data
+    }
+    return model.model_construct(**values)
+
 
 class ApiBaseModel(BaseModel, ABC):
     """
@@ -16,6 +120,18 @@ class ApiBaseModel(BaseModel, ABC):
     """
 
     _id: Optional[str] = PrivateAttr(default=None)
+    # Incremented by every update; documents start at version 0.
+    _version: int = PrivateAttr(default=0)
+    # Bulk actions ("POST", "GET", "DELETE") the controller generates.
+    BULK_METHODS: ClassVar[Tuple[str, ...]] = ()
+    # Ascending indexes of the model's collection, one tuple of fields
+    # each; repositories create them when they connect.
+    INDEXES: ClassVar[Tuple[Tuple[str, ...], ...]] = ()
+    # Date field and seconds after it when MongoDB deletes a document,
+    # through a TTL index; None keeps documents until they are deleted.
+    EXPIRES_AFTER: ClassVar[Optional[Tuple[str, int]]] = None
+    # Numeric table fields repositories may store as packed float64.
+    ARRAY_FIELDS: ClassVar[Tuple[str, ...]] = ()
     model_config = ConfigDict(
         use_enum_values=True,
         validate_default=True,
@@ -30,6 +146,42 @@ class ApiBaseModel(BaseModel, ABC):
     def get_id(self):
         return self._id
 
+    def set_version(self, value):
+        self._version = value
+
+    def get_version(self):
+        return self._version
+
+    def as_view(self, view: Type[ModelT], **fields) -> ModelT:
+        """
+        Copy this model into ``view`` without validating it again.
+
+        The fields were validated when the model was built, so they are
+        shared with the view as they are; nested models the view declares
+        as views of their own are copied the same way, with their id
+        when they were read from a document of their own.
+        """
+        values = dict(self)
+        for name, field in view.model_fields.items():
+            value = values.get(name)
+            if (
+                isinstance(value, ApiBaseModel)
+                and isinstance(field.annotation, type)
+                and field.annotation is not type(value)
+                and issubclass(field.annotation, type(value))
+            ):
+                id_field = f"{value.NAME}_id"
+                values[name] = value.as_view(
+                    field.annotation,
+                    **(
+                        {id_field: value.get_id()}
+                        if value.get_id() is not None
+                        and id_field in field.annotation.model_fields
+                        else {}
+                    ),
+                )
+        return view.model_construct(**{**values, **fields})
+
     @property
     @abstractmethod
     def NAME():  # pylint: disable=invalid-name, no-method-argument
@@ -59,3 +211,10 @@ class ApiBaseModel(BaseModel, ABC):
     @abstractmethod
     def RETRIEVED(model_instance: type(Self)):  # pylint: disable=invalid-name
         pass
+
+    @staticmethod
+    @abstractmethod
+    def RETRIEVED_MANY(
+        model_instances: List[Self], items: list
+    ):  # pylint: disable=invalid-name
+        pass
@@ -0,0 +1,97 @@
+import zlib
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, ClassVar, List, Optional, Self
+
+from pydantic import Field
+from src.models.interface import ApiBaseModel
+from src.secrets import Secrets
+
+# Seconds a job document is kept, from its creation and again once it
+# finishes; jobs cannot run for nearly as long.
+SIMULATION_JOB_TTL = int(Secrets.get_secret("SIMULATION_JOB_TTL", 24 * 3600))
+
+
+def job_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=SIMULATION_JOB_TTL)
+
+
+class JobStatus(str, Enum):
+    PENDING: str = "PENDING"
+    RUNNING: str = "RUNNING"
+    SUCCEEDED: str = "SUCCEEDED"
+    FAILED: str = "FAILED"
+
+
+class JobModel(ApiBaseModel):
+    """
+    Background simulation job.
+
+    ``kind`` names the simulated model ("flight") and ``target_id`` its
+    document; ``options`` holds the simulation query parameters. Once the
+    job succeeds ``result`` is the zlib-compressed JSON of the simulation
+    view of its kind; failures keep the HTTP status and detail they would
+    have answered with.
+
+    ``worker`` runs the job and renews ``heartbeat_at`` while it does, so
+    jobs of a worker that stopped can be told apart from running ones.
+    MongoDB deletes jobs at ``expires_at``: SIMULATION_JOB_TTL seconds
+    after they were created, pushed back when they finish.
+    """
+
+    NAME: ClassVar = "job"
+    METHODS: ClassVar = ("GET",)
+    EXPIRES_AFTER: ClassVar = ("expires_at", 0)
+
+    kind: str
+    target_id: str
+    options: dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    result: Optional[bytes] = None
+    error_status: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    worker: Optional[str] = None
+    heartbeat_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    expires_at: datetime = Field(default_factory=job_expiry)
+
+    @staticmethod
+    def UPDATED():
+        return
+
+    @staticmethod
+    def DELETED():
+        return
+
+    @staticmethod
+    def CREATED(model_id: str):
+        from src.views.job import JobCreated
+
+        return JobCreated(job_id=model_id)
+
+    @staticmethod
+    def RETRIEVED(model_instance: type(Self)):
+        from src.views.job import JOB_RESULT_VIEWS, JobRetrieved, JobView
+
+        result = None
+        if model_instance.result is not None:
+            result = JOB_RESULT_VIEWS[model_instance.kind].model_validate_json(
+                zlib.decompress(model_instance.result)
+            )
+        return JobRetrieved(
+            job=JobView(
+                job_id=model_instance.get_id(),
+                **model_instance.model_dump(exclude={"result"}),
+                result=result,
+            )
+        )
+
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        return
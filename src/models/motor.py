@@ -17,6 +17,9 @@ class MotorKinds(str, Enum):
 class MotorModel(ApiBaseModel):
     NAME: ClassVar = 'motor'
     METHODS: ClassVar = ('POST', 'GET', 'PUT', 'DELETE')
+    BULK_METHODS: ClassVar = ('POST', 'GET', 'DELETE')
+    INDEXES: ClassVar = (('motor_kind',),)
+    ARRAY_FIELDS: ClassVar = ('thrust_source',)
 
     # Required parameters
     thrust_source: List[List[float]]
@@ -121,8 +124,21 @@ class MotorModel(ApiBaseModel):
         from src.views.motor import MotorRetrieved, MotorView
 
         return MotorRetrieved(
-            motor=MotorView(
-                motor_id=model_instance.get_id(),
-                **model_instance.model_dump(),
+            motor=model_instance.as_view(
+                MotorView, motor_id=model_instance.get_id()
             )
         )
+
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        from src.views.motor import MotorsRetrieved, MotorView
+
+        return MotorsRetrieved(
+            motors=[
+                model_instance.as_view(
+                    MotorView, motor_id=model_instance.get_id()
+                )
+                for model_instance in model_instances
+            ],
+            items=items,
+        )
@@ -25,6 +25,9 @@ def _maybe_parse_json(value):
 class RocketModel(ApiBaseModel):
     NAME: ClassVar = "rocket"
     METHODS: ClassVar = ("POST", "GET", "PUT", "DELETE")
+    BULK_METHODS: ClassVar = ('POST', 'GET', 'DELETE')
+    INDEXES: ClassVar = (('motor.motor_kind',),)
+    ARRAY_FIELDS: ClassVar = ('power_off_drag', 'power_on_drag')
 
     # Required parameters
     motor: MotorModel
@@ -104,12 +107,25 @@ class RocketModel(ApiBaseModel):
         from src.views.rocket import RocketRetrieved, RocketView
 
         return RocketRetrieved(
-            rocket=RocketView(
-                rocket_id=model_instance.get_id(),
-                **model_instance.model_dump(),
+            rocket=model_instance.as_view(
+                RocketView, rocket_id=model_instance.get_id()
             )
         )
 
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        from src.views.rocket import RocketsRetrieved, RocketView
+
+        return RocketsRetrieved(
+            rockets=[
+                model_instance.as_view(
+                    RocketView, rocket_id=model_instance.get_id()
+                )
+                for model_instance in model_instances
+            ],
+            items=items,
+        )
+
 
 class RocketPartialModel(BaseModel):
     """Rocket attributes required when a motor is supplied by reference."""
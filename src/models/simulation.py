@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from typing import ClassVar, List, Self
+
+from pydantic import Field
+from src.models.interface import ApiBaseModel
+from src.secrets import Secrets
+
+
+class SimulationCacheModel(ApiBaseModel):
+    """
+    Persisted simulation result, addressed by the content hash of the
+    model that produced it.
+
+    The payload is the zlib-compressed JSON dump of the simulation view;
+    ``owner`` ("flight:<id>", "rocket:<id>", ...) is the source document
+    it was simulated for. Stored entries collect their ``owners``, so
+    updates to a source document drop the entries only it still uses.
+    Entries expire SIMULATION_CACHE_TTL seconds after their last write.
+    """
+
+    NAME: ClassVar = "simulation"
+    METHODS: ClassVar = ()
+    INDEXES: ClassVar = (("owners",),)
+    EXPIRES_AFTER: ClassVar = (
+        "created_at",
+        int(Secrets.get_secret("SIMULATION_CACHE_TTL", 7 * 24 * 3600)),
+    )
+
+    key: str
+    owner: str
+    payload: bytes
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    @staticmethod
+    def UPDATED():
+        return
+
+    @staticmethod
+    def DELETED():
+        return
+
+    @staticmethod
+    def CREATED(model_id: str):
+        return
+
+    @staticmethod
+    def RETRIEVED(model_instance: type(Self)):
+        return
+
+    @staticmethod
+    def RETRIEVED_MANY(model_instances: List[Self], items: list):
+        return
@@ -0,0 +1,215 @@
+from contextvars import ContextVar
+from functools import cache
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from opentelemetry import metrics
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.monitoring import ConnectionPoolListener
+from pymongo.server_api import ServerApi
+
+from src import logger
+from src.secrets import Secrets
+
+meter = metrics.get_meter(__name__)
+
+T = TypeVar("T")
+
+
+def _optional_int(key: str, default: Optional[int] = None) -> Optional[int]:
+    value = Secrets.get_secret(key, default)
+    return None if value in (None, "") else int(value)
+
+
+# Connection pool of the MongoDB client shared by every repository.
+MONGODB_MAX_POOL_SIZE = _optional_int("MONGODB_MAX_POOL_SIZE", 50)
+MONGODB_MIN_POOL_SIZE = _optional_int("MONGODB_MIN_POOL_SIZE", 1)
+MONGODB_MAX_IDLE_TIME_MS = _optional_int("MONGODB_MAX_IDLE_TIME_MS", 30000)
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = _optional_int("MONGODB_WAIT_QUEUE_TIMEOUT_MS")
+
+
+class PoolMetricsListener(ConnectionPoolListener):
+    """
+    Tracks the connection pools of the shared MongoDB client.
+
+    Counts are kept on the listener for inspection and mirrored to the
+    OpenTelemetry ``db.client.connection.*`` instruments, which are
+    exported wherever a meter provider is configured.
+    """
+
+    def __init__(self):
+        self.idle = 0
+        self.used = 0
+        self.pending = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+        self._connections = meter.create_up_down_counter(
+            "db.client.connection.count",
+            unit="{connection}",
+            description="Open connections, by state.",
+        )
+        self._pending_requests = meter.create_up_down_counter(
+            "db.client.connection.pending_requests",
+            unit="{request}",
+            description="Operations waiting for a pooled connection.",
+        )
+        self._wait_time = meter.create_histogram(
+            "db.client.connection.wait_time",
+            unit="s",
+            description="Time taken to check out a pooled connection.",
+        )
+        self._timeouts = meter.create_counter(
+            "db.client.connection.timeouts",
+            unit="{timeout}",
+            description="Checkouts that gave up waiting for a connection.",
+        )
+
+    @staticmethod
+    def _attributes(event, **attributes) -> dict:
+        host, port = event.address
+        attributes["db.client.connection.pool.name"] = f"{host}:{port}"
+        return attributes
+
+    def _move(self, event, source: Optional[str], target: Optional[str]):
+        for state, delta in ((source, -1), (target, 1)):
+            if state is None:
+                continue
+            setattr(self, state, getattr(self, state) + delta)
+            self._connections.add(
+                delta,
+                self._attributes(
+                    event, **{"db.client.connection.state": state}
+                ),
+            )
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._move(event, None, "idle")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._move(event, "idle", None)
+
+    def connection_check_out_started(self, event):
+        self.pending += 1
+        self._pending_requests.add(1, self._attributes(event))
+
+    def connection_check_out_failed(self, event):
+        self.pending -= 1
+        self.checkout_failures += 1
+        self._pending_requests.add(-1, self._attributes(event))
+        self._timeouts.add(
+            1, self._attributes(event, **{"error.type": str(event.reason)})
+        )
+
+    def connection_checked_out(self, event):
+        self.pending -= 1
+        self.checkouts += 1
+        self._pending_requests.add(-1, self._attributes(event))
+        self._wait_time.record(event.duration, self._attributes(event))
+        self._move(event, "idle", "used")
+
+    def connection_checked_in(self, event):
+        self._move(event, "used", "idle")
+
+    def snapshot(self) -> dict:
+        return {
+            "idle": self.idle,
+            "used": self.used,
+            "pending": self.pending,
+            "checkouts": self.checkouts,
+            "checkout_failures": self.checkout_failures,
+            "pool_clears": self.pool_clears,
+        }
+
+
+@cache
+def get_pool_metrics() -> PoolMetricsListener:
+    """
+    Provides the pool listener of the shared MongoDB client.
+
+    Returns:
+        PoolMetricsListener: Process-wide pool statistics.
+    """
+    return PoolMetricsListener()
+
+
+@cache
+def get_mongo_client() -> AsyncMongoClient:
+    """
+    Provides the process-wide MongoDB client.
+
+    Every repository reads its collection from this client, so a worker
+    keeps a single connection pool and monitor instead of one per
+    collection. The pool is sized by MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE, MONGODB_MAX_IDLE_TIME_MS and
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS.
+
+    Returns:
+        AsyncMongoClient: Shared client.
+    """
+    options = {
+        "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+    }
+    client = AsyncMongoClient(
+        Secrets.get_secret("MONGODB_CONNECTION_STRING"),
+        server_api=ServerApi("1"),
+        serverSelectionTimeoutMS=60000,
+        event_listeners=[get_pool_metrics()],
+        **{key: value for key, value in options.items() if value is not None},
+    )
+    logger.info("AsyncMongoClient initialized with %s", options)
+    return client
+
+
+# Session of the transaction the current task writes in, if any.
+_transaction_session: ContextVar[Optional[AsyncClientSession]] = ContextVar(
+    "_transaction_session", default=None
+)
+
+
+def _session_options() -> dict:
+    session = _transaction_session.get()
+    return {} if session is None else {"session": session}
+
+
+async def run_in_transaction(callback: Callable[[], Awaitable[T]]) -> T:
+    """
+    Await ``callback`` inside one multi-document transaction.
+
+    Repository writes made by ``callback`` join the transaction, so they
+    are committed or discarded together; the transaction is retried on
+    transient errors. Writes must be awaited one after the other, since
+    a session serves one operation at a time. Transactions need a
+    replica set or sharded cluster.
+
+    Returns:
+        The result of ``callback``.
+    """
+
+    async def callback_in_session(session: AsyncClientSession) -> T:
+        token = _transaction_session.set(session)
+        try:
+            return await callback()
+        finally:
+            _transaction_session.reset(token)
+
+    async with get_mongo_client().start_session() as session:
+        return await session.with_transaction(callback_in_session)
@@ -0,0 +1,150 @@
+import functools
+import struct
+import typing
+import zlib
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+from bson.binary import USER_DEFINED_SUBTYPE, Binary
+from pydantic import BaseModel
+
+from src.models.interface import ApiBaseModel
+
+# Header of a packed array: compression (0 none, 1 zlib) and number of
+# dimensions, followed by one uint32 per dimension.
+_HEADER = struct.Struct("<BB")
+_DIMENSION = struct.Struct("<I")
+_RAW, _ZLIB = 0, 1
+
+Path = Tuple[str, ...]
+
+
+def pack_array(value: Any, *, compress: bool = False) -> Optional[Binary]:
+    """
+    Pack a rectangular table of numbers into a BSON Binary holding its
+    little-endian float64 values.
+
+    Returns:
+        The packed array, or None when ``value`` is not a non-empty
+        table of numbers, e.g. a scalar or a ragged list.
+    """
+    if not isinstance(value, (list, tuple)) or not value:
+        return None
+    try:
+        array = np.asarray(value, dtype="<f8")
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 2 or not array.size:
+        return None
+    data = array.tobytes()
+    codec = _RAW
+    if compress:
+        data, codec = zlib.compress(data, 1), _ZLIB
+    header = _HEADER.pack(codec, array.ndim) + b"".join(
+        _DIMENSION.pack(size) for size in array.shape
+    )
+    return Binary(header + data, USER_DEFINED_SUBTYPE)
+
+
+def is_packed_array(value: Any) -> bool:
+    return isinstance(value, Binary) and value.subtype == USER_DEFINED_SUBTYPE
+
+
+def unpack_array(value: Binary) -> np.ndarray:
+    """Read a packed array back as a float64 NumPy array."""
+    codec, ndim = _HEADER.unpack_from(value)
+    offset = _HEADER.size
+    shape = []
+    for _ in range(ndim):
+        shape.append(_DIMENSION.unpack_from(value, offset)[0])
+        offset += _DIMENSION.size
+    data = memoryview(value)[offset:]
+    if codec == _ZLIB:
+        data = zlib.decompress(data)
+    return np.frombuffer(data, dtype="<f8").reshape(shape)
+
+
+@functools.cache
+def array_paths(model: type) -> Tuple[Path, ...]:
+    """
+    Paths of the ARRAY_FIELDS of ``model`` and of the models it embeds,
+    e.g. ("rocket", "motor", "thrust_source") for flights.
+    """
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return ()
+    paths = [(name,) for name in getattr(model, "ARRAY_FIELDS", ())]
+    for name, field in model.model_fields.items():
+        for member in (field.annotation, *typing.get_args(field.annotation)):
+            if isinstance(member, type) and issubclass(member, ApiBaseModel):
+                paths.extend((name, *path) for path in array_paths(member))
+    return tuple(paths)
+
+
+def _replace_path(document: Any, path: Path, function: Callable) -> Any:
+    """Copy of ``document`` with ``function`` applied at ``path``."""
+    if not isinstance(document, dict) or path[0] not in document:
+        return document
+    value = document[path[0]]
+    replaced = (
+        _replace_path(value, path[1:], function)
+        if len(path) > 1
+        else function(value)
+    )
+    if replaced is value:
+        return document
+    return {**document, path[0]: replaced}
+
+
+def _packer(compress: bool) -> Callable:
+    def pack(value):
+        packed = pack_array(value, compress=compress)
+        return value if packed is None else packed
+
+    return pack
+
+
+def encode_arrays(
+    model: type, document: dict, *, compress: bool = False
+) -> dict:
+    """
+    Copy of ``document`` with the array fields of ``model`` packed; the
+    document itself is not modified. Values that are not tables of
+    numbers are kept as they are.
+    """
+    pack = _packer(compress)
+    for path in array_paths(model):
+        document = _replace_path(document, path, pack)
+    return document
+
+
+def encode_array_updates(
+    model: type, fields: dict, *, compress: bool = False
+) -> dict:
+    """
+    Like encode_arrays, for ``$set`` values keyed by dotted path, e.g.
+    ``{"rocket.motor": {...}}`` or ``{"rocket.power_off_drag": [...]}``.
+    """
+    pack = _packer(compress)
+    encoded = {}
+    for key, value in fields.items():
+        parts = tuple(key.split("."))
+        depth = len(parts)
+        for path in array_paths(model):
+            if path[:depth] == parts:
+                wrapped = _replace_path({"": value}, ("", *path[depth:]), pack)
+                value = wrapped[""]
+        encoded[key] = value
+    return encoded
+
+
+def decode_arrays(model: type, document: dict) -> dict:
+    """Copy of ``document`` with the packed arrays of ``model`` as lists."""
+
+    def unpack(value):
+        return (
+            unpack_array(value).tolist() if is_packed_array(value) else value
+        )
+
+    for path in array_paths(model):
+        document = _replace_path(document, path, unpack)
+    return document
@@ -14,12 +14,14 @@ class EnvironmentRepository(RepositoryInterface):
         environment: models.EnvironmentModel
     """
 
+    READ_CACHE = True
+
     def __init__(self):
         super().__init__(EnvironmentModel)
 
     @repository_exception_handler
     async def create_environment(self, environment: EnvironmentModel) -> str:
-        return await self.insert(environment.model_dump())
+        return await self.insert(environment.model_dump(), validated=True)
 
     @repository_exception_handler
     async def read_environment_by_id(
@@ -32,7 +34,9 @@ class EnvironmentRepository(RepositoryInterface):
         self, environment_id: str, environment: EnvironmentModel
     ):
         await self.update_by_id(
-            environment.model_dump(), data_id=environment_id
+            environment.model_dump(),
+            data_id=environment_id,
+            validated=True,
         )
 
     @repository_exception_handler
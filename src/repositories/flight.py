@@ -1,5 +1,6 @@
-from typing import Optional
-from src.models.flight import FlightModel
+from typing import Optional, Sequence
+from bson import ObjectId
+from src.models.flight import FlightModel, FlightPartialModel
 from src.repositories.interface import (
     RepositoryInterface,
     repository_exception_handler,
@@ -12,14 +13,39 @@ class FlightRepository(RepositoryInterface):
 
     Init Attributes:
         flight: models.FlightModel
+
+    Flights either embed their environment and rocket or, when stored
+    with references, keep environment_id and rocket_id instead.
     """
 
+    REFERENCES = ("environment", "rocket")
+    READ_CACHE = True
+
     def __init__(self):
         super().__init__(FlightModel)
 
     @repository_exception_handler
     async def create_flight(self, flight: FlightModel) -> str:
-        return await self.insert(flight.model_dump(exclude_none=True))
+        return await self.insert(
+            flight.model_dump(exclude_none=True), validated=True
+        )
+
+    @repository_exception_handler
+    async def create_flight_with_references(
+        self,
+        flight: FlightPartialModel,
+        *,
+        environment_id: str,
+        rocket_id: str,
+    ) -> str:
+        return await self.insert(
+            {
+                **flight.model_dump(exclude_none=True),
+                "environment_id": ObjectId(environment_id),
+                "rocket_id": ObjectId(rocket_id),
+            },
+            validated=True,
+        )
 
     @repository_exception_handler
     async def read_flight_by_id(self, flight_id: str) -> Optional[FlightModel]:
@@ -28,9 +54,50 @@ class FlightRepository(RepositoryInterface):
     @repository_exception_handler
     async def update_flight_by_id(self, flight_id: str, flight: FlightModel):
         await self.update_by_id(
-            flight.model_dump(exclude_none=True), data_id=flight_id
+            flight.model_dump(exclude_none=True),
+            data_id=flight_id,
+            validated=True,
+        )
+
+    @repository_exception_handler
+    async def update_flight_with_references_by_id(
+        self,
+        flight_id: str,
+        flight: FlightPartialModel,
+        *,
+        environment_id: str,
+        rocket_id: str,
+    ) -> Optional[int]:
+        return await self.patch_by_id(
+            data_id=flight_id,
+            set_fields={
+                **flight.model_dump(exclude_none=True),
+                "environment_id": ObjectId(environment_id),
+                "rocket_id": ObjectId(rocket_id),
+            },
+            unset_fields=("environment", "rocket"),
         )
 
+    @repository_exception_handler
+    async def patch_flight_by_id(
+        self,
+        flight_id: str,
+        *,
+        set_fields: Optional[dict] = None,
+        unset_fields: Sequence[str] = (),
+        version: Optional[int] = None,
+    ) -> Optional[int]:
+        return await self.patch_by_id(
+            data_id=flight_id,
+            set_fields=set_fields,
+            unset_fields=unset_fields,
+            version=version,
+        )
+
+    @repository_exception_handler
+    async def read_flight_version_by_id(self, flight_id: str) -> Optional[int]:
+        return await self.read_version_by_id(flight_id)
+
     @repository_exception_handler
     async def delete_flight_by_id(self, flight_id: str):
         await self.delete_by_id(data_id=flight_id)
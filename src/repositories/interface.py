@@ -3,23 +3,58 @@ import asyncio
 import threading
 import functools
 
-from typing import Self
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Set,
+    Tuple,
+)
 from tenacity import (
     stop_after_attempt,
     wait_fixed,
     retry,
 )
 from pydantic import ValidationError
-from pymongo.errors import PyMongoError
-from pymongo.server_api import ServerApi
-from pymongo import AsyncMongoClient
+from pymongo.errors import BulkWriteError, PyMongoError
+from pymongo import ASCENDING, IndexModel, ReturnDocument
 
 from fastapi import HTTPException, status
 from bson import ObjectId
+from bson.errors import InvalidId
 
 from src import logger
 from src.secrets import Secrets
-from src.models.interface import ApiBaseModel
+from src.models.interface import ApiBaseModel, construct_model
+from src.repositories.codec import (
+    decode_arrays,
+    encode_array_updates,
+    encode_arrays,
+)
+from src.repositories.client import _session_options, get_mongo_client
+from src.repositories.read_cache import (
+    READ_CACHE_ENABLED,
+    ReadCache,
+    get_read_cache,
+)
+
+# Documents are only written from validated models; when false they are
+# read back with construct_model instead of being validated again.
+VALIDATE_STORED_DOCUMENTS = Secrets.get_flag("VALIDATE_STORED_DOCUMENTS", True)
+
+# Store the ARRAY_FIELDS of models as packed float64 BSON Binary, zlib
+# compressed when BINARY_ARRAY_COMPRESSION is set; packed and plain
+# arrays are both read back as lists.
+BINARY_ARRAY_STORAGE = Secrets.get_flag("BINARY_ARRAY_STORAGE")
+BINARY_ARRAY_COMPRESSION = Secrets.get_flag("BINARY_ARRAY_COMPRESSION")
+
+# Create the indexes models declare when repositories connect; turn off
+# when the database user may not create indexes.
+MONGODB_CREATE_INDEXES = Secrets.get_flag("MONGODB_CREATE_INDEXES", True)
 
 
 def not_implemented(*args, **kwargs):
@@ -86,13 +121,20 @@ class RepositoryInterface:
 
     The class is a singleton, meaning that only one instance
     of the class is created and shared among all instances
-    of the class. This is done to ensure that only one
-    connection per collection in the database is created
-    and shared among all repositories.
+    of the class. Every repository binds its collection on the
+    process-wide client from get_mongo_client, so all of them
+    share one connection pool.
     """
 
     _global_instances = {}
     _global_thread_lock = threading.Lock()
+    # Embedded components that documents may store as a ``<field>_id``
+    # reference to the ``<field>`` collection instead; reads resolve
+    # them with $lookup.
+    REFERENCES: ClassVar[Tuple[str, ...]] = ()
+    # Whether find_by_id reads through the process-wide ReadCache; only
+    # for collections every write to goes through this interface.
+    READ_CACHE: ClassVar[bool] = False
 
     def __new__(cls, *args, **kwargs):
         """
@@ -109,20 +151,18 @@ class RepositoryInterface:
                 cls._global_instances[cls] = instance
         return cls._global_instances[cls]
 
-    def __init__(self, model: ApiBaseModel, *, max_pool_size: int = 3):
+    def __init__(self, model: ApiBaseModel):
         """
-        Initialize the repository instance for a specific API model and configure its connection pool.
+        Initialize the repository instance for a specific API model.
 
         Parameters:
             model (ApiBaseModel): The API model used for validation and to determine the repository's collection.
-            max_pool_size (int, optional): Maximum size of the MongoDB connection pool. Defaults to 3.
 
         Notes:
             If the instance is already initialized, this constructor will not reconfigure it. Initialization of the underlying connection is started asynchronously.
         """
         if not getattr(self, '_initialized', False):
             self.model = model
-            self._max_pool_size = max_pool_size
             self._initialized_event = asyncio.Event()
             self._initialize()
 
@@ -153,6 +193,22 @@ class RepositoryInterface:
             self._initialized = True
             self._initialized_event.set()
 
+        if MONGODB_CREATE_INDEXES:
+            await self._create_indexes()
+
+    async def _create_indexes(self):
+        """
+        Create the declared indexes without holding back requests, which
+        are already served; a failure is logged and reads fall back to
+        collection scans.
+        """
+        try:
+            await self.create_indexes()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(
+                "Could not create %s indexes: %s", self.model.NAME, e
+            )
+
     def _initialize(self):
         """
         Ensure the repository's asynchronous initializer is executed: run it immediately if no event loop is active, otherwise schedule it on the running loop.
@@ -181,9 +237,9 @@ class RepositoryInterface:
 
     def _initialize_connection(self):
         """
-        Initialize the MongoDB async client, store the connection string, and bind the collection for this repository instance.
+        Bind the shared MongoDB async client, store the connection string, and bind the collection for this repository instance.
 
-        This method fetches the MongoDB connection string from secrets, creates an AsyncMongoClient configured with pool and timeout settings, and sets self._collection to the repository's collection named by the model. On success it logs the initialized client; on failure it raises a ConnectionError.
+        This method fetches the MongoDB connection string from secrets, takes the process-wide AsyncMongoClient from get_mongo_client, and sets self._collection to the repository's collection named by the model. On success it logs the bound collection; on failure it raises a ConnectionError.
 
         Raises:
             ConnectionError: If the client or collection cannot be initialized.
@@ -192,17 +248,11 @@ class RepositoryInterface:
             self._connection_string = Secrets.get_secret(
                 "MONGODB_CONNECTION_STRING"
             )
-            self._client = AsyncMongoClient(
-                self._connection_string,
-                server_api=ServerApi("1"),
-                maxIdleTimeMS=30000,
-                minPoolSize=1,
-                maxPoolSize=self._max_pool_size,
-                serverSelectionTimeoutMS=60000,
-            )
+            self._client = get_mongo_client()
             self._collection = self._client.rocketpy[self.model.NAME]
             logger.info(
-                "AsyncMongoClient initialized for %s",
+                "MongoDB collection %s bound for %s",
+                self.model.NAME,
                 self.__class__,
             )
         except Exception as e:
@@ -244,45 +294,512 @@ class RepositoryInterface:
             f"{model.NAME.capitalize()}Repository",
         )
 
+    def _encode(self, data: dict) -> dict:
+        if not BINARY_ARRAY_STORAGE:
+            return data
+        return encode_arrays(
+            self.model, data, compress=BINARY_ARRAY_COMPRESSION
+        )
+
+    def _decode(self, read_data: dict) -> dict:
+        return decode_arrays(self.model, read_data)
+
+    def _parse_document(self, read_data: dict) -> ApiBaseModel:
+        read_data = self._decode(read_data)
+        if VALIDATE_STORED_DOCUMENTS:
+            parsed_model = self.model.model_validate(read_data)
+        else:
+            parsed_model = construct_model(self.model, read_data)
+        parsed_model.set_id(str(read_data["_id"]))
+        parsed_model.set_version(read_data.get("_version", 0))
+        for field in self.REFERENCES:
+            if f"{field}_id" in read_data:
+                getattr(parsed_model, field).set_id(
+                    str(read_data[f"{field}_id"])
+                )
+        return parsed_model
+
+    def _resolve_pipeline(
+        self,
+        query: dict,
+        *,
+        limit: Optional[int] = None,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        """
+        Aggregation reading the documents matching ``query`` in ``_id``
+        order, with every reference replaced by the document it points
+        to; embedded components are kept as they are.
+        """
+        pipeline = [{"$match": query}, {"$sort": {"_id": 1}}]
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        for field in self.REFERENCES:
+            pipeline.append(
+                {
+                    "$lookup": {
+                        "from": field,
+                        "localField": f"{field}_id",
+                        "foreignField": "_id",
+                        "as": f"_{field}",
+                    }
+                }
+            )
+            pipeline.append(
+                {
+                    "$set": {
+                        field: {
+                            "$ifNull": [
+                                f"${field}",
+                                {"$arrayElemAt": [f"$_{field}", 0]},
+                            ]
+                        }
+                    }
+                }
+            )
+            pipeline.append(
+                {"$unset": [f"_{field}", f"{field}._id", f"{field}._version"]}
+            )
+        if projection:
+            pipeline.append({"$project": projection})
+        return pipeline
+
+    async def _find(self, query: dict):
+        if self.REFERENCES:
+            return await self.get_collection().aggregate(
+                self._resolve_pipeline(query)
+            )
+        return self.get_collection().find(query)
+
+    @staticmethod
+    def _version_query(version: int) -> dict:
+        # Documents stored before versioning have no _version field.
+        if version:
+            return {"_version": version}
+        return {"_version": {"$in": [None, 0]}}
+
     @repository_exception_handler
-    async def insert(self, data: dict):
+    async def insert(self, data: dict, *, validated: bool = False):
+        """
+        Insert one document.
+
+        Args:
+            data: the document.
+            validated: whether ``data`` is the dump of a validated model,
+                which is then not validated again.
+        """
         collection = self.get_collection()
-        try:
-            self.model.model_validate(data)
-        except ValidationError as e:
-            raise HTTPException(status_code=422, detail=str(e))
-        result = await collection.insert_one(data)
+        if not validated:
+            try:
+                self.model.model_validate(data)
+            except ValidationError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        result = await collection.insert_one(
+            self._encode(data), **_session_options()
+        )
         return str(result.inserted_id)
 
     @repository_exception_handler
-    async def update_by_id(self, data: dict, *, data_id: str):
+    async def update_by_id(
+        self, data: dict, *, data_id: str, validated: bool = False
+    ):
         collection = self.get_collection()
-        assert self.model.model_validate(data)
-        await collection.update_one({"_id": ObjectId(data_id)}, {"$set": data})
+        if not validated:
+            assert self.model.model_validate(data)
+        update = {"$set": self._encode(data), "$inc": {"_version": 1}}
+        # Embedded components replace the references they were read from.
+        references = [
+            f"{field}_id" for field in self.REFERENCES if field in data
+        ]
+        if references:
+            update["$unset"] = dict.fromkeys(references, "")
+        await collection.update_one(
+            {"_id": ObjectId(data_id)}, update, **_session_options()
+        )
+        await self._invalidate_cached([ObjectId(data_id)])
         return self
 
+    @repository_exception_handler
+    async def patch_by_id(
+        self,
+        *,
+        data_id: str,
+        set_fields: Optional[dict] = None,
+        unset_fields: Sequence[str] = (),
+        version: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Write only the given paths of a document, in one round trip.
+
+        Args:
+            data_id: the document id.
+            set_fields: values to ``$set``, by dotted path.
+            unset_fields: dotted paths to ``$unset``.
+            version: when given, the document is only written if it is
+                still at this version.
+
+        Returns:
+            The new version, or None when no document has ``data_id``
+            at ``version``.
+        """
+        query = {"_id": ObjectId(data_id)}
+        if version is not None:
+            query.update(self._version_query(version))
+        update = {"$inc": {"_version": 1}}
+        if set_fields:
+            update["$set"] = (
+                encode_array_updates(
+                    self.model,
+                    set_fields,
+                    compress=BINARY_ARRAY_COMPRESSION,
+                )
+                if BINARY_ARRAY_STORAGE
+                else set_fields
+            )
+        if unset_fields:
+            update["$unset"] = dict.fromkeys(unset_fields, "")
+        updated = await self.get_collection().find_one_and_update(
+            query,
+            update,
+            projection={"_version": 1},
+            return_document=ReturnDocument.AFTER,
+            **_session_options(),
+        )
+        await self._invalidate_cached([query["_id"]])
+        return None if updated is None else updated["_version"]
+
+    @repository_exception_handler
+    async def read_version_by_id(self, data_id: str) -> Optional[int]:
+        """
+        Returns:
+            The version of the document, or None when it does not exist.
+        """
+        read_data = await self.get_collection().find_one(
+            {"_id": ObjectId(data_id)}, {"_version": 1}
+        )
+        return None if read_data is None else read_data.get("_version", 0)
+
+    def _read_cache(self) -> Optional[ReadCache]:
+        if self.READ_CACHE and READ_CACHE_ENABLED:
+            return get_read_cache()
+        return None
+
+    async def _invalidate_cached(self, object_ids: List[ObjectId]):
+        read_cache = self._read_cache()
+        if read_cache is not None:
+            await read_cache.invalidate(
+                self.model.NAME, [str(object_id) for object_id in object_ids]
+            )
+
     @repository_exception_handler
     async def find_by_id(self, *, data_id: str):
-        collection = self.get_collection()
-        read_data = await collection.find_one({"_id": ObjectId(data_id)})
+        query = {"_id": ObjectId(data_id)}
+        read_cache = self._read_cache()
+        read_data = generation = None
+        if read_cache is not None:
+            read_data = await read_cache.get(
+                self.model.NAME, str(query["_id"])
+            )
+            generation = read_cache.generation
+        if read_data is None:
+            if self.REFERENCES:
+                cursor = await self._find(query)
+                read_data = next(iter(await cursor.to_list(1)), None)
+            else:
+                read_data = await self.get_collection().find_one(query)
+            # Resolved references would go stale when the referenced
+            # documents change, so those documents are not cached.
+            if (
+                read_cache is not None
+                and read_data
+                and not any(
+                    f"{field}_id" in read_data for field in self.REFERENCES
+                )
+            ):
+                await read_cache.put(
+                    self.model.NAME, str(query["_id"]), read_data, generation
+                )
         if read_data:
-            parsed_model = self.model.model_validate(read_data)
-            parsed_model.set_id(str(read_data["_id"]))
-            return parsed_model
+            return self._parse_document(read_data)
         return None
 
     @repository_exception_handler
     async def delete_by_id(self, *, data_id: str):
         collection = self.get_collection()
-        await collection.delete_one({"_id": ObjectId(data_id)})
+        await collection.delete_one(
+            {"_id": ObjectId(data_id)}, **_session_options()
+        )
+        await self._invalidate_cached([ObjectId(data_id)])
         return self
 
+    @staticmethod
+    def _parse_ids(data_ids: List[str]) -> Dict[str, ObjectId]:
+        object_ids = {}
+        for data_id in data_ids:
+            try:
+                object_ids[data_id] = ObjectId(data_id)
+            except (InvalidId, TypeError):
+                continue
+        return object_ids
+
     @repository_exception_handler
-    async def find_by_query(self, query: dict):
+    async def insert_many(
+        self, data: List[dict], *, validated: bool = False
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Insert documents in a single unordered insert_many round trip.
+
+        Args:
+            data: the documents.
+            validated: whether ``data`` holds dumps of validated models,
+                which are then not validated again.
+
+        Returns:
+            One (inserted id, error) pair per document, in order; the id
+            is None for documents that failed validation or writing.
+        """
+        results: List[Tuple[Optional[str], Optional[str]]] = [
+            (None, None)
+        ] * len(data)
+        documents, positions = [], []
+        for position, document in enumerate(data):
+            if not validated:
+                try:
+                    self.model.model_validate(document)
+                except ValidationError as e:
+                    results[position] = (None, str(e))
+                    continue
+            documents.append(self._encode(document))
+            positions.append(position)
+        if not documents:
+            return results
+
+        failed = {}
+        try:
+            await self.get_collection().insert_many(
+                documents, ordered=False, **_session_options()
+            )
+        except BulkWriteError as e:
+            if e.details.get("writeConcernErrors"):
+                raise
+            failed = {
+                error["index"]: error for error in e.details["writeErrors"]
+            }
+        # insert_many sets the generated _id on every document it sends.
+        for index, (position, document) in enumerate(
+            zip(positions, documents)
+        ):
+            if index in failed:
+                results[position] = (None, failed[index]["errmsg"])
+            else:
+                results[position] = (str(document["_id"]), None)
+        return results
+
+    @repository_exception_handler
+    async def find_by_ids(
+        self, data_ids: List[str]
+    ) -> Dict[str, ApiBaseModel]:
+        """
+        Read documents with a single ``$in`` query.
+
+        Returns:
+            Models by requested id; unknown and malformed ids are left
+            out.
+        """
+        object_ids = self._parse_ids(data_ids)
+        parsed_models = {}
+        async for read_data in await self._find(
+            {"_id": {"$in": list(object_ids.values())}}
+        ):
+            parsed_models[read_data["_id"]] = self._parse_document(read_data)
+        return {
+            data_id: parsed_models[object_id]
+            for data_id, object_id in object_ids.items()
+            if object_id in parsed_models
+        }
+
+    @staticmethod
+    def _keyset_query(
+        after: Optional[str], fields: Optional[Sequence[str]]
+    ) -> Tuple[dict, Optional[dict]]:
+        query = {} if after is None else {"_id": {"$gt": ObjectId(after)}}
+        projection = dict.fromkeys(fields, 1) if fields else None
+        return query, projection
+
+    @repository_exception_handler
+    async def find_page(
+        self,
+        *,
+        after: Optional[str] = None,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        resolve: bool = True,
+    ) -> List[dict]:
+        """
+        Read up to ``limit`` raw documents in ``_id`` order, starting
+        after the ``after`` id.
+
+        Paging by ``_id`` walks the default index, so every page costs
+        the same however deep it is, unlike skip-based offsets. Unless
+        ``resolve`` is false, references are resolved for the page only.
+        """
+        query, projection = self._keyset_query(after, fields)
+        if resolve and self.REFERENCES:
+            cursor = await self.get_collection().aggregate(
+                self._resolve_pipeline(
+                    query, limit=limit, projection=projection
+                )
+            )
+        else:
+            cursor = (
+                self.get_collection()
+                .find(query, projection)
+                .sort("_id", 1)
+                .limit(limit)
+            )
+        return [self._decode(document) for document in await cursor.to_list()]
+
+    async def iter_documents(
+        self,
+        *,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 100,
+        resolve: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield raw documents in ``_id`` order, starting after the
+        ``after`` id, fetching ``batch_size`` documents per round trip.
+        References are resolved unless ``resolve`` is false.
+        """
+        query, projection = self._keyset_query(after, fields)
+        if resolve and self.REFERENCES:
+            cursor = await self.get_collection().aggregate(
+                self._resolve_pipeline(query, projection=projection),
+                batchSize=batch_size,
+            )
+        else:
+            cursor = (
+                self.get_collection()
+                .find(query, projection, batch_size=batch_size)
+                .sort("_id", 1)
+            )
+        async for document in cursor:
+            yield self._decode(document)
+
+    @repository_exception_handler
+    async def delete_by_ids(self, data_ids: List[str]) -> Set[str]:
+        """
+        Delete the existing documents among ``data_ids`` with delete_many.
+
+        Returns:
+            Requested ids whose documents were deleted.
+        """
         collection = self.get_collection()
+        object_ids = self._parse_ids(data_ids)
+        existing = {
+            read_data["_id"]
+            async for read_data in collection.find(
+                {"_id": {"$in": list(object_ids.values())}}, {"_id": 1}
+            )
+        }
+        if existing:
+            await collection.delete_many(
+                {"_id": {"$in": list(existing)}}, **_session_options()
+            )
+            await self._invalidate_cached(list(existing))
+        return {
+            data_id
+            for data_id, object_id in object_ids.items()
+            if object_id in existing
+        }
+
+    @staticmethod
+    def index_name(fields: Sequence[str]) -> str:
+        """MongoDB's default name of the ascending index on ``fields``."""
+        return "_".join(f"{field}_1" for field in fields)
+
+    @repository_exception_handler
+    async def create_indexes(self) -> List[str]:
+        """
+        Create the indexes the model declares; existing ones are left as
+        they are, so this is idempotent.
+
+        Returns:
+            Names of the declared indexes.
+        """
+        indexes = [
+            IndexModel([(field, ASCENDING) for field in fields])
+            for fields in self.model.INDEXES
+        ]
+        if self.model.EXPIRES_AFTER is not None:
+            field, seconds = self.model.EXPIRES_AFTER
+            indexes.append(
+                IndexModel([(field, ASCENDING)], expireAfterSeconds=seconds)
+            )
+        if not indexes:
+            return []
+        return await self.get_collection().create_indexes(indexes)
+
+    @repository_exception_handler
+    async def read_index_stats(self) -> List[dict]:
+        """
+        Returns:
+            ``$indexStats`` of the collection: every index with its key
+            and how many operations used it since the server started.
+        """
+        cursor = await self.get_collection().aggregate([{"$indexStats": {}}])
+        return await cursor.to_list()
+
+    @repository_exception_handler
+    async def explain_query(
+        self,
+        query: dict,
+        *,
+        sort: Optional[dict] = None,
+        limit: int = 0,
+    ) -> dict:
+        """
+        Run ``find(query)`` under ``explain`` with execution statistics.
+
+        Returns:
+            The server's explain output: the winning plan and the keys
+            and documents it examined.
+        """
+        command = {"find": self.model.NAME, "filter": query}
+        if sort:
+            command["sort"] = sort
+        if limit:
+            command["limit"] = limit
+        return await self.get_collection().database.command(
+            {"explain": command, "verbosity": "executionStats"}
+        )
+
+    @repository_exception_handler
+    async def find_referenced_ids(
+        self, field: str, data_ids: List[str]
+    ) -> Set[str]:
+        """
+        Returns:
+            Ids among ``data_ids`` that documents reference as
+            ``<field>_id``.
+        """
+        object_ids = self._parse_ids(data_ids)
+        referenced = set(
+            await self.get_collection().distinct(
+                f"{field}_id",
+                {f"{field}_id": {"$in": list(object_ids.values())}},
+            )
+        )
+        return {
+            data_id
+            for data_id, object_id in object_ids.items()
+            if object_id in referenced
+        }
+
+    @repository_exception_handler
+    async def find_by_query(self, query: dict):
         parsed_models = []
-        async for read_data in collection.find(query):
-            parsed_model = self.model.model_validate(read_data)
-            parsed_model.set_id(str(read_data["_id"]))
-            parsed_models.append(parsed_model)
+        async for read_data in await self._find(query):
+            parsed_models.append(self._parse_document(read_data))
         return parsed_models
@@ -0,0 +1,120 @@
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from bson import ObjectId
+from fastapi import status as http_status
+
+from src.models.job import JobModel, JobStatus, job_expiry
+from src.repositories.interface import (
+    RepositoryInterface,
+    repository_exception_handler,
+)
+
+# Seconds between the heartbeats of a running job, and without one after
+# which its worker is taken for stopped.
+JOB_HEARTBEAT_SECONDS = 15
+JOB_LEASE_SECONDS = 4 * JOB_HEARTBEAT_SECONDS
+
+UNFINISHED_JOB_STATUSES = [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+
+
+def worker_id() -> str:
+    """Host and process running jobs in this worker."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobRepository(RepositoryInterface):
+    """
+    Enables database CRUD operations with models.Job
+
+    Init Attributes:
+        job: models.JobModel
+    """
+
+    def __init__(self):
+        super().__init__(JobModel)
+
+    @repository_exception_handler
+    async def create_job(self, job: JobModel) -> str:
+        return await self.insert(
+            job.model_dump(exclude_none=True), validated=True
+        )
+
+    @repository_exception_handler
+    async def read_job_by_id(self, job_id: str) -> Optional[JobModel]:
+        await self.fail_orphaned_jobs(job_id)
+        return await self.find_by_id(data_id=job_id)
+
+    @repository_exception_handler
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        result: Optional[bytes] = None,
+        error_status: Optional[int] = None,
+        error: Optional[str] = None,
+    ):
+        now = datetime.now(timezone.utc)
+        changes = {"status": JobStatus(status).value, "updated_at": now}
+        if status == JobStatus.RUNNING:
+            changes["worker"] = worker_id()
+            changes["heartbeat_at"] = now
+        if status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+            changes["finished_at"] = now
+            changes["expires_at"] = job_expiry()
+        if result is not None:
+            changes["result"] = result
+        if error_status is not None:
+            changes["error_status"] = error_status
+            changes["error"] = error
+        await self.get_collection().update_one(
+            {"_id": ObjectId(job_id)}, {"$set": changes}
+        )
+
+    @repository_exception_handler
+    async def renew_job_lease(self, job_id: str):
+        await self.get_collection().update_one(
+            {"_id": ObjectId(job_id), "status": JobStatus.RUNNING.value},
+            {"$set": {"heartbeat_at": datetime.now(timezone.utc)}},
+        )
+
+    @repository_exception_handler
+    async def fail_orphaned_jobs(self, job_id: Optional[str] = None) -> int:
+        """
+        Mark unfinished jobs without a heartbeat for JOB_LEASE_SECONDS as
+        failed: the worker running them restarted or stopped.
+
+        Args:
+            job_id: only check this job instead of every one.
+
+        Returns:
+            Number of jobs marked as failed.
+        """
+        now = datetime.now(timezone.utc)
+        stale = now - timedelta(seconds=JOB_LEASE_SECONDS)
+        query = {
+            "status": {"$in": UNFINISHED_JOB_STATUSES},
+            "$or": [
+                {"heartbeat_at": {"$lt": stale}},
+                {"heartbeat_at": None, "created_at": {"$lt": stale}},
+            ],
+        }
+        if job_id is not None:
+            query["_id"] = ObjectId(job_id)
+        result = await self.get_collection().update_many(
+            query,
+            {
+                "$set": {
+                    "status": JobStatus.FAILED.value,
+                    "error_status": http_status.HTTP_503_SERVICE_UNAVAILABLE,
+                    "error": "Simulation worker stopped, submit the job again",
+                    "updated_at": now,
+                    "finished_at": now,
+                    "expires_at": job_expiry(),
+                }
+            },
+        )
+        return result.modified_count
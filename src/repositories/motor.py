@@ -14,12 +14,16 @@ class MotorRepository(RepositoryInterface):
         motor: models.MotorModel
     """
 
+    READ_CACHE = True
+
     def __init__(self):
         super().__init__(MotorModel)
 
     @repository_exception_handler
     async def create_motor(self, motor: MotorModel) -> str:
-        return await self.insert(motor.model_dump(exclude_none=True))
+        return await self.insert(
+            motor.model_dump(exclude_none=True), validated=True
+        )
 
     @repository_exception_handler
     async def read_motor_by_id(self, motor_id: str) -> Optional[MotorModel]:
@@ -28,7 +32,9 @@ class MotorRepository(RepositoryInterface):
     @repository_exception_handler
     async def update_motor_by_id(self, motor_id: str, motor: MotorModel):
         await self.update_by_id(
-            motor.model_dump(exclude_none=False), data_id=motor_id
+            motor.model_dump(exclude_none=False),
+            data_id=motor_id,
+            validated=True,
         )
 
     @repository_exception_handler
@@ -0,0 +1,151 @@
+from functools import cache
+from typing import Optional, Sequence
+
+import bson
+from opentelemetry import metrics
+
+from src import logger
+from src.cache import LRUCache, SocketCache
+from src.secrets import Secrets
+
+meter = metrics.get_meter(__name__)
+
+# Read-through cache of find_by_id for models with READ_CACHE, opt-in
+# since the process tier of other workers is not invalidated: documents
+# are kept in process for READ_CACHE_TTL seconds and, when
+# READ_CACHE_SOCKET names a memcached socket, shared by the workers of the
+# host.
+READ_CACHE_ENABLED = Secrets.get_flag("READ_CACHE")
+READ_CACHE_ITEMS = int(Secrets.get_secret("READ_CACHE_ITEMS", 128))
+READ_CACHE_BYTES = int(Secrets.get_secret("READ_CACHE_BYTES", 64 * 2**20))
+READ_CACHE_TTL = float(Secrets.get_secret("READ_CACHE_TTL", 30))
+READ_CACHE_SOCKET = Secrets.get_secret("READ_CACHE_SOCKET")
+
+
+class ReadCache:
+    """
+    Read-through cache of raw documents by collection and id, kept as
+    BSON so callers never share a cached document.
+
+    The in-process tier is checked first, then the optional shared
+    tier; documents found in the shared tier are copied to the process.
+    Writes invalidate both tiers of the writing process, while other
+    processes may serve their copy until it expires. Every invalidation
+    bumps ``generation``, so a fill read from the database before a
+    concurrent write is dropped instead of caching the old document.
+    Lookups are counted
+    on the cache and mirrored to the OpenTelemetry
+    ``db.client.cache.lookups`` counter.
+
+    Init Attributes:
+        memory_tier: in-process LRUCache.
+        shared_tier: cache shared across processes, or None.
+    """
+
+    def __init__(
+        self,
+        memory_tier: LRUCache,
+        shared_tier: Optional[SocketCache] = None,
+    ):
+        self.memory_tier = memory_tier
+        self.shared_tier = shared_tier
+        self.hits = {"memory": 0, "shared": 0}
+        self.misses = {"memory": 0, "shared": 0}
+        self.generation = 0
+        self._lookups = meter.create_counter(
+            "db.client.cache.lookups",
+            unit="{lookup}",
+            description="Read cache lookups, by tier and result.",
+        )
+
+    def _count(self, collection: str, tier: str, hit: bool):
+        (self.hits if hit else self.misses)[tier] += 1
+        self._lookups.add(
+            1,
+            {
+                "db.collection.name": collection,
+                "cache.tier": tier,
+                "cache.result": "hit" if hit else "miss",
+            },
+        )
+
+    @staticmethod
+    def _key(collection: str, data_id: str) -> str:
+        return f"rocketpy:{collection}:{data_id}"
+
+    async def get(self, collection: str, data_id: str) -> Optional[dict]:
+        key = self._key(collection, data_id)
+        payload = self.memory_tier.get(key)
+        self._count(collection, "memory", payload is not None)
+        if payload is None and self.shared_tier is not None:
+            try:
+                payload = await self.shared_tier.get(key)
+            except ConnectionError as e:
+                logger.warning(f"Shared read cache unavailable: {e}")
+                return None
+            self._count(collection, "shared", payload is not None)
+            if payload is not None:
+                self.memory_tier.put(key, payload, size=len(payload))
+        return None if payload is None else bson.decode(payload)
+
+    async def put(
+        self,
+        collection: str,
+        data_id: str,
+        document: dict,
+        generation: Optional[int] = None,
+    ):
+        """
+        Cache a document read from the database; skipped when
+        ``generation``, taken before the read, is no longer current.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        key = self._key(collection, data_id)
+        payload = bson.encode(document)
+        self.memory_tier.put(key, payload, size=len(payload))
+        if self.shared_tier is None:
+            return
+        try:
+            await self.shared_tier.put(key, payload)
+        except ConnectionError as e:
+            logger.warning(f"Shared read cache unavailable: {e}")
+
+    async def invalidate(self, collection: str, data_ids: Sequence[str]):
+        self.generation += 1
+        keys = [self._key(collection, data_id) for data_id in data_ids]
+        for key in keys:
+            self.memory_tier.pop(key)
+        if self.shared_tier is None:
+            return
+        try:
+            for key in keys:
+                await self.shared_tier.delete(key)
+        except ConnectionError as e:
+            logger.warning(f"Shared read cache unavailable: {e}")
+
+    def snapshot(self) -> dict:
+        return {"hits": dict(self.hits), "misses": dict(self.misses)}
+
+
+@cache
+def get_read_cache() -> ReadCache:
+    """
+    Provides the process-wide read cache of find_by_id, bounded by
+    READ_CACHE_ITEMS, READ_CACHE_BYTES and READ_CACHE_TTL.
+
+    Returns:
+        ReadCache: Shared cache of raw documents.
+    """
+    return ReadCache(
+        LRUCache(
+            max_items=READ_CACHE_ITEMS,
+            max_size=READ_CACHE_BYTES,
+            ttl=READ_CACHE_TTL,
+        ),
+        (
+            SocketCache(READ_CACHE_SOCKET, ttl=int(READ_CACHE_TTL))
+            if READ_CACHE_SOCKET
+            else None
+        ),
+    )
@@ -14,12 +14,16 @@ class RocketRepository(RepositoryInterface):
         rocket: models.RocketModel
     """
 
+    READ_CACHE = True
+
     def __init__(self):
         super().__init__(RocketModel)
 
     @repository_exception_handler
     async def create_rocket(self, rocket: RocketModel) -> str:
-        return await self.insert(rocket.model_dump(exclude_none=True))
+        return await self.insert(
+            rocket.model_dump(exclude_none=True), validated=True
+        )
 
     @repository_exception_handler
     async def read_rocket_by_id(self, rocket_id: str) -> Optional[RocketModel]:
@@ -28,7 +32,9 @@ class RocketRepository(RepositoryInterface):
     @repository_exception_handler
     async def update_rocket_by_id(self, rocket_id: str, rocket: RocketModel):
         await self.update_by_id(
-            rocket.model_dump(exclude_none=False), data_id=rocket_id
+            rocket.model_dump(exclude_none=False),
+            data_id=rocket_id,
+            validated=True,
         )
 
     @repository_exception_handler
@@ -0,0 +1,115 @@
+from functools import partial
+from typing import Iterable, List, Optional, Set
+
+from src.cache import LRUCache
+from src.compression import PrecompressedBody
+from src.models.simulation import SimulationCacheModel
+from src.repositories.interface import (
+    RepositoryInterface,
+    repository_exception_handler,
+)
+from src.secrets import Secrets
+
+
+class SimulationRepository(RepositoryInterface):
+    """
+    Two-tier store of simulation results: an in-process LRU in front of
+    the Mongo collection. Documents use the content hash as ``_id``.
+
+    The in-process tier keeps each result as a PrecompressedBody, so
+    the content-coded variants served from it are built once; they count
+    towards SIMULATION_CACHE_BYTES as they are built.
+
+    Equal designs share an entry, so each one records the ``owners``
+    whose simulations produced it and is only deleted with the last of
+    them. The in-process tier only knows the owners it has seen, so it
+    may evict an entry that MongoDB still keeps for another owner.
+
+    Init Attributes:
+        simulation: models.SimulationCacheModel
+    """
+
+    memory_tier = LRUCache(
+        max_items=int(Secrets.get_secret("SIMULATION_CACHE_ITEMS", 64)),
+        max_size=int(
+            Secrets.get_secret("SIMULATION_CACHE_BYTES", 64 * 1024 * 1024)
+        ),
+    )
+
+    def __init__(self):
+        super().__init__(SimulationCacheModel)
+
+    @repository_exception_handler
+    async def read_simulation_body_by_key(
+        self, key: str
+    ) -> Optional[PrecompressedBody]:
+        entry = self.memory_tier.get(key)
+        if entry is not None:
+            return entry[1]
+        document = await self.get_collection().find_one({"_id": key})
+        if document is None:
+            return None
+        body = PrecompressedBody(key, bytes(document["payload"]))
+        self._remember(key, set(document.get("owners", ())), body)
+        return body
+
+    @repository_exception_handler
+    async def read_simulation_by_key(self, key: str) -> Optional[bytes]:
+        body = await self.read_simulation_body_by_key(key)
+        return None if body is None else body.payload
+
+    @repository_exception_handler
+    async def create_simulation(self, simulation: SimulationCacheModel):
+        payload = simulation.payload
+        cached = self.memory_tier.get(simulation.key)
+        owners = {simulation.owner}.union(() if cached is None else cached[0])
+        self._remember(
+            simulation.key, owners, PrecompressedBody(simulation.key, payload)
+        )
+        # Refreshing created_at restarts the entry's expiry.
+        await self.get_collection().update_one(
+            {"_id": simulation.key},
+            {
+                "$set": simulation.model_dump(exclude={"key", "owner"}),
+                "$addToSet": {"owners": simulation.owner},
+            },
+            upsert=True,
+        )
+
+    @repository_exception_handler
+    async def delete_simulations_by_owner(self, owner: str):
+        await self.delete_simulations_by_owners([owner])
+
+    @repository_exception_handler
+    async def delete_simulations_by_owners(self, owners: List[str]):
+        """
+        Remove ``owners`` from the entries they share and delete the
+        entries no owner is left on.
+        """
+        stale = set(owners)
+        self.memory_tier.evict_if(
+            lambda _, entry: not self._release(entry[0], stale)
+        )
+        collection = self.get_collection()
+        keys = await collection.distinct("_id", {"owners": {"$in": owners}})
+        if not keys:
+            return
+        await collection.update_many(
+            {"_id": {"$in": keys}}, {"$pull": {"owners": {"$in": owners}}}
+        )
+        await collection.delete_many({"_id": {"$in": keys}, "owners": []})
+
+    def _remember(self, key: str, owners: Set[str], body: PrecompressedBody):
+        """
+        Keep ``body`` in the memory tier, sized by its payload and the
+        variants it builds later on.
+        """
+        entry = (owners, body)
+        body.on_resize = partial(self.memory_tier.resize, key, entry)
+        self.memory_tier.put(key, entry, size=body.size)
+
+    @staticmethod
+    def _release(owners: Set[str], stale: Iterable[str]) -> Set[str]:
+        """Drop ``stale`` from an in-process entry's owners."""
+        owners.difference_update(stale)
+        return owners
@@ -0,0 +1,55 @@
+"""
+Database administration routes
+"""
+
+from fastapi import APIRouter, Depends
+from opentelemetry import trace
+
+from src.models.admin import QueryExplainRequest
+from src.views.admin import IndexReport, QueryPlan
+from src.dependencies import AdminControllerDep, check_admin_endpoints
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["ADMIN"],
+    dependencies=[Depends(check_admin_endpoints)],
+    responses={
+        404: {"description": "Not found"},
+        422: {"description": "Unprocessable Entity"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+
+tracer = trace.get_tracer(__name__)
+
+
+@router.get("/indexes")
+async def read_indexes(controller: AdminControllerDep) -> IndexReport:
+    """
+    Reports the indexes of every collection, how often each one served a
+    query, and declared indexes that are missing
+    """
+    with tracer.start_as_current_span("read_indexes"):
+        return await controller.get_index_report()
+
+
+@router.post("/explain/{collection}")
+async def explain_query(
+    collection: str,
+    request: QueryExplainRequest,
+    controller: AdminControllerDep,
+) -> QueryPlan:
+    """
+    Explains a query: the winning plan, the indexes it uses and the keys
+    and documents it examined. The query runs once on the server
+
+    ## Args
+    ```
+        collection: environment, motor, rocket, flight, simulation or job
+        filter: find() filter, e.g. {"motor_kind": "SOLID"}
+        sort: find() sort, e.g. {"name": 1}
+        limit: find() limit, 0 for none
+    ```
+    """
+    with tracer.start_as_current_span("explain_query"):
+        return await controller.explain_query(collection, request)
@@ -2,16 +2,39 @@
 Environment routes
 """
 
+from typing import Union
+
 from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from opentelemetry import trace
 
 from src.views.environment import (
     EnvironmentSimulation,
     EnvironmentCreated,
     EnvironmentRetrieved,
+    EnvironmentsRetrieved,
 )
+from src.views.interface import BulkCreated, BulkDeleted, DocumentPage
 from src.models.environment import EnvironmentModel
-from src.dependencies import EnvironmentControllerDep
+from src.compression import precompressed_response
+from src.dependencies import (
+    BulkDocumentsBody,
+    BulkIdsBody,
+    BulkIdsDep,
+    DocumentFieldsDep,
+    ListFormat,
+    ListFormatQuery,
+    PageCursorQuery,
+    PageLimitQuery,
+    DEFAULT_PAGE_LIMIT,
+    EnvironmentControllerDep,
+    CurveMethodQuery,
+    CurvePointsQuery,
+    SimulationFieldsDep,
+    AcceptEncodingHeader,
+    IfNoneMatchHeader,
+)
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 router = APIRouter(
     prefix="/environments",
@@ -41,6 +64,74 @@ async def create_environment(
         return await controller.post_environment(environment)
 
 
+@router.post("/bulk", status_code=207)
+async def create_environments(
+    environments: BulkDocumentsBody,
+    controller: EnvironmentControllerDep,
+) -> BulkCreated:
+    """
+    Creates several environments with a single database write
+
+    ## Args
+    ``` [models.Environment JSON] ```
+
+    Items are reported in request order with their own status (201 or
+    422) and new environment_id.
+    """
+    with tracer.start_as_current_span("create_environments"):
+        return await controller.post_environment_bulk(environments)
+
+
+@router.get("/")
+async def read_environments(
+    controller: EnvironmentControllerDep,
+    ids: BulkIdsDep,
+    fields: DocumentFieldsDep,
+    after: PageCursorQuery = None,
+    limit: PageLimitQuery = DEFAULT_PAGE_LIMIT,
+    format: ListFormatQuery = ListFormat.JSON,  # pylint: disable=redefined-builtin
+) -> Union[EnvironmentsRetrieved, DocumentPage]:
+    """
+    Lists stored environments, or reads the ones listed in ``ids``
+
+    ## Args
+    ```
+        ids: comma-separated environment ids, each reported with its own
+            status (200 or 404); paging arguments are ignored
+        after: next_cursor of the previous page
+        limit: environments per page
+        fields: comma-separated fields to return
+        format: json for one page, ndjson to stream every environment
+    ```
+    """
+    with tracer.start_as_current_span("read_environments"):
+        if ids is not None:
+            return await controller.get_environment_by_ids(ids)
+        if format == ListFormat.NDJSON:
+            return StreamingResponse(
+                await controller.stream_environment_documents(after, fields),
+                media_type="application/x-ndjson",
+            )
+        return await controller.get_environment_page(after, limit, fields)
+
+
+@router.delete("/bulk", status_code=207)
+async def delete_environments(
+    ids: BulkIdsBody,
+    controller: EnvironmentControllerDep,
+) -> BulkDeleted:
+    """
+    Deletes several existing environments
+
+    ## Args
+    ``` [environment_id: str] ```
+
+    Every requested id is reported with its own status (204 or 404).
+    """
+    with tracer.start_as_current_span("delete_environments"):
+        return await controller.delete_environment_by_ids(ids)
+
+
 @router.get("/{environment_id}")
 async def read_environment(
     environment_id: str,
@@ -129,16 +220,36 @@ async def get_rocketpy_environment_binary(
         )
 
 
-@router.get("/{environment_id}/simulate")
+@router.get(
+    "/{environment_id}/simulate",
+    response_model=EnvironmentSimulation,
+    responses={304: {"description": "Cached simulation not modified"}},
+)
 async def get_environment_simulation(
     environment_id: str,
     controller: EnvironmentControllerDep,
-) -> EnvironmentSimulation:
+    fields: SimulationFieldsDep,
+    points: CurvePointsQuery = DEFAULT_CURVE_POINTS,
+    method: CurveMethodQuery = CurveDownsampling.UNIFORM,
+    accept_encoding: AcceptEncodingHeader = None,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
     """
     Simulates an environment
 
     ## Args
     ``` environment_id: Environment ID```
+    ``` points: samples kept per curve (query) ```
+    ``` method: uniform | lttb | minmax (query) ```
+    ``` fields: comma-separated attributes to compute (query) ```
+
+    Results are served precompressed with a strong ETag; send it back
+    as If-None-Match to get 304 Not Modified while it is current.
     """
     with tracer.start_as_current_span("get_environment_simulation"):
-        return await controller.get_environment_simulation(environment_id)
+        simulation = await controller.get_environment_simulation(
+            environment_id, points, method, fields, encoded=True
+        )
+        return await precompressed_response(
+            simulation, accept_encoding, if_none_match
+        )
@@ -3,6 +3,7 @@ Flight routes with dependency injection for improved performance.
 """
 
 import json
+from typing import Union
 
 from fastapi import (
     APIRouter,
@@ -12,18 +13,56 @@ from fastapi import (
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 from opentelemetry import trace
 
 from src.views.flight import (
     FlightSimulation,
     FlightCreated,
     FlightRetrieved,
+    FlightsRetrieved,
     FlightImported,
+    FlightMonteCarloSimulation,
+    FlightSweepSimulation,
 )
+from src.views.interface import BulkCreated, BulkDeleted, DocumentPage
+from src.views.job import JobCreated
 from src.models.environment import EnvironmentModel
-from src.models.flight import FlightModel, FlightWithReferencesRequest
+from src.models.flight import (
+    FlightModel,
+    FlightMonteCarloRequest,
+    FlightSweepRequest,
+    FlightWithReferencesRequest,
+)
 from src.models.rocket import RocketModel
-from src.dependencies import FlightControllerDep
+from src.compression import precompressed_response
+from src.dependencies import (
+    BulkDocumentsBody,
+    BulkIdsBody,
+    BulkIdsDep,
+    DocumentFieldsDep,
+    ListFormat,
+    ListFormatQuery,
+    PageCursorQuery,
+    PageLimitQuery,
+    ResolveReferencesQuery,
+    DEFAULT_PAGE_LIMIT,
+    FlightControllerDep,
+    IfMatchVersionDep,
+    MergePatchBody,
+    CurveMethodQuery,
+    CurvePointsQuery,
+    SimulationFieldsDep,
+    AcceptEncodingHeader,
+    IfNoneMatchHeader,
+    KmlMaxPointsQuery,
+    KmzQuery,
+    StreamSimulationQuery,
+    TimeseriesColumnsDep,
+    TimeseriesFormatQuery,
+)
+from src.services.timeseries import TimeseriesFormat
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 router = APIRouter(
     prefix="/flights",
@@ -74,6 +113,79 @@ async def create_flight_from_references(
         return await controller.create_flight_from_references(payload)
 
 
+@router.post("/bulk", status_code=207)
+async def create_flights(
+    flights: BulkDocumentsBody,
+    controller: FlightControllerDep,
+) -> BulkCreated:
+    """
+    Creates several flights with a single database write
+
+    ## Args
+    ``` [models.Flight JSON] ```
+
+    Items are reported in request order with their own status (201 or
+    422) and new flight_id.
+    """
+    with tracer.start_as_current_span("create_flights"):
+        return await controller.post_flight_bulk(flights)
+
+
+@router.get("/")
+async def read_flights(
+    controller: FlightControllerDep,
+    ids: BulkIdsDep,
+    fields: DocumentFieldsDep,
+    after: PageCursorQuery = None,
+    limit: PageLimitQuery = DEFAULT_PAGE_LIMIT,
+    format: ListFormatQuery = ListFormat.JSON,  # pylint: disable=redefined-builtin
+    resolve: ResolveReferencesQuery = True,
+) -> Union[FlightsRetrieved, DocumentPage]:
+    """
+    Lists stored flights, or reads the ones listed in ``ids``
+
+    ## Args
+    ```
+        ids: comma-separated flight ids, each reported with its own
+            status (200 or 404); paging arguments are ignored
+        after: next_cursor of the previous page
+        limit: flights per page
+        fields: comma-separated fields to return
+        format: json for one page, ndjson to stream every flight
+        resolve: false to list flights stored with references as
+            environment_id and rocket_id, without reading those documents
+    ```
+    """
+    with tracer.start_as_current_span("read_flights"):
+        if ids is not None:
+            return await controller.get_flight_by_ids(ids)
+        if format == ListFormat.NDJSON:
+            return StreamingResponse(
+                await controller.stream_flight_documents(
+                    after, fields, resolve
+                ),
+                media_type="application/x-ndjson",
+            )
+        return await controller.get_flight_page(after, limit, fields, resolve)
+
+
+@router.delete("/bulk", status_code=207)
+async def delete_flights(
+    ids: BulkIdsBody,
+    controller: FlightControllerDep,
+) -> BulkDeleted:
+    """
+    Deletes several existing flights
+
+    ## Args
+    ``` [flight_id: str] ```
+
+    Every requested id is reported with its own status (204 or 404).
+    """
+    with tracer.start_as_current_span("delete_flights"):
+        return await controller.delete_flight_by_ids(ids)
+
+
 @router.get("/{flight_id}")
 async def read_flight(
     flight_id: str,
@@ -108,6 +220,43 @@ async def update_flight(
         return await controller.put_flight_by_id(flight_id, flight)
 
 
+@router.patch(
+    "/{flight_id}",
+    status_code=204,
+    responses={
+        409: {"description": "Flight kept being modified concurrently"},
+        412: {"description": "Flight modified since the If-Match version"},
+    },
+)
+async def patch_flight(
+    flight_id: str,
+    patch: MergePatchBody,
+    controller: FlightControllerDep,
+    response: Response,
+    version: IfMatchVersionDep,
+) -> None:
+    """
+    Partially updates an existing flight with a JSON merge patch.
+
+    Only the patched fields are written. The new version is returned in
+    the ETag header; send it back as If-Match to fail with 412 instead
+    of overwriting concurrent changes. Without If-Match the patch is
+    applied to the newest flight, and 409 answers a flight that kept
+    changing meanwhile.
+
+    ## Args
+    ```
+        flight_id: str
+        patch: JSON merge patch, e.g. {"rail_length": 5.2}
+    ```
+    """
+    with tracer.start_as_current_span("patch_flight"):
+        new_version = await controller.patch_flight_by_id(
+            flight_id, patch, version=version
+        )
+        response.headers["ETag"] = f'"{new_version}"'
+
+
 @router.put("/{flight_id}/from-references", status_code=204)
 async def update_flight_from_references(
     flight_id: str,
@@ -305,8 +454,11 @@ async def update_flight_rocket(
     "/{flight_id}/kml",
     responses={
         200: {
-            "description": "KML trajectory file download",
-            "content": {"application/vnd.google-earth.kml+xml": {}},
+            "description": "KML or KMZ trajectory file download",
+            "content": {
+                "application/vnd.google-earth.kml+xml": {},
+                "application/vnd.google-earth.kmz": {},
+            },
         }
     },
     status_code=200,
@@ -315,38 +467,194 @@ async def update_flight_rocket(
 async def get_flight_kml(
     flight_id: str,
     controller: FlightControllerDep,
+    max_points: KmlMaxPointsQuery = None,
+    kmz: KmzQuery = False,
 ):
     """
     Export a flight trajectory as a KML file for Google Earth.
 
     ## Args
     ``` flight_id: str ```
+    ``` max_points: trajectory points kept (query) ```
+    ``` kmz: zip the KML into a KMZ archive (query) ```
     """
     with tracer.start_as_current_span("get_flight_kml"):
-        kml = await controller.get_flight_kml(flight_id)
+        content = await controller.get_flight_kml(flight_id, max_points, kmz)
+        extension, media_type = (
+            ("kmz", "application/vnd.google-earth.kmz")
+            if kmz
+            else ("kml", "application/vnd.google-earth.kml+xml")
+        )
         headers = {
             "Content-Disposition": (
-                f'attachment; filename="flight_{flight_id}.kml"'
+                f'attachment; filename="flight_{flight_id}.{extension}"'
             ),
         }
         return Response(
-            content=kml,
+            content=content,
             headers=headers,
-            media_type="application/vnd.google-earth.kml+xml",
+            media_type=media_type,
             status_code=200,
         )
 
 
-@router.get("/{flight_id}/simulate")
+@router.get(
+    "/{flight_id}/timeseries",
+    responses={
+        200: {
+            "description": "Flight time series table download",
+            "content": {
+                table_format.media_type: {}
+                for table_format in TimeseriesFormat
+            },
+        },
+        422: {"description": "Unknown time series column"},
+        501: {"description": "Format needs pyarrow, which is missing"},
+    },
+    status_code=200,
+    response_class=Response,
+)
+async def get_flight_timeseries(
+    flight_id: str,
+    controller: FlightControllerDep,
+    columns: TimeseriesColumnsDep,
+    table_format: TimeseriesFormatQuery = TimeseriesFormat.CSV,
+):
+    """
+    Export the full-resolution flight solution and derived curves as a
+    columnar table with one shared time column.
+
+    ## Args
+    ``` flight_id: str ```
+    ``` format: arrow | parquet | npz | csv (query) ```
+    ``` columns: comma-separated derived curves, e.g. altitude (query) ```
+    """
+    with tracer.start_as_current_span("get_flight_timeseries"):
+        content = await controller.get_flight_timeseries(
+            flight_id, table_format, columns
+        )
+        headers = {
+            "Content-Disposition": (
+                f'attachment; filename="flight_{flight_id}_timeseries.'
+                f'{table_format.value}"'
+            ),
+        }
+        return Response(
+            content=content,
+            headers=headers,
+            media_type=table_format.media_type,
+            status_code=200,
+        )
+
+
+@router.get(
+    "/{flight_id}/simulate",
+    response_model=FlightSimulation,
+    responses={304: {"description": "Cached simulation not modified"}},
+)
 async def get_flight_simulation(
     flight_id: str,
     controller: FlightControllerDep,
-) -> FlightSimulation:
+    fields: SimulationFieldsDep,
+    points: CurvePointsQuery = DEFAULT_CURVE_POINTS,
+    method: CurveMethodQuery = CurveDownsampling.UNIFORM,
+    stream: StreamSimulationQuery = False,
+    accept_encoding: AcceptEncodingHeader = None,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
     """
     Simulates a flight
 
     ## Args
     ``` flight_id: Flight ID ```
+    ``` points: samples kept per curve (query) ```
+    ``` method: uniform | lttb | minmax (query) ```
+    ``` fields: comma-separated attributes to compute (query) ```
+    ``` stream: send the JSON in chunks as it is serialized (query) ```
+
+    Results are served precompressed with a strong ETag; send it back
+    as If-None-Match to get 304 Not Modified while it is current.
+    Streamed results have no ETag. Streaming only spares the server the
+    JSON string: a new simulation is still computed and held in full by
+    a worker before the first chunk is sent.
     """
     with tracer.start_as_current_span("get_flight_simulation"):
-        return await controller.get_flight_simulation(flight_id)
+        if stream:
+            return StreamingResponse(
+                await controller.stream_flight_simulation(
+                    flight_id, points, method, fields
+                ),
+                media_type="application/json",
+            )
+        simulation = await controller.get_flight_simulation(
+            flight_id, points, method, fields, encoded=True
+        )
+        return await precompressed_response(
+            simulation, accept_encoding, if_none_match
+        )
+
+
+@router.post("/{flight_id}/simulate/jobs", status_code=202)
+async def create_flight_simulation_job(
+    flight_id: str,
+    controller: FlightControllerDep,
+    fields: SimulationFieldsDep,
+    points: CurvePointsQuery = DEFAULT_CURVE_POINTS,
+    method: CurveMethodQuery = CurveDownsampling.UNIFORM,
+) -> JobCreated:
+    """
+    Queues a flight simulation and returns its job id immediately.
+    Poll ``GET /jobs/{job_id}`` for its status and result.
+
+    ## Args
+    ``` flight_id: Flight ID ```
+    ``` points, method, fields: as in GET /flights/{flight_id}/simulate ```
+    """
+    with tracer.start_as_current_span("create_flight_simulation_job"):
+        return await controller.post_flight_simulation_job(
+            flight_id, points, method, fields
+        )
+
+
+@router.post("/{flight_id}/montecarlo")
+async def create_flight_monte_carlo(
+    flight_id: str,
+    payload: FlightMonteCarloRequest,
+    controller: FlightControllerDep,
+) -> FlightMonteCarloSimulation:
+    """
+    Runs a Monte Carlo dispersion study around a flight and returns
+    summary statistics of apogee, max Mach number and impact point.
+
+    ## Args
+    ```
+        flight_id: Flight ID
+        samples: number of simulated flights
+        seed: optional random seed, for reproducible studies
+        dispersions: [{path, distribution, mean, std, low, high}]
+        percentiles: percentiles reported for every output
+    ```
+    """
+    with tracer.start_as_current_span("create_flight_monte_carlo"):
+        return await controller.post_flight_monte_carlo(flight_id, payload)
+
+
+@router.post("/{flight_id}/sweep")
+async def create_flight_sweep(
+    flight_id: str,
+    payload: FlightSweepRequest,
+    controller: FlightControllerDep,
+) -> FlightSweepSimulation:
+    """
+    Simulates a flight over every combination of the swept field values
+    and returns the requested outputs as columns, one row per grid point.
+
+    ## Args
+    ```
+        flight_id: Flight ID
+        parameters: [{path, values} or {path, start, stop, num}]
+        outputs: scalar flight outputs to record, e.g. apogee
+    ```
+    """
+    with tracer.start_as_current_span("create_flight_sweep"):
+        return await controller.post_flight_sweep(flight_id, payload)
@@ -0,0 +1,36 @@
+"""
+Simulation job routes
+"""
+
+from fastapi import APIRouter
+from opentelemetry import trace
+
+from src.views.job import JobRetrieved
+from src.dependencies import JobControllerDep
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["JOB"],
+    responses={
+        404: {"description": "Not found"},
+        422: {"description": "Unprocessable Entity"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+
+tracer = trace.get_tracer(__name__)
+
+
+@router.get("/{job_id}")
+async def read_job(
+    job_id: str,
+    controller: JobControllerDep,
+) -> JobRetrieved:
+    """
+    Reads a simulation job: its status and, once succeeded, its result
+
+    ## Args
+    ``` job_id: Job ID ```
+    """
+    with tracer.start_as_current_span("read_job"):
+        return await controller.get_job_by_id(job_id)
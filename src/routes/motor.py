@@ -2,17 +2,40 @@
 Motor routes
 """
 
+from typing import Union
+
 from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from opentelemetry import trace
 
 from src.views.motor import (
     MotorSimulation,
     MotorCreated,
     MotorRetrieved,
+    MotorsRetrieved,
     MotorDrawingGeometryView,
 )
+from src.views.interface import BulkCreated, BulkDeleted, DocumentPage
 from src.models.motor import MotorModel
-from src.dependencies import MotorControllerDep
+from src.compression import precompressed_response
+from src.dependencies import (
+    BulkDocumentsBody,
+    BulkIdsBody,
+    BulkIdsDep,
+    DocumentFieldsDep,
+    ListFormat,
+    ListFormatQuery,
+    PageCursorQuery,
+    PageLimitQuery,
+    DEFAULT_PAGE_LIMIT,
+    MotorControllerDep,
+    CurveMethodQuery,
+    CurvePointsQuery,
+    SimulationFieldsDep,
+    AcceptEncodingHeader,
+    IfNoneMatchHeader,
+)
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 router = APIRouter(
     prefix="/motors",
@@ -67,6 +90,74 @@ async def create_motor(
         return await controller.post_motor(motor)
 
 
+@router.post("/bulk", status_code=207)
+async def create_motors(
+    motors: BulkDocumentsBody,
+    controller: MotorControllerDep,
+) -> BulkCreated:
+    """
+    Creates several motors with a single database write
+
+    ## Args
+    ``` [models.Motor JSON] ```
+
+    Items are reported in request order with their own status (201 or
+    422) and new motor_id.
+    """
+    with tracer.start_as_current_span("create_motors"):
+        return await controller.post_motor_bulk(motors)
+
+
+@router.get("/")
+async def read_motors(
+    controller: MotorControllerDep,
+    ids: BulkIdsDep,
+    fields: DocumentFieldsDep,
+    after: PageCursorQuery = None,
+    limit: PageLimitQuery = DEFAULT_PAGE_LIMIT,
+    format: ListFormatQuery = ListFormat.JSON,  # pylint: disable=redefined-builtin
+) -> Union[MotorsRetrieved, DocumentPage]:
+    """
+    Lists stored motors, or reads the ones listed in ``ids``
+
+    ## Args
+    ```
+        ids: comma-separated motor ids, each reported with its own
+            status (200 or 404); paging arguments are ignored
+        after: next_cursor of the previous page
+        limit: motors per page
+        fields: comma-separated fields to return
+        format: json for one page, ndjson to stream every motor
+    ```
+    """
+    with tracer.start_as_current_span("read_motors"):
+        if ids is not None:
+            return await controller.get_motor_by_ids(ids)
+        if format == ListFormat.NDJSON:
+            return StreamingResponse(
+                await controller.stream_motor_documents(after, fields),
+                media_type="application/x-ndjson",
+            )
+        return await controller.get_motor_page(after, limit, fields)
+
+
+@router.delete("/bulk", status_code=207)
+async def delete_motors(
+    ids: BulkIdsBody,
+    controller: MotorControllerDep,
+) -> BulkDeleted:
+    """
+    Deletes several existing motors
+
+    ## Args
+    ``` [motor_id: str] ```
+
+    Every requested id is reported with its own status (204 or 404).
+    """
+    with tracer.start_as_current_span("delete_motors"):
+        return await controller.delete_motor_by_ids(ids)
+
+
 @router.get("/{motor_id}")
 async def read_motor(
     motor_id: str,
@@ -151,19 +242,39 @@ async def get_rocketpy_motor_binary(
         )
 
 
-@router.get("/{motor_id}/simulate")
+@router.get(
+    "/{motor_id}/simulate",
+    response_model=MotorSimulation,
+    responses={304: {"description": "Cached simulation not modified"}},
+)
 async def get_motor_simulation(
     motor_id: str,
     controller: MotorControllerDep,
-) -> MotorSimulation:
+    fields: SimulationFieldsDep,
+    points: CurvePointsQuery = DEFAULT_CURVE_POINTS,
+    method: CurveMethodQuery = CurveDownsampling.UNIFORM,
+    accept_encoding: AcceptEncodingHeader = None,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
     """
     Simulates a motor
 
     ## Args
     ``` motor_id: Motor ID ```
+    ``` points: samples kept per curve (query) ```
+    ``` method: uniform | lttb | minmax (query) ```
+    ``` fields: comma-separated attributes to compute (query) ```
+
+    Results are served precompressed with a strong ETag; send it back
+    as If-None-Match to get 304 Not Modified while it is current.
     """
     with tracer.start_as_current_span("get_motor_simulation"):
-        return await controller.get_motor_simulation(motor_id)
+        simulation = await controller.get_motor_simulation(
+            motor_id, points, method, fields, encoded=True
+        )
+        return await precompressed_response(
+            simulation, accept_encoding, if_none_match
+        )
 
 
 @router.get("/{motor_id}/drawing-geometry")
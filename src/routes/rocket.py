@@ -2,20 +2,43 @@
 Rocket routes
 """
 
+from typing import Union
+
 from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from opentelemetry import trace
 
 from src.views.rocket import (
     RocketSimulation,
     RocketCreated,
     RocketRetrieved,
+    RocketsRetrieved,
     RocketDrawingGeometry,
 )
+from src.views.interface import BulkCreated, BulkDeleted, DocumentPage
 from src.models.rocket import (
     RocketModel,
     RocketWithMotorReferenceRequest,
 )
-from src.dependencies import RocketControllerDep
+from src.compression import precompressed_response
+from src.dependencies import (
+    BulkDocumentsBody,
+    BulkIdsBody,
+    BulkIdsDep,
+    DocumentFieldsDep,
+    ListFormat,
+    ListFormatQuery,
+    PageCursorQuery,
+    PageLimitQuery,
+    DEFAULT_PAGE_LIMIT,
+    RocketControllerDep,
+    CurveMethodQuery,
+    CurvePointsQuery,
+    SimulationFieldsDep,
+    AcceptEncodingHeader,
+    IfNoneMatchHeader,
+)
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 router = APIRouter(
     prefix="/rockets",
@@ -63,6 +86,74 @@ async def create_rocket_from_motor_reference(
         return await controller.create_rocket_from_motor_reference(payload)
 
 
+@router.post("/bulk", status_code=207)
+async def create_rockets(
+    rockets: BulkDocumentsBody,
+    controller: RocketControllerDep,
+) -> BulkCreated:
+    """
+    Creates several rockets with a single database write
+
+    ## Args
+    ``` [models.Rocket JSON] ```
+
+    Items are reported in request order with their own status (201 or
+    422) and new rocket_id.
+    """
+    with tracer.start_as_current_span("create_rockets"):
+        return await controller.post_rocket_bulk(rockets)
+
+
+@router.get("/")
+async def read_rockets(
+    controller: RocketControllerDep,
+    ids: BulkIdsDep,
+    fields: DocumentFieldsDep,
+    after: PageCursorQuery = None,
+    limit: PageLimitQuery = DEFAULT_PAGE_LIMIT,
+    format: ListFormatQuery = ListFormat.JSON,  # pylint: disable=redefined-builtin
+) -> Union[RocketsRetrieved, DocumentPage]:
+    """
+    Lists stored rockets, or reads the ones listed in ``ids``
+
+    ## Args
+    ```
+        ids: comma-separated rocket ids, each reported with its own
+            status (200 or 404); paging arguments are ignored
+        after: next_cursor of the previous page
+        limit: rockets per page
+        fields: comma-separated fields to return
+        format: json for one page, ndjson to stream every rocket
+    ```
+    """
+    with tracer.start_as_current_span("read_rockets"):
+        if ids is not None:
+            return await controller.get_rocket_by_ids(ids)
+        if format == ListFormat.NDJSON:
+            return StreamingResponse(
+                await controller.stream_rocket_documents(after, fields),
+                media_type="application/x-ndjson",
+            )
+        return await controller.get_rocket_page(after, limit, fields)
+
+
+@router.delete("/bulk", status_code=207)
+async def delete_rockets(
+    ids: BulkIdsBody,
+    controller: RocketControllerDep,
+) -> BulkDeleted:
+    """
+    Deletes several existing rockets
+
+    ## Args
+    ``` [rocket_id: str] ```
+
+    Every requested id is reported with its own status (204 or 404).
+    """
+    with tracer.start_as_current_span("delete_rockets"):
+        return await controller.delete_rocket_by_ids(ids)
+
+
 @router.get("/{rocket_id}")
 async def read_rocket(
     rocket_id: str,
@@ -169,19 +260,39 @@ async def get_rocketpy_rocket_binary(
         )
 
 
-@router.get("/{rocket_id}/simulate")
+@router.get(
+    "/{rocket_id}/simulate",
+    response_model=RocketSimulation,
+    responses={304: {"description": "Cached simulation not modified"}},
+)
 async def simulate_rocket(
     rocket_id: str,
     controller: RocketControllerDep,
-) -> RocketSimulation:
+    fields: SimulationFieldsDep,
+    points: CurvePointsQuery = DEFAULT_CURVE_POINTS,
+    method: CurveMethodQuery = CurveDownsampling.UNIFORM,
+    accept_encoding: AcceptEncodingHeader = None,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
     """
     Simulates a rocket
 
     ## Args
     ``` rocket_id: Rocket ID ```
+    ``` points: samples kept per curve (query) ```
+    ``` method: uniform | lttb | minmax (query) ```
+    ``` fields: comma-separated attributes to compute (query) ```
+
+    Results are served precompressed with a strong ETag; send it back
+    as If-None-Match to get 304 Not Modified while it is current.
     """
     with tracer.start_as_current_span("get_rocket_simulation"):
-        return await controller.get_rocket_simulation(rocket_id)
+        simulation = await controller.get_rocket_simulation(
+            rocket_id, points, method, fields, encoded=True
+        )
+        return await precompressed_response(
+            simulation, accept_encoding, if_none_match
+        )
 
 
 @router.get("/{rocket_id}/drawing-geometry")
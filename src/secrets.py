@@ -14,8 +14,16 @@ class Secrets:
         return os.environ.get(key)
 
     @classmethod
-    def get_secret(cls, key):
+    def get_secret(cls, key, default=None):
         dotenv_secret = cls.secrets.get(key)
         if not dotenv_secret:
-            return cls.get_os_secret(key)
+            os_secret = cls.get_os_secret(key)
+            return default if os_secret is None else os_secret
         return dotenv_secret
+
+    @classmethod
+    def get_flag(cls, key, default=False):
+        value = cls.get_secret(key)
+        if value in (None, ""):
+            return default
+        return str(value).strip().lower() in ("1", "true", "yes", "on")
@@ -1,11 +1,16 @@
-from typing import Self
+from typing import Collection, Iterable, Optional, Self
 
 import dill
 
 from rocketpy.environment.environment import Environment as RocketPyEnvironment
 from src.models.environment import EnvironmentModel
 from src.views.environment import EnvironmentSimulation
-from src.utils import collect_attributes
+from src.services.objects import cached_object
+from src.utils import (
+    DEFAULT_CURVE_POINTS,
+    CurveDownsampling,
+    collect_attributes,
+)
 
 
 class EnvironmentService:
@@ -15,13 +20,30 @@ class EnvironmentService:
         self._environment = environment
 
     @classmethod
-    def from_env_model(cls, env: EnvironmentModel) -> Self:
+    def from_env_model(
+        cls, env: EnvironmentModel, *, uncached: Collection[str] = ()
+    ) -> Self:
         """
         Get the rocketpy env object.
 
+        Environments are only read by RocketPy, so one built object is
+        shared by every call with the same environment model, unless
+        "environment" is ``uncached``.
+
         Returns:
             RocketPyEnvironment
         """
+        return cls(
+            environment=cached_object(
+                "environment",
+                env,
+                lambda: cls._build_environment(env),
+                uncached=uncached,
+            )
+        )
+
+    @staticmethod
+    def _build_environment(env: EnvironmentModel) -> RocketPyEnvironment:
         rocketpy_env = RocketPyEnvironment(
             latitude=env.latitude,
             longitude=env.longitude,
@@ -41,7 +63,7 @@ class EnvironmentService:
             wind_u=env.wind_u if env.wind_u is not None else 0.0,
             wind_v=env.wind_v if env.wind_v is not None else 0.0,
         )
-        return cls(environment=rocketpy_env)
+        return rocketpy_env
 
     @property
     def environment(self) -> RocketPyEnvironment:
@@ -51,10 +73,20 @@ class EnvironmentService:
     def environment(self, environment: RocketPyEnvironment):
         self._environment = environment
 
-    def get_environment_simulation(self) -> EnvironmentSimulation:
+    def get_environment_simulation(
+        self,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Iterable[str]] = None,
+    ) -> EnvironmentSimulation:
         """
         Get the simulation of the environment.
 
+        Args:
+            points: samples kept per curve.
+            method: how curves are reduced to ``points`` samples.
+            fields: attributes to compute and encode (None for all).
+
         Returns:
             EnvironmentSimulation
         """
@@ -62,6 +94,9 @@ class EnvironmentService:
         encoded_attributes = collect_attributes(
             self.environment,
             [EnvironmentSimulation],
+            points=points,
+            method=method,
+            fields=fields,
         )
         env_simulation = EnvironmentSimulation(**encoded_attributes)
         return env_simulation
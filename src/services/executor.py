@@ -0,0 +1,193 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from src import logger
+from src.secrets import Secrets
+
+
+class _WorkerHTTPError(Exception):
+    """
+    Picklable stand-in for an HTTPException raised inside a worker.
+
+    Starlette's HTTPException cannot be unpickled, so services running in
+    the pool report status and detail through this class instead.
+    """
+
+    def __init__(self, status_code: int, detail: Any = None):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _run_service_call(
+    factory: Callable, model: Any, method_name: str, args, kwargs
+):
+    """Build a service from its model and invoke one of its methods."""
+    try:
+        service = factory(model)
+        return getattr(service, method_name)(*args, **kwargs)
+    except HTTPException as e:
+        raise _WorkerHTTPError(e.status_code, e.detail) from None
+
+
+def _terminate_workers(pool: ProcessPoolExecutor):
+    """
+    Shut a pool down without waiting for the jobs it is running; they
+    fail with BrokenProcessPool once their workers are gone.
+    """
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False)
+    for process in processes:
+        process.terminate()
+
+
+class SimulationExecutor:
+    """
+    Bounded process pool for CPU-bound RocketPy work.
+
+    Building RocketPy objects and integrating flights holds the GIL for
+    the whole computation, so it runs on worker processes and the event
+    loop stays free to serve CRUD requests in the meantime.
+
+    Init Attributes:
+        max_workers: number of worker processes.
+        queue_depth: jobs allowed to wait for a free worker; anything
+            beyond max_workers + queue_depth is rejected with 503.
+        timeout: seconds a caller waits for a job before getting a 504.
+
+    A worker cannot be stopped in the middle of a job, so the pool of a
+    job that times out while running is terminated and replaced; the
+    other jobs it was running fail with 503. A job keeps its slot until
+    its worker is gone, so no more than max_workers processes run.
+    """
+
+    def __init__(self, max_workers: int, queue_depth: int, timeout: float):
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + queue_depth)
+        self._pool_lock = threading.Lock()
+        self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn avoids forking a process that already runs the
+                # event loop and pymongo's monitor threads.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        _terminate_workers(pool)
+
+    async def run(
+        self,
+        factory: Callable,
+        model: Any,
+        method_name: str,
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        Run ``getattr(factory(model), method_name)(*args, **kwargs)`` on
+        the pool and await its result.
+
+        Args:
+            factory: picklable callable building a service from a model,
+                e.g. ``FlightService.from_flight_model``.
+            model: API model handed to the factory.
+            method_name: service method producing the result.
+            timeout: seconds to wait instead of the executor default.
+
+        Returns:
+            Whatever the service method returns.
+
+        Raises:
+            HTTP 503 Service Unavailable: If the pool queue is full, or
+                the workers were restarted while running the job.
+            HTTP 504 Gateway Timeout: If the job exceeds the timeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Simulation queue is full, please try again later",
+            )
+
+        timeout = self.timeout if timeout is None else timeout
+        pool = self._get_pool()
+        try:
+            future = pool.submit(
+                _run_service_call, factory, model, method_name, args, kwargs
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        # The slot is held until the job is done, which for a timed-out
+        # job means until its worker is terminated.
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"{method_name}: simulation exceeded {timeout}s")
+            if not future.cancel():
+                logger.warning("Terminating simulation workers")
+                self._discard_pool(pool)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="Simulation timed out",
+            )
+        except _WorkerHTTPError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+        except BrokenProcessPool:
+            logger.error("Simulation pool broke, recreating it")
+            self._discard_pool(pool)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Simulation workers restarted, please try again",
+            ) from None
+
+    def shutdown(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+@cache
+def get_simulation_executor() -> SimulationExecutor:
+    """
+    Provides the process-wide SimulationExecutor.
+
+    Sizing is read from SIMULATION_MAX_WORKERS, SIMULATION_QUEUE_DEPTH and
+    SIMULATION_TIMEOUT; worker processes are only spawned on first use.
+
+    Returns:
+        SimulationExecutor: Shared executor for RocketPy workloads.
+    """
+    return SimulationExecutor(
+        max_workers=int(
+            Secrets.get_secret(
+                "SIMULATION_MAX_WORKERS", min(os.cpu_count() or 1, 4)
+            )
+        ),
+        queue_depth=int(Secrets.get_secret("SIMULATION_QUEUE_DEPTH", 16)),
+        timeout=float(Secrets.get_secret("SIMULATION_TIMEOUT", 50)),
+    )
@@ -1,12 +1,12 @@
+import io
 import json
-import os
-import tempfile
-from typing import Self, Tuple
+import zipfile
+from typing import Collection, Iterable, Optional, Self, Tuple
 
 import numpy as np
+import simplekml
 
 from rocketpy.simulation.flight import Flight as RocketPyFlight
-from rocketpy.simulation.flight_data_exporter import FlightDataExporter
 from rocketpy._encoders import RocketPyEncoder, RocketPyDecoder
 from rocketpy.mathutils.function import Function
 from rocketpy.motors.solid_motor import SolidMotor
@@ -25,7 +25,13 @@ from rocketpy.rocket.aero_surface import (
 )
 
 from src.services.environment import EnvironmentService
+from src.services.objects import cached_object
 from src.services.rocket import RocketService
+from src.services.timeseries import (
+    TimeseriesFormat,
+    encode_table,
+    flight_table,
+)
 from src.models.environment import EnvironmentModel
 from src.models.motor import MotorModel, MotorKinds
 from src.models.rocket import RocketModel
@@ -41,7 +47,16 @@ from src.views.flight import FlightSimulation
 from src.views.rocket import RocketSimulation
 from src.views.motor import MotorSimulation
 from src.views.environment import EnvironmentSimulation
-from src.utils import collect_attributes
+from src.utils import (
+    DEFAULT_CURVE_POINTS,
+    CurveDownsampling,
+    collect_attributes,
+    lttb_indices,
+)
+
+# Trajectory style of rocketpy's FlightDataExporter.export_kml.
+KML_TRAJECTORY_NAME = "Rocket Trajectory - Powered by RocketPy"
+KML_TRAJECTORY_COLOR = "641400F0"
 
 
 class FlightService:
@@ -51,18 +66,43 @@ class FlightService:
         self._flight = flight
 
     @classmethod
-    def from_flight_model(cls, flight: FlightModel) -> Self:
+    def from_flight_model(
+        cls, flight: FlightModel, *, uncached: Collection[str] = ()
+    ) -> Self:
         """
         Get the rocketpy flight object.
 
+        Exports only read a built flight, so consecutive exports of the
+        same flight model share one simulation.
+
+        Args:
+            uncached: kinds ("flight", "rocket", "motor", "environment")
+                built fresh instead of taken from the object cache, e.g.
+                the components a study varies with every sample.
+
         Returns:
             FlightService containing the rocketpy flight object.
         """
+        return cls(
+            flight=cached_object(
+                "flight",
+                flight,
+                lambda: cls._build_flight(flight, uncached),
+                uncached=uncached,
+            )
+        )
+
+    @staticmethod
+    def _build_flight(
+        flight: FlightModel, uncached: Collection[str] = ()
+    ) -> RocketPyFlight:
         rocketpy_env = EnvironmentService.from_env_model(
-            flight.environment
+            flight.environment, uncached=uncached
         ).environment
-        rocketpy_rocket = RocketService.from_rocket_model(flight.rocket).rocket
-        rocketpy_flight = RocketPyFlight(
+        rocketpy_rocket = RocketService.from_rocket_model(
+            flight.rocket, uncached=uncached
+        ).rocket
+        return RocketPyFlight(
             rocket=rocketpy_rocket,
             environment=rocketpy_env,
             rail_length=flight.rail_length,
@@ -71,7 +111,6 @@ class FlightService:
             equations_of_motion=flight.equations_of_motion,
             **flight.get_additional_parameters(),
         )
-        return cls(flight=rocketpy_flight)
 
     @classmethod
     def from_rpy(cls, content: bytes) -> Self:
@@ -483,10 +522,20 @@ class FlightService:
     # Simulation & export
     # ------------------------------------------------------------------
 
-    def get_flight_simulation(self) -> FlightSimulation:
+    def get_flight_simulation(
+        self,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Iterable[str]] = None,
+    ) -> FlightSimulation:
         """
         Get the simulation of the flight.
 
+        Args:
+            points: samples kept per curve.
+            method: how curves are reduced to ``points`` samples.
+            fields: attributes to compute and encode (None for all).
+
         Returns:
             FlightSimulation
         """
@@ -498,28 +547,98 @@ class FlightService:
                 MotorSimulation,
                 EnvironmentSimulation,
             ],
+            points=points,
+            method=method,
+            fields=fields,
         )
         flight_simulation = FlightSimulation(**encoded_attributes)
         return flight_simulation
 
-    def get_flight_kml(self) -> bytes:
+    @staticmethod
+    def _trajectory_indices(
+        altitude: np.ndarray, time: np.ndarray, max_points: int
+    ) -> np.ndarray:
+        """
+        LTTB selection of at least 3 trajectory samples that always keeps
+        the apogee, in place of the selected sample closest to it.
+        """
+        indices = lttb_indices(time, altitude, max_points)
+        apogee = int(np.argmax(altitude))
+        if apogee not in indices:
+            interior = indices[1:-1]
+            interior[np.argmin(np.abs(interior - apogee))] = apogee
+            indices.sort()
+        return indices
+
+    def get_flight_kml(
+        self, max_points: Optional[int] = None, kmz: bool = False
+    ) -> bytes:
         """
         Get the flight trajectory as a KML file for Google Earth.
 
+        The document matches FlightDataExporter.export_kml with absolute
+        altitudes, but is built in memory instead of through a file.
+
+        Args:
+            max_points: trajectory points kept (at least 3), chosen by
+                LTTB on the altitude plus the apogee, so the first, last
+                and highest points and the shape of the path survive;
+                every integration step when None.
+            kmz: zip the document into a KMZ archive.
+
+        Returns:
+            bytes (UTF-8 encoded KML, or KMZ)
+        """
+        flight = self.flight
+        time = np.asarray(flight.time, dtype=float)
+        altitude = np.asarray(flight.z.get_value(time), dtype=float)
+        if max_points is not None:
+            indices = self._trajectory_indices(altitude, time, max_points)
+            time, altitude = time[indices], altitude[indices]
+        coords = np.column_stack(
+            [
+                flight.longitude.get_value(time),
+                flight.latitude.get_value(time),
+                altitude,
+            ]
+        )
+
+        kml = simplekml.Kml(open=1)
+        trajectory = kml.newlinestring(name=KML_TRAJECTORY_NAME)
+        trajectory.coords = coords.tolist()
+        trajectory.altitudemode = simplekml.AltitudeMode.absolute
+        trajectory.style.linestyle.color = KML_TRAJECTORY_COLOR
+        trajectory.style.polystyle.color = KML_TRAJECTORY_COLOR
+        trajectory.extrude = 1
+        content = kml.kml().encode()
+        if not kmz:
+            return content
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("doc.kml", content)
+        return buffer.getvalue()
+
+    def get_flight_timeseries(
+        self,
+        table_format: TimeseriesFormat = TimeseriesFormat.CSV,
+        columns: Optional[Iterable[str]] = None,
+    ) -> bytes:
+        """
+        Get the full-resolution flight solution and derived curves as a
+        columnar table sharing one time column.
+
+        Args:
+            table_format: file format of the table.
+            columns: derived Function attributes to add (None for the
+                defaults).
+
         Returns:
-            bytes (UTF-8 encoded KML)
+            bytes of the table file.
+
+        Raises:
+            ValueError: If a column is not a Function of the flight.
         """
-        with tempfile.NamedTemporaryFile(
-            suffix=".kml", delete=False
-        ) as tmp:
-            tmp_path = tmp.name
-        try:
-            FlightDataExporter(self.flight).export_kml(file_name=tmp_path)
-            with open(tmp_path, "rb") as fh:
-                return fh.read()
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return encode_table(flight_table(self.flight, columns), table_format)
 
     def get_flight_rpy(self) -> bytes:
         """
@@ -1,4 +1,4 @@
-from typing import Self
+from typing import Collection, Iterable, Optional, Self
 
 import dill
 import numpy as np
@@ -35,12 +35,17 @@ from src.models.sub.tanks import (
 )
 from src.models.motor import MotorKinds, MotorModel
 from src.views.motor import MotorSimulation, MotorDrawingGeometryView
+from src.services.objects import cached_object
 from src.views.drawing import (
     DrawingBounds,
     MotorDrawingGeometry,
     MotorPatch,
 )
-from src.utils import collect_attributes
+from src.utils import (
+    DEFAULT_CURVE_POINTS,
+    CurveDownsampling,
+    collect_attributes,
+)
 
 
 def _build_rocketpy_tank_geometry(geometry):
@@ -156,14 +161,30 @@ class MotorService:
         self._motor = motor
 
     @classmethod
-    def from_motor_model(cls, motor: MotorModel) -> Self:
+    def from_motor_model(
+        cls, motor: MotorModel, *, uncached: Collection[str] = ()
+    ) -> Self:
         """
         Get the rocketpy motor object.
 
+        Rockets and flights only read their motor, so one built object
+        is shared by every call with the same motor model, unless
+        "motor" is ``uncached``.
+
         Returns:
             MotorService containing the rocketpy motor object.
         """
+        return cls(
+            motor=cached_object(
+                "motor",
+                motor,
+                lambda: cls._build_motor(motor),
+                uncached=uncached,
+            )
+        )
 
+    @staticmethod
+    def _build_motor(motor: MotorModel) -> RocketPyMotor:
         reshape_thrust_curve = motor.reshape_thrust_curve
         if isinstance(reshape_thrust_curve, bool):
             reshape_thrust_curve = False
@@ -294,7 +315,7 @@ class MotorService:
                         )
                 rocketpy_motor.add_tank(rocketpy_tank, tank.position)
 
-        return cls(motor=rocketpy_motor)
+        return rocketpy_motor
 
     @property
     def motor(self) -> RocketPyMotor:
@@ -304,16 +325,29 @@ class MotorService:
     def motor(self, motor: RocketPyMotor):
         self._motor = motor
 
-    def get_motor_simulation(self) -> MotorSimulation:
+    def get_motor_simulation(
+        self,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Iterable[str]] = None,
+    ) -> MotorSimulation:
         """
         Get the simulation of the motor.
 
+        Args:
+            points: samples kept per curve.
+            method: how curves are reduced to ``points`` samples.
+            fields: attributes to compute and encode (None for all).
+
         Returns:
             MotorSimulation
         """
         encoded_attributes = collect_attributes(
             self.motor,
             [MotorSimulation],
+            points=points,
+            method=method,
+            fields=fields,
         )
         motor_simulation = MotorSimulation(**encoded_attributes)
         return motor_simulation
@@ -0,0 +1,109 @@
+import sys
+import types
+from functools import cache
+from typing import Callable, Collection, Optional, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.cache import LRUCache, model_hash
+from src.models.environment import weather_cycle
+from src.secrets import Secrets
+
+T = TypeVar("T")
+
+# Leaves of the object graph that never own simulation data.
+_OPAQUE_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def estimate_size(obj) -> int:
+    """
+    Approximate memory held by ``obj`` and everything it references.
+
+    numpy arrays count their buffers and shared objects are counted
+    once; classes, modules and functions are skipped.
+
+    Returns:
+        int: size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _OPAQUE_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            size += item.nbytes
+            continue
+        size += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.extend(vars(item).values())
+    return size
+
+
+@cache
+def get_object_cache() -> LRUCache:
+    """
+    Provides the process-wide cache of built RocketPy objects.
+
+    Each simulation worker process holds its own cache, bounded by
+    ROCKETPY_OBJECT_CACHE_ITEMS and ROCKETPY_OBJECT_CACHE_BYTES.
+
+    Returns:
+        LRUCache: Shared cache keyed by (kind, model hash, weather cycle).
+    """
+    return LRUCache(
+        max_items=int(Secrets.get_secret("ROCKETPY_OBJECT_CACHE_ITEMS", 64)),
+        max_size=int(
+            Secrets.get_secret("ROCKETPY_OBJECT_CACHE_BYTES", 256 * 2**20)
+        ),
+    )
+
+
+def cached_object(
+    kind: str,
+    model: BaseModel,
+    build: Callable[[], T],
+    copy: Optional[Callable[[T], T]] = None,
+    uncached: Collection[str] = (),
+) -> T:
+    """
+    Return the RocketPy object built from ``model``, building it once.
+
+    Objects are keyed by the content hash of ``model``, so the same
+    design shares one construction whatever document it comes from.
+    Objects with a downloaded atmosphere are rebuilt each weather cycle.
+
+    Args:
+        kind: object family, part of the key.
+        model: API model the object is built from.
+        build: builds the object on a miss.
+        copy: applied to the cached object before it is returned, for
+            objects that RocketPy mutates once handed out.
+        uncached: kinds built fresh and left out of the cache, e.g. the
+            components a study varies with every sample.
+
+    Returns:
+        The cached object, or ``copy`` of it.
+    """
+    if kind in uncached:
+        return build()
+    object_cache = get_object_cache()
+    key = (kind, model_hash(model), weather_cycle(model))
+    built = object_cache.get(key)
+    if built is None:
+        built = build()
+        object_cache.put(key, built, size=estimate_size(built))
+    return built if copy is None else copy(built)
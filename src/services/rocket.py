@@ -1,4 +1,5 @@
-from typing import Self, List
+import copy
+from typing import Collection, Iterable, List, Optional, Self
 
 import dill
 import numpy as np
@@ -20,6 +21,7 @@ from src import logger
 from src.models.rocket import RocketModel, Parachute
 from src.models.sub.aerosurfaces import NoseCone, Tail, Fins
 from src.services.motor import MotorService
+from src.services.objects import cached_object
 from src.views.rocket import (
     RocketSimulation,
     RocketDrawingGeometry,
@@ -34,7 +36,11 @@ from src.views.rocket import (
     DrawingBounds,
 )
 from src.views.motor import MotorSimulation
-from src.utils import collect_attributes
+from src.utils import (
+    DEFAULT_CURVE_POINTS,
+    CurveDownsampling,
+    collect_attributes,
+)
 
 
 class RocketService:
@@ -44,14 +50,53 @@ class RocketService:
         self._rocket = rocket
 
     @classmethod
-    def from_rocket_model(cls, rocket: RocketModel) -> Self:
+    def from_rocket_model(
+        cls, rocket: RocketModel, *, uncached: Collection[str] = ()
+    ) -> Self:
         """
         Get the rocketpy rocket object.
 
+        Built rockets are cached, but flights record their state on the
+        rocket, so every call gets its own copy sharing only the
+        read-only motor. Parachutes are built fresh for each copy: their
+        noise functions are bound to the parachute that created them.
+
+        Args:
+            uncached: kinds ("rocket", "motor") built fresh instead of
+                taken from the object cache.
+
         Returns:
             RocketService containing the rocketpy rocket object.
         """
+        rocketpy_rocket = cached_object(
+            "rocket",
+            rocket,
+            lambda: cls._build_rocket(rocket, uncached),
+            copy=lambda built: copy.deepcopy(
+                built, {id(built.motor): built.motor}
+            ),
+            uncached=uncached,
+        )
 
+        # Parachutes
+        if rocket.parachutes:
+            for parachute in rocket.parachutes:
+                if cls.check_parachute_trigger(parachute.trigger):
+                    rocketpy_parachute = cls.get_rocketpy_parachute(parachute)
+                    rocketpy_rocket.parachutes.append(rocketpy_parachute)
+                else:
+                    logger.warning(
+                        "Parachute trigger not valid. Skipping parachute."
+                    )
+                    continue
+
+        return cls(rocket=rocketpy_rocket)
+
+    @classmethod
+    def _build_rocket(
+        cls, rocket: RocketModel, uncached: Collection[str] = ()
+    ) -> RocketPyRocket:
+        """Build the rocketpy rocket, without its parachutes."""
         # Core
         rocketpy_rocket = RocketPyRocket(
             radius=rocket.radius,
@@ -63,7 +108,9 @@ class RocketService:
             coordinate_system_orientation=rocket.coordinate_system_orientation,
         )
         rocketpy_rocket.add_motor(
-            MotorService.from_motor_model(rocket.motor).motor,
+            MotorService.from_motor_model(
+                rocket.motor, uncached=uncached
+            ).motor,
             rocket.motor_position,
         )
 
@@ -95,19 +142,7 @@ class RocketService:
 
         # Air Brakes
 
-        # Parachutes
-        if rocket.parachutes:
-            for parachute in rocket.parachutes:
-                if cls.check_parachute_trigger(parachute.trigger):
-                    rocketpy_parachute = cls.get_rocketpy_parachute(parachute)
-                    rocketpy_rocket.parachutes.append(rocketpy_parachute)
-                else:
-                    logger.warning(
-                        "Parachute trigger not valid. Skipping parachute."
-                    )
-                    continue
-
-        return cls(rocket=rocketpy_rocket)
+        return rocketpy_rocket
 
     @property
     def rocket(self) -> RocketPyRocket:
@@ -117,15 +152,29 @@ class RocketService:
     def rocket(self, rocket: RocketPyRocket):
         self._rocket = rocket
 
-    def get_rocket_simulation(self) -> RocketSimulation:
+    def get_rocket_simulation(
+        self,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        fields: Optional[Iterable[str]] = None,
+    ) -> RocketSimulation:
         """
         Get the simulation of the rocket.
 
+        Args:
+            points: samples kept per curve.
+            method: how curves are reduced to ``points`` samples.
+            fields: attributes to compute and encode (None for all).
+
         Returns:
             RocketSimulation
         """
         encoded_attributes = collect_attributes(
-            self.rocket, [RocketSimulation, MotorSimulation]
+            self.rocket,
+            [RocketSimulation, MotorSimulation],
+            points=points,
+            method=method,
+            fields=fields,
         )
         rocket_simulation = RocketSimulation(**encoded_attributes)
         return rocket_simulation
@@ -0,0 +1,318 @@
+import itertools
+from typing import Any, List, Optional, Self, Sequence, Set
+
+import numpy as np
+
+from src import logger
+from src.models.flight import (
+    DispersionDistribution,
+    FlightDispersion,
+    FlightModel,
+)
+from src.services.flight import FlightService
+from src.views.flight import (
+    FlightImpactEllipse,
+    FlightMonteCarloSimulation,
+    FlightMonteCarloStatistic,
+    FlightSweepSimulation,
+)
+
+# Scalar outputs recorded for every Monte Carlo sample, in column order.
+MONTE_CARLO_OUTPUTS = (
+    "apogee",
+    "apogee_time",
+    "max_mach_number",
+    "out_of_rail_velocity",
+    "impact_velocity",
+    "x_impact",
+    "y_impact",
+)
+IMPACT_ELLIPSE_SIGMAS = (1, 2, 3)
+
+
+def _split_path(path: str) -> List[Any]:
+    """Split a JSON pointer (``/rocket/fins/0/span``) or dotted path."""
+    if path.startswith("/"):
+        keys = [
+            key.replace("~1", "/").replace("~0", "~")
+            for key in path[1:].split("/")
+        ]
+    else:
+        keys = path.split(".")
+    return [int(key) if key.isdigit() else key for key in keys]
+
+
+def _read_path(document: Any, path: str) -> Any:
+    for key in _split_path(path):
+        document = document[key]
+    return document
+
+
+def _write_path(document: Any, path: str, value: Any):
+    *parents, leaf = _split_path(path)
+    for key in parents:
+        document = document[key]
+    document[leaf] = value
+
+
+def varied_objects(paths: Sequence[str]) -> Set[str]:
+    """
+    RocketPy objects whose models a study changes through ``paths``:
+    the flight itself, plus the rocket, motor and environment when a
+    path leads into them.
+    """
+    kinds = {"flight"}
+    for path in paths:
+        keys = _split_path(path)
+        if keys[0] == "environment":
+            kinds.add("environment")
+        elif keys[0] == "rocket":
+            kinds.add("rocket")
+            if keys[1:2] == ["motor"]:
+                kinds.add("motor")
+    return kinds
+
+
+class FlightStudyService:
+    """
+    Studies simulating many variants of a nominal flight: Monte Carlo
+    dispersions and parameter sweeps.
+
+    Variants are generated once by the caller, one row of field values
+    each, and split into batches; each batch runs on a simulation worker
+    through ``get_sample_outputs`` and only returns one row of scalar
+    outputs per variant. Components a study does not vary come from the
+    worker's object cache, e.g. the motor when only fins change; the
+    varied ones are built for each variant and never cached.
+    """
+
+    _flight: FlightModel
+
+    def __init__(self, flight: FlightModel = None):
+        self._flight = flight
+
+    @classmethod
+    def from_flight_model(cls, flight: FlightModel) -> Self:
+        """
+        Wrap the nominal flight; nothing is simulated until a batch runs.
+
+        Returns:
+            FlightStudyService
+        """
+        return cls(flight=flight)
+
+    @property
+    def flight(self) -> FlightModel:
+        return self._flight
+
+    @staticmethod
+    def nominal_values(
+        flight: FlightModel, paths: Sequence[str]
+    ) -> List[float]:
+        """
+        Stored values of the studied fields.
+
+        Raises:
+            ValueError: If a path does not lead to a numeric field.
+        """
+        document = flight.model_dump()
+        nominal = []
+        for path in paths:
+            try:
+                value = _read_path(document, path)
+            except (KeyError, IndexError, TypeError):
+                raise ValueError(f"Unknown flight path: {path}") from None
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Flight path is not numeric: {path}")
+            nominal.append(value)
+        return nominal
+
+    @staticmethod
+    def draw_samples(
+        dispersions: Sequence[FlightDispersion],
+        nominal: Sequence[float],
+        samples: int,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Draw the dispersed inputs, one row per sample and one column per
+        dispersion. Columns of integer fields are rounded.
+        """
+        rng = np.random.default_rng(seed)
+        draws = np.empty((samples, len(dispersions)))
+        for column, (dispersion, value) in enumerate(
+            zip(dispersions, nominal)
+        ):
+            match dispersion.distribution:
+                case DispersionDistribution.NORMAL:
+                    mean = (
+                        value if dispersion.mean is None else dispersion.mean
+                    )
+                    draws[:, column] = rng.normal(
+                        mean, dispersion.std, samples
+                    )
+                case DispersionDistribution.UNIFORM:
+                    draws[:, column] = rng.uniform(
+                        dispersion.low, dispersion.high, samples
+                    )
+                case DispersionDistribution.TRIANGULAR:
+                    if dispersion.low == dispersion.high:
+                        draws[:, column] = dispersion.low
+                    else:
+                        mode = min(max(value, dispersion.low), dispersion.high)
+                        draws[:, column] = rng.triangular(
+                            dispersion.low, mode, dispersion.high, samples
+                        )
+            if isinstance(value, int):
+                draws[:, column] = np.round(draws[:, column])
+        return draws
+
+    @staticmethod
+    def sweep_grid(
+        axes: Sequence[Sequence[float]], nominal: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Cartesian product of the swept values, one row per grid point.
+
+        The last axis varies fastest, so consecutive rows (and therefore
+        each worker batch) share the components the leading axes fix.
+        Columns of integer fields are rounded.
+        """
+        grid = np.array(list(itertools.product(*axes)), dtype=float)
+        for column, value in enumerate(nominal):
+            if isinstance(value, int):
+                grid[:, column] = np.round(grid[:, column])
+        return grid
+
+    def get_sample_outputs(
+        self,
+        paths: Sequence[str],
+        samples: np.ndarray,
+        outputs: Sequence[str] = MONTE_CARLO_OUTPUTS,
+    ) -> np.ndarray:
+        """
+        Simulate one batch of flight variants.
+
+        Args:
+            paths: varied field paths, one per column of ``samples``.
+            samples: field values, one row per variant.
+            outputs: scalar Flight attributes to record.
+
+        Returns:
+            Array with one row per variant and one column per output;
+            rows of failed variants are NaN.
+        """
+        # Every variant overwrites the same paths, so one document is
+        # reused; model_validate copies it into fresh models.
+        document = self.flight.model_dump()
+        uncached = varied_objects(paths)
+        results = np.full((len(samples), len(outputs)), np.nan)
+        for row, values in enumerate(samples):
+            for path, value in zip(paths, values.tolist()):
+                nominal = _read_path(document, path)
+                _write_path(
+                    document,
+                    path,
+                    int(value) if isinstance(nominal, int) else value,
+                )
+            try:
+                flight = FlightService.from_flight_model(
+                    FlightModel.model_validate(document), uncached=uncached
+                ).flight
+                results[row] = [getattr(flight, output) for output in outputs]
+            except Exception as e:  # pylint: disable=broad-except
+                logger.info(f"Flight study sample {row} failed: {e}")
+        return results
+
+    @staticmethod
+    def summarize_monte_carlo(
+        outputs: np.ndarray,
+        percentiles: Sequence[float],
+        seed: Optional[int] = None,
+    ) -> FlightMonteCarloSimulation:
+        """
+        Aggregate Monte Carlo outputs into percentiles and impact
+        ellipses.
+
+        Raises:
+            ValueError: If every sample failed.
+        """
+        succeeded = outputs[~np.isnan(outputs).any(axis=1)]
+        if not len(succeeded):
+            raise ValueError("Every Monte Carlo sample failed")
+
+        statistics = {}
+        for column, output in enumerate(MONTE_CARLO_OUTPUTS):
+            values = succeeded[:, column]
+            statistics[output] = FlightMonteCarloStatistic(
+                mean=values.mean(),
+                std=values.std(),
+                min=values.min(),
+                max=values.max(),
+                percentiles=np.percentile(values, percentiles).tolist(),
+            )
+
+        impacts = succeeded[
+            :,
+            [
+                MONTE_CARLO_OUTPUTS.index("x_impact"),
+                MONTE_CARLO_OUTPUTS.index("y_impact"),
+            ],
+        ]
+        center = impacts.mean(axis=0)
+        covariance = (
+            np.cov(impacts, rowvar=False)
+            if len(impacts) > 1
+            else np.zeros((2, 2))
+        )
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        eigenvalues = np.clip(eigenvalues, 0, None)
+        major_axis = eigenvectors[:, 1]
+        angle = np.degrees(np.arctan2(major_axis[1], major_axis[0]))
+        impact_ellipses = [
+            FlightImpactEllipse(
+                sigma=sigma,
+                x_center=center[0],
+                y_center=center[1],
+                semi_major_axis=sigma * np.sqrt(eigenvalues[1]),
+                semi_minor_axis=sigma * np.sqrt(eigenvalues[0]),
+                angle=angle,
+            )
+            for sigma in IMPACT_ELLIPSE_SIGMAS
+        ]
+
+        return FlightMonteCarloSimulation(
+            samples=len(outputs),
+            failed_samples=len(outputs) - len(succeeded),
+            seed=seed,
+            percentiles=list(percentiles),
+            impact_ellipses=impact_ellipses,
+            **statistics,
+        )
+
+    @staticmethod
+    def tabulate_sweep(
+        paths: Sequence[str],
+        grid: np.ndarray,
+        outputs: Sequence[str],
+        results: np.ndarray,
+    ) -> FlightSweepSimulation:
+        """
+        Columnar table of a sweep: one column per swept path followed by
+        one per output, with null outputs for failed grid points.
+        """
+        columns = {
+            path: grid[:, column].tolist() for column, path in enumerate(paths)
+        }
+        for column, output in enumerate(outputs):
+            values = results[:, column]
+            columns[output] = [
+                None if np.isnan(value) else value for value in values.tolist()
+            ]
+        return FlightSweepSimulation(
+            points=len(grid),
+            failed_points=int(np.isnan(results).any(axis=1).sum()),
+            parameters=list(paths),
+            outputs=list(outputs),
+            columns=columns,
+        )
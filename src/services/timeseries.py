@@ -0,0 +1,130 @@
+import io
+from enum import Enum
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from rocketpy.mathutils.function import Function
+from rocketpy.simulation.flight import Flight as RocketPyFlight
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Columns of Flight.solution, one row per integration step.
+SOLUTION_COLUMNS = (
+    "time",
+    "x",
+    "y",
+    "z",
+    "vx",
+    "vy",
+    "vz",
+    "e0",
+    "e1",
+    "e2",
+    "e3",
+    "w1",
+    "w2",
+    "w3",
+)
+
+# Derived curves exported next to the solution unless others are asked.
+DEFAULT_TIMESERIES_COLUMNS = (
+    "altitude",
+    "speed",
+    "acceleration",
+    "mach_number",
+    "angle_of_attack",
+    "latitude",
+    "longitude",
+)
+
+
+class TimeseriesFormat(str, Enum):
+    """File format of flight time series exports."""
+
+    ARROW = "arrow"
+    PARQUET = "parquet"
+    NPZ = "npz"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            "arrow": "application/vnd.apache.arrow.file",
+            "parquet": "application/vnd.apache.parquet",
+            "npz": "application/x-npz",
+            "csv": "text/csv",
+        }[self.value]
+
+    @property
+    def available(self) -> bool:
+        """Whether the optional package writing this format is installed."""
+        return pyarrow is not None or self in (
+            TimeseriesFormat.NPZ,
+            TimeseriesFormat.CSV,
+        )
+
+
+def flight_table(
+    flight: RocketPyFlight, columns: Optional[Iterable[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Full-resolution time series of a flight, one array per column.
+
+    Args:
+        flight: simulated rocketpy flight.
+        columns: derived Function attributes evaluated at every solution
+            time, e.g. ("altitude", "mach_number"); the defaults when None.
+
+    Returns:
+        Columns of Flight.solution followed by the derived ones.
+
+    Raises:
+        ValueError: If a column is not a Function of the flight.
+    """
+    solution = np.asarray(flight.solution, dtype=float)
+    table = dict(zip(SOLUTION_COLUMNS, solution.T))
+    time = table["time"]
+    for name in DEFAULT_TIMESERIES_COLUMNS if columns is None else columns:
+        if name in table:
+            continue
+        function = (
+            None if name.startswith("_") else getattr(flight, name, None)
+        )
+        if not isinstance(function, Function):
+            raise ValueError(f"{name} is not a flight time series")
+        table[name] = np.asarray(function.get_value(time), dtype=float)
+    return table
+
+
+def encode_table(
+    table: Dict[str, np.ndarray], table_format: TimeseriesFormat
+) -> bytes:
+    """
+    Write a table of equally long columns in ``table_format``.
+
+    Arrow IPC files are left uncompressed for the response compression;
+    Parquet files are zstd-compressed and NPZ archives deflated.
+    """
+    if table_format is TimeseriesFormat.CSV:
+        rows = np.column_stack(list(table.values())).tolist()
+        lines = [",".join(table)]
+        lines.extend(",".join(map(repr, row)) for row in rows)
+        return ("\n".join(lines) + "\n").encode()
+    buffer = io.BytesIO()
+    if table_format is TimeseriesFormat.NPZ:
+        np.savez_compressed(buffer, **table)
+        return buffer.getvalue()
+    if not table_format.available:
+        raise RuntimeError(f"{table_format.value} export requires pyarrow")
+    arrow_table = pyarrow.table(table)
+    if table_format is TimeseriesFormat.PARQUET:
+        pyarrow.parquet.write_table(arrow_table, buffer, compression="zstd")
+    else:
+        with pyarrow.ipc.new_file(buffer, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    return buffer.getvalue()
@@ -1,18 +1,15 @@
-import gzip
-import io
+import copy
 import logging
-import json
 from datetime import datetime
-from typing import NoReturn, Tuple
+from enum import Enum
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
-from scipy.interpolate import interp1d
+from pydantic import BaseModel
+from pydantic_core import to_json
 
-from rocketpy import Function, Flight
-from rocketpy._encoders import RocketPyEncoder
-
-from starlette.datastructures import Headers, MutableHeaders
-from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from rocketpy import Environment, Function, Flight, NoseCone, Tail
+from rocketpy._encoders import RocketPyEncoder, get_class_signature
 
 from src.views.environment import EnvironmentSimulation
 from src.views.flight import FlightSimulation
@@ -53,81 +50,394 @@ class DiscretizeConfig:
         return cls(bounds=(0, 30), samples=200)
 
 
+DEFAULT_CURVE_POINTS = 25
+MAX_CURVE_POINTS = 10000
+
+# Flight.solution column used to pick samples for the index-selecting
+# methods: [t, x, y, z, vx, vy, vz, e0, e1, e2, e3, w1, w2, w3].
+_SOLUTION_ALTITUDE_COLUMN = 3
+
+
+class CurveDownsampling(str, Enum):
+    """How simulation curves are reduced to the requested point count."""
+
+    UNIFORM = "uniform"
+    LTTB = "lttb"
+    MINMAX = "minmax"
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection of ``points`` samples.
+
+    The first and last samples are always kept; every bucket in between
+    contributes the sample forming the largest triangle with the
+    previously kept sample and the average of the next bucket.
+
+    Returns:
+        Sorted indices into ``x``/``y``.
+    """
+    size = len(x)
+    if points >= size:
+        return np.arange(size)
+    if points <= 2:
+        return np.array([0, size - 1])
+
+    edges = np.linspace(1, size - 1, points - 1).astype(int)
+    indices = np.empty(points, dtype=int)
+    indices[0], indices[-1] = 0, size - 1
+    selected = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+        else:
+            next_start, next_end = size - 1, size
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Keep the minimum and maximum of ``y`` in evenly sized buckets, plus
+    the first and last samples, so peaks survive the reduction.
+
+    Returns:
+        Sorted indices into ``x``/``y`` (at most ``points`` of them).
+    """
+    size = len(x)
+    if points >= size:
+        return np.arange(size)
+
+    edges = np.linspace(1, size - 1, (points - 2) // 2 + 1).astype(int)
+    kept = [0, size - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            kept.append(start + int(np.argmin(y[start:end])))
+            kept.append(start + int(np.argmax(y[start:end])))
+    return np.unique(kept)
+
+
+_INDEX_SELECTORS = {
+    CurveDownsampling.LTTB: lttb_indices,
+    CurveDownsampling.MINMAX: minmax_indices,
+}
+
+
+def _uniform_grid(x: np.ndarray, points: int) -> np.ndarray:
+    return np.linspace(x[0], x[-1], points)
+
+
+def _interp_columns(x: np.ndarray, table: np.ndarray, grid: np.ndarray):
+    """
+    Linearly interpolate every column of ``table`` (sampled at ``x``)
+    onto ``grid`` at once, sharing the bracketing indices and weights.
+    """
+    right = np.clip(np.searchsorted(x, grid, side="right"), 1, len(x) - 1)
+    left = right - 1
+    span = x[right] - x[left]
+    weight = np.divide(
+        grid - x[left], span, out=np.zeros_like(grid), where=span > 0
+    )
+    return table[left] + weight[:, None] * (table[right] - table[left])
+
+
+# to_dict(discretize=True) of these classes calls set_discrete on its own
+# Functions, which rewrites them in place.
+_DISCRETIZED_IN_PLACE = {
+    Environment: (
+        "wind_velocity_x",
+        "wind_velocity_y",
+        "wind_heading",
+        "wind_direction",
+        "wind_speed",
+        "density",
+    ),
+    NoseCone: ("clalpha",),
+    Tail: ("clalpha",),
+}
+
+
 class InfinityEncoder(RocketPyEncoder):
+    """
+    RocketPyEncoder that reduces array-backed curves and the Flight
+    solution to ``points`` samples before encoding.
+
+    ``method`` picks the reduction: uniform resampling, or selection of
+    existing samples with LTTB or per-bucket min/max.
+    """
+
+    def __init__(
+        self,
+        *args,
+        points: int = DEFAULT_CURVE_POINTS,
+        method: CurveDownsampling = CurveDownsampling.UNIFORM,
+        **kwargs,
+    ):
+        self.points = points
+        self.method = CurveDownsampling(method)
+        super().__init__(*args, **kwargs)
+
+    def _encode_reduced_function(self, o: Function) -> dict:
+        """
+        Encode ``o`` reduced to ``points`` samples. Uniform resampling is
+        equivalent to ``set_discrete(mutate_self=False)`` without
+        deep-copying the Function.
+        """
+        encoding = o.to_dict(
+            include_outputs=self.include_outputs,
+            discretize=self.discretize,
+            allow_pickle=self.allow_pickle,
+        )
+        if self.method is CurveDownsampling.UNIFORM:
+            grid = _uniform_grid(o.x_array, self.points)
+            encoding["source"] = np.column_stack([grid, o.get_value(grid)])
+            encoding["interpolation"] = "spline"
+            encoding["extrapolation"] = "constant"
+        else:
+            source = np.asarray(o.source)
+            encoding["source"] = source[
+                _INDEX_SELECTORS[self.method](
+                    source[:, 0], source[:, 1], self.points
+                )
+            ]
+        encoding["signature"] = get_class_signature(o)
+        return encoding
+
+    def reduce_solution(self, solution) -> np.ndarray:
+        """Reduce a Flight solution table to ``points`` rows."""
+        solution = np.asarray(solution, dtype=float)
+        if len(solution) <= self.points:
+            return solution
+        time = solution[:, 0]
+        if self.method is CurveDownsampling.UNIFORM:
+            return _interp_columns(
+                time, solution, _uniform_grid(time, self.points)
+            )
+        return solution[
+            _INDEX_SELECTORS[self.method](
+                time, solution[:, _SOLUTION_ALTITUDE_COLUMN], self.points
+            )
+        ]
+
+    @staticmethod
+    def prepare_flight(o: Flight):
+        """
+        Run Flight post-processing and drop the integrator phases.
+
+        Built flights may be shared between requests, so nothing that a
+        later export reads is removed from the Flight itself.
+        """
+        try:
+            o._Flight__evaluate_post_process
+        except Exception:
+            pass
+        o.flight_phases = None
+
+    @staticmethod
+    def detach_discretized_functions(o):
+        """
+        Shallow copy of ``o`` whose Functions that ``to_dict`` discretizes
+        in place are copies too, so encoding leaves ``o`` untouched.
+        """
+        for cls, names in _DISCRETIZED_IN_PLACE.items():
+            if isinstance(o, cls):
+                o = copy.copy(o)
+                for name in names:
+                    setattr(o, name, copy.copy(getattr(o, name)))
+                break
+        return o
+
     def default(self, o):
+        if self.discretize:
+            o = self.detach_discretized_functions(o)
         if (
             isinstance(o, Function)
-            and not callable(o.source)
+            and isinstance(o.source, np.ndarray)
             and o.__dom_dim__ == 1
+            and self.include_function_data
+            and len(o.source) > self.points
         ):
-            size = len(o._domain)
-            reduction_factor = 1
-            if size > 25:
-                reduction_factor = size // 25
-            if reduction_factor > 1:
-                o = o.set_discrete(
-                    o.x_array[0],
-                    o.x_array[-1],
-                    size // reduction_factor,
-                    mutate_self=False,
-                )
+            return self._encode_reduced_function(o)
         if isinstance(o, Flight):
-            try:
-                o._Flight__evaluate_post_process
-            except Exception:
-                pass
-            solution = np.array(o.solution)
-            size = len(solution)
-            if size > 25:
-                reduction_factor = size // 25
-                reduced_solution = np.zeros(
-                    (size // reduction_factor, solution.shape[1])
-                )
-                reduced_scale = np.linspace(
-                    solution[0, 0], solution[-1, 0], size // reduction_factor
-                )
-                for i, col in enumerate(solution.T):
-                    reduced_solution[:, i] = interp1d(
-                        solution[:, 0], col, assume_sorted=True
-                    )(reduced_scale)
-                o.solution = reduced_solution.tolist()
-
-            o.flight_phases = None
-            o.function_evaluations = None
+            self.prepare_flight(o)
+            # Outputs are derived lazily from the solution, so it is only
+            # reduced in the encoding, never on the Flight itself.
+            encoding = super().default(o)
+            encoding["solution"] = self.reduce_solution(o.solution)
+            encoding.pop("function_evaluations", None)
+            return encoding
 
         return super().default(o)
 
 
-def rocketpy_encoder(obj):
-    """
-    Encode a RocketPy object using official RocketPy encoders.
+def _identity(value):
+    return value
+
+
+# Coercions json.dumps applies to scalar values and to dict keys, by type;
+# they are looked up along the MRO, so subclasses such as np.float64 or
+# IntEnum are coerced like their base type.
+_PRIMITIVE_SCALARS = {
+    type(None): _identity,
+    bool: _identity,
+    str: str.__str__,
+    int: int,
+    float: float,
+    datetime: _identity,
+}
+_JSON_KEYS = {
+    str: str.__str__,
+    bool: lambda key: "true" if key else "false",
+    type(None): lambda key: "null",
+    int: int.__repr__,
+    float: float.__repr__,
+}
+
+
+def _coercion(coercions: dict, value) -> Optional[Callable]:
+    for cls in type(value).__mro__:
+        coercion = coercions.get(cls)
+        if coercion is not None:
+            return coercion
+    return None
+
+
+def _json_key(key):
+    """Coerce a dict key the way ``json.dumps`` does."""
+    coercion = _coercion(_JSON_KEYS, key)
+    if coercion is None:
+        raise TypeError(
+            "keys must be str, int, float, bool or None, not "
+            f"{type(key).__name__}"
+        )
+    return coercion(key)
 
-    Uses InfinityEncoder for serialization and reduction.
+
+def _to_primitive(o, encoder: InfinityEncoder, markers: set):
+    """
+    Recursively turn ``o`` into JSON-compatible Python values, falling back
+    to ``encoder.default`` exactly where ``json.dumps`` would.
     """
-    json_str = json.dumps(
-        obj,
-        cls=InfinityEncoder,
+    coercion = _coercion(_PRIMITIVE_SCALARS, o)
+    if coercion is not None:
+        return coercion(o)
+    if isinstance(o, np.ndarray) and o.dtype != object:
+        # tolist() already yields plain Python scalars and lists.
+        return o.tolist()
+
+    marker = id(o)
+    if marker in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(marker)
+    try:
+        if isinstance(o, dict):
+            return {
+                _json_key(key): _to_primitive(value, encoder, markers)
+                for key, value in o.items()
+            }
+        if isinstance(o, (list, tuple)):
+            return [_to_primitive(item, encoder, markers) for item in o]
+        return _to_primitive(encoder.default(o), encoder, markers)
+    finally:
+        markers.discard(marker)
+
+
+def _infinity_encoder(
+    points: int = DEFAULT_CURVE_POINTS,
+    method: CurveDownsampling = CurveDownsampling.UNIFORM,
+):
+    return InfinityEncoder(
         include_outputs=True,
         include_function_data=True,
         discretize=True,
         allow_pickle=False,
+        points=points,
+        method=method,
     )
-    encoded_result = json.loads(json_str)
-    return _fix_datetime_fields(encoded_result)
 
 
-def collect_attributes(obj, attribute_classes=None):
-    """Collect and serialize attributes from simulation classes."""
+def rocketpy_encoder(
+    obj,
+    points: int = DEFAULT_CURVE_POINTS,
+    method: CurveDownsampling = CurveDownsampling.UNIFORM,
+):
+    """
+    Encode a RocketPy object using official RocketPy encoders.
+
+    Uses InfinityEncoder for serialization and reduction, producing plain
+    Python values in a single traversal (datetimes are kept as datetimes).
+    """
+    return _to_primitive(obj, _infinity_encoder(points, method), set())
+
+
+def collect_attributes(
+    obj,
+    attribute_classes=None,
+    points: int = DEFAULT_CURVE_POINTS,
+    method: CurveDownsampling = CurveDownsampling.UNIFORM,
+    fields: Optional[Iterable[str]] = None,
+):
+    """
+    Collect and serialize attributes from simulation classes, reducing
+    curves to ``points`` samples with ``method``.
+
+    When ``fields`` is given only those top-level attributes are read
+    from ``obj`` and encoded; nested simulations (``rocket``, ``env``,
+    ``motor``) are encoded whole when named.
+    """
     attribute_classes = attribute_classes or []
 
-    attributes = rocketpy_encoder(obj)
+    encoder = _infinity_encoder(points, method)
+    if fields is None:
+        attributes = _to_primitive(obj, encoder, set())
+    else:
+        fields = set(fields)
+        attributes = _project_attributes(obj, fields, encoder)
     for attribute_class in attribute_classes:
-        _populate_simulation_attributes(obj, attribute_class, attributes)
+        _populate_simulation_attributes(
+            obj, attribute_class, attributes, encoder, fields
+        )
 
-    return rocketpy_encoder(attributes)
+    return attributes
+
+
+def _project_attributes(obj, fields, encoder):
+    if isinstance(obj, Flight):
+        # Flight outputs are plain lazy attributes: read only those asked.
+        encoder.prepare_flight(obj)
+        encoding = {}
+    else:
+        # Other RocketPy objects discretize outputs inside to_dict; reuse
+        # it so projected values match the full response, but only encode
+        # the requested entries.
+        encoding = encoder.default(obj)
+
+    attributes = {}
+    for field in fields:
+        if field in encoding:
+            value = encoding[field]
+        elif field == "solution" and isinstance(obj, Flight):
+            value = encoder.reduce_solution(obj.solution)
+        else:
+            try:
+                value = getattr(obj, field)
+            except AttributeError:
+                continue
+        attributes[field] = _to_primitive(value, encoder, set())
+    return attributes
 
 
-def _populate_simulation_attributes(obj, attribute_class, attributes):
+def _populate_simulation_attributes(
+    obj, attribute_class, attributes, encoder, fields=None
+):
     if not isinstance(attribute_class, type):
         return
 
@@ -147,6 +457,13 @@ def _populate_simulation_attributes(obj, attribute_class, attributes):
         if not issubclass(attribute_class, klass):
             continue
 
+        if fields is not None and (
+            not target_path or target_path[0] not in fields
+        ):
+            # Projected top-level fields were already read; nested
+            # simulations are only filled in when requested.
+            return
+
         keys = _annotation_keys(attribute_class, exclusions)
         if not keys:
             return
@@ -156,7 +473,7 @@ def _populate_simulation_attributes(obj, attribute_class, attributes):
             return
 
         target = _resolve_attribute_target(attributes, target_path)
-        _copy_missing_attributes(source, target, keys)
+        _copy_missing_attributes(source, target, keys, encoder)
         return
 
 
@@ -181,174 +498,101 @@ def _resolve_attribute_target(attributes, path):
     return target
 
 
-def _copy_missing_attributes(source, target, keys):
+def _copy_missing_attributes(source, target, keys, encoder):
     for key in keys:
         if key in target:
             continue
         try:
-            target[key] = getattr(source, key)
+            value = getattr(source, key)
         except AttributeError:
             continue
+        target[key] = _to_primitive(value, encoder, set())
 
 
-def _fix_datetime_fields(data):
+def apply_merge_patch(target, patch):
     """
-    Fix datetime fields that RocketPyEncoder converted to lists.
+    Apply a JSON merge patch (RFC 7386) to ``target`` without mutating
+    it: objects are merged key by key, null removes a key and any other
+    value, arrays included, replaces the target value.
     """
-    if isinstance(data, dict):
-        fixed = {}
-        for key, value in data.items():
-            if (
-                key in ['date', 'local_date', 'datetime_date']
-                and isinstance(value, list)
-                and len(value) >= 3
-            ):
-                # Convert [year, month, day, hour, ...] back to datetime
-                try:
-                    year, month, day = value[0:3]
-                    hour = value[3] if len(value) > 3 else 0
-                    minute = value[4] if len(value) > 4 else 0
-                    second = value[5] if len(value) > 5 else 0
-                    microsecond = value[6] if len(value) > 6 else 0
-
-                    fixed[key] = datetime(
-                        year, month, day, hour, minute, second, microsecond
-                    )
-                except (ValueError, TypeError, IndexError):
-                    # If conversion fails, keep the original value
-                    fixed[key] = value
-            else:
-                fixed[key] = _fix_datetime_fields(value)
-        return fixed
-    if isinstance(data, (list, tuple)):
-        return [_fix_datetime_fields(item) for item in data]
-    return data
-
-
-class RocketPyGZipMiddleware:
-    def __init__(
-        self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9
-    ) -> None:
-        self.app = app
-        self.minimum_size = minimum_size
-        self.compresslevel = compresslevel
-
-    async def __call__(
-        self, scope: Scope, receive: Receive, send: Send
-    ) -> None:
-        if scope["type"] == "http":
-            headers = Headers(scope=scope)
-            if "gzip" in headers.get("Accept-Encoding", ""):
-                responder = GZipResponder(
-                    self.app,
-                    self.minimum_size,
-                    compresslevel=self.compresslevel,
-                )
-                await responder(scope, receive, send)
-                return
-        await self.app(scope, receive, send)
+    if not isinstance(patch, dict):
+        return patch
+    merged = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = apply_merge_patch(merged.get(key), value)
+    return merged
 
 
-class GZipResponder:
-    # fork of https://github.com/encode/starlette/blob/master/starlette/middleware/gzip.py
-    def __init__(
-        self, app: ASGIApp, minimum_size: int, compresslevel: int = 9
-    ) -> None:
-        self.app = app
-        self.minimum_size = minimum_size
-        self.send: Send = unattached_send
-        self.initial_message: Message = {}
-        self.started = False
-        self.content_encoding_set = False
-        self.gzip_buffer = io.BytesIO()
-        self.gzip_file = gzip.GzipFile(
-            mode="wb", fileobj=self.gzip_buffer, compresslevel=compresslevel
-        )
+def merge_patch_updates(
+    patch: dict, document: dict, prefix: str = ""
+) -> Tuple[dict, List[str]]:
+    """
+    Translate a JSON merge patch into MongoDB ``$set``/``$unset`` paths.
 
-    async def __call__(
-        self, scope: Scope, receive: Receive, send: Send
-    ) -> None:
-        self.send = send
-        with self.gzip_buffer, self.gzip_file:
-            await self.app(scope, receive, self.send_with_gzip)
-
-    async def send_with_gzip(self, message: Message) -> None:
-        message_type = message["type"]
-        if message_type == "http.response.start":
-            # Don't send the initial message until we've determined how to
-            # modify the outgoing headers correctly.
-            self.initial_message = message
-            headers = Headers(raw=self.initial_message["headers"])
-            self.content_encoding_set = "content-encoding" in headers
-        elif (
-            message_type == "http.response.body" and self.content_encoding_set
-        ):
-            if not self.started:
-                self.started = True
-                await self.send(self.initial_message)
-            await self.send(message)
-        elif message_type == "http.response.body" and not self.started:
-            self.started = True
-            body = message.get("body", b"")
-            more_body = message.get("more_body", False)
-            if ((len(body) < self.minimum_size) and not more_body) or any(
-                value == b'application/octet-stream'
-                for header, value in self.initial_message["headers"]
-            ):
-                # Don't apply GZip to small outgoing responses or octet-streams.
-                await self.send(self.initial_message)
-                await self.send(message)  # pylint: disable=unreachable
-            elif not more_body:
-                # Standard GZip response.
-                self.gzip_file.write(body)
-                self.gzip_file.close()
-                body = self.gzip_buffer.getvalue()
-
-                headers = MutableHeaders(raw=self.initial_message["headers"])
-                headers["Content-Encoding"] = "gzip"
-                headers["Content-Length"] = str(len(body))
-                headers.add_vary_header("Accept-Encoding")
-                message["body"] = body
-
-                await self.send(self.initial_message)
-                await self.send(message)  # pylint: disable=unreachable
-            else:
-                # Initial body in streaming GZip response.
-                headers = MutableHeaders(raw=self.initial_message["headers"])
-                headers["Content-Encoding"] = "gzip"
-                headers.add_vary_header("Accept-Encoding")
-                del headers["Content-Length"]
-
-                self.gzip_file.write(body)
-                message["body"] = self.gzip_buffer.getvalue()
-                self.gzip_buffer.seek(0)
-                self.gzip_buffer.truncate()
-
-                await self.send(self.initial_message)
-                await self.send(message)  # pylint: disable=unreachable
-
-        elif message_type == "http.response.body":
-            # Remaining body in streaming GZip response.
-            body = message.get("body", b"")
-            more_body = message.get("more_body", False)
-
-            self.gzip_file.write(body)
-            if not more_body:
-                self.gzip_file.close()
-
-            message["body"] = self.gzip_buffer.getvalue()
-            self.gzip_buffer.seek(0)
-            self.gzip_buffer.truncate()
-
-            await self.send(message)
+    Args:
+        patch: the merge patch.
+        document: the patched and validated document; its values are
+            the ones written, so normalized values are stored. Patched
+            keys it ignored are not written.
+        prefix: dotted path of ``patch`` within the stored document.
+
+    Returns:
+        Values to ``$set`` by dotted path, and dotted paths to ``$unset``.
 
+    Raises:
+        ValueError: If a key is not a plain field name.
+    """
+    set_fields, unset_fields = {}, []
+    for key, value in patch.items():
+        if "." in key or key.startswith("$") or not key:
+            raise ValueError(f"Invalid field name in patch: {key!r}")
+        path = f"{prefix}{key}"
+        if key not in document:
+            if value is None:
+                unset_fields.append(path)
+        elif isinstance(value, dict) and isinstance(document[key], dict):
+            nested_set, nested_unset = merge_patch_updates(
+                value, document[key], f"{path}."
+            )
+            set_fields.update(nested_set)
+            unset_fields.extend(nested_unset)
         else:
-            # Pass through other message types unmodified.
-            if not self.started:
-                self.started = True
-                await self.send(self.initial_message)
-            await self.send(message)
+            set_fields[path] = document[key]
+    return set_fields, unset_fields
+
 
+# List items serialized together by iter_model_json, e.g. curve samples.
+JSON_STREAM_ROWS = 1024
 
-async def unattached_send(message: Message) -> NoReturn:
-    raise RuntimeError("send awaitable not set")  # pragma: no cover
+
+def iter_model_json(
+    model: BaseModel, rows: int = JSON_STREAM_ROWS
+) -> Iterator[bytes]:
+    """
+    Serialize ``model`` as ``model_dump_json()`` does, one field at a time
+    and long lists ``rows`` items at a time, so the whole document is
+    never held as one string.
+
+    Yields:
+        bytes: consecutive pieces of the JSON document.
+    """
+    items = [(name, getattr(model, name)) for name in type(model).model_fields]
+    items.extend((model.__pydantic_extra__ or {}).items())
+    separator = b"{"
+    for name, value in items:
+        yield separator + to_json(name) + b":"
+        separator = b","
+        if isinstance(value, BaseModel):
+            yield from iter_model_json(value, rows)
+        elif isinstance(value, list) and len(value) > rows:
+            for start in range(0, len(value), rows):
+                stop = start + rows
+                batch = to_json(value[start:stop], inf_nan_mode="null")
+                yield (b"," if start else b"[") + batch[1:-1]
+            yield b"]"
+        else:
+            yield to_json(value, inf_nan_mode="null")
+    yield b"}" if separator == b"," else b"{}"
@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+from src.views.interface import ApiBaseView
+
+
+class IndexUsage(BaseModel):
+    """One index of a collection and the operations that used it."""
+
+    name: str
+    key: Dict[str, Any]
+    accesses: int
+    since: Optional[datetime] = None
+
+
+class CollectionIndexes(BaseModel):
+    """
+    Indexes of one collection. ``missing`` lists declared indexes that
+    do not exist, e.g. because index creation is turned off.
+    """
+
+    collection: str
+    indexes: List[IndexUsage]
+    missing: List[str] = []
+
+
+class IndexReport(ApiBaseView):
+    message: str = "Index usage successfully retrieved"
+    collections: List[CollectionIndexes]
+
+
+class QueryPlan(ApiBaseView):
+    """
+    Summary of a query's winning plan. ``stages`` runs from the stage
+    returning documents down to the one reading them, e.g. FETCH then
+    IXSCAN; a COLLSCAN stage means no index serves the query.
+    """
+
+    message: str = "Query successfully explained"
+    collection: str
+    stages: List[str]
+    indexes: List[str]
+    returned: int
+    keys_examined: int
+    documents_examined: int
+    execution_time_ms: int
+    winning_plan: Dict[str, Any]
@@ -1,7 +1,7 @@
-from typing import Optional, Any
+from typing import List, Optional, Any
 from datetime import datetime, timezone, timedelta
 from pydantic import ConfigDict, Field
-from src.views.interface import ApiBaseView
+from src.views.interface import ApiBaseView, BulkItemStatus
 from src.models.environment import EnvironmentModel
 
 
@@ -90,3 +90,9 @@ class EnvironmentCreated(ApiBaseView):
 class EnvironmentRetrieved(ApiBaseView):
     message: str = "Environment successfully retrieved"
     environment: EnvironmentView
+
+
+class EnvironmentsRetrieved(ApiBaseView):
+    message: str = "Environments successfully retrieved"
+    environments: List[EnvironmentView]
+    items: List[BulkItemStatus]
@@ -1,9 +1,9 @@
-from typing import Optional, Any
-from pydantic import ConfigDict
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict
 from src.models.flight import FlightModel
-from src.views.interface import ApiBaseView
+from src.views.interface import ApiBaseView, BulkItemStatus
 from src.views.rocket import RocketView, RocketSimulation
-from src.views.environment import EnvironmentSimulation
+from src.views.environment import EnvironmentSimulation, EnvironmentView
 
 
 class FlightSimulation(ApiBaseView):
@@ -140,8 +140,68 @@ class FlightSimulation(ApiBaseView):
     lateral_surface_wind: Optional[Any] = None
 
 
+class FlightMonteCarloStatistic(BaseModel):
+    """Summary of one scalar output over the successful samples."""
+
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: List[float]
+
+
+class FlightImpactEllipse(BaseModel):
+    """
+    Landing dispersion ellipse, in meters from the launch site.
+
+    ``angle`` is measured in degrees from the x (east) axis to the
+    semi-major axis.
+    """
+
+    sigma: int
+    x_center: float
+    y_center: float
+    semi_major_axis: float
+    semi_minor_axis: float
+    angle: float
+
+
+class FlightMonteCarloSimulation(ApiBaseView):
+    message: str = "Flight Monte Carlo successfully simulated"
+    samples: int
+    failed_samples: int
+    seed: Optional[int] = None
+    percentiles: List[float]
+    apogee: FlightMonteCarloStatistic
+    apogee_time: FlightMonteCarloStatistic
+    max_mach_number: FlightMonteCarloStatistic
+    out_of_rail_velocity: FlightMonteCarloStatistic
+    impact_velocity: FlightMonteCarloStatistic
+    x_impact: FlightMonteCarloStatistic
+    y_impact: FlightMonteCarloStatistic
+    impact_ellipses: List[FlightImpactEllipse]
+
+
+class FlightSweepSimulation(ApiBaseView):
+    """
+    Columnar sweep table: ``columns`` maps every swept path and every
+    output to one value per grid point, in grid order. Outputs of grid
+    points RocketPy could not simulate are null.
+    """
+
+    message: str = "Flight sweep successfully simulated"
+    points: int
+    failed_points: int
+    parameters: List[str]
+    outputs: List[str]
+    columns: Dict[str, List[Optional[float]]]
+
+
 class FlightView(FlightModel):
     flight_id: str
+    # Send back as If-Match when patching the flight.
+    version: int = 0
+    environment: EnvironmentView
     rocket: RocketView
 
 
@@ -161,3 +221,9 @@ class FlightImported(ApiBaseView):
 class FlightRetrieved(ApiBaseView):
     message: str = "Flight successfully retrieved"
     flight: FlightView
+
+
+class FlightsRetrieved(ApiBaseView):
+    message: str = "Flights successfully retrieved"
+    flights: List[FlightView]
+    items: List[BulkItemStatus]
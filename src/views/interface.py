@@ -1,6 +1,40 @@
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict
 
 
 class ApiBaseView(BaseModel):
     message: str = 'View not implemented'
     model_config = ConfigDict(ser_json_exclude_none=True)
+
+
+class BulkItemStatus(BaseModel):
+    """Outcome of one item of a bulk request, in request order."""
+
+    id: Optional[str] = None
+    status: int
+    detail: Optional[str] = None
+
+
+class BulkCreated(ApiBaseView):
+    message: str = "Bulk create completed"
+    created: int
+    failed: int
+    items: List[BulkItemStatus]
+
+
+class BulkDeleted(ApiBaseView):
+    message: str = "Bulk delete completed"
+    deleted: int
+    items: List[BulkItemStatus]
+
+
+class DocumentPage(ApiBaseView):
+    """
+    One keyset page of stored documents, each with its ``<model>_id``.
+    Pass ``next_cursor`` back as ``after`` for the following page; it is
+    null on the last page.
+    """
+
+    message: str = "Documents successfully listed"
+    documents: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
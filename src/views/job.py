@@ -0,0 +1,25 @@
+from typing import Optional, Union
+from pydantic import Field
+from src.models.flight import FlightModel
+from src.models.job import JobModel
+from src.views.interface import ApiBaseView
+from src.views.flight import FlightSimulation
+
+# Simulation view stored as the result of each job kind.
+JOB_RESULT_VIEWS = {FlightModel.NAME: FlightSimulation}
+
+
+class JobView(JobModel):
+    job_id: str
+    worker: Optional[str] = Field(default=None, exclude=True)
+    result: Optional[Union[tuple(JOB_RESULT_VIEWS.values())]] = None
+
+
+class JobCreated(ApiBaseView):
+    message: str = "Simulation job successfully queued"
+    job_id: str
+
+
+class JobRetrieved(ApiBaseView):
+    message: str = "Simulation job successfully retrieved"
+    job: JobView
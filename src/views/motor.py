@@ -1,6 +1,6 @@
-from typing import Optional, Any
+from typing import List, Optional, Any
 from pydantic import ConfigDict
-from src.views.interface import ApiBaseView
+from src.views.interface import ApiBaseView, BulkItemStatus
 from src.views.drawing import DrawingBounds, MotorDrawingGeometry
 from src.models.motor import MotorModel
 
@@ -88,6 +88,12 @@ class MotorRetrieved(ApiBaseView):
     motor: MotorView
 
 
+class MotorsRetrieved(ApiBaseView):
+    message: str = "Motors successfully retrieved"
+    motors: List[MotorView]
+    items: List[BulkItemStatus]
+
+
 class MotorDrawingGeometryView(ApiBaseView):
     """Motor-only drawing-geometry response.
 
@@ -1,7 +1,7 @@
-from typing import Optional, Any
+from typing import List, Optional, Any
 from pydantic import ConfigDict
 from src.models.rocket import RocketModel
-from src.views.interface import ApiBaseView
+from src.views.interface import ApiBaseView, BulkItemStatus
 from src.views.motor import MotorView, MotorSimulation
 
 # Re-export drawing types from src.views.drawing so callers that previously
@@ -131,3 +131,9 @@ class RocketCreated(ApiBaseView):
 class RocketRetrieved(ApiBaseView):
     message: str = "Rocket successfully retrieved"
     rocket: RocketView
+
+
+class RocketsRetrieved(ApiBaseView):
+    message: str = "Rockets successfully retrieved"
+    rockets: List[RocketView]
+    items: List[BulkItemStatus]
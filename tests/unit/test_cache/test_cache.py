@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import LRUCache, SocketCache, model_hash
+from src.models.environment import EnvironmentModel
+from src.views.environment import EnvironmentView
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_items=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_lru_cache_respects_max_size():
+    cache = LRUCache(max_items=10, max_size=10)
+    cache.put('a', b'aaaa', size=4)
+    cache.put('b', b'bbbb', size=4)
+    cache.put('c', b'cccc', size=4)
+    assert 'a' not in cache
+    assert len(cache) == 2
+    cache.put('huge', b'x' * 11, size=11)
+    assert 'huge' not in cache
+
+
+def test_lru_cache_resize():
+    cache = LRUCache(max_items=10, max_size=10)
+    value = [b'aaaa']
+    cache.put('a', value, size=4)
+    cache.put('b', b'bbbb', size=4)
+    cache.resize('b', b'other', size=8)
+    assert len(cache) == 2
+    assert cache.get('a') is value
+    cache.resize('a', value, size=7)
+    assert 'a' in cache
+    assert 'b' not in cache
+    cache.resize('a', value, size=11)
+    assert 'a' not in cache
+
+
+def test_lru_cache_evict_if():
+    cache = LRUCache()
+    cache.put('a', ('owner-1', 1))
+    cache.put('b', ('owner-2', 2))
+    assert cache.evict_if(lambda _, value: value[0] == 'owner-1') == 1
+    assert 'a' not in cache
+    assert 'b' in cache
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(ttl=10)
+    with patch('src.cache.time.monotonic', return_value=100):
+        cache.put('a', 1)
+    with patch('src.cache.time.monotonic', return_value=109):
+        assert cache.get('a') == 1
+    with patch('src.cache.time.monotonic', return_value=110):
+        assert cache.get('a') is None
+    assert 'a' not in cache
+
+
+async def _serve_memcached(reader, writer):
+    """Answers the get, set and delete commands of SocketCache."""
+    entries = {}
+    while line := await reader.readline():
+        command, key, *args = line.split()
+        if command == b'get':
+            if key in entries:
+                value = entries[key]
+                writer.write(
+                    b'VALUE %s 0 %d\r\n%s\r\n' % (key, len(value), value)
+                )
+            writer.write(b'END\r\n')
+        elif command == b'set':
+            entries[key] = (await reader.readexactly(int(args[2]) + 2))[:-2]
+        elif command == b'delete':
+            entries.pop(key, None)
+        await writer.drain()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_socket_cache_round_trip(tmp_path):
+    path = str(tmp_path / 'memcached.sock')
+    server = await asyncio.start_unix_server(_serve_memcached, path)
+    async with server:
+        cache = SocketCache(path, ttl=30)
+        assert await cache.get('a') is None
+        await cache.put('a', b'\x00value\r\n')
+        assert await cache.get('a') == b'\x00value\r\n'
+        await cache.delete('a')
+        assert await cache.get('a') is None
+
+
+@pytest.mark.asyncio
+async def test_socket_cache_raises_connection_error(tmp_path):
+    cache = SocketCache(str(tmp_path / 'missing.sock'))
+    with pytest.raises(ConnectionError):
+        await cache.get('a')
+
+
+def test_model_hash_ignores_view_ids():
+    env = EnvironmentModel(latitude=1, longitude=2, date='2030-01-01T00:00')
+    view = EnvironmentView(environment_id='123', **env.model_dump())
+    assert model_hash(env) == model_hash(view)
+
+
+def test_model_hash_changes_with_content_and_params():
+    env = EnvironmentModel(latitude=1, longitude=2, date='2030-01-01T00:00')
+    other = env.model_copy(update={'latitude': 3})
+    assert model_hash(env) != model_hash(other)
+    assert model_hash(env) != model_hash(env, points=50)
@@ -0,0 +1,219 @@
+import gzip
+import hashlib
+import io
+import zlib
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.compression import (
+    CompressionMetrics,
+    GZipCompressor,
+    PrecompressedBody,
+    RocketPyCompressionMiddleware,
+    compression_level,
+    negotiate_encoding,
+    parse_levels,
+    precompressed_response,
+    zlib_to_gzip,
+)
+
+BODY = b'{"x": [' + b', '.join(b'%d.5' % i for i in range(5000)) + b']}'
+DIGEST = hashlib.sha256(zlib.compress(BODY)).hexdigest()
+ENCODINGS = {'zstd': None, 'br': None, 'gzip': GZipCompressor}
+
+app = FastAPI()
+app.add_middleware(
+    RocketPyCompressionMiddleware, minimum_size=1000, offload_size=10000
+)
+
+
+@app.get('/json')
+def get_json():
+    return Response(BODY, media_type='application/json')
+
+
+@app.get('/small')
+def get_small():
+    return PlainTextResponse('x' * 10)
+
+
+@app.get('/binary')
+def get_binary():
+    return Response(BODY, media_type='application/octet-stream')
+
+
+@app.get('/stream')
+def get_stream():
+    stream = io.BytesIO(BODY)
+    chunks = iter(lambda: stream.read(4096), b'')
+    return StreamingResponse(chunks, media_type='application/x-ndjson')
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def compression_metrics():
+    compression_metrics = CompressionMetrics()
+    with patch(
+        'src.compression.get_compression_metrics',
+        return_value=compression_metrics,
+    ):
+        yield compression_metrics
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, expected',
+    [
+        ('gzip, br, zstd', 'zstd'),
+        ('gzip;q=1, br;q=0.5', 'gzip'),
+        ('br;q=0.8, zstd;q=0.9', 'zstd'),
+        ('zstd;q=0, *', 'br'),
+        ('deflate', None),
+        ('gzip;q=0', None),
+        ('', None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ENCODINGS) == expected
+
+
+def test_parse_levels():
+    levels = parse_levels('application/json:zstd=6, *:gzip=4')
+    assert levels == {('application/json', 'zstd'): 6, ('*', 'gzip'): 4}
+    with patch('src.compression.COMPRESSION_LEVELS', levels):
+        assert compression_level('application/json', 'zstd') == 6
+        assert compression_level('text/csv', 'gzip') == 4
+        assert compression_level('text/csv', 'zstd') == 3
+    with pytest.raises(ValueError):
+        parse_levels('application/json:deflate=6')
+
+
+def test_compresses_large_response(client, compression_metrics):
+    response = client.get('/json', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.content == BODY
+    assert compression_metrics.input_bytes == {'gzip': len(BODY)}
+    assert 0 < compression_metrics.output_bytes['gzip'] < len(BODY)
+
+
+def test_offloads_large_bodies(client):
+    async def run_sync(function):
+        return function()
+
+    with patch(
+        'src.compression.run_in_threadpool', side_effect=run_sync
+    ) as mock_run:
+        response = client.get('/json', headers={'Accept-Encoding': 'gzip'})
+        assert response.content == BODY
+        mock_run.assert_called_once()
+        mock_run.reset_mock()
+        response = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        assert response.content == BODY
+        mock_run.assert_not_called()
+
+
+@pytest.mark.parametrize('path', ['/small', '/binary'])
+def test_skips_small_and_compressed_responses(client, path):
+    response = client.get(path, headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_skips_unaccepted_encodings(client):
+    response = client.get('/json', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.content == BODY
+
+
+def test_compresses_streaming_response(client, compression_metrics):
+    response = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert response.content == BODY
+    assert compression_metrics.input_bytes == {'gzip': len(BODY)}
+
+
+@pytest.mark.parametrize(
+    'encoding, package', [('zstd', 'zstandard'), ('br', 'brotli')]
+)
+def test_compresses_with_optional_encodings(client, encoding, package):
+    pytest.importorskip(package)
+    response = client.get('/json', headers={'Accept-Encoding': encoding})
+    assert response.headers['Content-Encoding'] == encoding
+    assert response.content == BODY
+
+
+def test_zlib_to_gzip_keeps_deflate_stream():
+    payload = zlib.compress(BODY)
+    assert gzip.decompress(zlib_to_gzip(payload)) == BODY
+
+
+def test_precompressed_body_builds_variants_once():
+    body = PrecompressedBody('abc', zlib.compress(BODY))
+    assert body.content() == BODY
+    assert body.content('gzip') is body.content('gzip')
+    assert body.etag() == f'"{DIGEST}"'
+    assert body.etag('gzip') == f'"{DIGEST}-gzip"'
+
+
+def test_precompressed_body_etag_follows_payload():
+    body = PrecompressedBody('abc', zlib.compress(BODY))
+    assert PrecompressedBody('xyz', body.payload).etag() == body.etag()
+    assert PrecompressedBody('abc', zlib.compress(b'{}')).etag() != (
+        body.etag()
+    )
+
+
+def test_precompressed_body_reports_variant_sizes():
+    sizes = []
+    body = PrecompressedBody(
+        'abc', zlib.compress(BODY), on_resize=sizes.append
+    )
+    assert body.size == len(body.payload)
+    gzipped = body.content('gzip')
+    body.content('gzip')
+    assert sizes == [body.size] == [len(body.payload) + len(gzipped)]
+
+
+def test_precompressed_body_iter_content():
+    body = PrecompressedBody('abc', zlib.compress(BODY))
+    chunks = list(body.iter_content(4096))
+    assert b''.join(chunks) == BODY
+    assert max(map(len, chunks)) <= 4096
+
+
+@pytest.mark.parametrize(
+    'if_none_match, expected',
+    [
+        (f'"{DIGEST}"', True),
+        (f'W/"{DIGEST}-gzip"', True),
+        (f'"xyz", "{DIGEST}-zstd"', True),
+        ('*', True),
+        (f'"{DIGEST}d"', False),
+        ('"abc"', False),
+    ],
+)
+def test_precompressed_body_matches(if_none_match, expected):
+    body = PrecompressedBody('abc', zlib.compress(BODY))
+    assert body.matches(if_none_match) is expected
+
+
+@pytest.mark.asyncio
+async def test_precompressed_response():
+    body = PrecompressedBody('abc', zlib.compress(BODY))
+    response = await precompressed_response(body, 'gzip, deflate')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'] == f'"{DIGEST}-gzip"'
+    assert gzip.decompress(response.body) == BODY
+
+    response = await precompressed_response(body, None, f'"{DIGEST}-gzip"')
+    assert response.status_code == 304
+    assert response.headers['ETag'] == f'"{DIGEST}"'
+    assert 'Content-Encoding' not in response.headers
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from unittest.mock import patch, AsyncMock, MagicMock
+import pytest
+from fastapi import HTTPException, status
+from pymongo.errors import OperationFailure
+from src.controllers.admin import ADMIN_MODELS, AdminController
+from src.models.admin import QueryExplainRequest
+from src.repositories.interface import RepositoryInterface
+
+
+@pytest.fixture
+def stub_controller():
+    return AdminController()
+
+
+@pytest.fixture
+def mock_repo():
+    repo = AsyncMock()
+    repo_cls = MagicMock(index_name=RepositoryInterface.index_name)
+    repo_cls.return_value.__aenter__.return_value = repo
+    with patch(
+        'src.controllers.admin.RepositoryInterface.get_model_repo',
+        return_value=repo_cls,
+    ):
+        yield repo
+
+
+@pytest.mark.asyncio
+async def test_get_index_report_lists_missing_indexes(
+    stub_controller, mock_repo
+):
+    since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    mock_repo.read_index_stats.return_value = [
+        {'name': 'name_1', 'key': {'name': 1}, 'accesses': {'ops': 3}},
+        {
+            'name': '_id_',
+            'key': {'_id': 1},
+            'accesses': {'ops': 7, 'since': since},
+        },
+    ]
+    report = await stub_controller.get_index_report()
+    assert [c.collection for c in report.collections] == [
+        model.NAME for model in ADMIN_MODELS
+    ]
+    flight = {c.collection: c for c in report.collections}['flight']
+    assert [index.name for index in flight.indexes] == ['_id_', 'name_1']
+    assert flight.indexes[0].accesses == 7
+    assert flight.indexes[0].since == since
+    assert flight.missing == ['environment_id_1', 'rocket_id_1']
+    simulation = {c.collection: c for c in report.collections}['simulation']
+    assert simulation.missing == ['owners_1', 'created_at_1']
+
+
+@pytest.mark.asyncio
+async def test_explain_query_summarizes_winning_plan(
+    stub_controller, mock_repo
+):
+    winning_plan = {
+        'stage': 'FETCH',
+        'inputStage': {'stage': 'IXSCAN', 'indexName': 'motor_kind_1'},
+    }
+    mock_repo.explain_query.return_value = {
+        'queryPlanner': {'winningPlan': {'queryPlan': winning_plan}},
+        'executionStats': {
+            'nReturned': 2,
+            'totalKeysExamined': 2,
+            'totalDocsExamined': 2,
+            'executionTimeMillis': 1,
+        },
+    }
+    request = QueryExplainRequest(filter={'motor_kind': 'SOLID'}, limit=5)
+    plan = await stub_controller.explain_query('motor', request)
+    assert plan.stages == ['FETCH', 'IXSCAN']
+    assert plan.indexes == ['motor_kind_1']
+    assert plan.returned == 2
+    assert plan.documents_examined == 2
+    mock_repo.explain_query.assert_awaited_once_with(
+        {'motor_kind': 'SOLID'}, sort={}, limit=5
+    )
+
+
+@pytest.mark.asyncio
+async def test_explain_query_unknown_collection(stub_controller, mock_repo):
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.explain_query('unknown', QueryExplainRequest())
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    mock_repo.explain_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_explain_query_rejected_by_server(stub_controller, mock_repo):
+    mock_repo.explain_query.side_effect = OperationFailure('unknown operator')
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.explain_query(
+            'motor', QueryExplainRequest(filter={'$bad': 1})
+        )
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,11 +1,23 @@
-from unittest.mock import patch, Mock
+import asyncio
+import hashlib
+import json
+import zlib
+from datetime import datetime, timezone
+from unittest.mock import patch, Mock, AsyncMock, MagicMock
 import pytest
+from bson import ObjectId
 from pymongo.errors import PyMongoError
 from fastapi import HTTPException, status
+from pydantic import BaseModel
+from src.compression import PrecompressedBody
 from src.controllers.interface import (
     ControllerBase,
+    _background_jobs,
     controller_exception_handler,
 )
+from src.models.environment import EnvironmentModel
+from src.models.job import JobStatus
+from src.views.flight import FlightSimulation
 
 
 @pytest.fixture
@@ -13,6 +25,7 @@ def stub_model():
     model = Mock()
     model.NAME = 'test_model'
     model.METHODS = ('GET', 'POST', 'PUT', 'DELETE')
+    model.BULK_METHODS = ('POST', 'GET', 'DELETE')
     model.UPDATED = lambda: 'Updated'
     model.DELETED = lambda: 'Deleted'
     model.CREATED = lambda arg: 'Created'
@@ -95,6 +108,180 @@ async def test_controller_exception_handler_unexpected_exception(stub_model):
         )
 
 
+@pytest.mark.asyncio
+async def test_controller_interface_post_bulk_model(
+    stub_controller, stub_model
+):
+    class BulkModel(BaseModel):
+        burn_time: float
+
+    stub_model.model_validate = BulkModel.model_validate
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.insert_many = AsyncMock(return_value=[('1', None), (None, 'bad')])
+    documents = [{'burn_time': 1}, {'burn_time': 'never'}, {'burn_time': 2}]
+    result = await stub_controller._post_bulk_model(
+        stub_model, mock_repo, documents
+    )
+    assert result.created == 1
+    assert result.failed == 2
+    assert [item.status for item in result.items] == [201, 422, 422]
+    assert result.items[0].id == '1'
+    assert 'burn_time' in result.items[1].detail
+    assert result.items[2].detail == 'bad'
+    repo.insert_many.assert_awaited_once_with(
+        [{'burn_time': 1.0}, {'burn_time': 2.0}], validated=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_post_bulk_model_too_many(
+    stub_controller, stub_model
+):
+    with patch('src.controllers.interface.BULK_MAX_ITEMS', 1):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller._post_bulk_model(
+                stub_model, Mock(), [Mock(), Mock()]
+            )
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_get_bulk_model(
+    stub_controller, stub_model
+):
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.find_by_ids = AsyncMock(return_value={'b': 'model_b', 'a': 'model_a'})
+    stub_model.RETRIEVED_MANY = lambda models, items: (models, items)
+    models, items = await stub_controller._get_bulk_model(
+        stub_model, mock_repo, ['a', 'missing', 'b']
+    )
+    assert models == ['model_a', 'model_b']
+    assert [(item.id, item.status) for item in items] == [
+        ('a', 200),
+        ('missing', 404),
+        ('b', 200),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_delete_bulk_model(
+    stub_controller, stub_model
+):
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.delete_by_ids = AsyncMock(return_value={'a'})
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        simulation_repo = mock_get_repo.return_value.return_value
+        simulation_repo = simulation_repo.__aenter__.return_value
+        simulation_repo.delete_simulations_by_owners = AsyncMock()
+        result = await stub_controller._delete_bulk_model(
+            stub_model, mock_repo, ['a', 'missing']
+        )
+    assert result.deleted == 1
+    assert [(item.id, item.status) for item in result.items] == [
+        ('a', 204),
+        ('missing', 404),
+    ]
+    simulation_repo.delete_simulations_by_owners.assert_awaited_once_with(
+        ['test_model:a']
+    )
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_delete_bulk_model_keeps_referenced(
+    stub_controller, stub_model
+):
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.delete_by_ids = AsyncMock(return_value={'a'})
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        mock_get_repo.return_value.REFERENCES = ('test_model',)
+        shared_repo = mock_get_repo.return_value.return_value
+        shared_repo = shared_repo.__aenter__.return_value
+        shared_repo.find_referenced_ids = AsyncMock(return_value={'b'})
+        shared_repo.delete_simulations_by_owners = AsyncMock()
+        result = await stub_controller._delete_bulk_model(
+            stub_model, mock_repo, ['a', 'b']
+        )
+    assert result.deleted == 1
+    assert [(item.id, item.status) for item in result.items] == [
+        ('a', 204),
+        ('b', 409),
+    ]
+    repo.delete_by_ids.assert_awaited_once_with(['a'])
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_get_page_model(
+    stub_controller, stub_model
+):
+    first_id, second_id = ObjectId(), ObjectId()
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.find_page = AsyncMock(
+        return_value=[
+            {'_id': first_id, 'name': 'a'},
+            {'_id': second_id, 'name': 'b'},
+        ]
+    )
+    stub_model.model_fields = {'name': None}
+    page = await stub_controller._get_page_model(
+        stub_model, mock_repo, None, 1, ('name',)
+    )
+    assert page.documents == [{'name': 'a', 'test_model_id': str(first_id)}]
+    assert page.next_cursor == str(first_id)
+    repo.find_page.assert_awaited_once_with(
+        after=None, limit=2, fields=('name',), resolve=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'after, fields', [('not-an-id', None), (None, ('missing',))]
+)
+async def test_controller_interface_get_page_model_invalid_query(
+    stub_controller, stub_model, after, fields
+):
+    stub_model.model_fields = {'name': None}
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller._get_page_model(
+            stub_model, MagicMock(), after, 10, fields
+        )
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_stream_model(stub_controller, stub_model):
+    document_id = ObjectId()
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    async def iter_documents(**kwargs):  # pylint: disable=unused-argument
+        yield {'_id': document_id, 'created': created}
+
+    mock_repo = MagicMock()
+    repo = mock_repo.return_value.__aenter__.return_value
+    repo.iter_documents = Mock(side_effect=iter_documents)
+    lines = await stub_controller._stream_model(stub_model, mock_repo)
+    assert [line async for line in lines] == [
+        json.dumps(
+            {
+                'created': '2025-01-01T00:00:00+00:00',
+                'test_model_id': str(document_id),
+            }
+        ).encode()
+        + b'\n'
+    ]
+    repo.iter_documents.assert_called_once_with(
+        after=None, fields=None, resolve=True
+    )
+
+
 def test_controller_interface_init(stub_model):
     with patch(
         'src.controllers.interface.ControllerBase._generate_method'
@@ -112,6 +299,9 @@ def test_controller_interface_init(stub_model):
         assert getattr(stub_controller, 'get_test_model_by_id')() is True
         assert getattr(stub_controller, 'put_test_model_by_id')() is True
         assert getattr(stub_controller, 'delete_test_model_by_id')() is True
+        assert getattr(stub_controller, 'post_test_model_bulk')() is True
+        assert getattr(stub_controller, 'get_test_model_by_ids')() is True
+        assert getattr(stub_controller, 'delete_test_model_by_ids')() is True
 
 
 @pytest.mark.asyncio
@@ -225,3 +415,302 @@ async def test_controller_interface_delete_model(stub_controller, stub_model):
                 )
                 == 'Deleted'
             )
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_delete_model_referenced(
+    stub_controller, stub_model
+):
+    mock_repo = MagicMock()
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        mock_get_repo.return_value.REFERENCES = ('test_model',)
+        flight_repo = mock_get_repo.return_value.return_value
+        flight_repo.__aenter__.return_value.find_referenced_ids = AsyncMock(
+            return_value={'123'}
+        )
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller._delete_model(stub_model, mock_repo, '123')
+    assert exc.value.status_code == status.HTTP_409_CONFLICT
+    mock_repo.return_value.__aenter__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_simulate_cache_hit(stub_controller):
+    view = Mock()
+    view.__name__ = 'StubSimulation'
+    with (
+        patch(
+            'src.controllers.interface.RepositoryInterface.get_model_repo'
+        ) as mock_get_repo,
+        patch(
+            'src.controllers.interface.get_simulation_executor'
+        ) as mock_executor,
+        patch('src.controllers.interface.model_hash', return_value='key'),
+    ):
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        body = PrecompressedBody('key', zlib.compress(b'{}'))
+        repo.read_simulation_body_by_key = AsyncMock(return_value=body)
+        result = await stub_controller._simulate(
+            Mock(NAME='test_model'), '123', Mock(), view, Mock(), 'simulate'
+        )
+        assert result == view.model_validate_json.return_value
+        view.model_validate_json.assert_called_once_with(b'{}')
+        repo.read_simulation_body_by_key.assert_called_once_with('key')
+        result = await stub_controller._simulate(
+            Mock(NAME='test_model'),
+            '123',
+            Mock(),
+            view,
+            Mock(),
+            'simulate',
+            encoded=True,
+        )
+        assert result is body
+        view.model_validate_json.assert_called_once()
+        mock_executor.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_simulate_cache_miss(stub_controller):
+    view = Mock()
+    view.__name__ = 'StubSimulation'
+    simulation = Mock(model_dump_json=Mock(return_value='{}'))
+    factory = Mock()
+    model_instance = Mock()
+    with (
+        patch(
+            'src.controllers.interface.RepositoryInterface.get_model_repo'
+        ) as mock_get_repo,
+        patch(
+            'src.controllers.interface.get_simulation_executor'
+        ) as mock_executor,
+        patch('src.controllers.interface.model_hash', return_value='key'),
+    ):
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.read_simulation_body_by_key = AsyncMock(return_value=None)
+        repo.create_simulation = AsyncMock()
+        mock_executor.return_value.run = AsyncMock(return_value=simulation)
+        result = await stub_controller._simulate(
+            Mock(NAME='test_model'),
+            '123',
+            model_instance,
+            view,
+            factory,
+            'simulate',
+        )
+        assert result is simulation
+        mock_executor.return_value.run.assert_called_once_with(
+            factory, model_instance, 'simulate', timeout=None
+        )
+        entry = repo.create_simulation.call_args.args[0]
+        assert entry.key == 'key'
+        assert entry.owner == 'test_model:123'
+        assert zlib.decompress(entry.payload) == b'{}'
+        body = await stub_controller._simulate(
+            Mock(NAME='test_model'),
+            '123',
+            model_instance,
+            view,
+            factory,
+            'simulate',
+            encoded=True,
+        )
+        assert body.key == 'key'
+        assert body.etag() == f'"{hashlib.sha256(entry.payload).hexdigest()}"'
+        assert body.content() == b'{}'
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_stream_simulation_cache_hit(
+    stub_controller,
+):
+    view = Mock()
+    view.__name__ = 'StubSimulation'
+    payload = b'{"x": [' + b'1.5,' * 50000 + b'2]}'
+    with (
+        patch(
+            'src.controllers.interface.RepositoryInterface.get_model_repo'
+        ) as mock_get_repo,
+        patch(
+            'src.controllers.interface.get_simulation_executor'
+        ) as mock_executor,
+        patch('src.controllers.interface.model_hash', return_value='key'),
+    ):
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.read_simulation_body_by_key = AsyncMock(
+            return_value=PrecompressedBody('key', zlib.compress(payload))
+        )
+        chunks = await stub_controller._stream_simulation(
+            Mock(NAME='test_model'), '123', Mock(), view, Mock(), 'simulate'
+        )
+        chunks = [chunk async for chunk in chunks]
+    assert len(chunks) > 1
+    assert b''.join(chunks) == payload
+    mock_executor.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_stream_simulation_cache_miss(
+    stub_controller,
+):
+    simulation = FlightSimulation(x=[[float(t), 1.0] for t in range(20000)])
+    with (
+        patch(
+            'src.controllers.interface.RepositoryInterface.get_model_repo'
+        ) as mock_get_repo,
+        patch(
+            'src.controllers.interface.get_simulation_executor'
+        ) as mock_executor,
+        patch('src.controllers.interface.model_hash', return_value='key'),
+    ):
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.read_simulation_body_by_key = AsyncMock(return_value=None)
+        repo.create_simulation = AsyncMock()
+        mock_executor.return_value.run = AsyncMock(return_value=simulation)
+        chunks = await stub_controller._stream_simulation(
+            Mock(NAME='test_model'),
+            '123',
+            Mock(),
+            FlightSimulation,
+            Mock(),
+            'simulate',
+        )
+        repo.create_simulation.assert_not_called()
+        chunks = [chunk async for chunk in chunks]
+    expected = simulation.model_dump_json().encode()
+    assert len(chunks) > 1
+    assert b''.join(chunks) == expected
+    entry = repo.create_simulation.call_args.args[0]
+    assert entry.owner == 'test_model:123'
+    assert zlib.decompress(entry.payload) == expected
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_simulate_rejects_unknown_fields(
+    stub_controller,
+):
+    view = Mock(model_fields={'apogee': None})
+    with patch(
+        'src.controllers.interface.get_simulation_executor'
+    ) as mock_executor:
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller._simulate(
+                Mock(NAME='test_model'),
+                '123',
+                Mock(),
+                view,
+                Mock(),
+                'simulate',
+                fields=('apogee', 'bogus'),
+            )
+        assert exc.value.status_code == 422
+        assert exc.value.detail == 'Unknown simulation fields: bogus'
+        mock_executor.assert_not_called()
+
+
+def test_controller_interface_simulation_key_tracks_weather_cycle():
+    environment = EnvironmentModel(
+        latitude=1, longitude=2, atmospheric_model_type='forecast'
+    )
+    view = FlightSimulation
+    with patch(
+        'src.controllers.interface.weather_cycle',
+        side_effect=['2025-06-01T00:00:00', '2025-06-01T06:00:00', None],
+    ):
+        keys = [
+            ControllerBase._simulation_key(environment, view, {})
+            for _ in range(3)
+        ]
+    assert len(set(keys)) == 3
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_submit_job(stub_controller):
+    simulate = AsyncMock(
+        return_value=Mock(model_dump_json=Mock(return_value='{}'))
+    )
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.create_job = AsyncMock(return_value='job-id')
+        repo.update_job_status = AsyncMock()
+        result = await stub_controller._submit_job(
+            Mock(NAME='flight'), '123', {'points': 25}, simulate
+        )
+        assert result.job_id == 'job-id'
+        job = repo.create_job.call_args.args[0]
+        assert job.kind == 'flight'
+        assert job.target_id == '123'
+        assert job.options == {'points': 25}
+        await asyncio.gather(*_background_jobs)
+        statuses = [
+            call.args[1] for call in repo.update_job_status.call_args_list
+        ]
+        assert statuses == [JobStatus.RUNNING, JobStatus.SUCCEEDED]
+        result = repo.update_job_status.call_args.kwargs['result']
+        assert zlib.decompress(result) == b'{}'
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_run_job_http_exception():
+    simulate = AsyncMock(
+        side_effect=HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Simulation queue is full',
+        )
+    )
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.update_job_status = AsyncMock()
+        await ControllerBase._run_job('job-id', simulate)
+        repo.update_job_status.assert_called_with(
+            'job-id',
+            JobStatus.FAILED,
+            error_status=503,
+            error='Simulation queue is full',
+        )
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_run_job_renews_lease():
+    async def simulate():
+        await asyncio.sleep(0.05)
+        return Mock(model_dump_json=Mock(return_value='{}'))
+
+    with (
+        patch(
+            'src.controllers.interface.RepositoryInterface.get_model_repo'
+        ) as mock_get_repo,
+        patch('src.controllers.interface.JOB_HEARTBEAT_SECONDS', 0.01),
+    ):
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.update_job_status = AsyncMock()
+        repo.renew_job_lease = AsyncMock()
+        await ControllerBase._run_job('job-id', simulate)
+        renewals = repo.renew_job_lease.await_count
+        await asyncio.sleep(0.05)
+    assert renewals >= 1
+    assert repo.renew_job_lease.await_count == renewals
+    repo.renew_job_lease.assert_awaited_with('job-id')
+
+
+@pytest.mark.asyncio
+async def test_controller_interface_run_job_unexpected_exception():
+    simulate = AsyncMock(side_effect=ValueError('boom'))
+    with patch(
+        'src.controllers.interface.RepositoryInterface.get_model_repo'
+    ) as mock_get_repo:
+        repo = mock_get_repo.return_value.return_value.__aenter__.return_value
+        repo.update_job_status = AsyncMock()
+        await ControllerBase._run_job('job-id', simulate)
+        repo.update_job_status.assert_called_with(
+            'job-id',
+            JobStatus.FAILED,
+            error_status=500,
+            error='Unexpected error',
+        )
@@ -0,0 +1,405 @@
+import asyncio
+from unittest.mock import patch, Mock, AsyncMock, MagicMock
+import numpy as np
+import pytest
+from fastapi import HTTPException, status
+from src.controllers.flight import FLIGHT_PATCH_ATTEMPTS, FlightController
+from src.models.environment import EnvironmentModel
+from src.models.flight import FlightModel, FlightWithReferencesRequest
+from src.services.timeseries import TimeseriesFormat
+
+
+@pytest.fixture
+def stub_controller():
+    return FlightController()
+
+
+@pytest.mark.asyncio
+async def test_load_references_reports_missing_environment_first(
+    stub_controller,
+):
+    not_found = HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    with (
+        patch.object(
+            stub_controller,
+            '_load_environment',
+            AsyncMock(side_effect=not_found),
+        ),
+        patch.object(
+            stub_controller,
+            '_load_rocket',
+            AsyncMock(side_effect=HTTPException(status_code=500)),
+        ) as mock_load_rocket,
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller._load_references('env_id', 'rocket_id')
+    assert exc.value is not_found
+    mock_load_rocket.assert_awaited_once_with('rocket_id')
+
+
+@pytest.mark.asyncio
+async def test_load_references(stub_controller):
+    environment, rocket = Mock(), Mock()
+    with (
+        patch.object(
+            stub_controller,
+            '_load_environment',
+            AsyncMock(return_value=environment),
+        ),
+        patch.object(
+            stub_controller, '_load_rocket', AsyncMock(return_value=rocket)
+        ),
+    ):
+        assert await stub_controller._load_references(
+            'env_id', 'rocket_id'
+        ) == (environment, rocket)
+
+
+@pytest.mark.asyncio
+async def test_persist_models_concurrently(stub_controller):
+    models = [(Mock(), Mock()), (Mock(), Mock())]
+    with (
+        patch.object(
+            stub_controller,
+            '_persist_model',
+            AsyncMock(side_effect=['first_id', 'second_id']),
+        ) as mock_persist,
+        patch('src.controllers.flight.run_in_transaction') as mock_transaction,
+    ):
+        assert await stub_controller._persist_models(*models) == [
+            'first_id',
+            'second_id',
+        ]
+    mock_transaction.assert_not_called()
+    assert mock_persist.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_persist_models_in_transaction(stub_controller):
+    models = [(Mock(), Mock()), (Mock(), Mock())]
+
+    async def run_in_transaction(callback):
+        return await callback()
+
+    with (
+        patch.object(
+            stub_controller,
+            '_persist_model',
+            AsyncMock(side_effect=['first_id', 'second_id']),
+        ) as mock_persist,
+        patch(
+            'src.controllers.flight.run_in_transaction',
+            AsyncMock(side_effect=run_in_transaction),
+        ) as mock_transaction,
+        patch('src.controllers.flight.RPY_IMPORT_TRANSACTION', True),
+    ):
+        assert await stub_controller._persist_models(*models) == [
+            'first_id',
+            'second_id',
+        ]
+    mock_transaction.assert_awaited_once()
+    assert [call.args for call in mock_persist.await_args_list] == models
+
+
+@pytest.fixture
+def stub_flight():
+    flight = FlightModel(
+        environment={'latitude': 0, 'longitude': 0},
+        rail_length=5,
+        rocket={
+            'motor': {
+                'thrust_source': [[0, 0], [1, 10]],
+                'burn_time': 1,
+                'nozzle_radius': 0.1,
+                'dry_mass': 1,
+                'dry_inertia': [0.1, 0.1, 0.1],
+                'center_of_dry_mass_position': 0,
+                'motor_kind': 'SOLID',
+            },
+            'radius': 0.0635,
+            'mass': 14.4,
+            'motor_position': -1.25,
+            'center_of_mass_without_motor': 0,
+            'inertia': [6.3, 6.3, 0.03],
+            'nose': {
+                'name': 'nose',
+                'length': 0.55,
+                'kind': 'vonKarman',
+                'position': 1.27,
+                'base_radius': 0.0635,
+                'rocket_radius': 0.0635,
+            },
+            'fins': [
+                {
+                    'fins_kind': 'trapezoidal',
+                    'name': 'fins',
+                    'n': 4,
+                    'root_chord': 0.12,
+                    'tip_chord': 0.06,
+                    'span': 0.11,
+                    'position': -1.04,
+                }
+            ],
+            'tail': {
+                'name': 'tail',
+                'top_radius': 0.0635,
+                'bottom_radius': 0.0435,
+                'length': 0.06,
+                'position': -1.19,
+                'radius': 0.0635,
+            },
+        },
+    )
+    flight.set_version(2)
+    return flight
+
+
+@pytest.fixture
+def mock_flight_repo(stub_flight):
+    repo = AsyncMock()
+    repo.read_flight_by_id.return_value = stub_flight
+    repo.patch_flight_by_id.return_value = 3
+    repo.read_flight_version_by_id.return_value = 5
+    repo_cls = MagicMock(REFERENCES=('environment', 'rocket'))
+    repo_cls.return_value.__aenter__.return_value = repo
+    with patch(
+        'src.controllers.flight.RepositoryInterface.get_model_repo',
+        return_value=repo_cls,
+    ):
+        yield repo
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_writes_patched_paths(
+    stub_controller, mock_flight_repo
+):
+    with patch.object(
+        stub_controller, '_invalidate_simulations', AsyncMock()
+    ) as mock_invalidate:
+        assert (
+            await stub_controller.patch_flight_by_id(
+                'flight_id',
+                {
+                    'rail_length': 6,
+                    'rocket': {'tail': None, 'motor': {'burn_time': 2}},
+                },
+                version=2,
+            )
+            == 3
+        )
+    mock_flight_repo.patch_flight_by_id.assert_awaited_once_with(
+        'flight_id',
+        set_fields={'rail_length': 6.0, 'rocket.motor.burn_time': 2.0},
+        unset_fields=['rocket.tail'],
+        version=2,
+    )
+    mock_invalidate.assert_awaited_once_with(FlightModel, 'flight_id')
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_embeds_referenced_rocket(
+    stub_controller, mock_flight_repo, stub_flight
+):
+    stub_flight.rocket.set_id('rocket_id')
+    with patch.object(stub_controller, '_invalidate_simulations', AsyncMock()):
+        await stub_controller.patch_flight_by_id(
+            'flight_id', {'rail_length': 6, 'rocket': {'radius': 0.07}}
+        )
+    rocket = stub_flight.rocket.model_dump(exclude_none=True)
+    rocket['radius'] = 0.07
+    mock_flight_repo.patch_flight_by_id.assert_awaited_once_with(
+        'flight_id',
+        set_fields={'rail_length': 6.0, 'rocket': rocket},
+        unset_fields=['rocket_id'],
+        version=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_stale_version(stub_controller, mock_flight_repo):
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.patch_flight_by_id(
+            'flight_id', {'rail_length': 6}, version=1
+        )
+    assert exc.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+    mock_flight_repo.patch_flight_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_concurrent_update(
+    stub_controller, mock_flight_repo
+):
+    mock_flight_repo.patch_flight_by_id.return_value = None
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.patch_flight_by_id(
+            'flight_id', {'rail_length': 6}, version=2
+        )
+    assert exc.value.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert exc.value.detail == 'Flight was modified; its version is now 5'
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_retries_concurrent_update_without_if_match(
+    stub_controller, mock_flight_repo
+):
+    mock_flight_repo.patch_flight_by_id.side_effect = [None, 4]
+    with patch.object(stub_controller, '_invalidate_simulations', AsyncMock()):
+        assert (
+            await stub_controller.patch_flight_by_id(
+                'flight_id', {'rail_length': 6}
+            )
+            == 4
+        )
+    assert mock_flight_repo.read_flight_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_keeps_conflicting_without_if_match(
+    stub_controller, mock_flight_repo
+):
+    mock_flight_repo.patch_flight_by_id.return_value = None
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.patch_flight_by_id(
+            'flight_id', {'rail_length': 6}
+        )
+    assert exc.value.status_code == status.HTTP_409_CONFLICT
+    assert (
+        mock_flight_repo.patch_flight_by_id.await_count
+        == FLIGHT_PATCH_ATTEMPTS
+    )
+
+
+@pytest.mark.asyncio
+async def test_patch_flight_invalid(stub_controller, mock_flight_repo):
+    for invalid_patch in (
+        {'unknown': 1},
+        {'rail_length': 'long'},
+        {'rocket': {'motor.burn_time': None}},
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller.patch_flight_by_id(
+                'flight_id', invalid_patch
+            )
+        assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    mock_flight_repo.patch_flight_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_environment_by_flight_id_sets_environment(
+    stub_controller, mock_flight_repo
+):
+    environment = EnvironmentModel(latitude=1, longitude=2)
+    with patch.object(stub_controller, '_invalidate_simulations', AsyncMock()):
+        await stub_controller.update_environment_by_flight_id(
+            'flight_id', environment=environment
+        )
+    mock_flight_repo.read_flight_by_id.assert_not_called()
+    mock_flight_repo.patch_flight_by_id.assert_awaited_once_with(
+        'flight_id',
+        set_fields={'environment': environment.model_dump(exclude_none=True)},
+        unset_fields=('environment_id',),
+        version=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_rocket_by_flight_id_not_found(
+    stub_controller, mock_flight_repo, stub_flight
+):
+    mock_flight_repo.patch_flight_by_id.return_value = None
+    with pytest.raises(HTTPException) as exc:
+        await stub_controller.update_rocket_by_flight_id(
+            'flight_id', rocket=stub_flight.rocket
+        )
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_create_flight_from_references_stores_references(
+    stub_controller, mock_flight_repo
+):
+    mock_flight_repo.read_version_by_id.return_value = 0
+    mock_flight_repo.create_flight_with_references.return_value = 'flight_id'
+    payload = FlightWithReferencesRequest(
+        environment_id='env_id', rocket_id='rocket_id', flight={}
+    )
+    with patch('src.controllers.flight.NORMALIZED_FLIGHT_STORAGE', True):
+        created = await stub_controller.create_flight_from_references(payload)
+    assert created.flight_id == 'flight_id'
+    mock_flight_repo.create_flight_with_references.assert_awaited_once_with(
+        payload.flight, environment_id='env_id', rocket_id='rocket_id'
+    )
+    mock_flight_repo.read_rocket_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_flight_from_references_missing_rocket(
+    stub_controller, mock_flight_repo
+):
+    mock_flight_repo.read_version_by_id.side_effect = [0, None]
+    payload = FlightWithReferencesRequest(
+        environment_id='env_id', rocket_id='rocket_id', flight={}
+    )
+    with patch('src.controllers.flight.NORMALIZED_FLIGHT_STORAGE', True):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller.create_flight_from_references(payload)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc.value.detail == 'Rocket not found'
+    mock_flight_repo.create_flight_with_references.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_flight_repo')
+async def test_get_flight_timeseries_rejects_unknown_columns(stub_controller):
+    executor = Mock(run=AsyncMock(side_effect=ValueError('bad column')))
+    with patch(
+        'src.controllers.flight.get_simulation_executor',
+        return_value=executor,
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller.get_flight_timeseries(
+                'flight_id', TimeseriesFormat.CSV, ('bad',)
+            )
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert exc.value.detail == 'bad column'
+
+
+@pytest.mark.asyncio
+async def test_get_flight_timeseries_without_pyarrow(
+    stub_controller, mock_flight_repo
+):
+    with patch('src.services.timeseries.pyarrow', None):
+        with pytest.raises(HTTPException) as exc:
+            await stub_controller.get_flight_timeseries(
+                'flight_id', TimeseriesFormat.PARQUET
+            )
+    assert exc.value.status_code == status.HTTP_501_NOT_IMPLEMENTED
+    mock_flight_repo.read_flight_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_flight_study_cancels_other_batches_on_failure():
+    cancelled = []
+
+    async def run(*args, **kwargs):
+        batch = args[4]
+        if batch[0, 0] == 0:
+            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(batch[0, 0])
+            raise
+
+    executor = Mock(max_workers=3, run=run)
+    with patch(
+        'src.controllers.flight.get_simulation_executor',
+        return_value=executor,
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await FlightController._run_flight_study(
+                Mock(), ['inclination'], np.arange(3.0).reshape(3, 1), ()
+            )
+        await asyncio.sleep(0)
+    assert exc.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert sorted(cancelled) == [1.0, 2.0]
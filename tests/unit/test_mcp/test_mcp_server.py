@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp.client import Client
 from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
 
 from src.api import app
 from src.mcp.server import build_mcp
@@ -83,3 +84,17 @@ async def test_combined_app_serves_rest_and_mcp(monkeypatch):
         assert resp_rest.status_code == 200
         resp_docs = await client.get('/docs')
         assert resp_docs.status_code == 200
+
+
+def test_app_lifespan_shuts_down_simulation_executor():
+    with (
+        patch('src.api.get_simulation_executor') as mock_executor,
+        patch(
+            'src.api.JobController.fail_orphaned_jobs',
+            AsyncMock(return_value=1),
+        ) as mock_fail_orphaned_jobs,
+    ):
+        with TestClient(app):
+            mock_executor.return_value.shutdown.assert_not_called()
+    mock_executor.return_value.shutdown.assert_called_once_with()
+    mock_fail_orphaned_jobs.assert_awaited_once_with()
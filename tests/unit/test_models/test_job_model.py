@@ -0,0 +1,27 @@
+import zlib
+
+import pytest
+
+from src.models.job import JobModel, JobStatus
+from src.views.flight import FlightSimulation
+
+
+def test_job_retrieved_decodes_result_of_its_kind():
+    job = JobModel(
+        kind='flight',
+        target_id='456',
+        status=JobStatus.SUCCEEDED,
+        result=zlib.compress(b'{"apogee": 1000.0}'),
+    )
+    job.set_id('123')
+    retrieved = JobModel.RETRIEVED(job)
+    assert isinstance(retrieved.job.result, FlightSimulation)
+    assert retrieved.job.result.apogee == 1000.0
+
+
+def test_job_retrieved_rejects_unknown_kind():
+    job = JobModel(
+        kind='unknown', target_id='456', result=zlib.compress(b'{}')
+    )
+    with pytest.raises(KeyError):
+        JobModel.RETRIEVED(job)
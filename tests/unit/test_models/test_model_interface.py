@@ -0,0 +1,359 @@
+import bson
+import pytest
+from pydantic import BaseModel
+
+from src.models.environment import EnvironmentModel
+from src.models.flight import FlightModel
+from src.models.interface import construct_model
+from src.models.motor import MotorModel
+from src.models.rocket import RocketModel
+from src.models.sub.tanks import CylindricalTankGeometry, TankKinds
+from src.views.environment import EnvironmentView
+from src.views.flight import FlightRetrieved, FlightView
+from src.views.motor import MotorView
+from src.views.rocket import RocketView
+
+
+def _stored(model):
+    # Round trip through BSON like a document read back from MongoDB.
+    return bson.decode(bson.encode(model.model_dump()))
+
+
+def _motor(**kwargs):
+    return MotorModel(
+        thrust_source=[[0, 0], [1, 10]],
+        burn_time=1,
+        nozzle_radius=0.1,
+        dry_mass=1,
+        dry_inertia=[0.1, 0.1, 0.1],
+        center_of_dry_mass_position=0,
+        **kwargs,
+    )
+
+
+def _flight():
+    return FlightModel(
+        environment={'latitude': 0, 'longitude': 0},
+        rocket={
+            'motor': _motor(motor_kind='SOLID').model_dump(),
+            'radius': 0.0635,
+            'mass': 14.4,
+            'motor_position': -1.25,
+            'center_of_mass_without_motor': 0,
+            'inertia': [6.3, 6.3, 0.03],
+            'nose': {
+                'name': 'nose',
+                'length': 0.55,
+                'kind': 'vonKarman',
+                'position': 1.27,
+                'base_radius': 0.0635,
+                'rocket_radius': 0.0635,
+            },
+            'fins': [
+                {
+                    'fins_kind': 'trapezoidal',
+                    'name': 'fins',
+                    'n': 4,
+                    'root_chord': 0.12,
+                    'tip_chord': 0.06,
+                    'span': 0.11,
+                    'position': -1.04,
+                }
+            ],
+        },
+    )
+
+
+def test_construct_model_matches_validation():
+    motor = _motor(
+        motor_kind='LIQUID',
+        reshape_thrust_curve=(1, 10),
+        tanks=[
+            {
+                'name': 'tank',
+                'tank_kind': 'MASS',
+                'geometry': {
+                    'geometry_kind': 'cylindrical',
+                    'radius': 0.1,
+                    'height': 0.5,
+                },
+                'gas': {'name': 'gas', 'density': 1},
+                'liquid': {'name': 'lox', 'density': [[90, 1141]]},
+                'flux_time': (0, 1),
+                'position': 0,
+                'discretize': 10,
+                'liquid_mass': 0,
+                'gas_mass': 0,
+            }
+        ],
+    )
+    document = _stored(motor)
+    constructed = construct_model(MotorModel, document)
+    assert constructed == MotorModel.model_validate(document)
+    tanks = constructed.tanks or []
+    assert len(tanks) == 1
+    tank = tanks[0]
+    assert isinstance(tank.geometry, CylindricalTankGeometry)
+    assert tank.tank_kind is TankKinds.MASS
+    assert tank.liquid.density == [(90, 1141)]
+    assert constructed.reshape_thrust_curve == (1, 10)
+
+
+def test_construct_model_builds_nested_models():
+    document = _stored(_flight())
+    constructed = construct_model(FlightModel, document)
+    assert constructed == FlightModel.model_validate(document)
+    assert isinstance(constructed.rocket.motor, MotorModel)
+    assert constructed.rocket.inertia == (6.3, 6.3, 0.03)
+
+
+def test_as_view_copies_nested_views():
+    flight = _flight()
+    flight.set_id('flight_id')
+    retrieved = FlightModel.RETRIEVED(flight)
+    assert retrieved.flight.flight_id == 'flight_id'
+    assert isinstance(retrieved.flight.rocket, RocketView)
+    assert isinstance(retrieved.flight.rocket.motor, MotorView)
+    assert isinstance(retrieved.flight.environment, EnvironmentView)
+    assert retrieved.flight.rocket.rocket_id is None
+    assert FlightRetrieved.model_validate(
+        retrieved.model_dump()
+    ) == FlightRetrieved.model_validate(
+        {'flight': {'flight_id': 'flight_id', **flight.model_dump()}}
+    )
+
+
+def test_as_view_copies_ids_of_referenced_components():
+    flight = _flight()
+    flight.rocket.set_id('rocket_id')
+    flight.environment.set_id('environment_id')
+    view = flight.as_view(FlightView, flight_id='flight_id')
+    assert view.rocket.rocket_id == 'rocket_id'
+    assert view.environment.environment_id == 'environment_id'
+    assert view.rocket.motor.motor_id is None
+
+
+def _tank(tank_kind, geometry, **kwargs):
+    return {
+        'name': 'tank',
+        'tank_kind': tank_kind,
+        'geometry': geometry,
+        'gas': {'name': 'gas', 'density': 1.5},
+        'liquid': {'name': 'lox', 'density': [[90, 1141], [100, 1100]]},
+        'flux_time': (0, 1),
+        'position': 0.5,
+        'discretize': 10,
+        **kwargs,
+    }
+
+
+_GEOMETRIES = {
+    'custom': {'geometry_kind': 'custom', 'geometry': [[(0, 1), 0.1]]},
+    'cylindrical': {
+        'geometry_kind': 'cylindrical',
+        'radius': 0.1,
+        'height': 0.5,
+        'spherical_caps': True,
+    },
+    'spherical': {'geometry_kind': 'spherical', 'radius': 0.1},
+}
+
+_TANK_FIELDS = {
+    'LEVEL': {'liquid_height': 0.2},
+    'MASS': {'liquid_mass': 1.0, 'gas_mass': 0.1},
+    'MASS_FLOW': {
+        'initial_liquid_mass': 1.0,
+        'initial_gas_mass': 0.1,
+        'liquid_mass_flow_rate_in': 0.0,
+        'liquid_mass_flow_rate_out': 1.0,
+        'gas_mass_flow_rate_in': 0.0,
+        'gas_mass_flow_rate_out': 0.1,
+    },
+    'ULLAGE': {'ullage': 0.01},
+}
+
+_STORED_MODELS = {
+    'environment-standard': lambda: EnvironmentModel(
+        latitude=32.99, longitude=-106.97, elevation=1400.0
+    ),
+    'environment-constant-profiles': lambda: EnvironmentModel(
+        latitude=0,
+        longitude=0,
+        atmospheric_model_type='custom_atmosphere',
+        pressure=101325.0,
+        temperature=300.0,
+        wind_u=2.0,
+    ),
+    'environment-sampled-profiles': lambda: EnvironmentModel(
+        latitude=0,
+        longitude=0,
+        atmospheric_model_type='custom_atmosphere',
+        pressure=[(0, 101325), (1000, 89876)],
+        temperature=[(0, 300), (1000, 293.5)],
+        wind_u=[(0, 1), (1000, 5)],
+        wind_v=[(0, 0), (1000, -2)],
+    ),
+    'motor-solid': lambda: _motor(
+        motor_kind='SOLID',
+        grain_number=5,
+        grain_density=1815.0,
+        grain_outer_radius=0.033,
+        grain_initial_inner_radius=0.015,
+        grain_initial_height=0.12,
+        grains_center_of_mass_position=0.4,
+        grain_separation=0.005,
+        throat_radius=0.011,
+        reshape_thrust_curve=(3.9, 2200),
+    ),
+    'motor-generic': lambda: _motor(
+        motor_kind='GENERIC',
+        chamber_radius=0.03,
+        chamber_height=0.2,
+        chamber_position=0.1,
+        propellant_initial_mass=2.5,
+        nozzle_position=0.0,
+        reshape_thrust_curve=True,
+        interpolation_method='spline',
+    ),
+    'motor-hybrid': lambda: _motor(
+        motor_kind='HYBRID',
+        throat_radius=0.011,
+        grain_number=1,
+        grain_density=1000.0,
+        grain_outer_radius=0.05,
+        grain_initial_inner_radius=0.02,
+        grain_initial_height=0.3,
+        grains_center_of_mass_position=0.5,
+        grain_separation=0.0,
+        tanks=[
+            _tank('MASS', _GEOMETRIES['spherical'], **_TANK_FIELDS['MASS'])
+        ],
+    ),
+    **{
+        f'motor-liquid-{kind.lower()}-{geometry}': (
+            lambda kind=kind, shape=shape, fields=fields: _motor(
+                motor_kind='LIQUID',
+                coordinate_system_orientation='combustion_chamber_to_nozzle',
+                tanks=[
+                    _tank(kind, shape, **fields),
+                    _tank(
+                        'MASS', _GEOMETRIES['custom'], **_TANK_FIELDS['MASS']
+                    ),
+                ],
+            )
+        )
+        for kind, fields in _TANK_FIELDS.items()
+        for geometry, shape in _GEOMETRIES.items()
+    },
+    'rocket-minimal': lambda: _flight().rocket,
+    'rocket-complete': lambda: RocketModel.model_validate(
+        {
+            **_flight().rocket.model_dump(),
+            'motor': _STORED_MODELS['motor-liquid-ullage-cylindrical'](),
+            'inertia': (6.3, 6.3, 0.03, 0.1, 0.2, 0.3),
+            'power_off_drag': [(0, 0.5), (1, 0.6)],
+            'power_on_drag': [(0, 0.4), (1, 0.55)],
+            'coordinate_system_orientation': 'nose_to_tail',
+            'fins': [
+                {
+                    'fins_kind': 'elliptical',
+                    'name': 'elliptical',
+                    'n': 3,
+                    'root_chord': 0.12,
+                    'span': 0.1,
+                    'position': -1.0,
+                    'cant_angle': 0.5,
+                    'airfoil': ([(0, 0), (0.1, 0.5)], 'degrees'),
+                },
+                {
+                    'fins_kind': 'trapezoidal',
+                    'name': 'trapezoidal',
+                    'n': 4,
+                    'root_chord': 0.12,
+                    'tip_chord': 0.06,
+                    'span': 0.11,
+                    'position': -1.04,
+                    'sweep_angle': 10.0,
+                },
+            ],
+            'parachutes': [
+                {
+                    'name': 'drogue',
+                    'cd_s': 1.0,
+                    'sampling_rate': 105.0,
+                    'lag': 1.5,
+                    'trigger': 'apogee',
+                    'noise': (0, 8.3, 0.5),
+                },
+                {
+                    'name': 'main',
+                    'cd_s': 10.0,
+                    'sampling_rate': 105.0,
+                    'lag': 1.5,
+                    'trigger': 800.0,
+                    'noise': (0, 8.3, 0.5),
+                },
+            ],
+            'rail_buttons': {
+                'upper_button_position': 0.08,
+                'lower_button_position': -0.6,
+                'angular_position': 45.0,
+            },
+            'tail': {
+                'name': 'tail',
+                'top_radius': 0.0635,
+                'bottom_radius': 0.0435,
+                'length': 0.06,
+                'position': -1.19,
+                'radius': 0.0635,
+            },
+        }
+    ),
+    'flight-minimal': _flight,
+    'flight-complete': lambda: FlightModel(
+        name='complete',
+        environment=_STORED_MODELS['environment-sampled-profiles'](),
+        rocket=_STORED_MODELS['rocket-complete'](),
+        rail_length=5.2,
+        terminate_on_apogee=True,
+        equations_of_motion='solid_propulsion',
+        inclination=85.0,
+        heading=90.0,
+        max_time=600,
+        max_time_step=0.5,
+        min_time_step=0,
+        rtol=1e-6,
+        atol=1e-6,
+        verbose=False,
+    ),
+}
+
+
+def _assert_identical(constructed, validated, path='model'):
+    assert type(constructed) is type(validated), path
+    if isinstance(validated, BaseModel):
+        for name in type(validated).model_fields:
+            _assert_identical(
+                getattr(constructed, name),
+                getattr(validated, name),
+                f'{path}.{name}',
+            )
+    elif isinstance(validated, (list, tuple)):
+        assert len(constructed) == len(validated), path
+        for index, (left, right) in enumerate(zip(constructed, validated)):
+            _assert_identical(left, right, f'{path}[{index}]')
+    else:
+        assert constructed == validated, path
+
+
+@pytest.mark.parametrize('exclude_none', [True, False])
+@pytest.mark.parametrize('case', sorted(_STORED_MODELS))
+def test_construct_model_round_trips_stored_models(case, exclude_none):
+    model = _STORED_MODELS[case]()
+    document = bson.decode(
+        bson.encode(model.model_dump(exclude_none=exclude_none))
+    )
+    _assert_identical(
+        construct_model(type(model), document),
+        type(model).model_validate(document),
+    )
@@ -0,0 +1,53 @@
+from unittest.mock import patch, Mock
+
+from src.repositories.client import (
+    MONGODB_MAX_POOL_SIZE,
+    PoolMetricsListener,
+    get_mongo_client,
+    get_pool_metrics,
+)
+
+
+def test_get_mongo_client_is_shared_and_configured():
+    get_mongo_client.cache_clear()
+    with (
+        patch('src.repositories.client.AsyncMongoClient') as mock_client,
+        patch('src.repositories.client.MONGODB_WAIT_QUEUE_TIMEOUT_MS', None),
+    ):
+        assert get_mongo_client() is get_mongo_client()
+    get_mongo_client.cache_clear()
+    mock_client.assert_called_once()
+    options = mock_client.call_args.kwargs
+    assert options['maxPoolSize'] == MONGODB_MAX_POOL_SIZE
+    assert options['event_listeners'] == [get_pool_metrics()]
+    assert 'waitQueueTimeoutMS' not in options
+
+
+def test_pool_metrics_listener_tracks_connections():
+    listener = PoolMetricsListener()
+    event = Mock(address=('localhost', 27017), duration=0.01)
+    listener.connection_created(event)
+    listener.connection_created(event)
+    listener.connection_check_out_started(event)
+    listener.connection_checked_out(event)
+    listener.connection_check_out_started(event)
+    assert listener.snapshot() == {
+        'idle': 1,
+        'used': 1,
+        'pending': 1,
+        'checkouts': 1,
+        'checkout_failures': 0,
+        'pool_clears': 0,
+    }
+    listener.connection_check_out_failed(event)
+    listener.connection_checked_in(event)
+    listener.connection_closed(event)
+    listener.pool_cleared(event)
+    assert listener.snapshot() == {
+        'idle': 1,
+        'used': 0,
+        'pending': 0,
+        'checkouts': 1,
+        'checkout_failures': 1,
+        'pool_clears': 1,
+    }
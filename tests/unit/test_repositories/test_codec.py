@@ -0,0 +1,117 @@
+from unittest.mock import patch, AsyncMock, Mock
+import bson
+import numpy as np
+import pytest
+
+from src.models.environment import EnvironmentModel
+from src.models.flight import FlightModel
+from src.models.motor import MotorModel
+from src.repositories.codec import (
+    array_paths,
+    decode_arrays,
+    encode_array_updates,
+    encode_arrays,
+    is_packed_array,
+    pack_array,
+    unpack_array,
+)
+from src.repositories.interface import RepositoryInterface
+from src.repositories.motor import MotorRepository
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_pack_array_round_trip(compress):
+    table = [(0.0, 0.0), (0.5, 1200.25), (1.0, 0.0)]
+    packed = pack_array(table, compress=compress)
+    assert is_packed_array(packed)
+    unpacked = unpack_array(bson.decode(bson.encode({'t': packed}))['t'])
+    assert unpacked.dtype == np.float64
+    assert unpacked.tolist() == [list(row) for row in table]
+
+
+@pytest.mark.parametrize(
+    'value', [1.5, None, [], [1.0, 2.0], [[1.0, 2.0], [3.0]], [['a', 'b']]]
+)
+def test_pack_array_skips_non_tables(value):
+    assert pack_array(value) is None
+
+
+def test_array_paths_include_embedded_models():
+    assert set(array_paths(FlightModel)) == {
+        ('environment', 'pressure'),
+        ('environment', 'temperature'),
+        ('environment', 'wind_u'),
+        ('environment', 'wind_v'),
+        ('rocket', 'power_off_drag'),
+        ('rocket', 'power_on_drag'),
+        ('rocket', 'motor', 'thrust_source'),
+    }
+
+
+def test_encode_arrays_keeps_document_and_scalars():
+    document = {'pressure': 101325.0, 'wind_u': [[0, 1], [1000, 5]]}
+    encoded = encode_arrays(EnvironmentModel, document)
+    assert encoded['pressure'] == 101325.0
+    assert is_packed_array(encoded['wind_u'])
+    assert document['wind_u'] == [[0, 1], [1000, 5]]
+    assert decode_arrays(EnvironmentModel, encoded) == {
+        'pressure': 101325.0,
+        'wind_u': [[0.0, 1.0], [1000.0, 5.0]],
+    }
+
+
+def test_encode_array_updates_by_path():
+    table = [[0, 0], [1, 10]]
+    encoded = encode_array_updates(
+        FlightModel,
+        {
+            'rocket.motor': {'thrust_source': table, 'burn_time': 1},
+            'rocket.power_off_drag': table,
+            'rail_length': 5,
+        },
+    )
+    assert is_packed_array(encoded['rocket.motor']['thrust_source'])
+    assert encoded['rocket.motor']['burn_time'] == 1
+    assert is_packed_array(encoded['rocket.power_off_drag'])
+    assert encoded['rail_length'] == 5
+
+
+@pytest.fixture
+def stub_repository():
+    with patch.object(RepositoryInterface, "_initialize", return_value=None):
+        repo = MotorRepository()
+        repo._initialized = True
+        yield repo
+
+
+@pytest.mark.asyncio
+async def test_repository_stores_packed_arrays(stub_repository):
+    motor = MotorModel(
+        thrust_source=[[0, 0], [1, 10]],
+        burn_time=1,
+        nozzle_radius=0.1,
+        dry_mass=1,
+        dry_inertia=[0.1, 0.1, 0.1],
+        center_of_dry_mass_position=0,
+        motor_kind='SOLID',
+    )
+    mock_collection = Mock(
+        insert_one=AsyncMock(return_value=Mock(inserted_id='motor_id'))
+    )
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch('src.repositories.interface.BINARY_ARRAY_STORAGE', True),
+    ):
+        await stub_repository.insert(
+            motor.model_dump(exclude_none=True), validated=True
+        )
+    stored = mock_collection.insert_one.call_args.args[0]
+    assert is_packed_array(stored['thrust_source'])
+
+    read = stub_repository._parse_document(
+        {**bson.decode(bson.encode(stored)), '_id': bson.ObjectId()}
+    )
+    assert read.model_dump() == motor.model_dump()
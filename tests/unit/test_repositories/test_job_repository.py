@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from bson import ObjectId
+
+from src.models.job import JobStatus
+from src.repositories.interface import RepositoryInterface
+from src.repositories.job import (
+    JOB_LEASE_SECONDS,
+    JobRepository,
+    worker_id,
+)
+
+JOB_ID = str(ObjectId())
+
+
+@pytest.fixture
+def stub_repository():
+    with patch.object(RepositoryInterface, "_initialize", return_value=None):
+        repo = JobRepository()
+        repo._initialized = True
+        yield repo
+
+
+@pytest.fixture
+def mock_collection():
+    collection = Mock(
+        update_one=AsyncMock(),
+        update_many=AsyncMock(return_value=Mock(modified_count=1)),
+    )
+    with patch.object(
+        JobRepository, 'get_collection', return_value=collection
+    ):
+        yield collection
+
+
+@pytest.mark.asyncio
+async def test_update_job_status_running_takes_lease(
+    stub_repository, mock_collection
+):
+    await stub_repository.update_job_status(JOB_ID, JobStatus.RUNNING)
+    changes = mock_collection.update_one.call_args.args[1]['$set']
+    assert changes['status'] == 'RUNNING'
+    assert changes['worker'] == worker_id()
+    assert changes['heartbeat_at'] == changes['updated_at']
+    assert 'expires_at' not in changes
+
+
+@pytest.mark.asyncio
+async def test_update_job_status_finished_pushes_back_expiry(
+    stub_repository, mock_collection
+):
+    await stub_repository.update_job_status(JOB_ID, JobStatus.SUCCEEDED)
+    changes = mock_collection.update_one.call_args.args[1]['$set']
+    assert changes['finished_at'] == changes['updated_at']
+    assert changes['expires_at'] > changes['finished_at']
+
+
+@pytest.mark.asyncio
+async def test_renew_job_lease_only_while_running(
+    stub_repository, mock_collection
+):
+    await stub_repository.renew_job_lease(JOB_ID)
+    query, update = mock_collection.update_one.call_args.args
+    assert query == {'_id': ObjectId(JOB_ID), 'status': 'RUNNING'}
+    assert set(update['$set']) == {'heartbeat_at'}
+
+
+@pytest.mark.asyncio
+async def test_fail_orphaned_jobs(stub_repository, mock_collection):
+    assert await stub_repository.fail_orphaned_jobs() == 1
+    query, update = mock_collection.update_many.call_args.args
+    assert query['status'] == {'$in': ['PENDING', 'RUNNING']}
+    stale = query['$or'][0]['heartbeat_at']['$lt']
+    expected = datetime.now(timezone.utc) - timedelta(
+        seconds=JOB_LEASE_SECONDS
+    )
+    assert abs(stale - expected) < timedelta(seconds=5)
+    assert '_id' not in query
+    assert update['$set']['status'] == 'FAILED'
+    assert update['$set']['error_status'] == 503
+
+
+@pytest.mark.asyncio
+async def test_read_job_fails_it_when_orphaned(
+    stub_repository, mock_collection
+):
+    with patch.object(
+        JobRepository, 'find_by_id', AsyncMock(return_value='job')
+    ):
+        assert await stub_repository.read_job_by_id(JOB_ID) == 'job'
+    query = mock_collection.update_many.call_args.args[0]
+    assert query['_id'] == ObjectId(JOB_ID)
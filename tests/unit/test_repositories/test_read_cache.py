@@ -0,0 +1,153 @@
+from unittest.mock import patch, AsyncMock, Mock
+import bson
+import pytest
+
+from src.cache import LRUCache
+from src.repositories.flight import FlightRepository
+from src.repositories.interface import RepositoryInterface
+from src.repositories.motor import MotorRepository
+from src.repositories.read_cache import ReadCache
+
+MOTOR_DOCUMENT = {
+    'thrust_source': [[0.0, 0.0], [1.0, 10.0]],
+    'burn_time': 1,
+    'nozzle_radius': 0.1,
+    'dry_mass': 1,
+    'dry_inertia': [0.1, 0.1, 0.1],
+    'center_of_dry_mass_position': 0,
+    'motor_kind': 'SOLID',
+}
+
+
+@pytest.fixture
+def read_cache():
+    read_cache = ReadCache(LRUCache())
+    with (
+        patch(
+            'src.repositories.interface.get_read_cache',
+            return_value=read_cache,
+        ),
+        patch('src.repositories.interface.READ_CACHE_ENABLED', True),
+    ):
+        yield read_cache
+
+
+@pytest.fixture
+def stub_repository():
+    with patch.object(RepositoryInterface, "_initialize", return_value=None):
+        repo = MotorRepository()
+        repo._initialized = True
+        yield repo
+
+
+@pytest.fixture
+def mock_collection():
+    document = {**MOTOR_DOCUMENT, '_id': bson.ObjectId()}
+    mock_collection = Mock(
+        find_one=AsyncMock(return_value=document),
+        update_one=AsyncMock(),
+    )
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        yield mock_collection
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_reads_through_cache(
+    stub_repository, mock_collection, read_cache
+):
+    data_id = str(mock_collection.find_one.return_value['_id'])
+    first = await stub_repository.find_by_id(data_id=data_id)
+    second = await stub_repository.find_by_id(data_id=data_id)
+    mock_collection.find_one.assert_awaited_once()
+    assert second.model_dump() == first.model_dump()
+    assert second.get_id() == data_id
+    assert read_cache.snapshot() == {
+        'hits': {'memory': 1, 'shared': 0},
+        'misses': {'memory': 1, 'shared': 0},
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('read_cache')
+async def test_update_invalidates_cached_document(
+    stub_repository, mock_collection
+):
+    data_id = str(mock_collection.find_one.return_value['_id'])
+    await stub_repository.find_by_id(data_id=data_id)
+    await stub_repository.update_by_id(MOTOR_DOCUMENT, data_id=data_id)
+    await stub_repository.find_by_id(data_id=data_id)
+    assert mock_collection.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_drops_fill_raced_by_update(
+    stub_repository, mock_collection, read_cache
+):
+    document = mock_collection.find_one.return_value
+    data_id = str(document['_id'])
+
+    async def find_one_during_update(*_args, **_kwargs):
+        await stub_repository.update_by_id(MOTOR_DOCUMENT, data_id=data_id)
+        return document
+
+    mock_collection.find_one.side_effect = find_one_during_update
+    await stub_repository.find_by_id(data_id=data_id)
+    assert len(read_cache.memory_tier) == 0
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_skips_cache_unless_enabled(
+    stub_repository, mock_collection
+):
+    data_id = str(mock_collection.find_one.return_value['_id'])
+    with patch('src.repositories.interface.get_read_cache') as mock_cache:
+        await stub_repository.find_by_id(data_id=data_id)
+        await stub_repository.find_by_id(data_id=data_id)
+    mock_cache.assert_not_called()
+    assert mock_collection.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_skips_documents_with_references(read_cache):
+    document = {'_id': bson.ObjectId(), 'rocket_id': bson.ObjectId()}
+    with (
+        patch.object(RepositoryInterface, "_initialize", return_value=None),
+        patch.object(
+            FlightRepository, "_find", new_callable=AsyncMock
+        ) as mock_find,
+        patch.object(FlightRepository, "_parse_document"),
+    ):
+        mock_find.return_value.to_list = AsyncMock(return_value=[document])
+        repo = FlightRepository()
+        repo._initialized = True
+        await repo.find_by_id(data_id=str(document['_id']))
+    assert len(read_cache.memory_tier) == 0
+
+
+@pytest.mark.asyncio
+async def test_read_cache_copies_shared_hits_to_memory():
+    document = {'_id': bson.ObjectId(), 'burn_time': 1}
+    shared_tier = Mock(get=AsyncMock(return_value=bson.encode(document)))
+    read_cache = ReadCache(LRUCache(), shared_tier)
+    assert await read_cache.get('motor', 'a') == document
+    assert await read_cache.get('motor', 'a') == document
+    shared_tier.get.assert_awaited_once_with('rocketpy:motor:a')
+    assert read_cache.snapshot() == {
+        'hits': {'memory': 1, 'shared': 1},
+        'misses': {'memory': 1, 'shared': 0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_read_cache_falls_back_when_shared_tier_fails():
+    shared_tier = Mock(
+        get=AsyncMock(side_effect=ConnectionError('refused')),
+        put=AsyncMock(side_effect=ConnectionError('refused')),
+    )
+    read_cache = ReadCache(LRUCache(), shared_tier)
+    assert await read_cache.get('motor', 'a') is None
+    await read_cache.put('motor', 'a', {'burn_time': 1})
+    assert await read_cache.get('motor', 'a') == {'burn_time': 1}
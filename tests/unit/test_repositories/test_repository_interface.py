@@ -1,8 +1,11 @@
-from unittest.mock import patch, Mock, AsyncMock
+from unittest.mock import patch, Mock, AsyncMock, MagicMock
 import pytest
 import pytest_asyncio
-from pymongo.errors import PyMongoError
+from bson import ObjectId
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError, PyMongoError
 from fastapi import HTTPException, status
+from src.repositories.client import run_in_transaction
 from src.repositories.interface import (
     RepositoryInterface,
     repository_exception_handler,
@@ -165,6 +168,59 @@ async def test_repository_insert_invalid_data(stub_repository_invalid_model):
             await stub_repository_invalid_model.insert('invalid_model_data')
 
 
+@pytest.mark.asyncio
+async def test_repository_insert_validated_data(
+    stub_repository_invalid_model, mock_db_interface
+):
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_db_interface,
+    ):
+        with patch.object(
+            stub_repository_invalid_model.model, 'model_validate'
+        ) as mock_validate:
+            assert (
+                await stub_repository_invalid_model.insert(
+                    'mock_data', validated=True
+                )
+                == 'mock_id'
+            )
+            mock_validate.assert_not_called()
+            mock_db_interface.insert_one.assert_called_once_with('mock_data')
+
+
+@pytest.mark.asyncio
+async def test_repository_insert_in_transaction(
+    stub_repository, mock_db_interface
+):
+    session = MagicMock()
+
+    async def with_transaction(callback):
+        return await callback(session)
+
+    session.with_transaction = with_transaction
+    mock_client = MagicMock()
+    mock_client.start_session.return_value.__aenter__.return_value = session
+
+    async def insert():
+        return await stub_repository.insert('mock_data', validated=True)
+
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_db_interface,
+    ):
+        with patch(
+            'src.repositories.client.get_mongo_client',
+            return_value=mock_client,
+        ):
+            assert await run_in_transaction(insert) == 'mock_id'
+        mock_db_interface.insert_one.assert_called_once_with(
+            'mock_data', session=session
+        )
+        await stub_repository.insert('mock_data', validated=True)
+        mock_db_interface.insert_one.assert_called_with('mock_data')
+
+
 @pytest.mark.asyncio
 async def test_repository_update_data(stub_repository, mock_db_interface):
     with patch(
@@ -181,8 +237,55 @@ async def test_repository_update_data(stub_repository, mock_db_interface):
                 is stub_repository
             )
             mock_db_interface.update_one.assert_called_once_with(
-                {'_id': 'mock_id'}, {'$set': 'mock_data'}
+                {'_id': 'mock_id'},
+                {'$set': 'mock_data', '$inc': {'_version': 1}},
+            )
+
+
+@pytest.mark.asyncio
+async def test_repository_patch_data(stub_repository):
+    data_id = ObjectId()
+    mock_collection = AsyncMock()
+    mock_collection.find_one_and_update.return_value = {'_version': 1}
+    with patch.object(
+        RepositoryInterface, 'get_collection', return_value=mock_collection
+    ):
+        assert (
+            await stub_repository.patch_by_id(
+                data_id=str(data_id),
+                set_fields={'rocket.mass': 10},
+                unset_fields=['rocket.tail'],
+                version=0,
             )
+            == 1
+        )
+    query, update = mock_collection.find_one_and_update.call_args.args
+    assert query == {'_id': data_id, '_version': {'$in': [None, 0]}}
+    assert update == {
+        '$inc': {'_version': 1},
+        '$set': {'rocket.mass': 10},
+        '$unset': {'rocket.tail': ''},
+    }
+
+
+@pytest.mark.asyncio
+async def test_repository_patch_data_stale_version(stub_repository):
+    data_id = ObjectId()
+    mock_collection = AsyncMock()
+    mock_collection.find_one_and_update.return_value = None
+    mock_collection.find_one.return_value = {'_id': data_id, '_version': 4}
+    with patch.object(
+        RepositoryInterface, 'get_collection', return_value=mock_collection
+    ):
+        assert (
+            await stub_repository.patch_by_id(
+                data_id=str(data_id), set_fields={'name': 'x'}, version=3
+            )
+            is None
+        )
+        assert await stub_repository.read_version_by_id(str(data_id)) == 4
+    query, _ = mock_collection.find_one_and_update.call_args.args
+    assert query == {'_id': data_id, '_version': 3}
 
 
 @pytest.mark.asyncio
@@ -220,6 +323,38 @@ async def test_repository_find_data_found(
             )
 
 
+@pytest.mark.asyncio
+async def test_repository_find_trusted_data(
+    stub_repository, mock_db_interface, stub_loaded_model
+):
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_db_interface,
+    ):
+        with patch(
+            'src.repositories.interface.VALIDATE_STORED_DOCUMENTS', False
+        ):
+            with patch(
+                'src.repositories.interface.construct_model'
+            ) as mock_construct:
+                with patch.object(
+                    stub_repository.model, 'model_validate'
+                ) as mock_validate:
+                    assert (
+                        await stub_repository.find_by_id(
+                            data_id=str(ObjectId())
+                        )
+                        == mock_construct.return_value
+                    )
+                    mock_validate.assert_not_called()
+                mock_construct.assert_called_once_with(
+                    stub_repository.model, stub_loaded_model
+                )
+                mock_construct.return_value.set_id.assert_called_once_with(
+                    stub_loaded_model['_id']
+                )
+
+
 @pytest.mark.asyncio
 async def test_repository_find_data_not_found(
     stub_repository, mock_db_interface
@@ -284,3 +419,327 @@ async def test_repository_find_by_query_not_found(
     ):
         assert await stub_repository.find_by_query('mock_query') == []
         mock_db_interface_empty_find.find.assert_called_once_with('mock_query')
+
+
+@pytest.mark.asyncio
+async def test_repository_insert_many_reports_each_item(stub_repository):
+    # insert_many assigns the _id of each sent document; the mock does not.
+    first_id, last_id = ObjectId(), ObjectId()
+    documents = [
+        {'_id': first_id},
+        {'invalid': True},
+        {'_id': ObjectId()},
+        {'_id': last_id},
+    ]
+
+    def model_validate(document):
+        if document.get('invalid'):
+            raise ValidationError.from_exception_data('mock_model', [])
+        return Mock()
+
+    mock_collection = AsyncMock()
+    mock_collection.insert_many.side_effect = BulkWriteError(
+        {
+            'writeErrors': [{'index': 1, 'errmsg': 'duplicate key'}],
+            'writeConcernErrors': [],
+        }
+    )
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(
+            stub_repository.model, 'model_validate', side_effect=model_validate
+        ),
+    ):
+        results = await stub_repository.insert_many(documents)
+    mock_collection.insert_many.assert_awaited_once_with(
+        [documents[0], documents[2], documents[3]], ordered=False
+    )
+    assert results[0] == (str(first_id), None)
+    assert results[1][0] is None
+    assert results[2] == (None, 'duplicate key')
+    assert results[3] == (str(last_id), None)
+
+
+@pytest.mark.asyncio
+async def test_repository_find_by_ids(stub_repository):
+    found_id = ObjectId()
+
+    async def async_gen(*args, **kwargs):  # pylint: disable=unused-argument
+        yield {'_id': found_id}
+
+    mock_collection = Mock(find=Mock(return_value=async_gen()))
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        found = await stub_repository.find_by_ids(
+            [str(found_id), str(ObjectId()), 'not-an-id']
+        )
+    assert found == {str(found_id): stub_repository.model.model_validate()}
+    query = mock_collection.find.call_args.args[0]
+    assert len(query['_id']['$in']) == 2
+
+
+@pytest.mark.asyncio
+async def test_repository_find_page(stub_repository):
+    after = ObjectId()
+    mock_collection = Mock()
+    cursor = mock_collection.find.return_value.sort.return_value
+    cursor.limit.return_value.to_list = AsyncMock(return_value=['doc'])
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        assert await stub_repository.find_page(
+            after=str(after), limit=3, fields=('name',)
+        ) == ['doc']
+    mock_collection.find.assert_called_once_with(
+        {'_id': {'$gt': after}}, {'name': 1}
+    )
+    mock_collection.find.return_value.sort.assert_called_once_with('_id', 1)
+    cursor.limit.assert_called_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_repository_iter_documents(stub_repository, stub_loaded_model):
+    class StubCursor:
+        def sort(self, *args):  # pylint: disable=unused-argument
+            return self
+
+        async def __aiter__(self):
+            yield stub_loaded_model
+            yield stub_loaded_model
+
+    mock_collection = Mock(find=Mock(return_value=StubCursor()))
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        documents = [
+            document async for document in stub_repository.iter_documents()
+        ]
+    assert documents == [stub_loaded_model, stub_loaded_model]
+    mock_collection.find.assert_called_once_with({}, None, batch_size=100)
+
+
+@pytest.mark.asyncio
+async def test_repository_delete_by_ids(stub_repository):
+    found_id, missing_id = ObjectId(), ObjectId()
+
+    async def async_gen(*args, **kwargs):  # pylint: disable=unused-argument
+        yield {'_id': found_id}
+
+    mock_collection = Mock(
+        find=Mock(return_value=async_gen()), delete_many=AsyncMock()
+    )
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        deleted = await stub_repository.delete_by_ids(
+            [str(found_id), str(missing_id)]
+        )
+    assert deleted == {str(found_id)}
+    mock_collection.delete_many.assert_awaited_once_with(
+        {'_id': {'$in': [found_id]}}
+    )
+
+
+def test_repositories_bind_collections_on_shared_client():
+    mock_client = MagicMock()
+    with (
+        patch(
+            'src.repositories.interface.get_mongo_client',
+            return_value=mock_client,
+        ),
+        patch.object(RepositoryInterface, '_initialize', return_value=None),
+    ):
+        repo = RepositoryInterface(Mock(NAME='mock_model'))
+        repo._initialize_connection()
+    assert repo._client is mock_client
+    assert repo._collection is mock_client.rocketpy['mock_model']
+
+
+@pytest.mark.asyncio
+async def test_repository_find_page_resolves_references(stub_repository):
+    mock_collection = Mock()
+    mock_collection.aggregate = AsyncMock()
+    mock_collection.aggregate.return_value.to_list = AsyncMock(
+        return_value=['doc']
+    )
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(stub_repository, 'REFERENCES', ('rocket',)),
+    ):
+        assert await stub_repository.find_page(
+            limit=3, fields=('rocket',)
+        ) == ['doc']
+    pipeline = mock_collection.aggregate.call_args.args[0]
+    assert pipeline[:3] == [
+        {'$match': {}},
+        {'$sort': {'_id': 1}},
+        {'$limit': 3},
+    ]
+    assert pipeline[3]['$lookup'] == {
+        'from': 'rocket',
+        'localField': 'rocket_id',
+        'foreignField': '_id',
+        'as': '_rocket',
+    }
+    assert pipeline[-1] == {'$project': {'rocket': 1}}
+    mock_collection.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_repository_find_page_without_resolving(stub_repository):
+    mock_collection = Mock()
+    cursor = mock_collection.find.return_value.sort.return_value
+    cursor.limit.return_value.to_list = AsyncMock(return_value=['doc'])
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(stub_repository, 'REFERENCES', ('rocket',)),
+    ):
+        assert await stub_repository.find_page(limit=3, resolve=False) == [
+            'doc'
+        ]
+    mock_collection.find.assert_called_once_with({}, None)
+
+
+@pytest.mark.asyncio
+async def test_repository_find_by_id_sets_reference_ids(stub_repository):
+    flight_id, rocket_id = ObjectId(), ObjectId()
+    mock_collection = Mock()
+    mock_collection.aggregate = AsyncMock()
+    mock_collection.aggregate.return_value.to_list = AsyncMock(
+        return_value=[{'_id': flight_id, 'rocket_id': rocket_id}]
+    )
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(stub_repository, 'REFERENCES', ('rocket',)),
+    ):
+        parsed = await stub_repository.find_by_id(data_id=str(flight_id))
+    parsed.rocket.set_id.assert_called_once_with(str(rocket_id))
+    pipeline = mock_collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {'$match': {'_id': flight_id}}
+
+
+@pytest.mark.asyncio
+async def test_repository_update_by_id_replaces_references(stub_repository):
+    mock_collection = Mock(update_one=AsyncMock())
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(stub_repository, 'REFERENCES', ('environment', 'rocket')),
+    ):
+        await stub_repository.update_by_id(
+            {'rocket': {}}, data_id=str(ObjectId()), validated=True
+        )
+    update = mock_collection.update_one.call_args.args[1]
+    assert update['$unset'] == {'rocket_id': ''}
+
+
+@pytest.mark.asyncio
+async def test_repository_find_referenced_ids(stub_repository):
+    referenced, unreferenced = ObjectId(), ObjectId()
+    mock_collection = Mock(distinct=AsyncMock(return_value=[referenced]))
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        found = await stub_repository.find_referenced_ids(
+            'rocket', [str(referenced), str(unreferenced), 'not-an-id']
+        )
+    assert found == {str(referenced)}
+    mock_collection.distinct.assert_awaited_once_with(
+        'rocket_id', {'rocket_id': {'$in': [referenced, unreferenced]}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_repository_create_indexes(stub_repository):
+    mock_collection = Mock(
+        create_indexes=AsyncMock(return_value=['name_1', 'a_1_b_1'])
+    )
+    with (
+        patch(
+            'src.repositories.interface.RepositoryInterface.get_collection',
+            return_value=mock_collection,
+        ),
+        patch.object(
+            stub_repository.model,
+            'INDEXES',
+            (('name',), ('a', 'b')),
+            create=True,
+        ),
+        patch.object(
+            stub_repository.model,
+            'EXPIRES_AFTER',
+            ('created_at', 60),
+            create=True,
+        ),
+    ):
+        assert await stub_repository.create_indexes() == ['name_1', 'a_1_b_1']
+    indexes = mock_collection.create_indexes.call_args.args[0]
+    assert [index.document['key'] for index in indexes] == [
+        {'name': 1},
+        {'a': 1, 'b': 1},
+        {'created_at': 1},
+    ]
+    assert indexes[-1].document['expireAfterSeconds'] == 60
+    assert [
+        RepositoryInterface.index_name(fields)
+        for fields in (('name',), ('a', 'b'))
+    ] == ['name_1', 'a_1_b_1']
+
+
+@pytest.mark.asyncio
+async def test_repository_async_init_tolerates_index_failure(stub_repository):
+    stub_repository._initialized = False
+    with (
+        patch.object(stub_repository, '_initialize_connection'),
+        patch.object(
+            stub_repository,
+            'create_indexes',
+            AsyncMock(side_effect=PyMongoError('not authorized')),
+        ) as mock_create_indexes,
+    ):
+        await stub_repository._async_init()
+    assert stub_repository._initialized
+    mock_create_indexes.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_repository_explain_query(stub_repository):
+    mock_collection = Mock()
+    mock_collection.database.command = AsyncMock(return_value={'ok': 1})
+    with patch(
+        'src.repositories.interface.RepositoryInterface.get_collection',
+        return_value=mock_collection,
+    ):
+        assert await stub_repository.explain_query(
+            {'name': 'a'}, sort={'name': 1}
+        ) == {'ok': 1}
+    mock_collection.database.command.assert_awaited_once_with(
+        {
+            'explain': {
+                'find': 'mock_model',
+                'filter': {'name': 'a'},
+                'sort': {'name': 1},
+            },
+            'verbosity': 'executionStats',
+        }
+    )
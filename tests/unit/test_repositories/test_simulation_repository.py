@@ -0,0 +1,119 @@
+import zlib
+from unittest.mock import patch, AsyncMock, Mock
+import pytest
+
+from src.models.simulation import SimulationCacheModel
+from src.repositories.interface import RepositoryInterface
+from src.repositories.simulation import SimulationRepository
+
+
+@pytest.fixture
+def stub_repository():
+    with patch.object(RepositoryInterface, "_initialize", return_value=None):
+        repo = SimulationRepository()
+        repo._initialized = True
+        repo.memory_tier.clear()
+        yield repo
+        repo.memory_tier.clear()
+
+
+@pytest.fixture
+def mock_collection():
+    collection = Mock()
+    collection.find_one = AsyncMock(
+        return_value={
+            '_id': 'key',
+            'owners': ['flight:1'],
+            'payload': b'data',
+        }
+    )
+    collection.update_one = AsyncMock()
+    collection.distinct = AsyncMock(return_value=['key'])
+    collection.update_many = AsyncMock()
+    collection.delete_many = AsyncMock()
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_read_simulation_populates_memory_tier(
+    stub_repository, mock_collection
+):
+    with patch.object(
+        SimulationRepository, 'get_collection', return_value=mock_collection
+    ):
+        assert await stub_repository.read_simulation_by_key('key') == b'data'
+        assert await stub_repository.read_simulation_by_key('key') == b'data'
+        mock_collection.find_one.assert_called_once_with({'_id': 'key'})
+
+
+@pytest.mark.asyncio
+async def test_read_simulation_body_is_kept(stub_repository, mock_collection):
+    with patch.object(
+        SimulationRepository, 'get_collection', return_value=mock_collection
+    ):
+        body = await stub_repository.read_simulation_body_by_key('key')
+        assert body.payload == b'data'
+        assert body.key == 'key'
+        assert await stub_repository.read_simulation_body_by_key('key') is body
+        mock_collection.find_one.assert_called_once_with({'_id': 'key'})
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_counts_body_variants(
+    stub_repository, mock_collection
+):
+    payload = zlib.compress(b'{"x": 1}' * 1000)
+    mock_collection.find_one.return_value['payload'] = payload
+    with patch.object(
+        SimulationRepository, 'get_collection', return_value=mock_collection
+    ):
+        body = await stub_repository.read_simulation_body_by_key('key')
+    assert stub_repository.memory_tier._size == len(payload)
+    body.content('gzip')
+    assert stub_repository.memory_tier._size == body.size > len(payload)
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_simulations(stub_repository, mock_collection):
+    mock_collection.find_one.return_value = None
+    entry = SimulationCacheModel(key='key', owner='flight:1', payload=b'x')
+    with patch.object(
+        SimulationRepository, 'get_collection', return_value=mock_collection
+    ):
+        await stub_repository.create_simulation(entry)
+        query, update = mock_collection.update_one.call_args.args
+        assert query == {'_id': 'key'}
+        assert update['$addToSet'] == {'owners': 'flight:1'}
+        assert set(update['$set']) == {'payload', 'created_at'}
+        assert await stub_repository.read_simulation_by_key('key') == b'x'
+        mock_collection.find_one.assert_not_called()
+
+        await stub_repository.delete_simulations_by_owner('flight:1')
+        mock_collection.distinct.assert_awaited_once_with(
+            '_id', {'owners': {'$in': ['flight:1']}}
+        )
+        mock_collection.update_many.assert_awaited_once_with(
+            {'_id': {'$in': ['key']}},
+            {'$pull': {'owners': {'$in': ['flight:1']}}},
+        )
+        mock_collection.delete_many.assert_awaited_once_with(
+            {'_id': {'$in': ['key']}, 'owners': []}
+        )
+        assert await stub_repository.read_simulation_by_key('key') is None
+
+
+@pytest.mark.asyncio
+async def test_delete_simulations_keeps_entries_of_other_owners(
+    stub_repository, mock_collection
+):
+    with patch.object(
+        SimulationRepository, 'get_collection', return_value=mock_collection
+    ):
+        for owner in ('flight:1', 'flight:2'):
+            await stub_repository.create_simulation(
+                SimulationCacheModel(key='key', owner=owner, payload=b'x')
+            )
+        await stub_repository.delete_simulations_by_owners(['flight:1'])
+        assert await stub_repository.read_simulation_by_key('key') == b'x'
+        await stub_repository.delete_simulations_by_owners(['flight:2'])
+        assert 'key' not in stub_repository.memory_tier
@@ -1,6 +1,11 @@
 import json
+import zlib
+from unittest.mock import patch, AsyncMock
 import pytest
 
+from src.compression import PrecompressedBody
+from src.dependencies import get_flight_controller
+
 from src.models.rocket import RocketModel
 from src.models.sub.tanks import MotorTank, TankFluids, TankKinds
 from src.models.motor import MotorModel
@@ -196,3 +201,63 @@ def stub_rocket_dump(stub_motor_dump, stub_nose_cone_dump, stub_fins_dump):
     )
     rocket_json = rocket.model_dump_json()
     return json.loads(rocket_json)
+
+
+@pytest.fixture
+def precompress():
+    def precompress(simulation):
+        payload = zlib.compress(simulation.model_dump_json().encode())
+        return PrecompressedBody('key', payload)
+
+    return precompress
+
+
+@pytest.fixture
+def stub_flight_dump(stub_environment_dump, stub_rocket_dump):
+    flight = {
+        'name': 'Test Flight',
+        'environment': stub_environment_dump,
+        'rocket': stub_rocket_dump,
+        'rail_length': 1,
+        'time_overshoot': True,
+        'terminate_on_apogee': True,
+        'equations_of_motion': 'standard',
+    }
+    return flight
+
+
+@pytest.fixture
+def mock_flight_controller():
+    with patch("src.dependencies.FlightController") as mock_class:
+        mock_controller = AsyncMock()
+        mock_controller.post_flight = AsyncMock()
+        mock_controller.get_flight_by_id = AsyncMock()
+        mock_controller.put_flight_by_id = AsyncMock()
+        mock_controller.delete_flight_by_id = AsyncMock()
+        mock_controller.post_flight_bulk = AsyncMock()
+        mock_controller.get_flight_by_ids = AsyncMock()
+        mock_controller.delete_flight_by_ids = AsyncMock()
+        mock_controller.get_flight_page = AsyncMock()
+        mock_controller.stream_flight_documents = AsyncMock()
+        mock_controller.get_flight_simulation = AsyncMock()
+        mock_controller.post_flight_simulation_job = AsyncMock()
+        mock_controller.post_flight_monte_carlo = AsyncMock()
+        mock_controller.post_flight_sweep = AsyncMock()
+        mock_controller.get_rocketpy_flight_rpy = AsyncMock()
+        mock_controller.import_flight_from_rpy = AsyncMock()
+        mock_controller.get_flight_notebook = AsyncMock()
+        mock_controller.get_flight_kml = AsyncMock()
+        mock_controller.get_flight_timeseries = AsyncMock()
+        mock_controller.update_environment_by_flight_id = AsyncMock()
+        mock_controller.update_rocket_by_flight_id = AsyncMock()
+        mock_controller.create_flight_from_references = AsyncMock()
+        mock_controller.update_flight_from_references = AsyncMock()
+        mock_controller.patch_flight_by_id = AsyncMock()
+
+        mock_class.return_value = mock_controller
+
+        get_flight_controller.cache_clear()
+
+        yield mock_controller
+
+        get_flight_controller.cache_clear()
@@ -0,0 +1,85 @@
+from unittest.mock import patch, AsyncMock
+import pytest
+from fastapi.testclient import TestClient
+from src.views.admin import CollectionIndexes, IndexReport, QueryPlan
+from src.models.admin import QueryExplainRequest
+
+from src.dependencies import get_admin_controller
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance():
+    with (
+        patch("src.dependencies.AdminController") as mock_class,
+        patch("src.dependencies.ADMIN_ENDPOINTS", True),
+    ):
+        mock_controller = AsyncMock()
+        mock_controller.get_index_report = AsyncMock()
+        mock_controller.explain_query = AsyncMock()
+
+        mock_class.return_value = mock_controller
+
+        get_admin_controller.cache_clear()
+
+        yield mock_controller
+
+        get_admin_controller.cache_clear()
+
+
+def test_read_indexes(mock_controller_instance):
+    mock_controller_instance.get_index_report = AsyncMock(
+        return_value=IndexReport(
+            collections=[
+                CollectionIndexes(
+                    collection='motor', indexes=[], missing=['motor_kind_1']
+                )
+            ]
+        )
+    )
+    response = client.get('/admin/indexes')
+    assert response.status_code == 200
+    assert response.json()['collections'] == [
+        {'collection': 'motor', 'indexes': [], 'missing': ['motor_kind_1']}
+    ]
+
+
+def test_read_indexes_disabled(mock_controller_instance):
+    with patch("src.dependencies.ADMIN_ENDPOINTS", False):
+        response = client.get('/admin/indexes')
+    assert response.status_code == 404
+    mock_controller_instance.get_index_report.assert_not_called()
+
+
+def test_explain_query(mock_controller_instance):
+    mock_controller_instance.explain_query = AsyncMock(
+        return_value=QueryPlan(
+            collection='motor',
+            stages=['FETCH', 'IXSCAN'],
+            indexes=['motor_kind_1'],
+            returned=1,
+            keys_examined=1,
+            documents_examined=1,
+            execution_time_ms=0,
+            winning_plan={},
+        )
+    )
+    response = client.post(
+        '/admin/explain/motor',
+        json={'filter': {'motor_kind': 'SOLID'}, 'sort': {'_id': -1}},
+    )
+    assert response.status_code == 200
+    assert response.json()['indexes'] == ['motor_kind_1']
+    mock_controller_instance.explain_query.assert_called_once_with(
+        'motor',
+        QueryExplainRequest(filter={'motor_kind': 'SOLID'}, sort={'_id': -1}),
+    )
+
+
+def test_explain_query_invalid_sort(mock_controller_instance):
+    response = client.post('/admin/explain/motor', json={'sort': {'_id': 2}})
+    assert response.status_code == 422
+    mock_controller_instance.explain_query.assert_not_called()
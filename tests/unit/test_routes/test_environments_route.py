@@ -9,11 +9,19 @@ from src.views.environment import (
     EnvironmentCreated,
     EnvironmentRetrieved,
     EnvironmentSimulation,
+    EnvironmentsRetrieved,
+)
+from src.views.interface import (
+    BulkCreated,
+    BulkDeleted,
+    BulkItemStatus,
+    DocumentPage,
 )
 
 from src.dependencies import get_environment_controller
 
 from src import app
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 client = TestClient(app)
 
@@ -33,6 +41,11 @@ def mock_controller_instance():
         mock_controller.get_environment_by_id = AsyncMock()
         mock_controller.put_environment_by_id = AsyncMock()
         mock_controller.delete_environment_by_id = AsyncMock()
+        mock_controller.post_environment_bulk = AsyncMock()
+        mock_controller.get_environment_by_ids = AsyncMock()
+        mock_controller.delete_environment_by_ids = AsyncMock()
+        mock_controller.get_environment_page = AsyncMock()
+        mock_controller.stream_environment_documents = AsyncMock()
         mock_controller.get_environment_simulation = AsyncMock()
         mock_controller.get_rocketpy_environment_binary = AsyncMock()
 
@@ -200,17 +213,23 @@ def test_delete_environment_server_error(mock_controller_instance):
 
 
 def test_get_environment_simulation_success(
-    stub_environment_simulation_dump, mock_controller_instance
+    precompress, stub_environment_simulation_dump, mock_controller_instance
 ):
     mock_reponse = AsyncMock(
-        return_value=EnvironmentSimulation(**stub_environment_simulation_dump)
+        return_value=precompress(
+            EnvironmentSimulation(**stub_environment_simulation_dump)
+        )
     )
     mock_controller_instance.get_environment_simulation = mock_reponse
     response = client.get('/environments/123/simulate')
     assert response.status_code == 200
     assert response.json() == stub_environment_simulation_dump
     mock_controller_instance.get_environment_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -221,7 +240,11 @@ def test_get_environment_simulation_not_found(mock_controller_instance):
     assert response.status_code == 404
     assert response.json() == {'detail': 'Not Found'}
     mock_controller_instance.get_environment_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -264,3 +287,106 @@ def test_read_rocketpy_environment_binary_server_error(
     response = client.get('/environments/123/rocketpy')
     assert response.status_code == 500
     assert response.json() == {'detail': 'Internal Server Error'}
+
+
+def test_create_environments_bulk(
+    stub_environment_dump, mock_controller_instance
+):
+    mock_controller_instance.post_environment_bulk = AsyncMock(
+        return_value=BulkCreated(
+            created=1,
+            failed=1,
+            items=[
+                BulkItemStatus(id='123', status=201),
+                BulkItemStatus(status=422, detail='invalid'),
+            ],
+        )
+    )
+    response = client.post(
+        '/environments/bulk',
+        json=[stub_environment_dump, stub_environment_dump],
+    )
+    assert response.status_code == 207
+    assert response.json()['items'][0]['id'] == '123'
+    mock_controller_instance.post_environment_bulk.assert_called_once_with(
+        [stub_environment_dump] * 2
+    )
+
+
+def test_read_environments_by_ids(
+    stub_environment_dump, mock_controller_instance
+):
+    mock_controller_instance.get_environment_by_ids = AsyncMock(
+        return_value=EnvironmentsRetrieved(
+            environments=[
+                EnvironmentView(environment_id='1', **stub_environment_dump)
+            ],
+            items=[
+                BulkItemStatus(id='1', status=200),
+                BulkItemStatus(
+                    id='2', status=404, detail='environment not found'
+                ),
+            ],
+        )
+    )
+    response = client.get('/environments/', params={'ids': '1, 2,1,'})
+    assert response.status_code == 200
+    assert response.json()['environments'][0]['environment_id'] == '1'
+    mock_controller_instance.get_environment_by_ids.assert_called_once_with(
+        ['1', '2']
+    )
+
+
+def test_list_environments(mock_controller_instance):
+    mock_controller_instance.get_environment_page = AsyncMock(
+        return_value=DocumentPage(
+            documents=[{'environment_id': '2'}], next_cursor='2'
+        )
+    )
+    response = client.get(
+        '/environments/', params={'after': '1', 'limit': 1, 'fields': 'name'}
+    )
+    assert response.status_code == 200
+    assert response.json()['next_cursor'] == '2'
+    mock_controller_instance.get_environment_page.assert_called_once_with(
+        '1', 1, ('name',)
+    )
+
+
+def test_list_environments_limit_out_of_range():
+    response = client.get('/environments/', params={'limit': 0})
+    assert response.status_code == 422
+
+
+def test_stream_environments(mock_controller_instance):
+    async def lines():
+        yield b'{"environment_id": "1"}\n'
+        yield b'{"environment_id": "2"}\n'
+
+    mock_controller_instance.stream_environment_documents = AsyncMock(
+        return_value=lines()
+    )
+    response = client.get('/environments/', params={'format': 'ndjson'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {'environment_id': '1'},
+        {'environment_id': '2'},
+    ]
+    mock_controller_instance.stream_environment_documents.assert_called_once_with(
+        None, None
+    )
+
+
+def test_delete_environments_bulk(mock_controller_instance):
+    mock_controller_instance.delete_environment_by_ids = AsyncMock(
+        return_value=BulkDeleted(
+            deleted=1, items=[BulkItemStatus(id='1', status=204)]
+        )
+    )
+    response = client.request('DELETE', '/environments/bulk', json=['1'])
+    assert response.status_code == 207
+    assert response.json()['deleted'] == 1
+    mock_controller_instance.delete_environment_by_ids.assert_called_once_with(
+        ['1']
+    )
@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock
+import pytest
+from fastapi.testclient import TestClient
+from src.views.flight import (
+    FlightView,
+    FlightsRetrieved,
+)
+from src.views.interface import (
+    BulkCreated,
+    BulkDeleted,
+    BulkItemStatus,
+)
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance(mock_flight_controller):
+    return mock_flight_controller
+
+
+def test_create_flights_bulk(stub_flight_dump, mock_controller_instance):
+    mock_controller_instance.post_flight_bulk = AsyncMock(
+        return_value=BulkCreated(
+            created=1,
+            failed=1,
+            items=[
+                BulkItemStatus(id='123', status=201),
+                BulkItemStatus(status=422, detail='invalid'),
+            ],
+        )
+    )
+    response = client.post(
+        '/flights/bulk', json=[stub_flight_dump, stub_flight_dump]
+    )
+    assert response.status_code == 207
+    assert response.json()['items'][0]['id'] == '123'
+    mock_controller_instance.post_flight_bulk.assert_called_once_with(
+        [stub_flight_dump] * 2
+    )
+
+
+def test_read_flights_by_ids(stub_flight_dump, mock_controller_instance):
+    mock_controller_instance.get_flight_by_ids = AsyncMock(
+        return_value=FlightsRetrieved(
+            flights=[FlightView(flight_id='1', **stub_flight_dump)],
+            items=[
+                BulkItemStatus(id='1', status=200),
+                BulkItemStatus(id='2', status=404, detail='flight not found'),
+            ],
+        )
+    )
+    response = client.get('/flights/', params={'ids': '1, 2,1,'})
+    assert response.status_code == 200
+    assert response.json()['flights'][0]['flight_id'] == '1'
+    mock_controller_instance.get_flight_by_ids.assert_called_once_with(
+        ['1', '2']
+    )
+
+
+def test_delete_flights_bulk(mock_controller_instance):
+    mock_controller_instance.delete_flight_by_ids = AsyncMock(
+        return_value=BulkDeleted(
+            deleted=1, items=[BulkItemStatus(id='1', status=204)]
+        )
+    )
+    response = client.request('DELETE', '/flights/bulk', json=['1'])
+    assert response.status_code == 207
+    assert response.json()['deleted'] == 1
+    mock_controller_instance.delete_flight_by_ids.assert_called_once_with(
+        ['1']
+    )
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock
+import json
+import pytest
+from fastapi.testclient import TestClient
+from src.views.interface import (
+    DocumentPage,
+)
+
+from src.dependencies import DEFAULT_PAGE_LIMIT
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance(mock_flight_controller):
+    return mock_flight_controller
+
+
+def test_list_flights(mock_controller_instance):
+    mock_controller_instance.get_flight_page = AsyncMock(
+        return_value=DocumentPage(
+            documents=[{'flight_id': '2'}], next_cursor='2'
+        )
+    )
+    response = client.get(
+        '/flights/', params={'after': '1', 'limit': 1, 'fields': 'name'}
+    )
+    assert response.status_code == 200
+    assert response.json()['next_cursor'] == '2'
+    mock_controller_instance.get_flight_page.assert_called_once_with(
+        '1', 1, ('name',), True
+    )
+
+
+def test_list_flights_without_resolving_references(mock_controller_instance):
+    mock_controller_instance.get_flight_page = AsyncMock(
+        return_value=DocumentPage(
+            documents=[{'flight_id': '1', 'rocket_id': '2'}]
+        )
+    )
+    response = client.get('/flights/', params={'resolve': 'false'})
+    assert response.status_code == 200
+    assert response.json()['documents'] == [
+        {'flight_id': '1', 'rocket_id': '2'}
+    ]
+    mock_controller_instance.get_flight_page.assert_called_once_with(
+        None, DEFAULT_PAGE_LIMIT, None, False
+    )
+
+
+def test_list_flights_limit_out_of_range():
+    response = client.get('/flights/', params={'limit': 0})
+    assert response.status_code == 422
+
+
+def test_stream_flights(mock_controller_instance):
+    async def lines():
+        yield b'{"flight_id": "1"}\n'
+        yield b'{"flight_id": "2"}\n'
+
+    mock_controller_instance.stream_flight_documents = AsyncMock(
+        return_value=lines()
+    )
+    response = client.get('/flights/', params={'format': 'ndjson'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {'flight_id': '1'},
+        {'flight_id': '2'},
+    ]
+    mock_controller_instance.stream_flight_documents.assert_called_once_with(
+        None, None, True
+    )
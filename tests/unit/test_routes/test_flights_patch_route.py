@@ -0,0 +1,63 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import HTTPException, status
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance(mock_flight_controller):
+    return mock_flight_controller
+
+
+def test_patch_flight(mock_controller_instance):
+    mock_controller_instance.patch_flight_by_id.return_value = 4
+    response = client.patch(
+        '/flights/123',
+        content=json.dumps({'rail_length': 6, 'rocket': {'tail': None}}),
+        headers={
+            'Content-Type': 'application/merge-patch+json',
+            'If-Match': '"3"',
+        },
+    )
+    assert response.status_code == 204
+    assert response.headers['etag'] == '"4"'
+    mock_controller_instance.patch_flight_by_id.assert_called_once_with(
+        '123', {'rail_length': 6, 'rocket': {'tail': None}}, version=3
+    )
+
+
+def test_patch_flight_without_if_match(mock_controller_instance):
+    mock_controller_instance.patch_flight_by_id.return_value = 1
+    response = client.patch('/flights/123', json={'rail_length': 6})
+    assert response.status_code == 204
+    mock_controller_instance.patch_flight_by_id.assert_called_once_with(
+        '123', {'rail_length': 6}, version=None
+    )
+
+
+def test_patch_flight_invalid_if_match(mock_controller_instance):
+    response = client.patch(
+        '/flights/123',
+        json={'rail_length': 6},
+        headers={'If-Match': 'abc'},
+    )
+    assert response.status_code == 422
+    mock_controller_instance.patch_flight_by_id.assert_not_called()
+
+
+def test_patch_flight_version_conflict(mock_controller_instance):
+    mock_controller_instance.patch_flight_by_id.side_effect = HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail='Flight was modified; its version is now 4',
+    )
+    response = client.patch(
+        '/flights/123', json={'rail_length': 6}, headers={'If-Match': '3'}
+    )
+    assert response.status_code == 412
+    assert response.json() == {
+        'detail': 'Flight was modified; its version is now 4'
+    }
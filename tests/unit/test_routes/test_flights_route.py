@@ -1,11 +1,14 @@
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock
 import copy
 import json
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import HTTPException, status
 from src.models.environment import EnvironmentModel
-from src.models.flight import FlightModel, FlightWithReferencesRequest
+from src.models.flight import (
+    FlightModel,
+    FlightWithReferencesRequest,
+)
 from src.models.rocket import RocketModel
 from src.views.motor import MotorView
 from src.views.rocket import RocketView
@@ -17,27 +20,15 @@ from src.views.flight import (
     FlightView,
 )
 
-from src.dependencies import get_flight_controller
+from src.views.job import JobCreated
+from src.services.timeseries import TimeseriesFormat
 
 from src import app
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 client = TestClient(app)
 
 
-@pytest.fixture
-def stub_flight_dump(stub_environment_dump, stub_rocket_dump):
-    flight = {
-        'name': 'Test Flight',
-        'environment': stub_environment_dump,
-        'rocket': stub_rocket_dump,
-        'rail_length': 1,
-        'time_overshoot': True,
-        'terminate_on_apogee': True,
-        'equations_of_motion': 'standard',
-    }
-    return flight
-
-
 @pytest.fixture
 def stub_flight_simulate_dump():
     flight_simulate = FlightSimulation()
@@ -46,30 +37,8 @@ def stub_flight_simulate_dump():
 
 
 @pytest.fixture(autouse=True)
-def mock_controller_instance():
-    with patch("src.dependencies.FlightController") as mock_class:
-        mock_controller = AsyncMock()
-        mock_controller.post_flight = AsyncMock()
-        mock_controller.get_flight_by_id = AsyncMock()
-        mock_controller.put_flight_by_id = AsyncMock()
-        mock_controller.delete_flight_by_id = AsyncMock()
-        mock_controller.get_flight_simulation = AsyncMock()
-        mock_controller.get_rocketpy_flight_rpy = AsyncMock()
-        mock_controller.import_flight_from_rpy = AsyncMock()
-        mock_controller.get_flight_notebook = AsyncMock()
-        mock_controller.get_flight_kml = AsyncMock()
-        mock_controller.update_environment_by_flight_id = AsyncMock()
-        mock_controller.update_rocket_by_flight_id = AsyncMock()
-        mock_controller.create_flight_from_references = AsyncMock()
-        mock_controller.update_flight_from_references = AsyncMock()
-
-        mock_class.return_value = mock_controller
-
-        get_flight_controller.cache_clear()
-
-        yield mock_controller
-
-        get_flight_controller.cache_clear()
+def mock_controller_instance(mock_flight_controller):
+    return mock_flight_controller
 
 
 @pytest.fixture
@@ -476,20 +445,135 @@ def test_delete_flight_server_error(mock_controller_instance):
 
 
 def test_get_flight_simulation(
-    stub_flight_simulate_dump, mock_controller_instance
+    precompress, stub_flight_simulate_dump, mock_controller_instance
 ):
     mock_response = AsyncMock(
-        return_value=FlightSimulation(**stub_flight_simulate_dump)
+        return_value=precompress(FlightSimulation(**stub_flight_simulate_dump))
     )
     mock_controller_instance.get_flight_simulation = mock_response
     response = client.get('/flights/123/simulate')
     assert response.status_code == 200
     assert response.json() == stub_flight_simulate_dump
     mock_controller_instance.get_flight_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
+    )
+
+
+def test_get_flight_simulation_with_resolution(
+    precompress, stub_flight_simulate_dump, mock_controller_instance
+):
+    mock_controller_instance.get_flight_simulation = AsyncMock(
+        return_value=precompress(FlightSimulation(**stub_flight_simulate_dump))
+    )
+    response = client.get('/flights/123/simulate?points=500&method=lttb')
+    assert response.status_code == 200
+    mock_controller_instance.get_flight_simulation.assert_called_once_with(
+        '123', 500, CurveDownsampling.LTTB, None, encoded=True
     )
 
 
+def test_get_flight_simulation_with_fields(
+    precompress, stub_flight_simulate_dump, mock_controller_instance
+):
+    mock_controller_instance.get_flight_simulation = AsyncMock(
+        return_value=precompress(FlightSimulation(**stub_flight_simulate_dump))
+    )
+    response = client.get(
+        '/flights/123/simulate?fields=x_impact, apogee,,apogee'
+    )
+    assert response.status_code == 200
+    mock_controller_instance.get_flight_simulation.assert_called_once_with(
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        ('apogee', 'x_impact'),
+        encoded=True,
+    )
+
+
+def test_get_flight_simulation_precompressed(
+    precompress, stub_flight_simulate_dump, mock_controller_instance
+):
+    body = precompress(FlightSimulation(**stub_flight_simulate_dump))
+    mock_controller_instance.get_flight_simulation = AsyncMock(
+        return_value=body
+    )
+    response = client.get(
+        '/flights/123/simulate', headers={'Accept-Encoding': 'gzip'}
+    )
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'] == f'"{body.digest}-gzip"'
+    assert response.json() == stub_flight_simulate_dump
+
+    response = client.get(
+        '/flights/123/simulate',
+        headers={
+            'Accept-Encoding': 'identity',
+            'If-None-Match': response.headers['ETag'],
+        },
+    )
+    assert response.status_code == 304
+    assert response.headers['ETag'] == f'"{body.digest}"'
+    assert response.content == b''
+
+
+def test_get_flight_simulation_stream(mock_controller_instance):
+    async def chunks():
+        yield b'{"message":'
+        yield b'"Flight successfully simulated"}'
+
+    mock_controller_instance.stream_flight_simulation = AsyncMock(
+        return_value=chunks()
+    )
+    response = client.get('/flights/123/simulate?stream=true&points=50')
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert 'ETag' not in response.headers
+    assert response.json() == {'message': 'Flight successfully simulated'}
+    mock_controller_instance.stream_flight_simulation.assert_called_once_with(
+        '123', 50, CurveDownsampling.UNIFORM, None
+    )
+
+
+def test_create_flight_simulation_job(mock_controller_instance):
+    mock_controller_instance.post_flight_simulation_job = AsyncMock(
+        return_value=JobCreated(job_id='456')
+    )
+    response = client.post('/flights/123/simulate/jobs?fields=apogee')
+    assert response.status_code == 202
+    assert response.json() == {
+        'message': 'Simulation job successfully queued',
+        'job_id': '456',
+    }
+    mock_controller_instance.post_flight_simulation_job.assert_called_once_with(
+        '123', DEFAULT_CURVE_POINTS, CurveDownsampling.UNIFORM, ('apogee',)
+    )
+
+
+def test_create_flight_simulation_job_not_found(mock_controller_instance):
+    mock_controller_instance.post_flight_simulation_job.side_effect = (
+        HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    )
+    response = client.post('/flights/123/simulate/jobs')
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    'query', ['points=1', 'points=100000', 'method=spline']
+)
+def test_get_flight_simulation_invalid_resolution(
+    query, mock_controller_instance
+):
+    response = client.get(f'/flights/123/simulate?{query}')
+    assert response.status_code == 422
+    mock_controller_instance.get_flight_simulation.assert_not_called()
+
+
 def test_get_flight_simulation_not_found(mock_controller_instance):
     mock_controller_instance.get_flight_simulation.side_effect = HTTPException(
         status_code=status.HTTP_404_NOT_FOUND
@@ -551,7 +635,31 @@ def test_read_flight_kml(mock_controller_instance):
         == 'application/vnd.google-earth.kml+xml'
     )
     assert 'flight_123.kml' in response.headers['content-disposition']
-    mock_controller_instance.get_flight_kml.assert_called_once_with('123')
+    mock_controller_instance.get_flight_kml.assert_called_once_with(
+        '123', None, False
+    )
+
+
+def test_read_flight_kmz(mock_controller_instance):
+    mock_controller_instance.get_flight_kml = AsyncMock(return_value=b'PK')
+    response = client.get(
+        '/flights/123/kml', params={'max_points': 200, 'kmz': 'true'}
+    )
+    assert response.status_code == 200
+    assert response.content == b'PK'
+    assert (
+        response.headers['content-type'] == 'application/vnd.google-earth.kmz'
+    )
+    assert 'flight_123.kmz' in response.headers['content-disposition']
+    mock_controller_instance.get_flight_kml.assert_called_once_with(
+        '123', 200, True
+    )
+
+
+def test_read_flight_kml_invalid_max_points(mock_controller_instance):
+    response = client.get('/flights/123/kml', params={'max_points': 2})
+    assert response.status_code == 422
+    mock_controller_instance.get_flight_kml.assert_not_called()
 
 
 def test_read_flight_kml_not_found(mock_controller_instance):
@@ -572,6 +680,43 @@ def test_read_flight_kml_server_error(mock_controller_instance):
     assert response.json() == {'detail': 'Internal Server Error'}
 
 
+def test_read_flight_timeseries(mock_controller_instance):
+    mock_controller_instance.get_flight_timeseries = AsyncMock(
+        return_value=b'PK'
+    )
+    response = client.get(
+        '/flights/123/timeseries',
+        params={'format': 'npz', 'columns': 'altitude, speed,altitude'},
+    )
+    assert response.status_code == 200
+    assert response.content == b'PK'
+    assert response.headers['content-type'] == 'application/x-npz'
+    assert (
+        'flight_123_timeseries.npz' in response.headers['content-disposition']
+    )
+    mock_controller_instance.get_flight_timeseries.assert_called_once_with(
+        '123', TimeseriesFormat.NPZ, ('altitude', 'speed')
+    )
+
+
+def test_read_flight_timeseries_defaults(mock_controller_instance):
+    mock_controller_instance.get_flight_timeseries = AsyncMock(
+        return_value=b'time\n0.0\n'
+    )
+    response = client.get('/flights/123/timeseries')
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/csv')
+    mock_controller_instance.get_flight_timeseries.assert_called_once_with(
+        '123', TimeseriesFormat.CSV, None
+    )
+
+
+def test_read_flight_timeseries_invalid_format(mock_controller_instance):
+    response = client.get('/flights/123/timeseries', params={'format': 'xls'})
+    assert response.status_code == 422
+    mock_controller_instance.get_flight_timeseries.assert_not_called()
+
+
 # --- Issue #56: Import flight from .rpy ---
 
 
@@ -0,0 +1,213 @@
+from unittest.mock import patch, AsyncMock
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import HTTPException, status
+from src.models.flight import (
+    FlightMonteCarloRequest,
+    FlightSweepParameter,
+    FlightSweepRequest,
+)
+from src.views.flight import (
+    FlightImpactEllipse,
+    FlightMonteCarloSimulation,
+    FlightMonteCarloStatistic,
+    FlightSweepSimulation,
+)
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance(mock_flight_controller):
+    return mock_flight_controller
+
+
+@pytest.fixture
+def stub_monte_carlo_payload():
+    return {
+        'samples': 10,
+        'seed': 42,
+        'dispersions': [
+            {'path': 'rocket.mass', 'std': 0.5},
+            {
+                'path': 'inclination',
+                'distribution': 'uniform',
+                'low': 84,
+                'high': 86,
+            },
+        ],
+    }
+
+
+def test_create_flight_monte_carlo(
+    stub_monte_carlo_payload, mock_controller_instance
+):
+    statistic = FlightMonteCarloStatistic(
+        mean=1.0, std=0.0, min=1.0, max=1.0, percentiles=[1.0]
+    )
+    ellipse = FlightImpactEllipse(
+        sigma=1,
+        x_center=0,
+        y_center=0,
+        semi_major_axis=1,
+        semi_minor_axis=1,
+        angle=0,
+    )
+    mock_controller_instance.post_flight_monte_carlo = AsyncMock(
+        return_value=FlightMonteCarloSimulation(
+            samples=10,
+            failed_samples=0,
+            seed=42,
+            percentiles=[50],
+            apogee=statistic,
+            apogee_time=statistic,
+            max_mach_number=statistic,
+            out_of_rail_velocity=statistic,
+            impact_velocity=statistic,
+            x_impact=statistic,
+            y_impact=statistic,
+            impact_ellipses=[ellipse],
+        )
+    )
+    response = client.post(
+        '/flights/123/montecarlo', json=stub_monte_carlo_payload
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body['message'] == 'Flight Monte Carlo successfully simulated'
+    assert body['apogee']['percentiles'] == [1.0]
+    assert body['impact_ellipses'][0]['sigma'] == 1
+    mock_controller_instance.post_flight_monte_carlo.assert_called_once_with(
+        '123', FlightMonteCarloRequest(**stub_monte_carlo_payload)
+    )
+
+
+@pytest.mark.parametrize(
+    'dispersion',
+    [
+        {'path': 'rocket.mass'},
+        {'path': 'rocket.mass', 'std': -1},
+        {'path': 'inclination', 'distribution': 'uniform', 'low': 86},
+        {
+            'path': 'inclination',
+            'distribution': 'triangular',
+            'low': 86,
+            'high': 84,
+        },
+    ],
+)
+def test_create_flight_monte_carlo_invalid_dispersion(dispersion):
+    response = client.post(
+        '/flights/123/montecarlo', json={'dispersions': [dispersion]}
+    )
+    assert response.status_code == 422
+
+
+def test_create_flight_monte_carlo_duplicate_paths(
+    stub_monte_carlo_payload,
+):
+    stub_monte_carlo_payload['dispersions'].append(
+        {'path': 'rocket.mass', 'std': 1}
+    )
+    response = client.post(
+        '/flights/123/montecarlo', json=stub_monte_carlo_payload
+    )
+    assert response.status_code == 422
+
+
+def test_create_flight_monte_carlo_not_found(
+    stub_monte_carlo_payload, mock_controller_instance
+):
+    mock_controller_instance.post_flight_monte_carlo.side_effect = (
+        HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    )
+    response = client.post(
+        '/flights/123/montecarlo', json=stub_monte_carlo_payload
+    )
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def stub_sweep_payload():
+    return {
+        'parameters': [
+            {'path': '/rocket/fins/0/span', 'values': [0.1, 0.2]},
+            {'path': 'inclination', 'start': 80, 'stop': 90, 'num': 3},
+        ],
+        'outputs': ['apogee'],
+    }
+
+
+def test_create_flight_sweep(stub_sweep_payload, mock_controller_instance):
+    mock_controller_instance.post_flight_sweep = AsyncMock(
+        return_value=FlightSweepSimulation(
+            points=2,
+            failed_points=1,
+            parameters=['inclination'],
+            outputs=['apogee'],
+            columns={'inclination': [80.0, 90.0], 'apogee': [1.0, None]},
+        )
+    )
+    response = client.post('/flights/123/sweep', json=stub_sweep_payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert body['message'] == 'Flight sweep successfully simulated'
+    assert body['columns']['apogee'] == [1.0, None]
+    mock_controller_instance.post_flight_sweep.assert_called_once_with(
+        '123', FlightSweepRequest(**stub_sweep_payload)
+    )
+
+
+def test_flight_sweep_request_points(stub_sweep_payload):
+    request = FlightSweepRequest(**stub_sweep_payload)
+    assert request.parameters[1].get_values() == [80.0, 85.0, 90.0]
+    assert request.get_points() == 6
+
+
+def test_flight_sweep_request_points_without_values():
+    request = FlightSweepRequest(
+        parameters=[
+            {'path': path, 'start': 0, 'stop': 1, 'num': 1000}
+            for path in ('inclination', 'heading', 'rail_length')
+        ]
+    )
+    with patch.object(
+        FlightSweepParameter, 'get_values', side_effect=AssertionError
+    ):
+        assert request.get_points() == 10**9
+
+
+@pytest.mark.parametrize(
+    'parameter',
+    [
+        {'path': 'inclination'},
+        {'path': 'inclination', 'values': []},
+        {'path': 'inclination', 'start': 80, 'stop': 90},
+        {'path': 'inclination', 'values': [80], 'start': 80},
+        {'path': 'inclination', 'start': 80, 'stop': 90, 'num': 0},
+        {'path': 'inclination', 'start': 80, 'stop': 90, 'num': 10**9},
+    ],
+)
+def test_create_flight_sweep_invalid_parameter(parameter):
+    response = client.post(
+        '/flights/123/sweep', json={'parameters': [parameter]}
+    )
+    assert response.status_code == 422
+
+
+def test_create_flight_sweep_unknown_output(stub_sweep_payload):
+    stub_sweep_payload['outputs'] = ['not_an_output']
+    response = client.post('/flights/123/sweep', json=stub_sweep_payload)
+    assert response.status_code == 422
+
+
+def test_create_flight_sweep_not_found(
+    stub_sweep_payload, mock_controller_instance
+):
+    mock_controller_instance.post_flight_sweep.side_effect = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND
+    )
+    response = client.post('/flights/123/sweep', json=stub_sweep_payload)
+    assert response.status_code == 404
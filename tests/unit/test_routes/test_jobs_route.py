@@ -0,0 +1,66 @@
+from unittest.mock import patch, AsyncMock
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import HTTPException, status
+from src.views.flight import FlightSimulation
+from src.views.job import JobRetrieved, JobView
+
+from src.dependencies import get_job_controller
+
+from src import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def mock_controller_instance():
+    with patch("src.dependencies.JobController") as mock_class:
+        mock_controller = AsyncMock()
+        mock_controller.get_job_by_id = AsyncMock()
+
+        mock_class.return_value = mock_controller
+
+        get_job_controller.cache_clear()
+
+        yield mock_controller
+
+        get_job_controller.cache_clear()
+
+
+def test_read_job_pending(mock_controller_instance):
+    job = JobView(job_id='123', kind='flight', target_id='456')
+    mock_controller_instance.get_job_by_id = AsyncMock(
+        return_value=JobRetrieved(job=job)
+    )
+    response = client.get('/jobs/123')
+    assert response.status_code == 200
+    body = response.json()
+    assert body['message'] == 'Simulation job successfully retrieved'
+    assert body['job']['job_id'] == '123'
+    assert body['job']['status'] == 'PENDING'
+    mock_controller_instance.get_job_by_id.assert_called_once_with('123')
+
+
+def test_read_job_succeeded(mock_controller_instance):
+    job = JobView(
+        job_id='123',
+        kind='flight',
+        target_id='456',
+        status='SUCCEEDED',
+        result=FlightSimulation(apogee=1000.0),
+    )
+    mock_controller_instance.get_job_by_id = AsyncMock(
+        return_value=JobRetrieved(job=job)
+    )
+    response = client.get('/jobs/123')
+    assert response.status_code == 200
+    assert response.json()['job']['result']['apogee'] == 1000.0
+
+
+def test_read_job_not_found(mock_controller_instance):
+    mock_controller_instance.get_job_by_id.side_effect = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND
+    )
+    response = client.get('/jobs/123')
+    assert response.status_code == 404
+    assert response.json() == {'detail': 'Not Found'}
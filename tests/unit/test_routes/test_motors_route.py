@@ -9,11 +9,19 @@ from src.views.motor import (
     MotorRetrieved,
     MotorSimulation,
     MotorView,
+    MotorsRetrieved,
+)
+from src.views.interface import (
+    BulkCreated,
+    BulkDeleted,
+    BulkItemStatus,
+    DocumentPage,
 )
 
 from src.dependencies import get_motor_controller
 
 from src import app
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 client = TestClient(app)
 
@@ -33,6 +41,11 @@ def mock_controller_instance():
         mock_controller.get_motor_by_id = AsyncMock()
         mock_controller.put_motor_by_id = AsyncMock()
         mock_controller.delete_motor_by_id = AsyncMock()
+        mock_controller.post_motor_bulk = AsyncMock()
+        mock_controller.get_motor_by_ids = AsyncMock()
+        mock_controller.delete_motor_by_ids = AsyncMock()
+        mock_controller.get_motor_page = AsyncMock()
+        mock_controller.stream_motor_documents = AsyncMock()
         mock_controller.get_motor_simulation = AsyncMock()
         mock_controller.get_rocketpy_motor_binary = AsyncMock()
 
@@ -499,17 +512,21 @@ def test_delete_motor_server_error(mock_controller_instance):
 
 
 def test_get_motor_simulation(
-    mock_controller_instance, stub_motor_dump_simulation
+    precompress, mock_controller_instance, stub_motor_dump_simulation
 ):
     mock_response = AsyncMock(
-        return_value=MotorSimulation(**stub_motor_dump_simulation)
+        return_value=precompress(MotorSimulation(**stub_motor_dump_simulation))
     )
     mock_controller_instance.get_motor_simulation = mock_response
     response = client.get('/motors/123/simulate')
     assert response.status_code == 200
     assert response.json() == stub_motor_dump_simulation
     mock_controller_instance.get_motor_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -520,7 +537,11 @@ def test_get_motor_simulation_not_found(mock_controller_instance):
     assert response.status_code == 404
     assert response.json() == {'detail': 'Not Found'}
     mock_controller_instance.get_motor_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -531,7 +552,11 @@ def test_get_motor_simulation_server_error(mock_controller_instance):
     assert response.status_code == 500
     assert response.json() == {'detail': 'Internal Server Error'}
     mock_controller_instance.get_motor_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -567,3 +592,125 @@ def test_read_rocketpy_motor_binary_server_error(mock_controller_instance):
     mock_controller_instance.get_rocketpy_motor_binary.assert_called_once_with(
         '123'
     )
+
+
+def test_create_motors_bulk(stub_motor_dump, mock_controller_instance):
+    mock_controller_instance.post_motor_bulk = AsyncMock(
+        return_value=BulkCreated(
+            created=1,
+            failed=1,
+            items=[
+                BulkItemStatus(id='123', status=201),
+                BulkItemStatus(status=422, detail='invalid'),
+            ],
+        )
+    )
+    response = client.post(
+        '/motors/bulk',
+        json=[stub_motor_dump, stub_motor_dump],
+    )
+    assert response.status_code == 207
+    assert response.json()['items'][0]['id'] == '123'
+    mock_controller_instance.post_motor_bulk.assert_called_once_with(
+        [stub_motor_dump] * 2
+    )
+
+
+def test_create_motors_bulk_reports_invalid_items(
+    stub_motor_dump, mock_controller_instance
+):
+    mock_controller_instance.post_motor_bulk = AsyncMock(
+        return_value=BulkCreated(
+            created=1,
+            failed=1,
+            items=[
+                BulkItemStatus(id='123', status=201),
+                BulkItemStatus(status=422, detail='invalid'),
+            ],
+        )
+    )
+    invalid = {**stub_motor_dump, 'burn_time': 'never'}
+    response = client.post('/motors/bulk', json=[stub_motor_dump, invalid])
+    assert response.status_code == 207
+    mock_controller_instance.post_motor_bulk.assert_called_once_with(
+        [stub_motor_dump, invalid]
+    )
+
+
+def test_read_motors_by_ids(
+    stub_motor_dump, mock_controller_instance
+):
+    mock_controller_instance.get_motor_by_ids = AsyncMock(
+        return_value=MotorsRetrieved(
+            motors=[
+                MotorView(motor_id='1', **stub_motor_dump)
+            ],
+            items=[
+                BulkItemStatus(id='1', status=200),
+                BulkItemStatus(
+                    id='2', status=404, detail='motor not found'
+                ),
+            ],
+        )
+    )
+    response = client.get('/motors/', params={'ids': '1, 2,1,'})
+    assert response.status_code == 200
+    assert response.json()['motors'][0]['motor_id'] == '1'
+    mock_controller_instance.get_motor_by_ids.assert_called_once_with(
+        ['1', '2']
+    )
+
+
+def test_list_motors(mock_controller_instance):
+    mock_controller_instance.get_motor_page = AsyncMock(
+        return_value=DocumentPage(
+            documents=[{'motor_id': '2'}], next_cursor='2'
+        )
+    )
+    response = client.get(
+        '/motors/', params={'after': '1', 'limit': 1, 'fields': 'name'}
+    )
+    assert response.status_code == 200
+    assert response.json()['next_cursor'] == '2'
+    mock_controller_instance.get_motor_page.assert_called_once_with(
+        '1', 1, ('name',)
+    )
+
+
+def test_list_motors_limit_out_of_range():
+    response = client.get('/motors/', params={'limit': 0})
+    assert response.status_code == 422
+
+
+def test_stream_motors(mock_controller_instance):
+    async def lines():
+        yield b'{"motor_id": "1"}\n'
+        yield b'{"motor_id": "2"}\n'
+
+    mock_controller_instance.stream_motor_documents = AsyncMock(
+        return_value=lines()
+    )
+    response = client.get('/motors/', params={'format': 'ndjson'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {'motor_id': '1'},
+        {'motor_id': '2'},
+    ]
+    mock_controller_instance.stream_motor_documents.assert_called_once_with(
+        None, None
+    )
+
+
+def test_delete_motors_bulk(mock_controller_instance):
+    mock_controller_instance.delete_motor_by_ids = AsyncMock(
+        return_value=BulkDeleted(
+            deleted=1, items=[BulkItemStatus(id='1', status=204)]
+        )
+    )
+    response = client.request('DELETE', '/motors/bulk', json=['1'])
+    assert response.status_code == 207
+    assert response.json()['deleted'] == 1
+    mock_controller_instance.delete_motor_by_ids.assert_called_once_with(
+        ['1']
+    )
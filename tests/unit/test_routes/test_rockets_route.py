@@ -18,12 +18,20 @@ from src.views.rocket import (
     RocketRetrieved,
     RocketSimulation,
     RocketView,
+    RocketsRetrieved,
+)
+from src.views.interface import (
+    BulkCreated,
+    BulkDeleted,
+    BulkItemStatus,
+    DocumentPage,
 )
 
 
 from src.dependencies import get_rocket_controller
 
 from src import app
+from src.utils import DEFAULT_CURVE_POINTS, CurveDownsampling
 
 client = TestClient(app)
 
@@ -82,6 +90,11 @@ def mock_controller_instance():
         mock_controller.get_rocket_by_id = AsyncMock()
         mock_controller.put_rocket_by_id = AsyncMock()
         mock_controller.delete_rocket_by_id = AsyncMock()
+        mock_controller.post_rocket_bulk = AsyncMock()
+        mock_controller.get_rocket_by_ids = AsyncMock()
+        mock_controller.delete_rocket_by_ids = AsyncMock()
+        mock_controller.get_rocket_page = AsyncMock()
+        mock_controller.stream_rocket_documents = AsyncMock()
         mock_controller.get_rocket_simulation = AsyncMock()
         mock_controller.get_rocketpy_rocket_binary = AsyncMock()
         mock_controller.create_rocket_from_motor_reference = AsyncMock()
@@ -600,17 +613,23 @@ def test_delete_rocket_server_error(mock_controller_instance):
 
 
 def test_get_rocket_simulation(
-    stub_rocket_simulation_dump, mock_controller_instance
+    precompress, stub_rocket_simulation_dump, mock_controller_instance
 ):
     mock_response = AsyncMock(
-        return_value=RocketSimulation(**stub_rocket_simulation_dump)
+        return_value=precompress(
+            RocketSimulation(**stub_rocket_simulation_dump)
+        )
     )
     mock_controller_instance.get_rocket_simulation = mock_response
     response = client.get('/rockets/123/simulate')
     assert response.status_code == 200
     assert response.json() == stub_rocket_simulation_dump
     mock_controller_instance.get_rocket_simulation.assert_called_once_with(
-        '123'
+        '123',
+        DEFAULT_CURVE_POINTS,
+        CurveDownsampling.UNIFORM,
+        None,
+        encoded=True,
     )
 
 
@@ -660,3 +679,97 @@ def test_read_rocketpy_rocket_binary_server_error(mock_controller_instance):
     response = client.get('/rockets/123/rocketpy')
     assert response.status_code == 500
     assert response.json() == {'detail': 'Internal Server Error'}
+
+
+def test_create_rockets_bulk(stub_rocket_dump, mock_controller_instance):
+    mock_controller_instance.post_rocket_bulk = AsyncMock(
+        return_value=BulkCreated(
+            created=1,
+            failed=1,
+            items=[
+                BulkItemStatus(id='123', status=201),
+                BulkItemStatus(status=422, detail='invalid'),
+            ],
+        )
+    )
+    response = client.post(
+        '/rockets/bulk', json=[stub_rocket_dump, stub_rocket_dump]
+    )
+    assert response.status_code == 207
+    assert response.json()['items'][0]['id'] == '123'
+    mock_controller_instance.post_rocket_bulk.assert_called_once_with(
+        [stub_rocket_dump] * 2
+    )
+
+
+def test_read_rockets_by_ids(stub_rocket_dump, mock_controller_instance):
+    mock_controller_instance.get_rocket_by_ids = AsyncMock(
+        return_value=RocketsRetrieved(
+            rockets=[RocketView(rocket_id='1', **stub_rocket_dump)],
+            items=[
+                BulkItemStatus(id='1', status=200),
+                BulkItemStatus(id='2', status=404, detail='rocket not found'),
+            ],
+        )
+    )
+    response = client.get('/rockets/', params={'ids': '1, 2,1,'})
+    assert response.status_code == 200
+    assert response.json()['rockets'][0]['rocket_id'] == '1'
+    mock_controller_instance.get_rocket_by_ids.assert_called_once_with(
+        ['1', '2']
+    )
+
+
+def test_list_rockets(mock_controller_instance):
+    mock_controller_instance.get_rocket_page = AsyncMock(
+        return_value=DocumentPage(
+            documents=[{'rocket_id': '2'}], next_cursor='2'
+        )
+    )
+    response = client.get(
+        '/rockets/', params={'after': '1', 'limit': 1, 'fields': 'name'}
+    )
+    assert response.status_code == 200
+    assert response.json()['next_cursor'] == '2'
+    mock_controller_instance.get_rocket_page.assert_called_once_with(
+        '1', 1, ('name',)
+    )
+
+
+def test_list_rockets_limit_out_of_range():
+    response = client.get('/rockets/', params={'limit': 0})
+    assert response.status_code == 422
+
+
+def test_stream_rockets(mock_controller_instance):
+    async def lines():
+        yield b'{"rocket_id": "1"}\n'
+        yield b'{"rocket_id": "2"}\n'
+
+    mock_controller_instance.stream_rocket_documents = AsyncMock(
+        return_value=lines()
+    )
+    response = client.get('/rockets/', params={'format': 'ndjson'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {'rocket_id': '1'},
+        {'rocket_id': '2'},
+    ]
+    mock_controller_instance.stream_rocket_documents.assert_called_once_with(
+        None, None
+    )
+
+
+def test_delete_rockets_bulk(mock_controller_instance):
+    mock_controller_instance.delete_rocket_by_ids = AsyncMock(
+        return_value=BulkDeleted(
+            deleted=1, items=[BulkItemStatus(id='1', status=204)]
+        )
+    )
+    response = client.request('DELETE', '/rockets/bulk', json=['1'])
+    assert response.status_code == 207
+    assert response.json()['deleted'] == 1
+    mock_controller_instance.delete_rocket_by_ids.assert_called_once_with(
+        ['1']
+    )
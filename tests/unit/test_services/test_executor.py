@@ -0,0 +1,135 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.services.executor import SimulationExecutor
+
+
+class _Service:
+    def __init__(self, value):
+        self.value = value
+
+    def echo(self, suffix=''):
+        return f"{self.value}{suffix}"
+
+    def slow(self, seconds):
+        time.sleep(seconds)
+        return self.value
+
+    def reject(self):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='bad model',
+        )
+
+
+@pytest.fixture
+def stub_executor():
+    executor = SimulationExecutor(max_workers=1, queue_depth=0, timeout=1)
+    thread_pool = ThreadPoolExecutor(max_workers=1)
+    with patch.object(executor, '_get_pool', return_value=thread_pool):
+        yield executor
+    thread_pool.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_run_returns_service_result(stub_executor):
+    result = await stub_executor.run(_Service, 'foo', 'echo', suffix='bar')
+    assert result == 'foobar'
+
+
+@pytest.mark.asyncio
+async def test_run_reraises_worker_http_exception(stub_executor):
+    with pytest.raises(HTTPException) as exc:
+        await stub_executor.run(_Service, 'foo', 'reject')
+    assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert exc.value.detail == 'bad model'
+
+
+@pytest.mark.asyncio
+async def test_run_times_out(stub_executor):
+    stub_executor.timeout = 0.05
+    with pytest.raises(HTTPException) as exc:
+        await stub_executor.run(_Service, 'foo', 'slow', 0.3)
+    assert exc.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_when_queue_is_full(stub_executor):
+    running = asyncio.create_task(
+        stub_executor.run(_Service, 'foo', 'slow', 0.2)
+    )
+    await asyncio.sleep(0)
+    with pytest.raises(HTTPException) as exc:
+        await stub_executor.run(_Service, 'foo', 'echo')
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert await running == 'foo'
+    assert await stub_executor.run(_Service, 'foo', 'echo') == 'foo'
+
+
+@pytest.mark.asyncio
+async def test_run_on_process_pool():
+    executor = SimulationExecutor(max_workers=1, queue_depth=0, timeout=60)
+    try:
+        assert await executor.run(str, 'rocketpy', 'upper') == 'ROCKETPY'
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_slot_of_timed_out_job_until_it_stops():
+    executor = SimulationExecutor(max_workers=1, queue_depth=0, timeout=1)
+    thread_pools = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+    with patch.object(executor, '_get_pool', side_effect=thread_pools):
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(_Service, 'foo', 'slow', 0.3, timeout=0.05)
+        assert exc.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(_Service, 'foo', 'echo')
+        assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        thread_pools[0].shutdown(wait=True)
+        assert await executor.run(_Service, 'foo', 'echo') == 'foo'
+    thread_pools[1].shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_run_answers_503_when_pool_breaks():
+    executor = SimulationExecutor(max_workers=1, queue_depth=0, timeout=1)
+    broken = Future()
+    broken.set_exception(BrokenProcessPool('worker died'))
+    pool = MagicMock()
+    pool.submit.return_value = broken
+    with patch.object(executor, '_get_pool', return_value=pool):
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(_Service, 'foo', 'echo')
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert exc.value.detail == 'Simulation workers restarted, please try again'
+    pool.shutdown.assert_called_once_with(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_run_terminates_worker_of_timed_out_job():
+    executor = SimulationExecutor(max_workers=1, queue_depth=1, timeout=60)
+    try:
+        assert await executor.run(str, 'rocketpy', 'upper') == 'ROCKETPY'
+        pool = executor._get_pool()
+        workers = list(pool._processes.values())
+        queued = asyncio.create_task(executor.run(str, 'rocketpy', 'upper'))
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(time.sleep, 30, 'real', timeout=0.5)
+        assert exc.value.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        with pytest.raises(HTTPException) as exc:
+            await queued
+        assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+        assert executor._get_pool() is not pool
+        assert await executor.run(str, 'rocketpy', 'upper') == 'ROCKETPY'
+    finally:
+        executor.shutdown()
@@ -0,0 +1,61 @@
+import io
+import re
+import zipfile
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from rocketpy import Function
+
+from src.services.flight import FlightService
+
+TIME = np.linspace(0, 100, 1001)
+# Fast ascent to apogee at t=10, then a slow descent.
+ALTITUDE = 1400 + np.where(
+    TIME < 10, 3000 * np.sin(np.pi * TIME / 20), 3000 * (1 - (TIME - 10) / 90)
+)
+
+
+@pytest.fixture
+def stub_flight_service():
+    flight = Mock(
+        time=TIME,
+        z=Function(np.column_stack([TIME, ALTITUDE])),
+        latitude=Function(lambda t: 32.99 + t * 1e-5),
+        longitude=Function(lambda t: -106.97 + t * 1e-5),
+    )
+    return FlightService(flight=flight)
+
+
+def _coordinates(kml: bytes) -> np.ndarray:
+    text = re.search(rb'<coordinates>(.*?)</coordinates>', kml, re.S)[1]
+    return np.array(
+        [list(map(float, point.split(b','))) for point in text.split()]
+    )
+
+
+def test_get_flight_kml_exports_every_step(stub_flight_service):
+    kml = stub_flight_service.get_flight_kml()
+    assert kml.startswith(b'<?xml')
+    assert b'<altitudeMode>absolute</altitudeMode>' in kml
+    coordinates = _coordinates(kml)
+    assert len(coordinates) == len(TIME)
+    np.testing.assert_allclose(coordinates[:, 2], ALTITUDE)
+
+
+@pytest.mark.parametrize('max_points', [3, 5, 10, 20, 51])
+def test_get_flight_kml_keeps_apogee_when_decimated(
+    stub_flight_service, max_points
+):
+    coordinates = _coordinates(stub_flight_service.get_flight_kml(max_points))
+    assert len(coordinates) == max_points
+    assert np.all(np.diff(coordinates[:, 0]) > 0)
+    assert coordinates[:, 2].max() == ALTITUDE.max()
+    np.testing.assert_allclose(coordinates[[0, -1], 2], ALTITUDE[[0, -1]])
+
+
+def test_get_flight_kmz(stub_flight_service):
+    kmz = stub_flight_service.get_flight_kml(51, kmz=True)
+    with zipfile.ZipFile(io.BytesIO(kmz)) as archive:
+        assert archive.namelist() == ['doc.kml']
+        assert len(_coordinates(archive.read('doc.kml'))) == 51
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from src.models.environment import (
+    WEATHER_CYCLE_HOURS,
+    EnvironmentModel,
+    weather_cycle,
+)
+from src.services.objects import (
+    cached_object,
+    estimate_size,
+    get_object_cache,
+)
+
+LAUNCH_DATE = datetime(2025, 6, 1, 12, tzinfo=timezone.utc)
+
+
+def _environment(latitude=1.0):
+    return EnvironmentModel(latitude=latitude, longitude=2, date=LAUNCH_DATE)
+
+
+@pytest.fixture(autouse=True)
+def empty_object_cache():
+    get_object_cache().clear()
+    yield
+    get_object_cache().clear()
+
+
+def test_estimate_size_counts_shared_arrays_once():
+    array = np.zeros(10_000)
+    single = estimate_size({'a': array})
+    shared = estimate_size({'a': array, 'b': array, 'c': [array]})
+    assert single >= array.nbytes
+    assert shared - single < array.nbytes
+
+
+def test_estimate_size_follows_instance_attributes():
+    holder = Mock(spec=[])
+    holder.source = np.zeros(10_000)
+    assert estimate_size(holder) >= holder.source.nbytes
+
+
+def test_cached_object_builds_once_per_design():
+    build = Mock(side_effect=object)
+    first = cached_object('environment', _environment(), build)
+    second = cached_object('environment', _environment(), build)
+    other = cached_object('environment', _environment(3.0), build)
+    assert first is second
+    assert other is not first
+    assert build.call_count == 2
+
+
+def test_cached_object_separates_kinds():
+    model = _environment()
+    assert cached_object('a', model, lambda: 'a') == 'a'
+    assert cached_object('b', model, lambda: 'b') == 'b'
+
+
+def test_cached_object_hands_out_copies():
+    model = _environment()
+    built = cached_object('rocket', model, lambda: [1], copy=list)
+    again = cached_object('rocket', model, lambda: [2], copy=list)
+    built.append(2)
+    assert again == [1]
+
+
+def test_cached_object_builds_uncached_kinds_fresh():
+    model = _environment()
+    build = Mock(side_effect=object)
+    first = cached_object('motor', model, build, uncached={'motor'})
+    second = cached_object('motor', model, build, uncached={'motor'})
+    assert first is not second
+    assert len(get_object_cache()) == 0
+
+
+def test_cached_object_does_not_cache_failed_builds():
+    model = _environment()
+    with pytest.raises(ValueError):
+        cached_object('motor', model, Mock(side_effect=ValueError))
+    assert cached_object('motor', model, lambda: 'built') == 'built'
+
+
+def test_weather_cycle_only_for_fetched_atmospheres():
+    forecast = _environment()
+    forecast.atmospheric_model_type = 'forecast'
+    cycle = weather_cycle(forecast)
+    assert datetime.fromisoformat(cycle).hour % WEATHER_CYCLE_HOURS == 0
+    assert weather_cycle(Mock(environment=forecast)) == cycle
+    assert weather_cycle(_environment()) is None
+    assert weather_cycle(Mock(spec=[])) is None
+
+
+def test_cached_object_rebuilds_fetched_atmosphere_each_cycle():
+    build = Mock(side_effect=object)
+    model = _environment()
+    with patch(
+        'src.services.objects.weather_cycle',
+        side_effect=['2025-06-01T06:00:00', '2025-06-01T06:00:00', None],
+    ):
+        first = cached_object('environment', model, build)
+        assert cached_object('environment', model, build) is first
+        assert cached_object('environment', model, build) is not first
+    assert build.call_count == 2
@@ -0,0 +1,193 @@
+from unittest.mock import patch, Mock
+
+import numpy as np
+import pytest
+
+from src.models.flight import FlightDispersion
+from src.services.study import (
+    MONTE_CARLO_OUTPUTS,
+    FlightStudyService,
+    varied_objects,
+)
+
+
+@pytest.fixture
+def stub_flight_model():
+    flight = Mock()
+    flight.model_dump.return_value = {
+        'inclination': 85.0,
+        'max_time': 600,
+        'terminate_on_apogee': False,
+        'environment': {'elevation': 1400.0},
+        'rocket': {'mass': 14.4, 'parachutes': [{'cd_s': 10.0}]},
+    }
+    return flight
+
+
+def test_nominal_values(stub_flight_model):
+    paths = ['rocket.parachutes.0.cd_s', 'environment.elevation', 'max_time']
+    assert FlightStudyService.nominal_values(stub_flight_model, paths) == [
+        10.0,
+        1400.0,
+        600,
+    ]
+
+
+def test_nominal_values_accepts_json_pointers(stub_flight_model):
+    paths = ['/rocket/parachutes/0/cd_s', '/environment/elevation']
+    assert FlightStudyService.nominal_values(stub_flight_model, paths) == [
+        10.0,
+        1400.0,
+    ]
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        'rocket.missing',
+        'rocket.parachutes.3.cd_s',
+        'rocket',
+        'terminate_on_apogee',
+    ],
+)
+def test_nominal_values_rejects_non_numeric_paths(stub_flight_model, path):
+    with pytest.raises(ValueError):
+        FlightStudyService.nominal_values(stub_flight_model, [path])
+
+
+def test_draw_samples_is_reproducible_and_bounded():
+    dispersions = [
+        FlightDispersion(path='a', std=2),
+        FlightDispersion(path='b', distribution='uniform', low=1, high=2),
+        FlightDispersion(path='c', distribution='triangular', low=0, high=4),
+        FlightDispersion(path='d', std=10),
+    ]
+    draws = FlightStudyService.draw_samples(
+        dispersions, [10.0, 0.0, 1.0, 600], 500, seed=7
+    )
+    np.testing.assert_array_equal(
+        draws,
+        FlightStudyService.draw_samples(
+            dispersions, [10.0, 0.0, 1.0, 600], 500, seed=7
+        ),
+    )
+    assert draws.shape == (500, 4)
+    assert abs(draws[:, 0].mean() - 10) < 0.5
+    assert draws[:, 1].min() >= 1 and draws[:, 1].max() <= 2
+    assert draws[:, 2].min() >= 0 and draws[:, 2].max() <= 4
+    np.testing.assert_array_equal(draws[:, 3], np.round(draws[:, 3]))
+
+
+def test_sweep_grid_varies_last_axis_fastest():
+    grid = FlightStudyService.sweep_grid(
+        [[1.0, 2.0], [10.0, 20.4, 30.6]], [1.5, 10]
+    )
+    np.testing.assert_array_equal(
+        grid,
+        [
+            [1.0, 10.0],
+            [1.0, 20.0],
+            [1.0, 31.0],
+            [2.0, 10.0],
+            [2.0, 20.0],
+            [2.0, 31.0],
+        ],
+    )
+
+
+def test_get_sample_outputs_marks_failed_samples():
+    flight = Mock()
+    flight.model_dump.return_value = {'inclination': 85.0}
+    service = FlightStudyService.from_flight_model(flight)
+    simulated = Mock(**{output: 1.0 for output in MONTE_CARLO_OUTPUTS})
+    validated = []
+
+    def model_validate(document):
+        validated.append(dict(document))
+        if document['inclination'] < 0:
+            raise ValueError('bad inclination')
+        return Mock()
+
+    with (
+        patch('src.services.study.FlightModel') as mock_model,
+        patch('src.services.study.FlightService') as mock_service,
+    ):
+        mock_model.model_validate.side_effect = model_validate
+        mock_service.from_flight_model.return_value.flight = simulated
+        outputs = service.get_sample_outputs(
+            ['inclination'], np.array([[84.0], [-1.0]])
+        )
+    np.testing.assert_array_equal(outputs[0], 1.0)
+    assert np.isnan(outputs[1]).all()
+    assert validated == [{'inclination': 84.0}, {'inclination': -1.0}]
+    assert mock_service.from_flight_model.call_args.kwargs == {
+        'uncached': {'flight'}
+    }
+
+
+@pytest.mark.parametrize(
+    'paths, expected',
+    [
+        (['inclination'], {'flight'}),
+        (['environment.elevation'], {'flight', 'environment'}),
+        (['/rocket/parachutes/0/cd_s'], {'flight', 'rocket'}),
+        (
+            ['rocket.motor.dry_mass', 'inclination'],
+            {'flight', 'rocket', 'motor'},
+        ),
+    ],
+)
+def test_varied_objects(paths, expected):
+    assert varied_objects(paths) == expected
+
+
+def test_summarize_monte_carlo_statistics_and_impact_ellipse():
+    rng = np.random.default_rng(0)
+    outputs = np.zeros((2001, len(MONTE_CARLO_OUTPUTS)))
+    outputs[:, 0] = np.linspace(1000, 2000, 2001)
+    x_column = MONTE_CARLO_OUTPUTS.index('x_impact')
+    y_column = MONTE_CARLO_OUTPUTS.index('y_impact')
+    outputs[:, x_column] = rng.normal(100, 30, 2001)
+    outputs[:, y_column] = rng.normal(-50, 10, 2001)
+    outputs[-1] = np.nan
+
+    summary = FlightStudyService.summarize_monte_carlo(
+        outputs, [5, 50, 95], seed=1
+    )
+
+    assert summary.samples == 2001
+    assert summary.failed_samples == 1
+    assert summary.percentiles == [5, 50, 95]
+    assert summary.apogee.min == 1000
+    assert summary.apogee.percentiles[1] == pytest.approx(1499.75)
+    ellipse = summary.impact_ellipses[1]
+    assert ellipse.sigma == 2
+    assert ellipse.x_center == pytest.approx(100, abs=2)
+    assert ellipse.semi_major_axis == pytest.approx(60, rel=0.1)
+    assert ellipse.semi_minor_axis == pytest.approx(20, rel=0.1)
+    assert abs(np.sin(np.radians(ellipse.angle))) < 0.1
+
+
+def test_summarize_monte_carlo_rejects_all_failed_samples():
+    outputs = np.full((3, len(MONTE_CARLO_OUTPUTS)), np.nan)
+    with pytest.raises(ValueError):
+        FlightStudyService.summarize_monte_carlo(outputs, [50])
+
+
+def test_tabulate_sweep_nulls_failed_points():
+    grid = np.array([[1.0], [2.0], [3.0]])
+    results = np.array([[10.0, 1.0], [np.nan, np.nan], [30.0, 3.0]])
+
+    sweep = FlightStudyService.tabulate_sweep(
+        ['/rocket/mass'], grid, ['apogee', 'x_impact'], results
+    )
+
+    assert sweep.points == 3
+    assert sweep.failed_points == 1
+    assert sweep.parameters == ['/rocket/mass']
+    assert sweep.outputs == ['apogee', 'x_impact']
+    assert sweep.columns == {
+        '/rocket/mass': [1.0, 2.0, 3.0],
+        'apogee': [10.0, None, 30.0],
+        'x_impact': [1.0, None, 3.0],
+    }
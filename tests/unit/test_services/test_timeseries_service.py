@@ -0,0 +1,76 @@
+import csv
+import io
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from rocketpy.mathutils.function import Function
+
+from src.services.timeseries import (
+    SOLUTION_COLUMNS,
+    TimeseriesFormat,
+    encode_table,
+    flight_table,
+)
+
+TIME = np.linspace(0, 10, 50)
+
+
+@pytest.fixture
+def stub_flight():
+    solution = np.column_stack([TIME] + [TIME * i for i in range(1, 14)])
+    return Mock(
+        solution=solution.tolist(),
+        altitude=Function(np.column_stack([TIME, TIME**2])),
+        speed=Function(lambda t: 2 * t),
+    )
+
+
+def test_flight_table_evaluates_columns_at_solution_times(stub_flight):
+    table = flight_table(stub_flight, ['altitude', 'x', 'speed'])
+    assert list(table) == [*SOLUTION_COLUMNS, 'altitude', 'speed']
+    np.testing.assert_allclose(table['altitude'], TIME**2)
+    np.testing.assert_allclose(table['speed'], 2 * TIME)
+    np.testing.assert_array_equal(table['x'], TIME)
+
+
+@pytest.mark.parametrize('column', ['mach', '_solution', 'solution'])
+def test_flight_table_rejects_non_functions(stub_flight, column):
+    with pytest.raises(ValueError):
+        flight_table(stub_flight, [column])
+
+
+def test_encode_npz_keeps_values(stub_flight):
+    table = flight_table(stub_flight, ['altitude'])
+    archive = np.load(io.BytesIO(encode_table(table, TimeseriesFormat.NPZ)))
+    assert list(archive) == list(table)
+    for name, column in table.items():
+        np.testing.assert_array_equal(archive[name], column)
+
+
+def test_encode_csv_round_trips_floats(stub_flight):
+    table = flight_table(stub_flight, ['altitude'])
+    content = encode_table(table, TimeseriesFormat.CSV).decode()
+    rows = list(csv.reader(io.StringIO(content)))
+    assert rows[0] == list(table)
+    assert len(rows) == len(TIME) + 1
+    assert [float(value) for value in rows[7]] == [
+        column[6] for column in table.values()
+    ]
+
+
+@pytest.mark.parametrize(
+    'table_format', [TimeseriesFormat.ARROW, TimeseriesFormat.PARQUET]
+)
+def test_encode_arrow_formats(stub_flight, table_format):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    ipc = pytest.importorskip('pyarrow.ipc')
+
+    table = flight_table(stub_flight, ['altitude'])
+    content = encode_table(table, table_format)
+    if table_format is TimeseriesFormat.PARQUET:
+        arrow_table = parquet.read_table(io.BytesIO(content))
+    else:
+        arrow_table = ipc.open_file(content).read_all()
+    assert arrow_table.column_names == list(table)
+    np.testing.assert_array_equal(arrow_table['altitude'], table['altitude'])
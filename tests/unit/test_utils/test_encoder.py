@@ -0,0 +1,139 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+from rocketpy import Environment, Function
+
+from src.utils import (
+    CurveDownsampling,
+    InfinityEncoder,
+    _interp_columns,
+    collect_attributes,
+    lttb_indices,
+    minmax_indices,
+    rocketpy_encoder,
+)
+
+
+def _json_round_trip(obj):
+    encoder = InfinityEncoder(
+        include_outputs=True,
+        include_function_data=True,
+        discretize=True,
+        allow_pickle=False,
+    )
+    return json.loads(encoder.encode(obj))
+
+
+def test_rocketpy_encoder_matches_json_round_trip():
+    payload = {
+        'array': np.linspace(0, 1, 5),
+        'scalar': np.float64(1.5),
+        'count': np.int32(3),
+        'pair': (1, 2.0),
+        'nested': {1: 'one', 2.5: None, False: [np.arange(3)], None: 'x'},
+        'function': Function([[0, 0], [1, 1], [2, 4]]),
+    }
+    encoded = rocketpy_encoder(payload)
+    expected = _json_round_trip(payload)
+    del encoded['function']['signature']['hash']
+    del expected['function']['signature']['hash']
+    assert encoded == expected
+    assert isinstance(encoded['scalar'], float)
+    assert isinstance(encoded['count'], int)
+    assert not isinstance(encoded['scalar'], np.generic)
+    assert not isinstance(encoded['count'], np.generic)
+
+
+def test_rocketpy_encoder_keeps_datetimes():
+    date = datetime(2024, 5, 1, 12, 30, 15)
+    assert rocketpy_encoder({'date': date}) == {'date': date}
+
+
+def test_rocketpy_encoder_rejects_circular_references():
+    payload = []
+    payload.append(payload)
+    with pytest.raises(ValueError):
+        rocketpy_encoder(payload)
+
+
+def test_interp_columns_matches_np_interp_per_column():
+    time = np.array([0.0, 0.5, 0.5, 2.0, 3.0])
+    table = np.column_stack([time, time**2, np.sin(time)])
+    grid = np.linspace(0, 3, 7)
+    reduced = _interp_columns(time, table, grid)
+    for column in range(table.shape[1]):
+        np.testing.assert_allclose(
+            reduced[:, column], np.interp(grid, time, table[:, column])
+        )
+
+
+def test_rocketpy_encoder_reduces_functions_to_requested_points():
+    function = Function(np.column_stack([np.arange(100), np.arange(100)]))
+    encoded = rocketpy_encoder(function, points=10)
+    assert len(encoded['source']) == 10
+    assert encoded['source'][-1] == [99.0, 99.0]
+    assert len(function.source) == 100
+
+
+@pytest.mark.parametrize('selector', [lttb_indices, minmax_indices])
+def test_index_selectors_keep_endpoints_and_peak(selector):
+    x = np.linspace(0, 10, 1001)
+    y = np.exp(-((x - 3.3) ** 2) * 20)
+    indices = selector(x, y, 20)
+    assert len(indices) <= 20
+    assert indices[0] == 0 and indices[-1] == 1000
+    assert np.all(np.diff(indices) > 0)
+    assert y[indices].max() > 0.95
+
+
+def test_index_selectors_return_everything_for_short_series():
+    x = np.arange(5.0)
+    np.testing.assert_array_equal(lttb_indices(x, x, 10), np.arange(5))
+    np.testing.assert_array_equal(minmax_indices(x, x, 10), np.arange(5))
+
+
+def test_rocketpy_encoder_lttb_keeps_original_samples():
+    x = np.linspace(0, 10, 1001)
+    function = Function(np.column_stack([x, np.sin(x)]))
+    encoded = rocketpy_encoder(
+        function, points=50, method=CurveDownsampling.LTTB
+    )
+    source = np.array(encoded['source'])
+    assert len(source) == 50
+    np.testing.assert_allclose(source[:, 1], np.sin(source[:, 0]))
+
+
+class _Component:
+    def __init__(self):
+        self.mass = np.float64(2.5)
+        self.thrust = Function([[0, 0], [1, 10]])
+
+    @property
+    def expensive(self):
+        raise AssertionError('unrequested attribute evaluated')
+
+    @property
+    def burn_time(self):
+        return 1.0
+
+
+def test_collect_attributes_projects_requested_fields():
+    attributes = collect_attributes(
+        _Component(), fields=['mass', 'burn_time', 'missing']
+    )
+    assert attributes == {'mass': 2.5, 'burn_time': 1.0}
+
+
+def test_rocketpy_encoder_leaves_environment_functions_untouched():
+    environment = Environment()
+    environment.set_atmospheric_model(
+        type='custom_atmosphere', wind_u=[(0, 1), (3000, 8)], wind_v=0
+    )
+    wind_speed = environment.wind_speed
+    source = wind_speed.source
+    encoded = rocketpy_encoder(environment)
+    assert environment.wind_speed is wind_speed
+    assert wind_speed.source is source
+    assert len(encoded['wind_speed']['source']) == 25
@@ -0,0 +1,31 @@
+import pytest
+
+from src.utils import apply_merge_patch, merge_patch_updates
+
+
+def test_apply_merge_patch():
+    document = {'a': {'b': 1, 'c': [1, 2]}, 'd': 1}
+    patched = apply_merge_patch(
+        document, {'a': {'b': None, 'c': [3], 'e': {'f': 1}}, 'd': 2}
+    )
+    assert patched == {'a': {'c': [3], 'e': {'f': 1}}, 'd': 2}
+    assert document == {'a': {'b': 1, 'c': [1, 2]}, 'd': 1}
+
+
+def test_merge_patch_updates():
+    patch = {
+        'a': {'b': None, 'c': [3], 'e': {'f': '1'}},
+        'd': '2',
+        'ignored': 1,
+    }
+    document = {'a': {'c': [3], 'e': {'f': 1}}, 'd': 2}
+    assert merge_patch_updates(patch, document) == (
+        {'a.c': [3], 'a.e.f': 1, 'd': 2},
+        ['a.b'],
+    )
+
+
+@pytest.mark.parametrize('key', ['a.b', '$set', ''])
+def test_merge_patch_updates_rejects_paths(key):
+    with pytest.raises(ValueError):
+        merge_patch_updates({key: None}, {})
@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+
+from src.utils import iter_model_json
+from src.views.flight import FlightSimulation
+from src.views.rocket import RocketSimulation
+
+
+def test_iter_model_json_matches_model_dump_json():
+    simulation = FlightSimulation(
+        apogee=float('nan'),
+        x=[[float(t), t * 2e-5] for t in range(2500)],
+        rocket=RocketSimulation(thrust=[[0, 1], [1, 0]]),
+        initial_solution=[0, 1, 2],
+    )
+    pieces = list(iter_model_json(simulation, rows=1000))
+    assert b''.join(pieces) == simulation.model_dump_json().encode()
+    assert max(map(len, pieces)) < len(simulation.model_dump_json()) / 2
+
+
+def test_iter_model_json_empty_model():
+    class Empty(BaseModel):
+        pass
+
+    assert b''.join(iter_model_json(Empty())) == b'{}'